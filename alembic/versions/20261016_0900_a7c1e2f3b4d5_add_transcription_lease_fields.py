@@ -0,0 +1,37 @@
+"""add_transcription_lease_fields
+
+Revision ID: a7c1e2f3b4d5
+Revises: dd7777d4445b
+Create Date: 2026-10-16 09:00:00.000000
+
+Adds worker id and lease expiry columns so several pipeline nodes can claim
+transcription work from the same database without picking the same episode.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7c1e2f3b4d5'
+down_revision: Union[str, None] = 'dd7777d4445b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('episodes', sa.Column('transcript_worker_id', sa.String(length=128), nullable=True))
+    op.add_column('episodes', sa.Column('transcript_lease_expires_at', sa.DateTime(), nullable=True))
+    op.create_index(
+        'ix_episodes_transcript_lease',
+        'episodes',
+        ['transcript_status', 'transcript_lease_expires_at'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_episodes_transcript_lease', table_name='episodes')
+    op.drop_column('episodes', 'transcript_lease_expires_at')
+    op.drop_column('episodes', 'transcript_worker_id')
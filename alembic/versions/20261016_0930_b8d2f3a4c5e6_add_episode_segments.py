@@ -0,0 +1,45 @@
+"""add_episode_segments
+
+Revision ID: b8d2f3a4c5e6
+Revises: a7c1e2f3b4d5
+Create Date: 2026-10-16 09:30:00.000000
+
+Adds the episode_segments table. Transcript segments are written as they
+are decoded so interrupted transcriptions can resume, and the timestamps
+are available for citations.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b8d2f3a4c5e6'
+down_revision: Union[str, None] = 'a7c1e2f3b4d5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'episode_segments',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('episode_id', sa.String(length=36), nullable=False),
+        sa.Column('start_seconds', sa.Float(), nullable=False),
+        sa.Column('end_seconds', sa.Float(), nullable=False),
+        sa.Column('text', sa.Text(), nullable=False),
+        sa.ForeignKeyConstraint(['episode_id'], ['episodes.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index(
+        'ix_episode_segments_episode_start',
+        'episode_segments',
+        ['episode_id', 'start_seconds'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_episode_segments_episode_start', table_name='episode_segments')
+    op.drop_table('episode_segments')
@@ -0,0 +1,35 @@
+"""add_audio_preprocessing_fields
+
+Revision ID: c9e3a4b5d6f7
+Revises: b8d2f3a4c5e6
+Create Date: 2026-10-16 10:00:00.000000
+
+Adds preprocessing status, decoded PCM path and speech regions so audio can
+be decoded and VAD-trimmed ahead of transcription.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c9e3a4b5d6f7'
+down_revision: Union[str, None] = 'b8d2f3a4c5e6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'episodes',
+        sa.Column('preprocess_status', sa.String(length=32), nullable=False, server_default='pending'),
+    )
+    op.add_column('episodes', sa.Column('preprocessed_audio_path', sa.String(length=1024), nullable=True))
+    op.add_column('episodes', sa.Column('speech_regions', sa.JSON(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('episodes', 'speech_regions')
+    op.drop_column('episodes', 'preprocessed_audio_path')
+    op.drop_column('episodes', 'preprocess_status')
@@ -0,0 +1,46 @@
+"""add_episode_priority
+
+Revision ID: d1f4b5c6e7a8
+Revises: c9e3a4b5d6f7
+Create Date: 2026-10-16 10:30:00.000000
+
+Adds a denormalised priority score to episodes, indexed together with the
+download and transcript status so the work queues are ordered by an index
+scan. Existing rows start at 0 and are scored on the next feed sync.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd1f4b5c6e7a8'
+down_revision: Union[str, None] = 'c9e3a4b5d6f7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'episodes',
+        sa.Column('priority', sa.Float(), nullable=False, server_default='0'),
+    )
+    op.create_index(
+        'ix_episodes_download_priority',
+        'episodes',
+        ['download_status', 'priority'],
+        unique=False,
+    )
+    op.create_index(
+        'ix_episodes_transcript_priority',
+        'episodes',
+        ['transcript_status', 'priority'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_episodes_transcript_priority', table_name='episodes')
+    op.drop_index('ix_episodes_download_priority', table_name='episodes')
+    op.drop_column('episodes', 'priority')
@@ -0,0 +1,116 @@
+"""move_transcripts_to_compressed_table
+
+Revision ID: e2a5c6d7f8b9
+Revises: d1f4b5c6e7a8
+Create Date: 2026-10-16 11:00:00.000000
+
+Moves full transcripts out of episodes.transcript_text into a separate
+episode_transcripts table, compressed. Existing transcripts are written with
+zlib, which every install can read; new ones are written by the application
+with its default codec (zstd).
+Episode queries no longer read the transcript body with every row.
+"""
+import zlib
+from datetime import datetime
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2a5c6d7f8b9'
+down_revision: Union[str, None] = 'd1f4b5c6e7a8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Rows copied per round trip while moving transcripts
+BATCH_SIZE = 500
+
+# Codec and level existing transcripts are written with, pinned here rather
+# than taken from src.db.compression so the result does not depend on the
+# packages installed when the migration runs
+CODEC = 'zlib'
+ZLIB_LEVEL = 9
+
+
+def _decompress(codec: str, data: bytes) -> str:
+    """Decompress a stored transcript (zlib, or zstd when installed)."""
+    if codec == 'zlib':
+        return zlib.decompress(data).decode('utf-8')
+    if codec == 'zstd':
+        import zstandard
+
+        return zstandard.ZstdDecompressor().decompress(data).decode('utf-8')
+    raise ValueError(f'Unknown codec: {codec}')
+
+
+def upgrade() -> None:
+    op.create_table(
+        'episode_transcripts',
+        sa.Column('episode_id', sa.String(length=36), nullable=False),
+        sa.Column('codec', sa.String(length=16), nullable=False),
+        sa.Column('content', sa.LargeBinary(), nullable=False),
+        sa.Column('text_length', sa.Integer(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['episode_id'], ['episodes.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('episode_id'),
+    )
+
+    conn = op.get_bind()
+    transcripts = sa.table(
+        'episode_transcripts',
+        sa.column('episode_id', sa.String),
+        sa.column('codec', sa.String),
+        sa.column('content', sa.LargeBinary),
+        sa.column('text_length', sa.Integer),
+        sa.column('created_at', sa.DateTime),
+        sa.column('updated_at', sa.DateTime),
+    )
+    now = datetime.utcnow()
+    last_id = ''
+    while True:
+        rows = conn.execute(
+            sa.text(
+                "SELECT id, transcript_text FROM episodes "
+                "WHERE transcript_text IS NOT NULL AND id > :last_id "
+                "ORDER BY id LIMIT :limit"
+            ),
+            {'last_id': last_id, 'limit': BATCH_SIZE},
+        ).fetchall()
+        if not rows:
+            break
+        values = []
+        for episode_id, text in rows:
+            values.append({
+                'episode_id': episode_id,
+                'codec': CODEC,
+                'content': zlib.compress(text.encode('utf-8'), ZLIB_LEVEL),
+                'text_length': len(text),
+                'created_at': now,
+                'updated_at': now,
+            })
+        conn.execute(transcripts.insert(), values)
+        last_id = rows[-1][0]
+
+    op.drop_column('episodes', 'transcript_text')
+
+
+def downgrade() -> None:
+    op.add_column(
+        'episodes',
+        sa.Column('transcript_text', sa.Text(), nullable=True)
+    )
+
+    conn = op.get_bind()
+    rows = conn.execute(
+        sa.text("SELECT episode_id, codec, content FROM episode_transcripts")
+    )
+    for episode_id, codec, content in rows.fetchall():
+        conn.execute(
+            sa.text("UPDATE episodes SET transcript_text = :text WHERE id = :id"),
+            {'text': _decompress(codec, content), 'id': episode_id},
+        )
+
+    op.drop_table('episode_transcripts')
@@ -0,0 +1,156 @@
+"""add_episode_search_index
+
+Revision ID: f3b6d7e8a9c0
+Revises: e2a5c6d7f8b9
+Create Date: 2026-10-16 11:30:00.000000
+
+Adds the episode_search full-text index over transcripts, titles, summaries,
+keywords, hosts and guests: a weighted tsvector with a GIN index on
+PostgreSQL, an FTS5 virtual table on SQLite. Existing episodes that have a
+transcript or metadata are indexed here; new ones are indexed as the
+pipeline completes them.
+"""
+import zlib
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3b6d7e8a9c0'
+down_revision: Union[str, None] = 'e2a5c6d7f8b9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Episodes indexed per round trip
+BATCH_SIZE = 200
+
+# Head of the transcript that is indexed; PostgreSQL rejects tsvectors over 1 MB
+MAX_TRANSCRIPT_CHARS = 500_000
+
+POSTGRES_UPSERT = sa.text(
+    "INSERT INTO episode_search (episode_id, document) VALUES (:episode_id, "
+    "setweight(to_tsvector('english', :title), 'A') || "
+    "setweight(to_tsvector('english', :people), 'A') || "
+    "setweight(to_tsvector('english', :keywords), 'B') || "
+    "setweight(to_tsvector('english', :summary), 'C') || "
+    "setweight(to_tsvector('english', :transcript), 'D')) "
+    "ON CONFLICT (episode_id) DO UPDATE SET document = EXCLUDED.document"
+)
+
+SQLITE_INSERT = sa.text(
+    "INSERT INTO episode_search "
+    "(episode_id, title, people, keywords, summary, transcript) "
+    "VALUES (:episode_id, :title, :people, :keywords, :summary, :transcript)"
+)
+
+
+def _decompress(codec: str, data: bytes) -> str:
+    """Decompress a stored transcript (zlib, or zstd when installed)."""
+    if codec == 'zlib':
+        return zlib.decompress(data).decode('utf-8')
+    if codec == 'zstd':
+        import zstandard
+
+        return zstandard.ZstdDecompressor().decompress(data).decode('utf-8')
+    raise ValueError(f'Unknown codec: {codec}')
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    postgres = conn.dialect.name == 'postgresql'
+    if postgres:
+        op.execute(
+            "CREATE TABLE IF NOT EXISTS episode_search ("
+            "episode_id VARCHAR(36) PRIMARY KEY "
+            "REFERENCES episodes(id) ON DELETE CASCADE, "
+            "document TSVECTOR NOT NULL)"
+        )
+        op.execute(
+            "CREATE INDEX IF NOT EXISTS ix_episode_search_document "
+            "ON episode_search USING GIN (document)"
+        )
+    else:
+        op.execute(
+            "CREATE VIRTUAL TABLE IF NOT EXISTS episode_search USING fts5("
+            "episode_id UNINDEXED, title, people, keywords, summary, transcript, "
+            "tokenize = 'porter unicode61')"
+        )
+
+    episodes = sa.table(
+        'episodes',
+        sa.column('id', sa.String),
+        sa.column('title', sa.String),
+        sa.column('ai_summary', sa.Text),
+        sa.column('ai_keywords', sa.JSON),
+        sa.column('ai_hosts', sa.JSON),
+        sa.column('ai_guests', sa.JSON),
+        sa.column('transcript_status', sa.String),
+        sa.column('metadata_status', sa.String),
+    )
+    transcripts = sa.table(
+        'episode_transcripts',
+        sa.column('episode_id', sa.String),
+        sa.column('codec', sa.String),
+        sa.column('content', sa.LargeBinary),
+    )
+
+    last_id = ''
+    while True:
+        rows = conn.execute(
+            sa.select(
+                episodes.c.id,
+                episodes.c.title,
+                episodes.c.ai_summary,
+                episodes.c.ai_keywords,
+                episodes.c.ai_hosts,
+                episodes.c.ai_guests,
+                transcripts.c.codec,
+                transcripts.c.content,
+            )
+            .select_from(
+                episodes.outerjoin(
+                    transcripts, transcripts.c.episode_id == episodes.c.id
+                )
+            )
+            .where(
+                episodes.c.id > last_id,
+                sa.or_(
+                    episodes.c.transcript_status == 'completed',
+                    episodes.c.metadata_status == 'completed',
+                ),
+            )
+            .order_by(episodes.c.id)
+            .limit(BATCH_SIZE)
+        ).fetchall()
+        if not rows:
+            break
+        documents = [
+            {
+                'episode_id': row.id,
+                'title': row.title or '',
+                'people': ' '.join((row.ai_hosts or []) + (row.ai_guests or [])),
+                'keywords': ' '.join(row.ai_keywords or []),
+                'summary': row.ai_summary or '',
+                'transcript': (
+                    _decompress(row.codec, row.content)[:MAX_TRANSCRIPT_CHARS]
+                    if row.codec else ''
+                ),
+            }
+            for row in rows
+        ]
+        if postgres:
+            conn.execute(POSTGRES_UPSERT, documents)
+        else:
+            # FTS5 tables have no unique constraint to upsert against
+            conn.execute(
+                sa.text('DELETE FROM episode_search WHERE episode_id = :episode_id'),
+                [{'episode_id': document['episode_id']} for document in documents],
+            )
+            conn.execute(SQLITE_INSERT, documents)
+        last_id = rows[-1].id
+
+
+def downgrade() -> None:
+    op.execute('DROP TABLE IF EXISTS episode_search')
@@ -0,0 +1,79 @@
+"""add_people_and_keyword_tables
+
+Revision ID: a4c7e8f9b0d1
+Revises: f3b6d7e8a9c0
+Create Date: 2026-10-16 12:00:00.000000
+
+Adds normalised people/episode_people and keywords/episode_keywords tables
+mirroring the ai_hosts, ai_guests and ai_keywords JSON columns, so person and
+keyword lookups use indexes. Existing episodes are populated by
+scripts/backfill_people_keywords.py.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a4c7e8f9b0d1'
+down_revision: Union[str, None] = 'f3b6d7e8a9c0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'people',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('name', sa.String(length=512), nullable=False),
+        sa.Column('display_name', sa.String(length=512), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('name'),
+    )
+    op.create_table(
+        'episode_people',
+        sa.Column('episode_id', sa.String(length=36), nullable=False),
+        sa.Column('person_id', sa.Integer(), nullable=False),
+        sa.Column('role', sa.String(length=16), nullable=False),
+        sa.ForeignKeyConstraint(['episode_id'], ['episodes.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['person_id'], ['people.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('episode_id', 'person_id', 'role'),
+    )
+    op.create_index(
+        'ix_episode_people_person_role',
+        'episode_people',
+        ['person_id', 'role'],
+        unique=False,
+    )
+    op.create_table(
+        'keywords',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('name', sa.String(length=512), nullable=False),
+        sa.Column('display_name', sa.String(length=512), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('name'),
+    )
+    op.create_table(
+        'episode_keywords',
+        sa.Column('episode_id', sa.String(length=36), nullable=False),
+        sa.Column('keyword_id', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['episode_id'], ['episodes.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['keyword_id'], ['keywords.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('episode_id', 'keyword_id'),
+    )
+    op.create_index(
+        'ix_episode_keywords_keyword',
+        'episode_keywords',
+        ['keyword_id'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_episode_keywords_keyword', table_name='episode_keywords')
+    op.drop_table('episode_keywords')
+    op.drop_table('keywords')
+    op.drop_index('ix_episode_people_person_role', table_name='episode_people')
+    op.drop_table('episode_people')
+    op.drop_table('people')
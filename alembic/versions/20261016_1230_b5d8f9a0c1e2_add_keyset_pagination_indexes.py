@@ -0,0 +1,57 @@
+"""add_keyset_pagination_indexes
+
+Revision ID: b5d8f9a0c1e2
+Revises: a4c7e8f9b0d1
+Create Date: 2026-10-16 12:30:00.000000
+
+Adds composite (sort column, id) indexes backing keyset pagination of
+episodes, conversations and chat messages. Each replaces a single-column
+index that is a prefix of it.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b5d8f9a0c1e2'
+down_revision: Union[str, None] = 'a4c7e8f9b0d1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_episodes_published_id', 'episodes', ['published_date', 'id']
+    )
+    op.create_index(
+        'ix_episodes_podcast_published', 'episodes',
+        ['podcast_id', 'published_date', 'id'],
+    )
+    op.create_index(
+        'ix_conversations_user_updated', 'conversations',
+        ['user_id', 'updated_at', 'id'],
+    )
+    op.create_index(
+        'ix_chat_messages_conversation_created', 'chat_messages',
+        ['conversation_id', 'created_at', 'id'],
+    )
+
+    op.drop_index('ix_episodes_published_date', 'episodes')
+    op.drop_index('ix_episodes_podcast_id', 'episodes')
+    op.drop_index('ix_conversations_user_id', 'conversations')
+    op.drop_index('ix_chat_messages_conversation_id', 'chat_messages')
+
+
+def downgrade() -> None:
+    op.create_index(
+        'ix_chat_messages_conversation_id', 'chat_messages', ['conversation_id']
+    )
+    op.create_index('ix_conversations_user_id', 'conversations', ['user_id'])
+    op.create_index('ix_episodes_podcast_id', 'episodes', ['podcast_id'])
+    op.create_index('ix_episodes_published_date', 'episodes', ['published_date'])
+
+    op.drop_index('ix_chat_messages_conversation_created', 'chat_messages')
+    op.drop_index('ix_conversations_user_updated', 'conversations')
+    op.drop_index('ix_episodes_podcast_published', 'episodes')
+    op.drop_index('ix_episodes_published_id', 'episodes')
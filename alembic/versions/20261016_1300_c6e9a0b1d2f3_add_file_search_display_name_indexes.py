@@ -0,0 +1,35 @@
+"""add_file_search_display_name_indexes
+
+Revision ID: c6e9a0b1d2f3
+Revises: b5d8f9a0c1e2
+Create Date: 2026-10-16 13:00:00.000000
+
+Indexes the File Search display names that chat citations are resolved by,
+so a response's citations are looked up with one indexed IN query.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c6e9a0b1d2f3'
+down_revision: Union[str, None] = 'b5d8f9a0c1e2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_episodes_file_search_display_name', 'episodes',
+        ['file_search_display_name'],
+    )
+    op.create_index(
+        'ix_podcasts_description_file_search_display_name', 'podcasts',
+        ['description_file_search_display_name'],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_podcasts_description_file_search_display_name', 'podcasts')
+    op.drop_index('ix_episodes_file_search_display_name', 'episodes')
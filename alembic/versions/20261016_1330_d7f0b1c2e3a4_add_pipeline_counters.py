@@ -0,0 +1,165 @@
+"""add_pipeline_counters
+
+Revision ID: d7f0b1c2e3a4
+Revises: c6e9a0b1d2f3
+Create Date: 2026-10-16 13:30:00.000000
+
+Adds the pipeline_counters table of per-podcast episode counts by pipeline
+state, with triggers on episodes that keep it current in the same
+transaction as each insert, delete or status change. Dashboard stats and
+worker queue depths read it instead of scanning episodes. The counts are
+backfilled from the existing episodes here.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd7f0b1c2e3a4'
+down_revision: Union[str, None] = 'c6e9a0b1d2f3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Frozen copy of src/db/counters.py as of this revision, so that later edits
+# to the live counter definitions do not change what this revision creates.
+# Counter name -> condition on an episodes row, with {r} standing for the row.
+COUNTERS = {
+    "total_episodes": "1 = 1",
+    "pending_download": "{r}.download_status = 'pending'",
+    "downloading": "{r}.download_status = 'downloading'",
+    "downloaded": "{r}.download_status = 'completed'",
+    "download_failed": "{r}.download_status = 'failed'",
+    "pending_transcription": "{r}.transcript_status = 'pending'",
+    "transcribing": "{r}.transcript_status = 'processing'",
+    "transcribed": "{r}.transcript_status = 'completed'",
+    "transcript_failed": "{r}.transcript_status = 'failed'",
+    "pending_indexing": "{r}.file_search_status = 'pending'",
+    "indexed": "{r}.file_search_status = 'indexed'",
+    "fully_processed": (
+        "{r}.transcript_status = 'completed' AND {r}.metadata_status = 'completed' "
+        "AND {r}.file_search_status = 'indexed'"
+    ),
+    "transcription_queue": (
+        "{r}.download_status = 'completed' AND {r}.transcript_status = 'pending' "
+        "AND {r}.local_file_path IS NOT NULL"
+    ),
+    "preprocessing_queue": (
+        "{r}.download_status = 'completed' AND {r}.transcript_status = 'pending' "
+        "AND {r}.local_file_path IS NOT NULL AND {r}.preprocess_status = 'pending'"
+    ),
+    "metadata_queue": (
+        "{r}.transcript_status = 'completed' AND {r}.metadata_status = 'pending'"
+    ),
+    "indexing_queue": (
+        "{r}.metadata_status = 'completed' AND {r}.file_search_status = 'pending'"
+    ),
+    "cleanup_queue": (
+        "{r}.transcript_status = 'completed' AND {r}.metadata_status = 'completed' "
+        "AND {r}.file_search_status = 'indexed' AND {r}.local_file_path IS NOT NULL"
+    ),
+}
+
+COUNTED_COLUMNS = (
+    "podcast_id",
+    "download_status",
+    "transcript_status",
+    "preprocess_status",
+    "metadata_status",
+    "file_search_status",
+    "local_file_path",
+)
+
+TRIGGER_OPS = ("insert", "update", "delete")
+
+
+def _flag(name: str, row: str) -> str:
+    return f"(CASE WHEN {COUNTERS[name].format(r=row)} THEN 1 ELSE 0 END)"
+
+
+def _apply_deltas_sql(trigger_op: str) -> str:
+    """Upsert adding one trigger's non-zero deltas to pipeline_counters."""
+    rows = []
+    for name in COUNTERS:
+        new, old = _flag(name, "NEW"), _flag(name, "OLD")
+        if trigger_op == "insert":
+            rows.append(("NEW.podcast_id", name, new))
+        elif trigger_op == "delete":
+            rows.append(("OLD.podcast_id", name, f"-{old}"))
+        else:
+            same = "NEW.podcast_id = OLD.podcast_id"
+            rows.append((
+                "OLD.podcast_id", name,
+                f"(CASE WHEN {same} THEN {new} ELSE 0 END) - {old}",
+            ))
+            rows.append(("NEW.podcast_id", name, f"(CASE WHEN {same} THEN 0 ELSE {new} END)"))
+    selects = " UNION ALL ".join(
+        f"SELECT {podcast_id} AS podcast_id, '{name}' AS name, {delta} AS delta"
+        for podcast_id, name, delta in rows
+    )
+    return (
+        "INSERT INTO pipeline_counters (podcast_id, name, value) "
+        f"SELECT podcast_id, name, delta FROM ({selects}) AS deltas WHERE delta <> 0 "
+        "ON CONFLICT (podcast_id, name) "
+        "DO UPDATE SET value = pipeline_counters.value + excluded.value"
+    )
+
+
+def _trigger_event(trigger_op: str) -> str:
+    if trigger_op == "update":
+        return f"AFTER UPDATE OF {', '.join(COUNTED_COLUMNS)}"
+    return f"AFTER {trigger_op.upper()}"
+
+
+def upgrade() -> None:
+    op.create_table(
+        'pipeline_counters',
+        sa.Column('podcast_id', sa.String(length=36), nullable=False),
+        sa.Column('name', sa.String(length=64), nullable=False),
+        sa.Column('value', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('podcast_id', 'name'),
+    )
+
+    conn = op.get_bind()
+    postgres = conn.dialect.name == 'postgresql'
+    for trigger_op in TRIGGER_OPS:
+        trigger = f'pipeline_counters_{trigger_op}'
+        if postgres:
+            op.execute(
+                f"CREATE OR REPLACE FUNCTION {trigger}() RETURNS trigger "
+                f"LANGUAGE plpgsql AS $$ BEGIN {_apply_deltas_sql(trigger_op)}; "
+                "RETURN NULL; END $$"
+            )
+            op.execute(f'DROP TRIGGER IF EXISTS {trigger} ON episodes')
+            op.execute(
+                f"CREATE TRIGGER {trigger} {_trigger_event(trigger_op)} ON episodes "
+                f"FOR EACH ROW EXECUTE FUNCTION {trigger}()"
+            )
+        else:
+            op.execute(
+                f"CREATE TRIGGER IF NOT EXISTS {trigger} {_trigger_event(trigger_op)} "
+                f"ON episodes BEGIN {_apply_deltas_sql(trigger_op)}; END"
+            )
+
+    # Backfill from the existing episodes, blocking episode writes until commit
+    if postgres:
+        op.execute('LOCK TABLE episodes IN SHARE MODE')
+    for name, condition in COUNTERS.items():
+        op.execute(
+            "INSERT INTO pipeline_counters (podcast_id, name, value) "
+            f"SELECT podcast_id, '{name}', COUNT(*) FROM episodes "
+            f"WHERE {condition.format(r='episodes')} GROUP BY podcast_id"
+        )
+
+
+def downgrade() -> None:
+    postgres = op.get_bind().dialect.name == 'postgresql'
+    for trigger_op in TRIGGER_OPS:
+        trigger = f'pipeline_counters_{trigger_op}'
+        if postgres:
+            op.execute(f'DROP TRIGGER IF EXISTS {trigger} ON episodes')
+            op.execute(f'DROP FUNCTION IF EXISTS {trigger}()')
+        else:
+            op.execute(f'DROP TRIGGER IF EXISTS {trigger}')
+    op.drop_table('pipeline_counters')
@@ -0,0 +1,38 @@
+"""add_briefing_audio_storage_key
+
+Revision ID: e8a1c2d3f4b5
+Revises: d7f0b1c2e3a4
+Create Date: 2026-10-16 14:00:00.000000
+
+Briefing audio moves out of the daily_briefings.audio_data blob into audio
+storage (a directory or an S3 bucket). audio_storage_key locates it there and
+audio_size_bytes records its length, so serving it needs no blob read.
+Existing blobs get their size backfilled here and are moved to storage the
+first time they are played.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e8a1c2d3f4b5'
+down_revision: Union[str, None] = 'd7f0b1c2e3a4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('daily_briefings', sa.Column('audio_storage_key', sa.String(length=255), nullable=True))
+    op.add_column('daily_briefings', sa.Column('audio_size_bytes', sa.Integer(), nullable=True))
+    op.execute(
+        "UPDATE daily_briefings SET audio_size_bytes = length(audio_data) "
+        "WHERE audio_data IS NOT NULL"
+    )
+
+
+def downgrade() -> None:
+    # Audio already moved to storage is not copied back into audio_data.
+    op.drop_column('daily_briefings', 'audio_size_bytes')
+    op.drop_column('daily_briefings', 'audio_storage_key')
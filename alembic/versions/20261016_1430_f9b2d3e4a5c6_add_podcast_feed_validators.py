@@ -0,0 +1,33 @@
+"""add_podcast_feed_validators
+
+Revision ID: f9b2d3e4a5c6
+Revises: e8a1c2d3f4b5
+Create Date: 2026-10-16 14:30:00.000000
+
+Stores the ETag, Last-Modified and SHA-256 body hash of each podcast's
+last processed feed fetch. Sync sends them back as If-None-Match /
+If-Modified-Since and skips parsing when the feed is unchanged.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f9b2d3e4a5c6'
+down_revision: Union[str, None] = 'e8a1c2d3f4b5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('podcasts', sa.Column('feed_etag', sa.String(length=512), nullable=True))
+    op.add_column('podcasts', sa.Column('feed_last_modified', sa.String(length=64), nullable=True))
+    op.add_column('podcasts', sa.Column('feed_content_hash', sa.String(length=64), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('podcasts', 'feed_content_hash')
+    op.drop_column('podcasts', 'feed_last_modified')
+    op.drop_column('podcasts', 'feed_etag')
@@ -0,0 +1,31 @@
+"""add_podcast_next_check_at
+
+Revision ID: 0a3c4e5f6b7d
+Revises: f9b2d3e4a5c6
+Create Date: 2026-10-16 15:00:00.000000
+
+Adds the indexed time at which sync next checks each podcast's feed. Existing
+podcasts start with NULL, which is due, so the first pass after upgrading
+checks every feed and schedules it from its publishing cadence.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0a3c4e5f6b7d'
+down_revision: Union[str, None] = 'f9b2d3e4a5c6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('podcasts', sa.Column('next_check_at', sa.DateTime(), nullable=True))
+    op.create_index('ix_podcasts_next_check_at', 'podcasts', ['next_check_at'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_podcasts_next_check_at', table_name='podcasts')
+    op.drop_column('podcasts', 'next_check_at')
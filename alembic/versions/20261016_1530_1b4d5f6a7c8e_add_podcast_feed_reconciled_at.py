@@ -0,0 +1,29 @@
+"""add_podcast_feed_reconciled_at
+
+Revision ID: 1b4d5f6a7c8e
+Revises: 0a3c4e5f6b7d
+Create Date: 2026-10-16 15:30:00.000000
+
+Records when each podcast's feed was last parsed in full. Syncs in between
+parse only the newest items of a changed feed. Existing podcasts start with
+NULL, so their next sync is a full parse.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '1b4d5f6a7c8e'
+down_revision: Union[str, None] = '0a3c4e5f6b7d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('podcasts', sa.Column('feed_reconciled_at', sa.DateTime(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('podcasts', 'feed_reconciled_at')
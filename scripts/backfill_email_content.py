@@ -104,13 +104,13 @@ def find_episodes_missing_email_content(
     )
 
 
-def build_batch_request(episode) -> dict:
+def build_batch_request(episode, transcript: str) -> dict:
     """Build a single Batch API request for an episode."""
     prompt = EMAIL_CONTENT_PROMPT.format(
         podcast_title=episode.podcast.title if episode.podcast else "Unknown",
         episode_title=episode.title or "Unknown",
         summary=episode.ai_summary or "No summary available.",
-        transcript=episode.transcript_text[:50000],
+        transcript=transcript[:50000],
     )
 
     return {
@@ -131,7 +131,10 @@ def cmd_batch_submit(args, config):
     """Submit a batch job for episodes missing email content."""
     from google.genai import types
 
+    from src.db.factory import create_repository
+
     client = get_client(config)
+    repository = create_repository(database_url=config.DATABASE_URL)
 
     logger.info("Querying episodes missing ai_email_content...")
     episodes = find_episodes_missing_email_content(config, limit=args.limit)
@@ -148,11 +151,12 @@ def cmd_batch_submit(args, config):
     ) as f:
         jsonl_path = f.name
         for i, episode in enumerate(episodes):
-            if not episode.transcript_text:
+            transcript = repository.get_transcript_text(episode.id)
+            if not transcript:
                 skipped += 1
                 continue
 
-            request = build_batch_request(episode)
+            request = build_batch_request(episode, transcript)
             f.write(json.dumps(request) + "\n")
 
             if (i + 1) % 500 == 0:
@@ -418,7 +422,7 @@ def cmd_sequential(args, config):
             # slightly higher quality output, which is acceptable for small backfills.
             prompt = prompt_manager.build_prompt(
                 prompt_name="metadata_extraction",
-                transcript=episode.transcript_text,
+                transcript=repository.get_transcript_text(episode.id),
                 filename=episode.title,
             )
 
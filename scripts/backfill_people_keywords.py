@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""Backfill the people and keyword tables from existing episode metadata.
+
+New episodes are linked to people and keywords when their metadata is
+written. This one-shot script does the same for episodes processed before
+the tables existed, reading ai_hosts, ai_guests and ai_keywords. It is safe
+to re-run.
+
+Usage:
+    python scripts/backfill_people_keywords.py
+    python scripts/backfill_people_keywords.py --batch-size 1000
+"""
+
+import argparse
+import logging
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.config import Config
+from src.db.factory import create_repository
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(levelname)s - %(message)s",
+)
+logger = logging.getLogger(__name__)
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description="Backfill people and keyword tables from episode metadata"
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=500,
+        help="Episodes processed per transaction (default: 500)",
+    )
+    args = parser.parse_args()
+
+    config = Config()
+    repository = create_repository(database_url=config.DATABASE_URL)
+
+    try:
+        processed = repository.backfill_episode_tags(batch_size=args.batch_size)
+        logger.info(f"Backfill complete: {processed} episodes processed")
+    finally:
+        repository.close()
+
+
+if __name__ == "__main__":
+    main()
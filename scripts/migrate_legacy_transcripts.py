@@ -3,7 +3,7 @@
 
 This script matches transcript files in /opt/podcasts to episodes in the database
 using fuzzy matching on podcast and episode titles, then imports the transcript
-content into the transcript_text column.
+content into the database transcript store.
 
 Usage:
     python scripts/migrate_legacy_transcripts.py                    # Run migration
@@ -291,11 +291,10 @@ def migrate_legacy_transcripts(
 
         # Get episodes for this podcast
         with repository._get_session() as session:
-            stmt = select(Episode).where(Episode.podcast_id == podcast_id)
-            episodes = [
-                (e.title, e.id, e.transcript_text is not None)
-                for e in session.scalars(stmt).all()
-            ]
+            stmt = select(Episode.title, Episode.id, Episode.transcript.has()).where(
+                Episode.podcast_id == podcast_id
+            )
+            episodes = [tuple(row) for row in session.execute(stmt).all()]
 
         # Build episode lookup for fast matching
         normalized_lookup, episodes_for_fuzzy = build_episode_lookup(episodes)
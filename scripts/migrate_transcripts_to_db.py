@@ -82,18 +82,18 @@ def migrate_transcripts(
     Returns:
         Tuple of (migrated_count, skipped_count, error_count).
     """
-    # Query episodes with transcript_path set but no transcript_text
+    # Query episodes with transcript_path set but no stored transcript
     # Using raw query for efficiency
     with repository._get_session() as session:
         from sqlalchemy import select
         from src.db.models import Episode
 
-        # Find episodes with transcript_path but no transcript_text
+        # Find episodes with transcript_path but no stored transcript
         stmt = (
             select(Episode)
             .where(
                 Episode.transcript_path.isnot(None),
-                Episode.transcript_text.is_(None),
+                ~Episode.transcript.has(),
             )
             .order_by(Episode.published_date.desc())
         )
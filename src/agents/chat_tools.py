@@ -56,6 +56,8 @@ def _extract_citations_from_response(
     if not hasattr(grounding, 'grounding_chunks') or not grounding.grounding_chunks:
         return citations
 
+    # Collect unique sources first so they can be resolved in one query
+    sources = []
     for chunk in grounding.grounding_chunks:
         if not hasattr(chunk, 'retrieved_context'):
             continue
@@ -68,53 +70,50 @@ def _extract_citations_from_response(
         if title in seen_titles:
             continue
         seen_titles.add(title)
+        sources.append((title, text))
 
-        # Get metadata from database, including IDs for internal linking
+    if not sources:
+        return citations
+
+    # Get metadata from database, including IDs for internal linking
+    titles = [title for title, _ in sources]
+    try:
+        if source_type == "transcript":
+            matches = repository.get_episodes_by_file_search_display_names(titles)
+        else:
+            matches = repository.get_podcasts_by_description_display_names(titles)
+    except Exception as e:
+        logger.warning(f"Database lookup failed for {source_type} citations: {e!s}")
+        return citations
+
+    for title, text in sources:
         # Skip citations that don't match the expected source type (this filters
         # out non-transcript results when searching globally without type filter)
-        metadata = {}
-        podcast_id = None
-        episode_id = None
+        match = matches.get(title)
+        if match is None:
+            logger.debug(f"Skipping citation '{title}' - not found as {source_type}")
+            continue
 
         if source_type == "transcript":
-            try:
-                episode = repository.get_episode_by_file_search_display_name(title)
-            except Exception as e:
-                logger.warning(f"Database lookup failed for transcript '{title}': {e!s}")
-                continue
-
-            if episode:
-                episode_id = str(episode.id)
-                podcast_id = str(episode.podcast.id) if episode.podcast else None
-                metadata = {
-                    'podcast': episode.podcast.title if episode.podcast else '',
-                    'episode': episode.title or '',
-                    'release_date': episode.published_date.strftime('%Y-%m-%d') if episode.published_date else '',
-                    'hosts': episode.ai_hosts or ''
-                }
-            else:
-                # Not a transcript - skip this citation
-                logger.debug(f"Skipping citation '{title}' - not found as transcript")
-                continue
-        elif source_type == "description":
-            try:
-                podcast = repository.get_podcast_by_description_display_name(title)
-            except Exception as e:
-                logger.warning(f"Database lookup failed for description '{title}': {e!s}")
-                continue
-
-            if podcast:
-                podcast_id = str(podcast.id)
-                metadata = {
-                    'podcast': podcast.title or '',
-                    'author': podcast.itunes_author or podcast.author or '',
-                    'description': podcast.description or '',
-                    'image_url': podcast.image_url or '',
-                }
-            else:
-                # Not a description - skip this citation
-                logger.debug(f"Skipping citation '{title}' - not found as description")
-                continue
+            episode = match
+            episode_id = str(episode.id)
+            podcast_id = str(episode.podcast.id) if episode.podcast else None
+            metadata = {
+                'podcast': episode.podcast.title if episode.podcast else '',
+                'episode': episode.title or '',
+                'release_date': episode.published_date.strftime('%Y-%m-%d') if episode.published_date else '',
+                'hosts': episode.ai_hosts or ''
+            }
+        else:
+            podcast = match
+            episode_id = None
+            podcast_id = str(podcast.id)
+            metadata = {
+                'podcast': podcast.title or '',
+                'author': podcast.itunes_author or podcast.author or '',
+                'description': podcast.description or '',
+                'image_url': podcast.image_url or '',
+            }
 
         citations.append({
             'index': len(citations) + 1,
@@ -482,6 +482,8 @@ def extract_citations(
     if not hasattr(grounding, 'grounding_chunks') or not grounding.grounding_chunks:
         return citations
 
+    # Collect unique sources first so they can be resolved in one query
+    sources = []
     for chunk in grounding.grounding_chunks:
         if not hasattr(chunk, 'retrieved_context'):
             continue
@@ -494,10 +496,19 @@ def extract_citations(
         if title in seen_titles:
             continue
         seen_titles.add(title)
+        sources.append((title, text))
 
-        # Try to get metadata from the database
+    if not sources:
+        return citations
+
+    # Try to get metadata from the database
+    episodes = repository.get_episodes_by_file_search_display_names(
+        [title for title, _ in sources]
+    )
+
+    for title, text in sources:
         metadata = {}
-        episode = repository.get_episode_by_file_search_display_name(title)
+        episode = episodes.get(title)
         if episode:
             metadata = {
                 'podcast': episode.podcast.title if episode.podcast else '',
@@ -134,6 +134,13 @@ def sync_feeds(args, config: Config):
         sync_service = FeedSyncService(
             repository=repository,
             download_directory=config.PODCAST_DOWNLOAD_DIRECTORY,
+            max_concurrent=config.FEED_SYNC_MAX_CONCURRENT,
+            max_per_host=config.FEED_SYNC_MAX_PER_HOST,
+            parse_workers=config.FEED_SYNC_PARSE_WORKERS,
+            min_check_interval_minutes=config.FEED_SYNC_MIN_INTERVAL_MINUTES,
+            max_check_interval_hours=config.FEED_SYNC_MAX_INTERVAL_HOURS,
+            stop_after_known=config.FEED_SYNC_STOP_AFTER_KNOWN,
+            reconcile_interval_hours=config.FEED_SYNC_RECONCILE_HOURS,
         )
 
         if args.podcast_id:
@@ -156,6 +163,16 @@ def sync_feeds(args, config: Config):
             print(f"  Podcasts failed: {result['failed']}")
             print(f"  New episodes: {result['new_episodes']}")
 
+            timed = [r for r in result.get("results", []) if r.get("fetch_seconds") is not None]
+            if timed:
+                timed.sort(
+                    key=lambda r: r["fetch_seconds"] + (r["parse_seconds"] or 0),
+                    reverse=True,
+                )
+                print("\nSlowest feeds (fetch / parse seconds):")
+                for r in timed[:5]:
+                    print(f"  {r['podcast_id']}: {r['fetch_seconds']:.2f} / {r['parse_seconds'] or 0:.2f}")
+
     finally:
         repository.close()
 
@@ -178,6 +195,7 @@ def download_episodes(args, config: Config):
         pool_size=config.DB_POOL_SIZE,
         max_overflow=config.DB_MAX_OVERFLOW,
         echo=config.DB_ECHO,
+        cache=config.REPOSITORY_CACHE,
     )
 
     downloader = None
@@ -383,6 +401,7 @@ def run_pipeline(args, config: Config):
         pool_size=config.DB_POOL_SIZE,
         max_overflow=config.DB_MAX_OVERFLOW,
         echo=config.DB_ECHO,
+        cache=config.REPOSITORY_CACHE,
     )
 
     try:
@@ -89,6 +89,14 @@ class Config:
             raise ValueError(
                 f"BRIEFING_AUDIO_RETENTION_DAYS must be non-negative, got {self.BRIEFING_AUDIO_RETENTION_DAYS}"
             )
+        # Where generated briefing audio is stored: "local" (directory) or "s3"
+        self.BRIEFING_AUDIO_STORAGE = os.getenv("BRIEFING_AUDIO_STORAGE", "local").lower()
+        self.BRIEFING_AUDIO_DIRECTORY = os.getenv(
+            "BRIEFING_AUDIO_DIRECTORY", "./briefing_audio"
+        )
+        self.BRIEFING_AUDIO_S3_BUCKET = os.getenv("BRIEFING_AUDIO_S3_BUCKET", "")
+        self.BRIEFING_AUDIO_S3_PREFIX = os.getenv("BRIEFING_AUDIO_S3_PREFIX", "")
+        self.BRIEFING_AUDIO_S3_ENDPOINT_URL = os.getenv("BRIEFING_AUDIO_S3_ENDPOINT_URL", "")
         # Gemini File Search configuration
         self.GEMINI_FILE_SEARCH_STORE_NAME = os.getenv("GEMINI_FILE_SEARCH_STORE_NAME", "podcast-transcripts")
 
@@ -158,6 +166,20 @@ class Config:
         self.DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "2"))
         self.DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() == "true"
         self.DB_ECHO = os.getenv("DB_ECHO", "false").lower() == "true"
+        # Serve the web app's read paths from the asyncio repository (asyncpg/aiosqlite)
+        self.WEB_ASYNC_DB = os.getenv("WEB_ASYNC_DB", "false").lower() == "true"
+        # Cache podcast, user and subscription lookups in front of the repository
+        self.REPOSITORY_CACHE = os.getenv("REPOSITORY_CACHE", "false").lower() == "true"
+        # Read replicas for the web app's read paths (comma-separated database URLs)
+        self.DATABASE_REPLICA_URLS = [
+            url.strip()
+            for url in os.getenv("DATABASE_REPLICA_URLS", "").split(",")
+            if url.strip()
+        ]
+        # After a client writes, its reads go to the primary for this many seconds
+        self.DB_READ_YOUR_WRITES_SECONDS = float(
+            os.getenv("DB_READ_YOUR_WRITES_SECONDS", "10")
+        )
 
         # Podcast download configuration
         self.PODCAST_MAX_CONCURRENT_DOWNLOADS = int(
@@ -173,6 +195,32 @@ class Config:
             os.getenv("PODCAST_CHUNK_SIZE", "8192")
         )
 
+        # Feed sync configuration
+        self.FEED_SYNC_MAX_CONCURRENT = int(os.getenv("FEED_SYNC_MAX_CONCURRENT", "20"))
+        self.FEED_SYNC_MAX_PER_HOST = int(os.getenv("FEED_SYNC_MAX_PER_HOST", "4"))
+        self.FEED_SYNC_PARSE_WORKERS = int(os.getenv("FEED_SYNC_PARSE_WORKERS", "4"))
+        # Bounds on the adaptive per-feed polling interval
+        self.FEED_SYNC_MIN_INTERVAL_MINUTES = int(os.getenv("FEED_SYNC_MIN_INTERVAL_MINUTES", "30"))
+        self.FEED_SYNC_MAX_INTERVAL_HOURS = int(os.getenv("FEED_SYNC_MAX_INTERVAL_HOURS", "168"))
+        # Incremental parsing of already-imported feeds
+        self.FEED_SYNC_STOP_AFTER_KNOWN = int(os.getenv("FEED_SYNC_STOP_AFTER_KNOWN", "20"))
+        self.FEED_SYNC_RECONCILE_HOURS = int(os.getenv("FEED_SYNC_RECONCILE_HOURS", "168"))
+        for name in (
+            "FEED_SYNC_MAX_CONCURRENT",
+            "FEED_SYNC_MAX_PER_HOST",
+            "FEED_SYNC_PARSE_WORKERS",
+            "FEED_SYNC_MIN_INTERVAL_MINUTES",
+            "FEED_SYNC_MAX_INTERVAL_HOURS",
+            "FEED_SYNC_STOP_AFTER_KNOWN",
+            "FEED_SYNC_RECONCILE_HOURS",
+        ):
+            if getattr(self, name) <= 0:
+                raise ValueError(f"{name} must be positive, got {getattr(self, name)}")
+        if self.FEED_SYNC_MIN_INTERVAL_MINUTES > self.FEED_SYNC_MAX_INTERVAL_HOURS * 60:
+            raise ValueError(
+                "FEED_SYNC_MIN_INTERVAL_MINUTES must not exceed FEED_SYNC_MAX_INTERVAL_HOURS"
+            )
+
     def load_config(self):
         """
         Prints selected configuration values useful for debugging.
@@ -0,0 +1,634 @@
+"""Native asyncio repository for the web tier.
+
+Implements the read paths the FastAPI app uses on top of
+``sqlalchemy.ext.asyncio`` (asyncpg on PostgreSQL, aiosqlite on SQLite), so
+request handlers await the database directly instead of hopping onto the
+default thread pool with ``asyncio.to_thread``. Writes stay on the
+synchronous SQLAlchemyPodcastRepository.
+
+Queries and eager-loading options mirror the synchronous repository, so
+handlers see identically populated (detached) ORM objects from either one.
+"""
+
+import logging
+from datetime import date, datetime
+from typing import Any
+
+from sqlalchemy import func, select
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import defer, joinedload
+
+from . import fulltext
+from .models import (
+    ChatMessage,
+    Conversation,
+    DailyBriefing,
+    Episode,
+    EpisodePerson,
+    Person,
+    Podcast,
+    User,
+    UserSubscription,
+)
+from .pagination import fetch_page_async
+from .repository import _normalize_tag
+
+logger = logging.getLogger(__name__)
+
+# Synchronous driver name -> asyncio driver name
+_ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgres": "postgresql+asyncpg",
+    "postgresql": "postgresql+asyncpg",
+    "postgresql+psycopg2": "postgresql+asyncpg",
+}
+
+
+def to_async_database_url(database_url: str) -> tuple[str, dict[str, Any]]:
+    """
+    Convert a synchronous database URL to its asyncio-driver equivalent.
+
+    asyncpg does not understand libpq's ``sslmode`` query parameter, so it is
+    moved into the returned connect arguments.
+
+    Args:
+        database_url: SQLAlchemy URL as used by the synchronous repository.
+
+    Returns:
+        tuple[str, dict]: Async database URL and extra ``connect_args`` for the engine.
+
+    Raises:
+        ValueError: If the database backend has no supported asyncio driver.
+    """
+    url = make_url(database_url)
+    if url.drivername not in _ASYNC_DRIVERS:
+        if url.drivername in _ASYNC_DRIVERS.values():
+            return database_url, {}
+        raise ValueError(f"No asyncio driver configured for {url.drivername}")
+
+    url = url.set(drivername=_ASYNC_DRIVERS[url.drivername])
+    connect_args: dict[str, Any] = {}
+    if url.get_backend_name() == "postgresql":
+        query = dict(url.query)
+        sslmode = query.pop("sslmode", None)
+        if sslmode:
+            connect_args["ssl"] = sslmode
+        url = url.set(query=query)
+    return url.render_as_string(hide_password=False), connect_args
+
+
+def _order_podcasts(stmt, sort_by: str, sort_order: str):
+    """Apply the podcast list sort order used by list_podcasts() and get_user_subscriptions()."""
+    if sort_by == "recency":
+        order_col = Podcast.last_new_episode
+    elif sort_by == "subscribers":
+        order_col = (
+            select(func.count(UserSubscription.user_id))
+            .where(UserSubscription.podcast_id == Podcast.id)
+            .correlate(Podcast)
+            .scalar_subquery()
+        )
+    else:
+        # Alphabetical, also the fallback for invalid sort_by
+        order_col = Podcast.title
+
+    ordered = order_col.desc() if sort_order == "desc" else order_col.asc()
+    # For recency, place nulls last regardless of direction
+    if sort_by == "recency":
+        ordered = ordered.nullslast()
+    return stmt.order_by(ordered)
+
+
+class AsyncSQLAlchemyPodcastRepository:
+    """Read-only asyncio counterpart of SQLAlchemyPodcastRepository.
+
+    Method names, arguments and return values match the synchronous
+    repository, so the web layer can dispatch a read to either one.
+    """
+
+    def __init__(
+        self,
+        database_url: str,
+        pool_size: int = 3,  # Supabase-optimized
+        max_overflow: int = 2,  # Supabase-optimized
+        echo: bool = False,
+        pool_pre_ping: bool = True,  # Detect stale connections
+        pool_recycle: int = 1800,  # Recycle connections after 30 minutes
+    ):
+        """
+        Initialize the async engine and session factory.
+
+        Parameters:
+            database_url (str): Synchronous SQLAlchemy URL; converted to the asyncpg/aiosqlite driver.
+            pool_size (int): Connection pool size for PostgreSQL; ignored for SQLite.
+            max_overflow (int): Maximum overflow connections for PostgreSQL; ignored for SQLite.
+            echo (bool): If true, enable SQLAlchemy SQL statement logging.
+            pool_pre_ping (bool): If true, test connections for liveness before using them.
+            pool_recycle (int): Seconds after which to recycle connections.
+        """
+        self.database_url, connect_args = to_async_database_url(database_url)
+
+        if self.database_url.startswith("sqlite"):
+            self.engine = create_async_engine(self.database_url, echo=echo)
+        else:
+            # pgbouncer (Supabase pooler) in transaction mode cannot keep
+            # asyncpg's per-connection prepared statements
+            if "pooler.supabase" in database_url:
+                connect_args["statement_cache_size"] = 0
+            self.engine = create_async_engine(
+                self.database_url,
+                pool_size=pool_size,
+                max_overflow=max_overflow,
+                pool_pre_ping=pool_pre_ping,
+                pool_recycle=pool_recycle,
+                echo=echo,
+                connect_args=connect_args,
+            )
+
+        self.SessionLocal = async_sessionmaker(bind=self.engine, expire_on_commit=False)
+
+        logger.info(f"Async database initialized: {self.engine.url.render_as_string()}")
+
+    def _get_session(self) -> AsyncSession:
+        """Obtain a new AsyncSession bound to the repository's engine."""
+        return self.SessionLocal()
+
+    # --- Podcast Operations ---
+
+    async def get_podcast(self, podcast_id: str) -> Podcast | None:
+        """Retrieve a podcast by its primary key."""
+        async with self._get_session() as session:
+            return await session.get(Podcast, podcast_id)
+
+    async def get_podcast_by_feed_url(self, feed_url: str) -> Podcast | None:
+        """Find the podcast with the given RSS/Atom feed URL."""
+        async with self._get_session() as session:
+            return await session.scalar(select(Podcast).where(Podcast.feed_url == feed_url))
+
+    async def list_podcasts(
+        self,
+        limit: int | None = None,
+        sort_by: str = "recency",
+        sort_order: str = "desc",
+    ) -> list[Podcast]:
+        """List all podcasts with configurable sorting."""
+        stmt = _order_podcasts(select(Podcast), sort_by, sort_order)
+        if limit:
+            stmt = stmt.limit(limit)
+        async with self._get_session() as session:
+            return list((await session.scalars(stmt)).all())
+
+    async def get_podcast_episode_counts(self, podcast_ids: list[str]) -> dict[str, int]:
+        """Get episode counts for multiple podcasts in a single GROUP BY query."""
+        if not podcast_ids:
+            return {}
+        stmt = (
+            select(Episode.podcast_id, func.count(Episode.id))
+            .where(Episode.podcast_id.in_(podcast_ids))
+            .group_by(Episode.podcast_id)
+        )
+        async with self._get_session() as session:
+            counts = {str(pid): count for pid, count in (await session.execute(stmt)).all()}
+        return {pid: counts.get(pid, 0) for pid in podcast_ids}
+
+    async def get_podcast_subscriber_counts(self, podcast_ids: list[str]) -> dict[str, int]:
+        """Get subscriber counts for multiple podcasts in a single GROUP BY query."""
+        if not podcast_ids:
+            return {}
+        stmt = (
+            select(UserSubscription.podcast_id, func.count(UserSubscription.user_id))
+            .where(UserSubscription.podcast_id.in_(podcast_ids))
+            .group_by(UserSubscription.podcast_id)
+        )
+        async with self._get_session() as session:
+            counts = {str(pid): count for pid, count in (await session.execute(stmt)).all()}
+        return {pid: counts.get(pid, 0) for pid in podcast_ids}
+
+    # --- Episode Operations ---
+
+    async def get_episode(self, episode_id: str) -> Episode | None:
+        """Retrieve an episode (with its podcast) by ID."""
+        stmt = (
+            select(Episode)
+            .options(joinedload(Episode.podcast))
+            .where(Episode.id == episode_id)
+        )
+        async with self._get_session() as session:
+            return (await session.scalars(stmt)).unique().first()
+
+    async def list_episodes(
+        self,
+        podcast_id: str | None = None,
+        download_status: str | None = None,
+        transcript_status: str | None = None,
+        metadata_status: str | None = None,
+        file_search_status: str | None = None,
+        limit: int | None = None,
+        offset: int = 0,
+    ) -> list[Episode]:
+        """Retrieve episodes filtered by podcast and statuses, newest first."""
+        stmt = select(Episode).options(joinedload(Episode.podcast))
+        stmt = self._filter_episodes(
+            stmt, podcast_id, download_status, transcript_status,
+            metadata_status, file_search_status,
+        )
+        stmt = stmt.order_by(Episode.published_date.desc()).offset(offset)
+        if limit:
+            stmt = stmt.limit(limit)
+        async with self._get_session() as session:
+            return list((await session.scalars(stmt)).unique().all())
+
+    async def list_episodes_page(
+        self,
+        podcast_id: str | None = None,
+        download_status: str | None = None,
+        transcript_status: str | None = None,
+        metadata_status: str | None = None,
+        file_search_status: str | None = None,
+        limit: int = 50,
+        cursor: str | None = None,
+    ) -> tuple[list[Episode], str | None]:
+        """List one page of filtered episodes, newest first, by keyset."""
+        stmt = select(Episode).options(joinedload(Episode.podcast))
+        stmt = self._filter_episodes(
+            stmt, podcast_id, download_status, transcript_status,
+            metadata_status, file_search_status,
+        )
+        async with self._get_session() as session:
+            return await fetch_page_async(
+                session, stmt, Episode.published_date, Episode.id, limit, cursor
+            )
+
+    async def count_episodes(
+        self,
+        podcast_id: str | None = None,
+        download_status: str | None = None,
+        transcript_status: str | None = None,
+        metadata_status: str | None = None,
+        file_search_status: str | None = None,
+    ) -> int:
+        """Count episodes matching the given filters."""
+        stmt = self._filter_episodes(
+            select(func.count(Episode.id)), podcast_id, download_status,
+            transcript_status, metadata_status, file_search_status,
+        )
+        async with self._get_session() as session:
+            return await session.scalar(stmt) or 0
+
+    @staticmethod
+    def _filter_episodes(
+        stmt,
+        podcast_id: str | None,
+        download_status: str | None,
+        transcript_status: str | None,
+        metadata_status: str | None,
+        file_search_status: str | None,
+    ):
+        """Apply the optional podcast and status filters shared by list_episodes() and count_episodes()."""
+        if podcast_id:
+            stmt = stmt.where(Episode.podcast_id == podcast_id)
+        if download_status:
+            stmt = stmt.where(Episode.download_status == download_status)
+        if transcript_status:
+            stmt = stmt.where(Episode.transcript_status == transcript_status)
+        if metadata_status:
+            stmt = stmt.where(Episode.metadata_status == metadata_status)
+        if file_search_status:
+            stmt = stmt.where(Episode.file_search_status == file_search_status)
+        return stmt
+
+    async def search_episodes_by_person(self, name: str, limit: int = 50) -> list[Episode]:
+        """Search for episodes featuring the specified person as host or guest."""
+        matching = (
+            select(EpisodePerson.episode_id)
+            .join(Person, Person.id == EpisodePerson.person_id)
+            .where(Person.name == _normalize_tag(name))
+        )
+        stmt = (
+            select(Episode)
+            .options(joinedload(Episode.podcast))
+            .where(Episode.id.in_(matching))
+            .order_by(Episode.published_date.desc())
+            .limit(limit)
+        )
+        async with self._get_session() as session:
+            return list((await session.scalars(stmt)).unique().all())
+
+    async def search_episodes_fulltext(
+        self,
+        query: str,
+        podcast_ids: list[str] | None = None,
+        limit: int = 50,
+        cursor: str | None = None,
+    ) -> tuple[list[Episode], str | None]:
+        """
+        Search transcripts, titles, summaries, keywords, hosts and guests with the full-text index.
+
+        Raises:
+            ValueError: If the cursor is malformed.
+        """
+        try:
+            offset = int(cursor) if cursor else 0
+        except ValueError:
+            raise ValueError(f"Invalid cursor: {cursor}") from None
+        if offset < 0:
+            raise ValueError(f"Invalid cursor: {cursor}")
+
+        async with self._get_session() as session:
+            # Fetch one extra hit to learn whether there is a next page
+            hits = await session.run_sync(
+                lambda sync_session: fulltext.search(
+                    sync_session, query, podcast_ids=podcast_ids,
+                    limit=limit + 1, offset=offset,
+                )
+            )
+            has_more = len(hits) > limit
+            ids = [episode_id for episode_id, _ in hits[:limit]]
+            if not ids:
+                return [], None
+
+            stmt = (
+                select(Episode)
+                .options(joinedload(Episode.podcast))
+                .where(Episode.id.in_(ids))
+            )
+            by_id = {ep.id: ep for ep in (await session.scalars(stmt)).unique().all()}
+            episodes = [by_id[episode_id] for episode_id in ids if episode_id in by_id]
+
+        next_cursor = str(offset + len(ids)) if has_more else None
+        return episodes, next_cursor
+
+    async def get_recent_processed_episodes(self, limit: int = 5) -> list[Episode]:
+        """Get the most recently published fully-processed episodes."""
+        stmt = (
+            select(Episode)
+            .options(joinedload(Episode.podcast))
+            .where(
+                Episode.ai_summary.isnot(None),
+                Episode.metadata_status == "completed",
+            )
+            .order_by(Episode.published_date.desc())
+            .limit(limit)
+        )
+        async with self._get_session() as session:
+            return list((await session.scalars(stmt)).unique().all())
+
+    # --- User Operations ---
+
+    async def get_user(self, user_id: str) -> User | None:
+        """Get a user by ID."""
+        async with self._get_session() as session:
+            return await session.get(User, user_id)
+
+    async def get_user_by_google_id(self, google_id: str) -> User | None:
+        """Get a user by their Google ID."""
+        async with self._get_session() as session:
+            return await session.scalar(select(User).where(User.google_id == google_id))
+
+    async def list_users(
+        self,
+        is_admin: bool | None = None,
+        is_active: bool | None = None,
+        limit: int | None = None,
+        offset: int = 0,
+    ) -> list[User]:
+        """List users with optional filtering, newest first."""
+        stmt = select(User)
+        if is_admin is not None:
+            stmt = stmt.where(User.is_admin == is_admin)
+        if is_active is not None:
+            stmt = stmt.where(User.is_active == is_active)
+        stmt = stmt.order_by(User.created_at.desc()).offset(offset)
+        if limit:
+            stmt = stmt.limit(limit)
+        async with self._get_session() as session:
+            return list((await session.scalars(stmt)).all())
+
+    async def get_user_count(self, is_admin: bool | None = None) -> int:
+        """Get total count of users with optional filtering."""
+        stmt = select(func.count(User.id))
+        if is_admin is not None:
+            stmt = stmt.where(User.is_admin == is_admin)
+        async with self._get_session() as session:
+            return await session.scalar(stmt) or 0
+
+    # --- Subscription Operations ---
+
+    async def get_user_subscriptions(
+        self,
+        user_id: str,
+        sort_by: str = "recency",
+        sort_order: str = "desc",
+    ) -> list[Podcast]:
+        """Get all podcasts a user is subscribed to."""
+        stmt = (
+            select(Podcast)
+            .join(UserSubscription, Podcast.id == UserSubscription.podcast_id)
+            .where(UserSubscription.user_id == user_id)
+        )
+        stmt = _order_podcasts(stmt, sort_by, sort_order)
+        async with self._get_session() as session:
+            return list((await session.scalars(stmt)).all())
+
+    async def is_user_subscribed(self, user_id: str, podcast_id: str) -> bool:
+        """Check if a user is subscribed to a podcast."""
+        stmt = select(UserSubscription.user_id).where(
+            UserSubscription.user_id == user_id,
+            UserSubscription.podcast_id == podcast_id,
+        )
+        async with self._get_session() as session:
+            return (await session.execute(stmt)).first() is not None
+
+    async def get_new_episodes_for_user_since(
+        self, user_id: str, since: datetime, limit: int = 50
+    ) -> list[Episode]:
+        """Get new fully-processed episodes for a user's subscriptions published since a date."""
+        stmt = (
+            select(Episode)
+            .options(joinedload(Episode.podcast))
+            .join(UserSubscription, Episode.podcast_id == UserSubscription.podcast_id)
+            .where(
+                UserSubscription.user_id == user_id,
+                Episode.published_date > since,
+                Episode.ai_summary.isnot(None),
+                Episode.metadata_status == "completed",
+            )
+            .order_by(Episode.published_date.desc())
+            .limit(limit)
+        )
+        async with self._get_session() as session:
+            return list((await session.scalars(stmt)).unique().all())
+
+    # --- Feed and Briefing Operations ---
+
+    async def get_feed_episodes_in_range(
+        self, user_id: str, start_date: datetime, end_date: datetime
+    ) -> list[Episode]:
+        """Get fully-processed episodes from subscribed podcasts in a date range."""
+        stmt = (
+            select(Episode)
+            .options(joinedload(Episode.podcast))
+            .join(UserSubscription, Episode.podcast_id == UserSubscription.podcast_id)
+            .where(
+                UserSubscription.user_id == user_id,
+                Episode.published_date >= start_date,
+                Episode.published_date < end_date,
+                Episode.ai_summary.isnot(None),
+                Episode.metadata_status == "completed",
+            )
+            .order_by(Episode.published_date.desc())
+        )
+        async with self._get_session() as session:
+            return list((await session.scalars(stmt)).unique().all())
+
+    async def get_daily_briefings_in_range(
+        self, user_id: str, start_date: date, end_date: date
+    ) -> list[DailyBriefing]:
+        """Get a user's briefings within a date range, without their audio blobs."""
+        stmt = (
+            select(DailyBriefing)
+            .options(defer(DailyBriefing.audio_data))
+            .where(
+                DailyBriefing.user_id == user_id,
+                DailyBriefing.briefing_date >= start_date,
+                DailyBriefing.briefing_date < end_date,
+            )
+            .order_by(DailyBriefing.briefing_date.desc())
+        )
+        async with self._get_session() as session:
+            return list((await session.scalars(stmt)).all())
+
+    async def has_feed_episodes_before(self, user_id: str, before: datetime) -> bool:
+        """Check if any fully-processed episodes exist before the given UTC datetime."""
+        stmt = (
+            select(Episode.id)
+            .join(UserSubscription, Episode.podcast_id == UserSubscription.podcast_id)
+            .where(
+                UserSubscription.user_id == user_id,
+                Episode.published_date < before,
+                Episode.ai_summary.isnot(None),
+                Episode.metadata_status == "completed",
+            )
+            .limit(1)
+        )
+        async with self._get_session() as session:
+            return (await session.execute(stmt)).first() is not None
+
+    async def has_daily_briefings_before(self, user_id: str, before: date) -> bool:
+        """Check if any daily briefings exist before the given date."""
+        stmt = (
+            select(DailyBriefing.id)
+            .where(
+                DailyBriefing.user_id == user_id,
+                DailyBriefing.briefing_date < before,
+            )
+            .limit(1)
+        )
+        async with self._get_session() as session:
+            return (await session.execute(stmt)).first() is not None
+
+    async def get_briefing_by_id(self, briefing_id: str) -> DailyBriefing | None:
+        """Fetch a single briefing by ID (audio_data deferred, not loaded)."""
+        async with self._get_session() as session:
+            return await session.get(
+                DailyBriefing, briefing_id, options=[defer(DailyBriefing.audio_data)]
+            )
+
+    # --- Conversation Operations ---
+
+    async def get_conversation(self, conversation_id: str) -> Conversation | None:
+        """Get a conversation by ID with its messages and related entities."""
+        stmt = (
+            select(Conversation)
+            .options(
+                joinedload(Conversation.messages),
+                joinedload(Conversation.podcast),
+                joinedload(Conversation.episode),
+            )
+            .where(Conversation.id == conversation_id)
+        )
+        async with self._get_session() as session:
+            return (await session.scalars(stmt)).unique().first()
+
+    async def list_conversations(
+        self, user_id: str, limit: int = 50, offset: int = 0
+    ) -> list[Conversation]:
+        """List conversations for a user, most recent first."""
+        stmt = (
+            select(Conversation)
+            .options(
+                joinedload(Conversation.podcast),
+                joinedload(Conversation.episode),
+            )
+            .where(Conversation.user_id == user_id)
+            .order_by(Conversation.updated_at.desc())
+            .offset(offset)
+            .limit(limit)
+        )
+        async with self._get_session() as session:
+            return list((await session.scalars(stmt)).unique().all())
+
+    async def list_conversations_page(
+        self, user_id: str, limit: int = 50, cursor: str | None = None
+    ) -> tuple[list[Conversation], str | None]:
+        """List one page of a user's conversations, most recent first, by keyset."""
+        stmt = (
+            select(Conversation)
+            .options(
+                joinedload(Conversation.podcast),
+                joinedload(Conversation.episode),
+            )
+            .where(Conversation.user_id == user_id)
+        )
+        async with self._get_session() as session:
+            return await fetch_page_async(
+                session, stmt, Conversation.updated_at, Conversation.id, limit, cursor
+            )
+
+    async def get_messages(
+        self, conversation_id: str, limit: int = 100, offset: int = 0
+    ) -> list[ChatMessage]:
+        """Get messages for a conversation, ordered by creation time."""
+        stmt = (
+            select(ChatMessage)
+            .where(ChatMessage.conversation_id == conversation_id)
+            .order_by(ChatMessage.created_at.asc())
+            .offset(offset)
+            .limit(limit)
+        )
+        async with self._get_session() as session:
+            return list((await session.scalars(stmt)).all())
+
+    async def get_messages_page(
+        self, conversation_id: str, limit: int = 100, cursor: str | None = None
+    ) -> tuple[list[ChatMessage], str | None]:
+        """Get one page of a conversation's messages, oldest first, by keyset."""
+        stmt = select(ChatMessage).where(ChatMessage.conversation_id == conversation_id)
+        async with self._get_session() as session:
+            return await fetch_page_async(
+                session,
+                stmt,
+                ChatMessage.created_at,
+                ChatMessage.id,
+                limit,
+                cursor,
+                descending=False,
+            )
+
+    async def count_conversations(self, user_id: str) -> int:
+        """Count total conversations for a user."""
+        stmt = (
+            select(func.count())
+            .select_from(Conversation)
+            .where(Conversation.user_id == user_id)
+        )
+        async with self._get_session() as session:
+            return await session.scalar(stmt) or 0
+
+    # --- Connection Management ---
+
+    async def close(self) -> None:
+        """Dispose the async engine and release its pooled connections."""
+        await self.engine.dispose()
+        logger.info("Async database connection closed")
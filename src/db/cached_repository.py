@@ -0,0 +1,351 @@
+"""Read-through cache in front of a podcast repository.
+
+Podcasts, users and subscription checks are read many times per request and
+across requests (scope context on every chat turn, the admin check on every
+admin call, the podcast of every downloaded episode). CachingPodcastRepository
+wraps any PodcastRepositoryInterface, answers those lookups from bounded
+in-process caches, and delegates everything else unchanged.
+
+Entries are dropped when this process writes the entity through the wrapper.
+Writes made by other processes are picked up when entries expire, so TTLs
+bound how stale another process's change can appear. Cached ORM objects are
+shared between callers and must be treated as read-only.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any
+
+from .models import Podcast, User
+from .repository import PodcastRepositoryInterface
+
+# Defaults for the per-entity caches: (max entries, seconds to live)
+DEFAULT_PODCAST_CACHE = (1024, 300.0)
+DEFAULT_USER_CACHE = (1024, 60.0)
+DEFAULT_SUBSCRIPTION_CACHE = (4096, 60.0)
+
+_MISSING = object()
+
+
+class TTLCache:
+    """Thread-safe LRU mapping whose entries expire a fixed time after being set.
+
+    Counts hits and misses for reporting via stats().
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl: float,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            maxsize: Maximum number of entries; the least recently used is evicted beyond it.
+            ttl: Seconds an entry stays valid after it is set.
+            clock: Monotonic time source (injectable for tests).
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._clock = clock
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        # Bumped by every invalidation, so a value loaded before one is not stored after it
+        self.generation = 0
+
+    def get(self, key: Hashable) -> Any:
+        """Return the cached value for key, or _MISSING if absent or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > self._clock():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._entries[key]
+            self.misses += 1
+            return _MISSING
+
+    def set(self, key: Hashable, value: Any, generation: int | None = None) -> None:
+        """Store value under key, evicting the least recently used entry if full.
+
+        If generation is given and entries were invalidated since it was read,
+        the value may be stale and is not stored.
+        """
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                return
+            self._entries[key] = (self._clock() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def discard_where(self, predicate: Callable[[Hashable, Any], bool]) -> None:
+        """Drop every entry for which predicate(key, value) is true."""
+        with self._lock:
+            self.generation += 1
+            for key in [k for k, (_, v) in self._entries.items() if predicate(k, v)]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """Drop all entries (counters are kept)."""
+        with self._lock:
+            self.generation += 1
+            self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        """Hit and miss counts and current size."""
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "size": len(self._entries)}
+
+
+class CachingPodcastRepository:
+    """PodcastRepositoryInterface decorator caching podcast, user and subscription reads.
+
+    Cached reads: get_podcast, get_podcast_by_feed_url, get_user,
+    get_user_by_google_id, get_user_by_email and is_user_subscribed. Misses
+    (None results) are not cached, except for is_user_subscribed where False
+    is a real answer. Every other method is delegated to the wrapped
+    repository; the write methods below also invalidate affected entries.
+
+    Callers that load a cached read some other way (from a read replica or
+    the asyncio repository) go through read_through_async() so they share
+    these caches.
+    """
+
+    # Cached read methods: name -> (cache attribute, key built from positional args)
+    CACHED_READS: dict[str, tuple[str, Callable[..., Hashable]]] = {
+        "get_podcast": ("_podcasts", lambda podcast_id: ("id", podcast_id)),
+        "get_podcast_by_feed_url": ("_podcasts", lambda feed_url: ("feed_url", feed_url)),
+        "get_user": ("_users", lambda user_id: ("id", user_id)),
+        "get_user_by_google_id": ("_users", lambda google_id: ("google_id", google_id)),
+        "get_user_by_email": ("_users", lambda email: ("email", email)),
+        "is_user_subscribed": ("_subscriptions", lambda user_id, podcast_id: (user_id, podcast_id)),
+    }
+
+    def __init__(
+        self,
+        repository: PodcastRepositoryInterface,
+        podcast_cache: tuple[int, float] = DEFAULT_PODCAST_CACHE,
+        user_cache: tuple[int, float] = DEFAULT_USER_CACHE,
+        subscription_cache: tuple[int, float] = DEFAULT_SUBSCRIPTION_CACHE,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            repository: Repository to wrap.
+            podcast_cache: (max entries, TTL seconds) for podcasts.
+            user_cache: (max entries, TTL seconds) for users.
+            subscription_cache: (max entries, TTL seconds) for subscription checks.
+            clock: Monotonic time source (injectable for tests).
+        """
+        self._repository = repository
+        self._podcasts = TTLCache(*podcast_cache, clock=clock)
+        self._users = TTLCache(*user_cache, clock=clock)
+        self._subscriptions = TTLCache(*subscription_cache, clock=clock)
+
+    def __getattr__(self, name: str) -> Any:
+        """Delegate everything not overridden here to the wrapped repository."""
+        return getattr(self._repository, name)
+
+    def cache_stats(self) -> dict[str, dict[str, int]]:
+        """
+        Report cache effectiveness.
+
+        Returns:
+            dict: Per-entity ("podcasts", "users", "subscriptions") hit, miss and size counts.
+        """
+        return {
+            "podcasts": self._podcasts.stats(),
+            "users": self._users.stats(),
+            "subscriptions": self._subscriptions.stats(),
+        }
+
+    def clear_cache(self) -> None:
+        """Drop every cached entry."""
+        self._podcasts.clear()
+        self._users.clear()
+        self._subscriptions.clear()
+
+    def _cache_entry(self, name: str, args: tuple) -> tuple[TTLCache, Hashable]:
+        """Return the cache and key holding the result of a cached read."""
+        attribute, make_key = self.CACHED_READS[name]
+        return getattr(self, attribute), make_key(*args)
+
+    def _read_through(self, name: str, args: tuple, load: Callable[[], Any]) -> Any:
+        """Return the cached result of a read, loading and caching it on a miss."""
+        cache, key = self._cache_entry(name, args)
+        generation = cache.generation
+        value = cache.get(key)
+        if value is _MISSING:
+            value = load()
+            if value is not None:
+                cache.set(key, value, generation)
+        return value
+
+    async def read_through_async(
+        self, name: str, args: tuple, load: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Answer a cached read from the cache, awaiting load() on a miss.
+
+        Args:
+            name: One of CACHED_READS.
+            args: The read's positional arguments.
+            load: Loads the value from wherever the caller reads it.
+
+        Returns:
+            The cached or loaded value.
+        """
+        cache, key = self._cache_entry(name, args)
+        generation = cache.generation
+        value = cache.get(key)
+        if value is _MISSING:
+            value = await load()
+            if value is not None:
+                cache.set(key, value, generation)
+        return value
+
+    # --- Podcasts ---
+
+    def get_podcast(self, podcast_id: str) -> Podcast | None:
+        """Get a podcast by ID (cached)."""
+        return self._read_through(
+            "get_podcast", (podcast_id,),
+            lambda: self._repository.get_podcast(podcast_id),
+        )
+
+    def get_podcast_by_feed_url(self, feed_url: str) -> Podcast | None:
+        """Get a podcast by feed URL (cached)."""
+        return self._read_through(
+            "get_podcast_by_feed_url", (feed_url,),
+            lambda: self._repository.get_podcast_by_feed_url(feed_url),
+        )
+
+    def _invalidate_podcast(self, podcast_id: str) -> None:
+        """Drop every cached entry for a podcast."""
+        self._podcasts.discard_where(lambda _, podcast: podcast.id == podcast_id)
+
+    def update_podcast(self, podcast_id: str, **kwargs) -> Podcast | None:
+        """Update a podcast and drop it from the cache."""
+        try:
+            return self._repository.update_podcast(podcast_id, **kwargs)
+        finally:
+            self._invalidate_podcast(podcast_id)
+
+    def delete_podcast(self, podcast_id: str, delete_files: bool = False) -> bool:
+        """Delete a podcast and drop it and its subscriptions from the cache."""
+        try:
+            return self._repository.delete_podcast(podcast_id, delete_files=delete_files)
+        finally:
+            self._invalidate_podcast(podcast_id)
+            self._subscriptions.discard_where(lambda key, _: key[1] == podcast_id)
+
+    def mark_description_indexing_started(self, podcast_id: str) -> None:
+        """Mark description indexing started and drop the podcast from the cache."""
+        try:
+            return self._repository.mark_description_indexing_started(podcast_id)
+        finally:
+            self._invalidate_podcast(podcast_id)
+
+    def mark_description_indexing_complete(
+        self, podcast_id: str, resource_name: str, display_name: str
+    ) -> None:
+        """Mark description indexing complete and drop the podcast from the cache."""
+        try:
+            return self._repository.mark_description_indexing_complete(
+                podcast_id, resource_name, display_name
+            )
+        finally:
+            self._invalidate_podcast(podcast_id)
+
+    def mark_description_indexing_failed(self, podcast_id: str, error: str) -> None:
+        """Mark description indexing failed and drop the podcast from the cache."""
+        try:
+            return self._repository.mark_description_indexing_failed(podcast_id, error)
+        finally:
+            self._invalidate_podcast(podcast_id)
+
+    def reset_all_podcast_description_indexing_status(self) -> int:
+        """Reset all description indexing statuses and clear the podcast cache."""
+        try:
+            return self._repository.reset_all_podcast_description_indexing_status()
+        finally:
+            self._podcasts.clear()
+
+    # --- Users ---
+
+    def get_user(self, user_id: str) -> User | None:
+        """Get a user by ID (cached)."""
+        return self._read_through(
+            "get_user", (user_id,), lambda: self._repository.get_user(user_id)
+        )
+
+    def get_user_by_google_id(self, google_id: str) -> User | None:
+        """Get a user by Google ID (cached)."""
+        return self._read_through(
+            "get_user_by_google_id", (google_id,),
+            lambda: self._repository.get_user_by_google_id(google_id),
+        )
+
+    def get_user_by_email(self, email: str) -> User | None:
+        """Get a user by email address (cached)."""
+        return self._read_through(
+            "get_user_by_email", (email,),
+            lambda: self._repository.get_user_by_email(email),
+        )
+
+    def _invalidate_user(self, user_id: str) -> None:
+        """Drop every cached entry for a user."""
+        self._users.discard_where(lambda _, user: user.id == user_id)
+
+    def update_user(self, user_id: str, **kwargs) -> User | None:
+        """Update a user and drop them from the cache."""
+        try:
+            return self._repository.update_user(user_id, **kwargs)
+        finally:
+            self._invalidate_user(user_id)
+
+    def set_user_admin_status(self, user_id: str, is_admin: bool) -> User | None:
+        """Set a user's admin status and drop them from the cache."""
+        try:
+            return self._repository.set_user_admin_status(user_id, is_admin)
+        finally:
+            self._invalidate_user(user_id)
+
+    def mark_email_digest_sent(self, user_id: str) -> None:
+        """Record a sent digest and drop the user from the cache."""
+        try:
+            return self._repository.mark_email_digest_sent(user_id)
+        finally:
+            self._invalidate_user(user_id)
+
+    # --- Subscriptions ---
+
+    def is_user_subscribed(self, user_id: str, podcast_id: str) -> bool:
+        """Check if a user is subscribed to a podcast (cached)."""
+        return self._read_through(
+            "is_user_subscribed", (user_id, podcast_id),
+            lambda: self._repository.is_user_subscribed(user_id, podcast_id),
+        )
+
+    def subscribe_user_to_podcast(self, user_id: str, podcast_id: str):
+        """Subscribe a user to a podcast and drop the cached check."""
+        try:
+            return self._repository.subscribe_user_to_podcast(user_id, podcast_id)
+        finally:
+            self._subscriptions.discard_where(lambda key, _: key == (user_id, podcast_id))
+
+    def unsubscribe_user_from_podcast(self, user_id: str, podcast_id: str) -> bool:
+        """Unsubscribe a user from a podcast and drop the cached check."""
+        try:
+            return self._repository.unsubscribe_user_from_podcast(user_id, podcast_id)
+        finally:
+            self._subscriptions.discard_where(lambda key, _: key == (user_id, podcast_id))
+
+
+PodcastRepositoryInterface.register(CachingPodcastRepository)
@@ -0,0 +1,75 @@
+"""Compression for large text blobs stored in the database.
+
+Transcripts are stored compressed in the episode_transcripts table. Each row
+records the codec it was written with, so rows written with different codecs
+can coexist and be read back.
+
+zstd (via the zstandard package, a core dependency) is used for new writes.
+If the package is missing from an environment anyway, text is written with
+zlib from the standard library.
+"""
+
+import zlib
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - depends on installed packages
+    zstandard = None
+
+CODEC_ZSTD = "zstd"
+CODEC_ZLIB = "zlib"
+
+# zstd level 10 gives most of the ratio of the high levels at a fraction of the CPU
+ZSTD_LEVEL = 10
+ZLIB_LEVEL = 9
+
+
+def default_codec() -> str:
+    """Codec used for new writes: zstd when available, otherwise zlib."""
+    return CODEC_ZSTD if zstandard is not None else CODEC_ZLIB
+
+
+def compress_text(text: str, codec: str | None = None) -> tuple[str, bytes]:
+    """Compress text.
+
+    Args:
+        text: Text to compress.
+        codec: Codec name; defaults to default_codec().
+
+    Returns:
+        Tuple of (codec, compressed bytes).
+
+    Raises:
+        ValueError: If the codec is unknown or unavailable.
+    """
+    codec = codec or default_codec()
+    data = text.encode("utf-8")
+    if codec == CODEC_ZSTD:
+        if zstandard is None:
+            raise ValueError("zstd compression requires the zstandard package")
+        return codec, zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(data)
+    if codec == CODEC_ZLIB:
+        return codec, zlib.compress(data, ZLIB_LEVEL)
+    raise ValueError(f"Unknown codec: {codec}")
+
+
+def decompress_text(codec: str, data: bytes) -> str:
+    """Decompress text written by compress_text().
+
+    Args:
+        codec: Codec the data was written with.
+        data: Compressed bytes.
+
+    Returns:
+        The original text.
+
+    Raises:
+        ValueError: If the codec is unknown or unavailable.
+    """
+    if codec == CODEC_ZSTD:
+        if zstandard is None:
+            raise ValueError("zstd-compressed data requires the zstandard package")
+        return zstandard.ZstdDecompressor().decompress(data).decode("utf-8")
+    if codec == CODEC_ZLIB:
+        return zlib.decompress(data).decode("utf-8")
+    raise ValueError(f"Unknown codec: {codec}")
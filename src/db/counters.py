@@ -0,0 +1,192 @@
+"""Incrementally maintained episode counts for dashboards and queue depths.
+
+``pipeline_counters`` holds one row per (podcast, counter) with the number of
+the podcast's episodes matching the counter's condition. Row-level triggers
+on ``episodes`` apply the +1/-1 deltas of every insert, delete and status
+change in the same transaction as the change, so the counts are exact
+without ever scanning ``episodes``:
+
+- PostgreSQL: PL/pgSQL trigger functions.
+- SQLite: ``CREATE TRIGGER`` bodies.
+
+Counts are kept per podcast rather than in one global row so that workers
+processing different podcasts do not serialise on the same counter row;
+system-wide figures sum the (small) table.
+
+The triggers are not part of the ORM metadata; create_counter_triggers()
+creates them, and rebuild_counters() recomputes every count from scratch.
+"""
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+
+COUNTERS_TABLE = "pipeline_counters"
+
+# Counter name -> condition on an episodes row, with {r} standing for the row.
+# Queue conditions mirror the worker queries, except that transcript_status
+# "completed" stands in for the "transcript is stored" check.
+COUNTERS: dict[str, str] = {
+    "total_episodes": "1 = 1",
+    "pending_download": "{r}.download_status = 'pending'",
+    "downloading": "{r}.download_status = 'downloading'",
+    "downloaded": "{r}.download_status = 'completed'",
+    "download_failed": "{r}.download_status = 'failed'",
+    "pending_transcription": "{r}.transcript_status = 'pending'",
+    "transcribing": "{r}.transcript_status = 'processing'",
+    "transcribed": "{r}.transcript_status = 'completed'",
+    "transcript_failed": "{r}.transcript_status = 'failed'",
+    "pending_indexing": "{r}.file_search_status = 'pending'",
+    "indexed": "{r}.file_search_status = 'indexed'",
+    "fully_processed": (
+        "{r}.transcript_status = 'completed' AND {r}.metadata_status = 'completed' "
+        "AND {r}.file_search_status = 'indexed'"
+    ),
+    "transcription_queue": (
+        "{r}.download_status = 'completed' AND {r}.transcript_status = 'pending' "
+        "AND {r}.local_file_path IS NOT NULL"
+    ),
+    "preprocessing_queue": (
+        "{r}.download_status = 'completed' AND {r}.transcript_status = 'pending' "
+        "AND {r}.local_file_path IS NOT NULL AND {r}.preprocess_status = 'pending'"
+    ),
+    "metadata_queue": (
+        "{r}.transcript_status = 'completed' AND {r}.metadata_status = 'pending'"
+    ),
+    "indexing_queue": (
+        "{r}.metadata_status = 'completed' AND {r}.file_search_status = 'pending'"
+    ),
+    "cleanup_queue": (
+        "{r}.transcript_status = 'completed' AND {r}.metadata_status = 'completed' "
+        "AND {r}.file_search_status = 'indexed' AND {r}.local_file_path IS NOT NULL"
+    ),
+}
+
+# Columns the counter conditions read; updates touching none of them skip the trigger
+_COUNTED_COLUMNS = (
+    "podcast_id",
+    "download_status",
+    "transcript_status",
+    "preprocess_status",
+    "metadata_status",
+    "file_search_status",
+    "local_file_path",
+)
+
+_TRIGGER_OPS = ("insert", "update", "delete")
+
+
+def _flag(name: str, row: str) -> str:
+    """SQL expression that is 1 if the row matches the counter, else 0."""
+    return f"(CASE WHEN {COUNTERS[name].format(r=row)} THEN 1 ELSE 0 END)"
+
+
+def _delta_rows(op: str) -> list[tuple[str, str, str]]:
+    """(podcast id, counter name, delta) SQL expressions for one trigger."""
+    rows = []
+    for name in COUNTERS:
+        new, old = _flag(name, "NEW"), _flag(name, "OLD")
+        if op == "insert":
+            rows.append(("NEW.podcast_id", name, new))
+        elif op == "delete":
+            rows.append(("OLD.podcast_id", name, f"-{old}"))
+        else:
+            # Net change stays with the podcast; a move between podcasts is
+            # a delete from one and an insert into the other
+            same = "NEW.podcast_id = OLD.podcast_id"
+            rows.append((
+                "OLD.podcast_id", name,
+                f"(CASE WHEN {same} THEN {new} ELSE 0 END) - {old}",
+            ))
+            rows.append(("NEW.podcast_id", name, f"(CASE WHEN {same} THEN 0 ELSE {new} END)"))
+    return rows
+
+
+def _apply_deltas_sql(op: str) -> str:
+    """Single upsert adding a trigger's non-zero deltas to the counters."""
+    selects = " UNION ALL ".join(
+        f"SELECT {podcast_id} AS podcast_id, '{name}' AS name, {delta} AS delta"
+        for podcast_id, name, delta in _delta_rows(op)
+    )
+    return (
+        f"INSERT INTO {COUNTERS_TABLE} (podcast_id, name, value) "
+        f"SELECT podcast_id, name, delta FROM ({selects}) AS deltas WHERE delta <> 0 "
+        "ON CONFLICT (podcast_id, name) "
+        f"DO UPDATE SET value = {COUNTERS_TABLE}.value + excluded.value"
+    )
+
+
+def _trigger_event(op: str) -> str:
+    """Trigger timing clause for an operation."""
+    if op == "update":
+        return f"AFTER UPDATE OF {', '.join(_COUNTED_COLUMNS)}"
+    return f"AFTER {op.upper()}"
+
+
+def _dialect(conn: Connection | Session) -> str:
+    """Name of the database dialect behind a connection or session."""
+    bind = conn.get_bind() if isinstance(conn, Session) else conn
+    return bind.dialect.name
+
+
+def create_counter_triggers(conn: Connection | Session) -> None:
+    """Create (or replace) the triggers that maintain the counters.
+
+    Args:
+        conn: Connection or session to run the DDL on; the caller commits.
+    """
+    postgres = _dialect(conn) == "postgresql"
+    for op in _TRIGGER_OPS:
+        trigger = f"{COUNTERS_TABLE}_{op}"
+        if postgres:
+            conn.execute(text(
+                f"CREATE OR REPLACE FUNCTION {trigger}() RETURNS trigger "
+                f"LANGUAGE plpgsql AS $$ BEGIN {_apply_deltas_sql(op)}; "
+                "RETURN NULL; END $$"
+            ))
+            conn.execute(text(f"DROP TRIGGER IF EXISTS {trigger} ON episodes"))
+            conn.execute(text(
+                f"CREATE TRIGGER {trigger} {_trigger_event(op)} ON episodes "
+                f"FOR EACH ROW EXECUTE FUNCTION {trigger}()"
+            ))
+        else:
+            conn.execute(text(
+                f"CREATE TRIGGER IF NOT EXISTS {trigger} {_trigger_event(op)} ON episodes "
+                f"BEGIN {_apply_deltas_sql(op)}; END"
+            ))
+
+
+def drop_counter_triggers(conn: Connection | Session) -> None:
+    """Drop the counter triggers.
+
+    Args:
+        conn: Connection or session to run the DDL on; the caller commits.
+    """
+    postgres = _dialect(conn) == "postgresql"
+    for op in _TRIGGER_OPS:
+        trigger = f"{COUNTERS_TABLE}_{op}"
+        if postgres:
+            conn.execute(text(f"DROP TRIGGER IF EXISTS {trigger} ON episodes"))
+            conn.execute(text(f"DROP FUNCTION IF EXISTS {trigger}()"))
+        else:
+            conn.execute(text(f"DROP TRIGGER IF EXISTS {trigger}"))
+
+
+def rebuild_counters(conn: Connection | Session) -> None:
+    """Recompute every counter from the episodes table.
+
+    On PostgreSQL, episode writes are blocked until the caller commits so
+    that none is counted twice or missed.
+
+    Args:
+        conn: Connection or session; the caller commits.
+    """
+    if _dialect(conn) == "postgresql":
+        conn.execute(text("LOCK TABLE episodes IN SHARE MODE"))
+    conn.execute(text(f"DELETE FROM {COUNTERS_TABLE}"))
+    for name, condition in COUNTERS.items():
+        conn.execute(text(
+            f"INSERT INTO {COUNTERS_TABLE} (podcast_id, name, value) "
+            f"SELECT podcast_id, '{name}', COUNT(*) FROM episodes "
+            f"WHERE {condition.format(r='episodes')} GROUP BY podcast_id"
+        ))
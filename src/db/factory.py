@@ -7,7 +7,11 @@ for SQLite (local development) or PostgreSQL (Cloud SQL production).
 import logging
 import os
 
+from .cached_repository import CachingPodcastRepository
+from .counters import create_counter_triggers
+from .fulltext import create_search_index
 from .models import Base
+from .priority import PriorityFunction, default_priority
 from .repository import PodcastRepositoryInterface, SQLAlchemyPodcastRepository
 
 logger = logging.getLogger(__name__)
@@ -24,6 +28,8 @@ def create_repository(
     create_tables: bool = False,
     pool_pre_ping: bool = True,  # Detect stale connections
     pool_recycle: int = 1800,  # Recycle connections after 30 minutes
+    priority_function: PriorityFunction = default_priority,
+    cache: bool = False,
 ) -> PodcastRepositoryInterface:
     """
     Create a PodcastRepositoryInterface configured from the provided or discovered database URL.
@@ -39,6 +45,9 @@ def create_repository(
             production should use Alembic migrations).
         pool_pre_ping (bool): Test connections for liveness before using (recommended for Supabase).
         pool_recycle (int): Seconds after which to recycle connections (default 1800 = 30 minutes).
+        priority_function (PriorityFunction): Scores pending episodes for the work queues.
+        cache (bool): If true, wrap the repository in a CachingPodcastRepository that caches
+            podcast, user and subscription lookups.
 
     Returns:
         PodcastRepositoryInterface: A repository instance backed by the resolved database URL.
@@ -73,16 +82,66 @@ def create_repository(
         echo=echo,
         pool_pre_ping=pool_pre_ping,
         pool_recycle=pool_recycle,
+        priority_function=priority_function,
     )
 
     # Create tables directly for testing (production should use Alembic migrations)
     if create_tables:
         Base.metadata.create_all(repo.engine)
+        with repo.engine.begin() as conn:
+            create_search_index(conn)
+            create_counter_triggers(conn)
         logger.info("Created database tables (testing mode)")
 
+    if cache:
+        return CachingPodcastRepository(repo)
     return repo
 
 
+def create_async_repository(
+    database_url: str | None = None,
+    pool_size: int = 3,  # Supabase-optimized
+    max_overflow: int = 2,  # Supabase-optimized
+    echo: bool = False,
+    pool_pre_ping: bool = True,  # Detect stale connections
+    pool_recycle: int = 1800,  # Recycle connections after 30 minutes
+):
+    """
+    Create an AsyncSQLAlchemyPodcastRepository for the web tier's read paths.
+
+    The URL is resolved like create_repository() and converted to the asyncpg (PostgreSQL) or aiosqlite (SQLite) driver. Tables are never created here.
+
+    Parameters:
+        database_url (Optional[str]): SQLAlchemy database URL to use; if None the environment or default is used.
+        pool_size (int): Connection pool size for PostgreSQL; ignored for SQLite.
+        max_overflow (int): Maximum overflow connections for PostgreSQL; ignored for SQLite.
+        echo (bool): If true, enable SQL statement logging.
+        pool_pre_ping (bool): Test connections for liveness before using.
+        pool_recycle (int): Seconds after which to recycle connections.
+
+    Returns:
+        AsyncSQLAlchemyPodcastRepository: Repository whose read methods are coroutines.
+    """
+    # Imported lazily: requires the asyncpg/aiosqlite drivers from the web dependency group
+    from .async_repository import AsyncSQLAlchemyPodcastRepository
+
+    if database_url is None:
+        database_url = os.getenv("DATABASE_URL", DEFAULT_DATABASE_URL)
+
+    if "supabase.co" in database_url or "pooler.supabase" in database_url:
+        pool_size = min(pool_size, 3)
+        max_overflow = min(max_overflow, 2)
+
+    return AsyncSQLAlchemyPodcastRepository(
+        database_url=database_url,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        echo=echo,
+        pool_pre_ping=pool_pre_ping,
+        pool_recycle=pool_recycle,
+    )
+
+
 def get_database_url_from_config(config) -> str:
     """
     Retrieve the database URL from a configuration object, falling back to the environment and a default.
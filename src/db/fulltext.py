@@ -0,0 +1,228 @@
+"""Full-text search index over episode transcripts and metadata.
+
+Each episode has one row in the ``episode_search`` table, built from its
+title, hosts and guests, keywords, summary and transcript:
+
+- PostgreSQL: a weighted ``tsvector`` column with a GIN index, queried with
+  ``websearch_to_tsquery`` and ranked with ``ts_rank_cd``.
+- SQLite: an FTS5 virtual table, ranked with ``bm25``.
+
+The table is not part of the ORM metadata because the FTS5 table cannot be
+created by ``create_all``; create_search_index() creates it instead. The
+repository refreshes an episode's row whenever its transcript or metadata
+is written.
+"""
+
+import re
+from dataclasses import dataclass
+
+from sqlalchemy import bindparam, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+
+SEARCH_TABLE = "episode_search"
+
+# PostgreSQL rejects tsvectors over 1 MB; the head of a very long transcript
+# is plenty to match on
+MAX_TRANSCRIPT_CHARS = 500_000
+
+# Text search configuration used on PostgreSQL
+TS_CONFIG = "english"
+
+# bm25() weights for the FTS5 columns, in column order
+# (episode_id, title, people, keywords, summary, transcript)
+_FTS5_WEIGHTS = "0.0, 10.0, 5.0, 5.0, 2.0, 1.0"
+
+# A quoted phrase or a bare term
+_QUERY_TOKEN = re.compile(r'"([^"]*)"|(\S+)')
+
+
+@dataclass
+class SearchDocument:
+    """Searchable text for one episode, one field per weight class."""
+
+    title: str = ""
+    people: str = ""
+    keywords: str = ""
+    summary: str = ""
+    transcript: str = ""
+
+
+def build_document(episode, transcript: str | None) -> SearchDocument:
+    """Build the search document for an episode.
+
+    Args:
+        episode: Episode whose title and AI metadata are indexed.
+        transcript: Full transcript text, if any.
+
+    Returns:
+        SearchDocument for the episode.
+    """
+    return SearchDocument(
+        title=episode.title or "",
+        people=" ".join((episode.ai_hosts or []) + (episode.ai_guests or [])),
+        keywords=" ".join(episode.ai_keywords or []),
+        summary=episode.ai_summary or "",
+        transcript=(transcript or "")[:MAX_TRANSCRIPT_CHARS],
+    )
+
+
+def _dialect(conn: Connection | Session) -> str:
+    """Name of the database dialect behind a connection or session."""
+    bind = conn.get_bind() if isinstance(conn, Session) else conn
+    return bind.dialect.name
+
+
+def create_search_index(conn: Connection | Session) -> None:
+    """Create the search table (and its index) if it does not exist.
+
+    Args:
+        conn: Connection or session to run the DDL on; the caller commits.
+    """
+    if _dialect(conn) == "postgresql":
+        conn.execute(text(
+            f"CREATE TABLE IF NOT EXISTS {SEARCH_TABLE} ("
+            "episode_id VARCHAR(36) PRIMARY KEY "
+            "REFERENCES episodes(id) ON DELETE CASCADE, "
+            "document TSVECTOR NOT NULL)"
+        ))
+        conn.execute(text(
+            f"CREATE INDEX IF NOT EXISTS ix_{SEARCH_TABLE}_document "
+            f"ON {SEARCH_TABLE} USING GIN (document)"
+        ))
+    else:
+        conn.execute(text(
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {SEARCH_TABLE} USING fts5("
+            "episode_id UNINDEXED, title, people, keywords, summary, transcript, "
+            "tokenize = 'porter unicode61')"
+        ))
+
+
+def drop_search_index(conn: Connection | Session) -> None:
+    """Drop the search table.
+
+    Args:
+        conn: Connection or session to run the DDL on; the caller commits.
+    """
+    conn.execute(text(f"DROP TABLE IF EXISTS {SEARCH_TABLE}"))
+
+
+def upsert_document(
+    conn: Connection | Session, episode_id: str, document: SearchDocument
+) -> None:
+    """Insert or replace an episode's row in the search index.
+
+    Args:
+        conn: Connection or session; the caller commits.
+        episode_id: Episode the document belongs to.
+        document: Text to index.
+    """
+    params = {"episode_id": episode_id, **document.__dict__}
+    if _dialect(conn) == "postgresql":
+        conn.execute(text(
+            f"INSERT INTO {SEARCH_TABLE} (episode_id, document) VALUES (:episode_id, "
+            f"setweight(to_tsvector('{TS_CONFIG}', :title), 'A') || "
+            f"setweight(to_tsvector('{TS_CONFIG}', :people), 'A') || "
+            f"setweight(to_tsvector('{TS_CONFIG}', :keywords), 'B') || "
+            f"setweight(to_tsvector('{TS_CONFIG}', :summary), 'C') || "
+            f"setweight(to_tsvector('{TS_CONFIG}', :transcript), 'D')) "
+            "ON CONFLICT (episode_id) DO UPDATE SET document = EXCLUDED.document"
+        ), params)
+    else:
+        # FTS5 tables have no unique constraint to upsert against
+        delete_document(conn, episode_id)
+        conn.execute(text(
+            f"INSERT INTO {SEARCH_TABLE} "
+            "(episode_id, title, people, keywords, summary, transcript) "
+            "VALUES (:episode_id, :title, :people, :keywords, :summary, :transcript)"
+        ), params)
+
+
+def delete_document(conn: Connection | Session, episode_id: str) -> None:
+    """Remove an episode from the search index.
+
+    Args:
+        conn: Connection or session; the caller commits.
+        episode_id: Episode to remove.
+    """
+    conn.execute(
+        text(f"DELETE FROM {SEARCH_TABLE} WHERE episode_id = :episode_id"),
+        {"episode_id": episode_id},
+    )
+
+
+def to_fts5_query(query: str) -> str:
+    """Translate a user query into an FTS5 MATCH expression.
+
+    Quoted text is kept as a phrase; every other word becomes a quoted term,
+    so FTS5 operators and punctuation in user input are matched literally.
+    All terms must match.
+
+    Args:
+        query: Raw search query.
+
+    Returns:
+        FTS5 query string, empty if the query has no terms.
+    """
+    terms = []
+    for phrase, word in _QUERY_TOKEN.findall(query):
+        term = (phrase or word).strip()
+        if term:
+            terms.append('"' + term.replace('"', '""') + '"')
+    return " ".join(terms)
+
+
+def search(
+    conn: Connection | Session,
+    query: str,
+    podcast_ids: list[str] | None = None,
+    limit: int = 50,
+    offset: int = 0,
+) -> list[tuple[str, float]]:
+    """Find episodes matching a query, best match first.
+
+    Args:
+        conn: Connection or session.
+        query: Words and "quoted phrases"; all must match.
+        podcast_ids: Restrict results to these podcasts.
+        limit: Maximum number of results.
+        offset: Number of ranked results to skip.
+
+    Returns:
+        List of (episode_id, score) tuples; higher scores rank first.
+    """
+    params: dict = {"limit": limit, "offset": offset}
+    podcast_filter = ""
+    if podcast_ids is not None:
+        if not podcast_ids:
+            return []
+        podcast_filter = "AND e.podcast_id IN :podcast_ids "
+        params["podcast_ids"] = list(podcast_ids)
+
+    if _dialect(conn) == "postgresql":
+        params["query"] = query
+        stmt = text(
+            f"SELECT s.episode_id, ts_rank_cd(s.document, q) AS score "
+            f"FROM {SEARCH_TABLE} s "
+            "JOIN episodes e ON e.id = s.episode_id, "
+            f"websearch_to_tsquery('{TS_CONFIG}', :query) q "
+            f"WHERE s.document @@ q {podcast_filter}"
+            "ORDER BY score DESC, s.episode_id LIMIT :limit OFFSET :offset"
+        )
+    else:
+        params["query"] = to_fts5_query(query)
+        if not params["query"]:
+            return []
+        # bm25() is lower-is-better; negate it so both backends rank high-first
+        stmt = text(
+            f"SELECT {SEARCH_TABLE}.episode_id, "
+            f"-bm25({SEARCH_TABLE}, {_FTS5_WEIGHTS}) AS score "
+            f"FROM {SEARCH_TABLE} "
+            f"JOIN episodes e ON e.id = {SEARCH_TABLE}.episode_id "
+            f"WHERE {SEARCH_TABLE} MATCH :query {podcast_filter}"
+            f"ORDER BY score DESC, {SEARCH_TABLE}.episode_id LIMIT :limit OFFSET :offset"
+        )
+
+    if podcast_ids is not None:
+        stmt = stmt.bindparams(bindparam("podcast_ids", expanding=True))
+    return [(row[0], float(row[1])) for row in conn.execute(stmt, params)]
@@ -19,6 +19,7 @@ from google import genai
 from google.genai.errors import APIError, ClientError
 
 from src.utils.metadata_utils import flatten_episode_metadata
+from src.utils.metrics import GEMINI_CALL_SECONDS, GEMINI_RETRIES
 
 T = TypeVar('T')
 
@@ -92,10 +93,15 @@ class GeminiFileSearchManager:
         """
         delay = initial_delay
         last_exception = None
+        started = time.monotonic()
 
         for attempt in range(max_retries + 1):
             try:
-                return func()
+                result = func()
+                GEMINI_CALL_SECONDS.observe(
+                    time.monotonic() - started, operation="file_search_upload"
+                )
+                return result
             except (APIError, ClientError) as e:
                 last_exception = e
 
@@ -110,6 +116,7 @@ class GeminiFileSearchManager:
                         f"API error on attempt {attempt + 1}/{max_retries + 1}: {e}. "
                         f"Retrying in {delay:.1f}s..."
                     )
+                    GEMINI_RETRIES.inc(operation="file_search_upload")
                     time.sleep(delay)
                     delay = min(delay * backoff_factor, max_delay)
                 else:
@@ -8,6 +8,7 @@ from sqlalchemy import (
     Boolean,
     Date,
     DateTime,
+    Float,
     ForeignKey,
     Index,
     Integer,
@@ -19,6 +20,8 @@ from sqlalchemy import (
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 from sqlalchemy.types import JSON
 
+from .compression import compress_text, decompress_text
+
 
 class Base(DeclarativeBase):
     """Base class for all ORM models."""
@@ -64,7 +67,17 @@ class Podcast(Base):
     # Feed management
     last_checked: Mapped[datetime | None] = mapped_column(DateTime)
     last_new_episode: Mapped[datetime | None] = mapped_column(DateTime)
+    # Regular polling interval learned from the publishing cadence (see poll_schedule)
     check_frequency_hours: Mapped[int] = mapped_column(Integer, default=24)
+    # When sync next checks the feed; NULL means due now
+    next_check_at: Mapped[datetime | None] = mapped_column(DateTime)
+    # Validators and body hash from the last fetch that was fully processed;
+    # a 304 or an identical body skips parsing on the next sync
+    feed_etag: Mapped[str | None] = mapped_column(String(512))
+    feed_last_modified: Mapped[str | None] = mapped_column(String(64))
+    feed_content_hash: Mapped[str | None] = mapped_column(String(64))
+    # Last full parse of the feed; syncs in between parse only its newest items
+    feed_reconciled_at: Mapped[datetime | None] = mapped_column(DateTime)
 
     # File organization
     local_directory: Mapped[str | None] = mapped_column(String(1024))
@@ -97,7 +110,12 @@ class Podcast(Base):
 
     __table_args__ = (
         Index("ix_podcasts_feed_url", "feed_url"),
+        Index("ix_podcasts_next_check_at", "next_check_at"),
         Index("ix_podcasts_description_file_search_status", "description_file_search_status"),
+        Index(
+            "ix_podcasts_description_file_search_display_name",
+            "description_file_search_display_name",
+        ),
     )
 
     def __repr__(self) -> str:
@@ -172,9 +190,22 @@ class Episode(Base):
     )  # pending, processing, completed, failed, skipped
     transcript_error: Mapped[str | None] = mapped_column(Text)
     transcript_path: Mapped[str | None] = mapped_column(String(1024))
-    transcript_text: Mapped[str | None] = mapped_column(Text)  # Full transcript content
     transcribed_at: Mapped[datetime | None] = mapped_column(DateTime)
 
+    # Audio preprocessing (16 kHz mono PCM + speech regions ready for transcription)
+    preprocess_status: Mapped[str] = mapped_column(
+        String(32), default="pending"
+    )  # pending, completed, failed
+    preprocessed_audio_path: Mapped[str | None] = mapped_column(String(1024))
+    speech_regions: Mapped[list[list[float]] | None] = mapped_column(JSON)
+
+    # Queue priority (denormalised score, see src.db.priority; higher runs first)
+    priority: Mapped[float] = mapped_column(Float, default=0.0, nullable=False)
+
+    # Transcription work claiming (lets several pipeline nodes share one database)
+    transcript_worker_id: Mapped[str | None] = mapped_column(String(128))
+    transcript_lease_expires_at: Mapped[datetime | None] = mapped_column(DateTime)
+
     # MP3 ID3 tag metadata
     mp3_artist: Mapped[str | None] = mapped_column(String(512))
     mp3_album: Mapped[str | None] = mapped_column(String(512))
@@ -215,16 +246,43 @@ class Episode(Base):
 
     # Relationships
     podcast: Mapped["Podcast"] = relationship("Podcast", back_populates="episodes")
+    segments: Mapped[list["EpisodeSegment"]] = relationship(
+        "EpisodeSegment", back_populates="episode", cascade="all, delete-orphan"
+    )
+    # Full transcript, stored compressed in its own table and never joined by
+    # default; read it with PodcastRepositoryInterface.get_transcript_text()
+    transcript: Mapped[Optional["EpisodeTranscript"]] = relationship(
+        "EpisodeTranscript",
+        back_populates="episode",
+        uselist=False,
+        cascade="all, delete-orphan",
+    )
+
+    # Normalised hosts/guests and keywords (mirrors of ai_hosts, ai_guests, ai_keywords)
+    people_links: Mapped[list["EpisodePerson"]] = relationship(
+        "EpisodePerson", back_populates="episode", cascade="all, delete-orphan"
+    )
+    keyword_links: Mapped[list["EpisodeKeyword"]] = relationship(
+        "EpisodeKeyword", back_populates="episode", cascade="all, delete-orphan"
+    )
 
     __table_args__ = (
         UniqueConstraint("podcast_id", "guid", name="uq_episode_podcast_guid"),
-        Index("ix_episodes_podcast_id", "podcast_id"),
+        Index("ix_episodes_podcast_published", "podcast_id", "published_date", "id"),
         Index("ix_episodes_download_status", "download_status"),
         Index("ix_episodes_transcript_status", "transcript_status"),
         Index("ix_episodes_file_search_status", "file_search_status"),
-        Index("ix_episodes_published_date", "published_date"),
+        Index("ix_episodes_file_search_display_name", "file_search_display_name"),
+        Index("ix_episodes_published_id", "published_date", "id"),
         Index("ix_episodes_published_metadata", "published_date", "metadata_status"),
         Index("ix_episodes_metadata_published", "metadata_status", "published_date"),
+        Index("ix_episodes_download_priority", "download_status", "priority"),
+        Index("ix_episodes_transcript_priority", "transcript_status", "priority"),
+        Index(
+            "ix_episodes_transcript_lease",
+            "transcript_status",
+            "transcript_lease_expires_at",
+        ),
     )
 
     def __repr__(self) -> str:
@@ -261,6 +319,213 @@ class Episode(Base):
         return self.is_fully_processed and self.local_file_path is not None
 
 
+class EpisodeSegment(Base):
+    """Timestamped transcript segment.
+
+    Written incrementally while an episode is transcribed, so an interrupted
+    transcription can resume from the last stored segment. Kept after
+    completion to provide timestamps for citations.
+    """
+
+    __tablename__ = "episode_segments"
+
+    # Primary key
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    episode_id: Mapped[str] = mapped_column(
+        String(36), ForeignKey("episodes.id", ondelete="CASCADE"), nullable=False
+    )
+
+    # Segment content (seconds from the start of the audio)
+    start_seconds: Mapped[float] = mapped_column(Float, nullable=False)
+    end_seconds: Mapped[float] = mapped_column(Float, nullable=False)
+    text: Mapped[str] = mapped_column(Text, nullable=False)
+
+    # Relationships
+    episode: Mapped["Episode"] = relationship("Episode", back_populates="segments")
+
+    __table_args__ = (
+        Index("ix_episode_segments_episode_start", "episode_id", "start_seconds"),
+    )
+
+    def __repr__(self) -> str:
+        """Return a concise representation of the EpisodeSegment instance."""
+        return (
+            f"<EpisodeSegment(episode_id={self.episode_id}, "
+            f"start={self.start_seconds:.2f}, end={self.end_seconds:.2f})>"
+        )
+
+
+class EpisodeTranscript(Base):
+    """Compressed full transcript of an episode.
+
+    Kept out of the episodes table so episode listings and feed queries
+    only read metadata-sized rows.
+    """
+
+    __tablename__ = "episode_transcripts"
+
+    episode_id: Mapped[str] = mapped_column(
+        String(36), ForeignKey("episodes.id", ondelete="CASCADE"), primary_key=True
+    )
+
+    # Compressed UTF-8 transcript (see src.db.compression)
+    codec: Mapped[str] = mapped_column(String(16), nullable=False)
+    content: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+    text_length: Mapped[int] = mapped_column(Integer, nullable=False)  # Characters
+
+    # Timestamps
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow
+    )
+
+    # Relationships
+    episode: Mapped["Episode"] = relationship("Episode", back_populates="transcript")
+
+    @property
+    def text(self) -> str:
+        """Decompressed transcript text."""
+        return decompress_text(self.codec, self.content)
+
+    @text.setter
+    def text(self, value: str) -> None:
+        """Compress and store transcript text."""
+        self.codec, self.content = compress_text(value)
+        self.text_length = len(value)
+
+    def __repr__(self) -> str:
+        """Return a concise representation of the EpisodeTranscript instance."""
+        return (
+            f"<EpisodeTranscript(episode_id={self.episode_id}, "
+            f"codec={self.codec}, chars={self.text_length})>"
+        )
+
+
+class Person(Base):
+    """A host or guest, shared across episodes.
+
+    ``name`` is the case-folded, whitespace-collapsed form used for lookups;
+    ``display_name`` keeps the spelling first seen.
+    """
+
+    __tablename__ = "people"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    name: Mapped[str] = mapped_column(String(512), nullable=False, unique=True)
+    display_name: Mapped[str] = mapped_column(String(512), nullable=False)
+
+    # Relationships
+    episode_links: Mapped[list["EpisodePerson"]] = relationship(
+        "EpisodePerson", back_populates="person"
+    )
+
+    def __repr__(self) -> str:
+        """Return a concise representation of the Person instance."""
+        return f"<Person(id={self.id}, name='{self.display_name}')>"
+
+
+class EpisodePerson(Base):
+    """Appearance of a person in an episode as host or guest."""
+
+    __tablename__ = "episode_people"
+
+    episode_id: Mapped[str] = mapped_column(
+        String(36), ForeignKey("episodes.id", ondelete="CASCADE"), primary_key=True
+    )
+    person_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("people.id", ondelete="CASCADE"), primary_key=True
+    )
+    role: Mapped[str] = mapped_column(String(16), primary_key=True)  # host, guest
+
+    # Relationships
+    episode: Mapped["Episode"] = relationship("Episode", back_populates="people_links")
+    person: Mapped["Person"] = relationship("Person", back_populates="episode_links")
+
+    __table_args__ = (
+        Index("ix_episode_people_person_role", "person_id", "role"),
+    )
+
+    def __repr__(self) -> str:
+        """Return a concise representation of the EpisodePerson instance."""
+        return (
+            f"<EpisodePerson(episode_id={self.episode_id}, "
+            f"person_id={self.person_id}, role={self.role})>"
+        )
+
+
+class Keyword(Base):
+    """A topic keyword, shared across episodes.
+
+    ``name`` is the case-folded, whitespace-collapsed form used for lookups;
+    ``display_name`` keeps the spelling first seen.
+    """
+
+    __tablename__ = "keywords"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    name: Mapped[str] = mapped_column(String(512), nullable=False, unique=True)
+    display_name: Mapped[str] = mapped_column(String(512), nullable=False)
+
+    # Relationships
+    episode_links: Mapped[list["EpisodeKeyword"]] = relationship(
+        "EpisodeKeyword", back_populates="keyword"
+    )
+
+    def __repr__(self) -> str:
+        """Return a concise representation of the Keyword instance."""
+        return f"<Keyword(id={self.id}, name='{self.display_name}')>"
+
+
+class EpisodeKeyword(Base):
+    """Association between an episode and one of its keywords."""
+
+    __tablename__ = "episode_keywords"
+
+    episode_id: Mapped[str] = mapped_column(
+        String(36), ForeignKey("episodes.id", ondelete="CASCADE"), primary_key=True
+    )
+    keyword_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("keywords.id", ondelete="CASCADE"), primary_key=True
+    )
+
+    # Relationships
+    episode: Mapped["Episode"] = relationship("Episode", back_populates="keyword_links")
+    keyword: Mapped["Keyword"] = relationship("Keyword", back_populates="episode_links")
+
+    __table_args__ = (
+        Index("ix_episode_keywords_keyword", "keyword_id"),
+    )
+
+    def __repr__(self) -> str:
+        """Return a concise representation of the EpisodeKeyword instance."""
+        return (
+            f"<EpisodeKeyword(episode_id={self.episode_id}, keyword_id={self.keyword_id})>"
+        )
+
+
+class PipelineCounter(Base):
+    """Running count of a podcast's episodes in one pipeline state.
+
+    Maintained by triggers on ``episodes`` (see src.db.counters) in the same
+    transaction as the change being counted; never written by the ORM.
+    ``podcast_id`` deliberately has no foreign key so that the triggers can
+    run while a podcast's episodes are being cascade-deleted.
+    """
+
+    __tablename__ = "pipeline_counters"
+
+    podcast_id: Mapped[str] = mapped_column(String(36), primary_key=True)
+    name: Mapped[str] = mapped_column(String(64), primary_key=True)
+    value: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    def __repr__(self) -> str:
+        """Return a concise representation of the PipelineCounter instance."""
+        return (
+            f"<PipelineCounter(podcast_id={self.podcast_id}, "
+            f"name={self.name}, value={self.value})>"
+        )
+
+
 class User(Base):
     """User model for Google OAuth authenticated users.
 
@@ -394,8 +659,12 @@ class DailyBriefing(Base):
         JSON, nullable=False, default=list
     )
 
-    # Audio briefing fields (lazy-generated on first play, stored as DB blob)
+    # Audio briefing fields (lazy-generated on first play). The audio lives in
+    # audio storage under audio_storage_key; audio_data only holds blobs
+    # written before that, until they are moved on first play.
     audio_data: Mapped[bytes | None] = mapped_column(LargeBinary)
+    audio_storage_key: Mapped[str | None] = mapped_column(String(255))
+    audio_size_bytes: Mapped[int | None] = mapped_column(Integer)
     audio_mime_type: Mapped[str | None] = mapped_column(String(64))
     audio_status: Mapped[str | None] = mapped_column(String(20))
     audio_duration_sec: Mapped[int | None] = mapped_column(Integer)
@@ -470,7 +739,7 @@ class Conversation(Base):
     )
 
     __table_args__ = (
-        Index("ix_conversations_user_id", "user_id"),
+        Index("ix_conversations_user_updated", "user_id", "updated_at", "id"),
         Index("ix_conversations_updated_at", "updated_at"),
     )
 
@@ -511,7 +780,9 @@ class ChatMessage(Base):
     )
 
     __table_args__ = (
-        Index("ix_chat_messages_conversation_id", "conversation_id"),
+        Index(
+            "ix_chat_messages_conversation_created", "conversation_id", "created_at", "id"
+        ),
         Index("ix_chat_messages_created_at", "created_at"),
     )
 
@@ -0,0 +1,167 @@
+"""Keyset (cursor) pagination for repository list queries.
+
+A page is fetched by seeking past the last row of the previous page on a
+``(sort column, id)`` pair instead of skipping rows with OFFSET, so every
+page costs the same index range scan as the first. The position is handed
+to clients as an opaque cursor string.
+
+Rows whose sort column is NULL come after all others, in id order. They are
+read by a second query so that both queries can walk a composite
+``(sort column, id)`` index in order.
+"""
+
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import Select, literal, tuple_
+from sqlalchemy.orm import InstrumentedAttribute, Session
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+
+def encode_cursor(sort_value: datetime | None, row_id: str) -> str:
+    """
+    Encode the position of a row as an opaque cursor.
+
+    Args:
+        sort_value: Value of the row's sort column.
+        row_id: Primary key of the row.
+
+    Returns:
+        URL-safe cursor string.
+    """
+    payload = [sort_value.isoformat() if sort_value is not None else None, row_id]
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime | None, str]:
+    """
+    Decode a cursor produced by encode_cursor().
+
+    Args:
+        cursor: Cursor string from a previous page.
+
+    Returns:
+        tuple[datetime | None, str]: Sort value and id of the last row of that page.
+
+    Raises:
+        ValueError: If the cursor is malformed.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        sort_value, row_id = json.loads(base64.urlsafe_b64decode(padded))
+        if not isinstance(row_id, str):
+            raise TypeError(row_id)
+        return (
+            datetime.fromisoformat(sort_value) if sort_value is not None else None,
+            row_id,
+        )
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError):
+        raise ValueError(f"Invalid cursor: {cursor}") from None
+
+
+def _page_queries(
+    stmt: Select,
+    sort_column: InstrumentedAttribute,
+    id_column: InstrumentedAttribute,
+    cursor: str | None,
+    descending: bool,
+) -> list[Select]:
+    """Build the queries that read the page after ``cursor``, in order."""
+    def direction(column):
+        return column.desc() if descending else column.asc()
+
+    def after(left, right):
+        return left < right if descending else left > right
+
+    sort_value, last_id = decode_cursor(cursor) if cursor else (None, None)
+
+    null_rows = stmt.where(sort_column.is_(None)).order_by(direction(id_column))
+    if cursor and sort_value is None:
+        # Already inside the NULL tail
+        return [null_rows.where(after(id_column, last_id))]
+
+    sorted_rows = stmt.where(sort_column.is_not(None))
+    if cursor:
+        sorted_rows = sorted_rows.where(
+            after(
+                tuple_(sort_column, id_column),
+                tuple_(literal(sort_value, sort_column.type), literal(last_id, id_column.type)),
+            )
+        )
+    sorted_rows = sorted_rows.order_by(direction(sort_column), direction(id_column))
+    return [sorted_rows, null_rows]
+
+
+def _finish_page(
+    rows: list[Any],
+    limit: int,
+    sort_column: InstrumentedAttribute,
+    id_column: InstrumentedAttribute,
+) -> tuple[list[Any], str | None]:
+    """Trim the look-ahead row and build the cursor for the next page."""
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    last = rows[-1]
+    return rows, encode_cursor(getattr(last, sort_column.key), getattr(last, id_column.key))
+
+
+def fetch_page(
+    session: Session,
+    stmt: Select,
+    sort_column: InstrumentedAttribute,
+    id_column: InstrumentedAttribute,
+    limit: int,
+    cursor: str | None = None,
+    descending: bool = True,
+) -> tuple[list[Any], str | None]:
+    """
+    Fetch one page of ORM entities ordered by ``(sort_column, id_column)``.
+
+    Args:
+        session: Session to query with.
+        stmt: ``select(Entity)`` with filters and loader options applied, but no
+            ordering, offset or limit.
+        sort_column: Column to order by, e.g. ``Episode.published_date``.
+        id_column: Unique tiebreaker column, e.g. ``Episode.id``.
+        limit: Page size.
+        cursor: Cursor returned with the previous page, or None for the first page.
+        descending: Newest first when True.
+
+    Returns:
+        tuple[list, str | None]: The page, and the cursor for the next page (None on the last page).
+
+    Raises:
+        ValueError: If the cursor is malformed.
+    """
+    rows: list[Any] = []
+    for query in _page_queries(stmt, sort_column, id_column, cursor, descending):
+        rows.extend(session.scalars(query.limit(limit + 1 - len(rows))).unique().all())
+        if len(rows) > limit:
+            break
+    return _finish_page(rows, limit, sort_column, id_column)
+
+
+async def fetch_page_async(
+    session: "AsyncSession",
+    stmt: Select,
+    sort_column: InstrumentedAttribute,
+    id_column: InstrumentedAttribute,
+    limit: int,
+    cursor: str | None = None,
+    descending: bool = True,
+) -> tuple[list[Any], str | None]:
+    """Asyncio version of fetch_page(); see there for arguments."""
+    rows: list[Any] = []
+    for query in _page_queries(stmt, sort_column, id_column, cursor, descending):
+        result = await session.scalars(query.limit(limit + 1 - len(rows)))
+        rows.extend(result.unique().all())
+        if len(rows) > limit:
+            break
+    return _finish_page(rows, limit, sort_column, id_column)
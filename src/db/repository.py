@@ -8,51 +8,135 @@ import logging
 import os
 import shutil
 from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
 from datetime import UTC, date, datetime, timedelta
 from typing import Any
 
-from sqlalchemy import String, and_, cast, create_engine, func, or_, select
+from sqlalchemy import and_, create_engine, delete, func, or_, select
+from sqlalchemy import insert as sa_insert
 from sqlalchemy import update as sa_update
-from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import Session, joinedload, sessionmaker
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import DBAPIError, IntegrityError
+from sqlalchemy.orm import Session, defer, joinedload, sessionmaker
 
+from . import fulltext
+from .counters import COUNTERS, rebuild_counters
 from .models import (
     ChatMessage,
     Conversation,
     DailyBriefing,
     Episode,
+    EpisodeKeyword,
+    EpisodePerson,
+    EpisodeSegment,
+    EpisodeTranscript,
+    Keyword,
+    Person,
+    PipelineCounter,
     Podcast,
     User,
     UserSubscription,
 )
+from .pagination import fetch_page
+from .priority import PriorityFunction, PriorityInputs, default_priority, hours_until_digest
 
 logger = logging.getLogger(__name__)
 
 
-def _escape_like_pattern(value: str) -> str:
+def _normalize_tag(value: str) -> str:
     """
-    Escape special characters for use in SQL LIKE patterns.
-
-    Escapes backslashes, percent signs, underscores, and double quotes
-    to prevent unintended pattern matching or injection in LIKE clauses.
-
-    The escape order matters: backslashes must be escaped first since
-    they are used as the escape character.
+    Normalise a person name or keyword for lookups: collapse whitespace and case-fold.
 
     Args:
-        value: The raw string to escape
+        value: Name or keyword as extracted from the transcript.
 
     Returns:
-        str: Escaped string safe for use in LIKE patterns
+        str: Normalised form; empty if the value has no visible characters.
+    """
+    return " ".join(value.split()).casefold()
+
+
+# Maximum length of people.name / keywords.name
+_TAG_MAX_LENGTH = 512
+
+# Pipeline stage name -> Episode status column
+STAGE_STATUS_FIELDS = {
+    "download": "download_status",
+    "preprocess": "preprocess_status",
+    "transcript": "transcript_status",
+    "metadata": "metadata_status",
+    "indexing": "file_search_status",
+}
+
+# Maximum ids per IN (...) list in bulk updates
+_BULK_UPDATE_CHUNK_SIZE = 500
+
+# Rows per INSERT in bulk_create_episodes (keeps bound parameters well under
+# SQLite's and PostgreSQL's limits)
+_BULK_INSERT_CHUNK_SIZE = 500
+
+
+def _validate_episode_fields(fields: dict[str, Any]) -> None:
+    """Raise ValueError if any key is not an Episode column."""
+    unknown = set(fields) - set(Episode.__table__.c.keys())
+    if unknown:
+        raise ValueError(f"Unknown episode fields: {sorted(unknown)}")
+
+
+class EpisodeUpdateBatch:
+    """Episode column updates collected by unit_of_work() and written together.
+
+    Updates for the same episode are merged, so a worker can record a
+    status and its result fields in separate calls. With `flush_every`,
+    queued updates are written each time that many episodes are pending,
+    so results of a long batch are not all held back until it ends.
     """
-    # Escape backslash first (it's the escape character)
-    escaped = value.replace('\\', '\\\\')
-    # Escape LIKE wildcards
-    escaped = escaped.replace('%', '\\%')
-    escaped = escaped.replace('_', '\\_')
-    # Escape double quotes (used in JSON string matching)
-    escaped = escaped.replace('"', '\\"')
-    return escaped
+
+    def __init__(
+        self,
+        write: Callable[[dict[str, dict[str, Any]]], None] | None = None,
+        flush_every: int | None = None,
+    ):
+        self._updates: dict[str, dict[str, Any]] = {}
+        self._write = write
+        self._flush_every = flush_every
+
+    def update(self, episode_id: str, **fields: Any) -> None:
+        """Queue column updates for an episode.
+
+        Raises:
+            ValueError: If a field is not an Episode column.
+        """
+        _validate_episode_fields(fields)
+        self._updates.setdefault(episode_id, {}).update(fields)
+        if self._flush_every and len(self._updates) >= self._flush_every:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write the queued updates in their own transaction and clear the queue."""
+        if self._updates and self._write is not None:
+            self._write(self._updates)
+            self._updates = {}
+
+    def mark(self, stage: str, episode_id: str, status: str, **fields: Any) -> None:
+        """Queue a status change for a pipeline stage plus any extra fields.
+
+        Raises:
+            ValueError: If stage name is invalid.
+        """
+        if stage not in STAGE_STATUS_FIELDS:
+            raise ValueError(f"Invalid stage: {stage}")
+        self.update(episode_id, **{STAGE_STATUS_FIELDS[stage]: status}, **fields)
+
+    @property
+    def updates(self) -> dict[str, dict[str, Any]]:
+        """Queued updates keyed by episode ID."""
+        return self._updates
+
+    def __len__(self) -> int:
+        return len(self._updates)
 
 
 class PodcastRepositoryInterface(ABC):
@@ -170,6 +254,21 @@ class PodcastRepositoryInterface(ABC):
         """
         pass
 
+    @abstractmethod
+    def list_podcasts_due_for_sync(
+        self, now: datetime, limit: int | None = None
+    ) -> list[Podcast]:
+        """List subscribed podcasts whose next feed check is due.
+
+        Args:
+            now: Podcasts with next_check_at at or before this time (or unset) are due.
+            limit: Maximum number of podcasts to return.
+
+        Returns:
+            List[Podcast]: Due podcasts with at least one subscriber, most overdue first.
+        """
+        pass
+
     # --- Episode Operations ---
 
     @abstractmethod
@@ -237,6 +336,20 @@ class PodcastRepositoryInterface(ABC):
         """
         pass
 
+    @abstractmethod
+    def get_episode_published_dates(self, podcast_id: str, limit: int = 20) -> list[datetime]:
+        """
+        Retrieve the published dates of a podcast's most recent episodes.
+
+        Parameters:
+            podcast_id (str): The podcast's primary identifier.
+            limit (int): Maximum number of dates to return.
+
+        Returns:
+            List[datetime]: Published dates, newest first; episodes without one are skipped.
+        """
+        pass
+
     @abstractmethod
     def get_episode_by_file_search_display_name(
         self, display_name: str
@@ -271,6 +384,39 @@ class PodcastRepositoryInterface(ABC):
         """
         pass
 
+    @abstractmethod
+    def get_episodes_by_file_search_display_names(
+        self, display_names: list[str]
+    ) -> dict[str, Episode]:
+        """
+        Retrieve the episodes for several File Search display names in one query.
+
+        Used to resolve all citations of a File Search response at once.
+
+        Parameters:
+            display_names (List[str]): file_search_display_name values to look up.
+
+        Returns:
+            Dict[str, Episode]: Episodes (with podcast loaded) keyed by display name;
+            names without a matching episode are absent.
+        """
+        pass
+
+    @abstractmethod
+    def get_podcasts_by_description_display_names(
+        self, display_names: list[str]
+    ) -> dict[str, Podcast]:
+        """
+        Retrieve the podcasts for several description File Search display names in one query.
+
+        Parameters:
+            display_names (List[str]): description_file_search_display_name values to look up.
+
+        Returns:
+            Dict[str, Podcast]: Podcasts keyed by display name; names without a match are absent.
+        """
+        pass
+
     @abstractmethod
     def list_episodes(
         self,
@@ -299,6 +445,36 @@ class PodcastRepositoryInterface(ABC):
         """
         pass
 
+    @abstractmethod
+    def list_episodes_page(
+        self,
+        podcast_id: str | None = None,
+        download_status: str | None = None,
+        transcript_status: str | None = None,
+        metadata_status: str | None = None,
+        file_search_status: str | None = None,
+        limit: int = 50,
+        cursor: str | None = None,
+    ) -> tuple[list[Episode], str | None]:
+        """
+        List one page of episodes using keyset pagination.
+
+        Takes the same filters as list_episodes(). Episodes are ordered by published date
+        (newest first, undated episodes last) with the episode id as tiebreaker.
+
+        Parameters:
+            limit (int): Maximum number of episodes in the page.
+            cursor (Optional[str]): Cursor returned with the previous page; None for the first page.
+
+        Returns:
+            tuple[List[Episode], Optional[str]]: The page and the cursor for the next page,
+            or None when this is the last page.
+
+        Raises:
+            ValueError: If the cursor is malformed.
+        """
+        pass
+
     @abstractmethod
     def count_episodes(
         self,
@@ -369,6 +545,24 @@ class PodcastRepositoryInterface(ABC):
         """
         pass
 
+    @abstractmethod
+    def bulk_create_episodes(self, podcast_id: str, episodes: list[dict[str, Any]]) -> int:
+        """
+        Insert many episodes for a podcast, skipping GUIDs that already exist.
+
+        Parameters:
+            podcast_id (str): ID of the parent podcast.
+            episodes (list[dict]): Episode fields per episode; each needs guid,
+                title, enclosure_url and enclosure_type.
+
+        Returns:
+            int: Number of episodes created.
+
+        Raises:
+            ValueError: If a field is not an Episode column.
+        """
+        pass
+
     @abstractmethod
     def get_or_create_episode(
         self,
@@ -400,10 +594,10 @@ class PodcastRepositoryInterface(ABC):
         self, keyword: str, limit: int = 50
     ) -> list[Episode]:
         """
-        Search for episodes containing the specified keyword in ai_keywords.
+        Search for episodes tagged with the specified keyword.
 
         Parameters:
-            keyword (str): The keyword to search for (case-insensitive).
+            keyword (str): The keyword to search for (case- and whitespace-insensitive).
             limit (int): Maximum number of episodes to return (default 50).
 
         Returns:
@@ -419,7 +613,7 @@ class PodcastRepositoryInterface(ABC):
         Search for episodes featuring the specified person as host or guest.
 
         Parameters:
-            name (str): The person's name to search for (case-insensitive).
+            name (str): The person's name to search for (case- and whitespace-insensitive).
             limit (int): Maximum number of episodes to return (default 50).
 
         Returns:
@@ -427,12 +621,90 @@ class PodcastRepositoryInterface(ABC):
         """
         pass
 
+    @abstractmethod
+    def get_top_people(
+        self,
+        role: str | None = None,
+        since: datetime | None = None,
+        limit: int = 10,
+    ) -> list[tuple[str, int]]:
+        """
+        Rank people by the number of episodes they appear in.
+
+        Parameters:
+            role (Optional[str]): Count only "host" or "guest" appearances; None counts both.
+            since (Optional[datetime]): Count only episodes published at or after this time.
+            limit (int): Maximum number of people to return (default 10).
+
+        Returns:
+            List[tuple[str, int]]: (display name, episode count) pairs, most frequent first.
+        """
+        pass
+
+    @abstractmethod
+    def get_episodes_sharing_people(
+        self, episode_id: str, role: str | None = None, limit: int = 10
+    ) -> list[Episode]:
+        """
+        Find other episodes featuring any of the people in an episode.
+
+        Parameters:
+            episode_id (str): Episode whose hosts and guests to match.
+            role (Optional[str]): Match only "host" or "guest" appearances; None matches both.
+            limit (int): Maximum number of episodes to return (default 10).
+
+        Returns:
+            List[Episode]: Episodes ordered by the number of shared people, then published_date descending.
+        """
+        pass
+
+    @abstractmethod
+    def backfill_episode_tags(self, batch_size: int = 500) -> int:
+        """
+        Populate the people and keyword tables from the ai_hosts, ai_guests and ai_keywords of every episode with completed metadata.
+
+        Safe to re-run; each episode's links are replaced.
+
+        Parameters:
+            batch_size (int): Episodes processed per transaction.
+
+        Returns:
+            int: Number of episodes processed.
+        """
+        pass
+
+    @abstractmethod
+    def search_episodes_fulltext(
+        self,
+        query: str,
+        podcast_ids: list[str] | None = None,
+        limit: int = 50,
+        cursor: str | None = None,
+    ) -> tuple[list[Episode], str | None]:
+        """
+        Search transcripts, titles, summaries, keywords, hosts and guests with the full-text index.
+
+        Parameters:
+            query (str): Words and "quoted phrases"; all must match.
+            podcast_ids (Optional[List[str]]): Restrict results to these podcasts.
+            limit (int): Maximum number of episodes to return (default 50).
+            cursor (Optional[str]): Cursor returned by a previous call, to fetch the next page.
+
+        Returns:
+            tuple[List[Episode], Optional[str]]: Matching episodes, best match first, and the cursor
+            for the next page (None when there are no more results).
+
+        Raises:
+            ValueError: If the cursor is malformed.
+        """
+        pass
+
     @abstractmethod
     def get_episodes_pending_download(self, limit: int = 10) -> list[Episode]:
         """
         Retrieve episodes that are pending download.
 
-        Returns episodes whose download_status is "pending", ordered by published_date descending and limited to the most recent `limit` entries.
+        Returns episodes whose download_status is "pending", ordered by priority then published_date descending and limited to `limit` entries.
 
         Parameters:
             limit (int): Maximum number of episodes to return (default 10).
@@ -442,6 +714,16 @@ class PodcastRepositoryInterface(ABC):
         """
         pass
 
+    @abstractmethod
+    def count_episodes_pending_download(self) -> int:
+        """
+        Count episodes awaiting download, from the pipeline counters.
+
+        Returns:
+            int: Number of episodes with download status "pending".
+        """
+        pass
+
     @abstractmethod
     def get_episodes_pending_transcription(self, limit: int = 10) -> list[Episode]:
         """
@@ -509,6 +791,16 @@ class PodcastRepositoryInterface(ABC):
         """
         pass
 
+    @abstractmethod
+    def count_episodes_pending_metadata(self) -> int:
+        """
+        Count transcribed episodes awaiting metadata extraction, from the pipeline counters.
+
+        Returns:
+            int: Number of episodes waiting for metadata.
+        """
+        pass
+
     @abstractmethod
     def get_episodes_pending_indexing(self, limit: int = 10) -> list[Episode]:
         """
@@ -546,8 +838,81 @@ class PodcastRepositoryInterface(ABC):
         """
         pass
 
+    @abstractmethod
+    def count_episodes_ready_for_cleanup(self) -> int:
+        """
+        Count episodes whose audio files can be removed, from the pipeline counters.
+
+        Returns:
+            int: Number of episodes eligible for audio cleanup.
+        """
+        pass
+
     # --- Status Update Helpers ---
 
+    @abstractmethod
+    def mark_many(
+        self, stage: str, episode_ids: list[str], status: str, **fields: Any
+    ) -> int:
+        """
+        Set the status of a pipeline stage for many episodes in one statement.
+
+        Parameters:
+            stage (str): Stage name ('download', 'preprocess', 'transcript', 'metadata', or 'indexing').
+            episode_ids (list[str]): Episodes to update.
+            status (str): New status for the stage.
+            **fields: Additional Episode columns to set to the same value on every episode.
+
+        Returns:
+            int: Number of episodes updated.
+
+        Raises:
+            ValueError: If stage name or a field is invalid.
+        """
+        pass
+
+    @abstractmethod
+    def unit_of_work(self, flush_every: int | None = None) -> Iterator[EpisodeUpdateBatch]:
+        """
+        Collect per-episode updates and write them in a single transaction.
+
+        Used as a context manager; updates queued on the yielded batch are written when the block exits normally and discarded if it raises.
+
+        Example:
+            with repository.unit_of_work() as batch:
+                batch.mark("indexing", episode.id, "indexed", file_search_error=None)
+
+        Parameters:
+            flush_every (int, optional): Write the queued updates in their own transaction
+                whenever this many episodes are pending, instead of only at the end.
+
+        Yields:
+            EpisodeUpdateBatch: Batch to queue updates on.
+        """
+        pass
+
+    @abstractmethod
+    def requeue_stale_episodes(self, stage: str, status: str, older_than: datetime) -> int:
+        """
+        Return episodes left in an in-progress status of a stage to pending.
+
+        Batch workers mark a whole batch in progress before working through it,
+        so episodes whose worker crashed before recording a result would
+        otherwise stay in that status forever.
+
+        Parameters:
+            stage (str): Stage name ('download', 'preprocess', 'transcript', 'metadata', or 'indexing').
+            status (str): In-progress status to requeue from (e.g. "downloading").
+            older_than (datetime): Only episodes last updated before this are requeued.
+
+        Returns:
+            int: Number of episodes returned to pending.
+
+        Raises:
+            ValueError: If stage name is invalid.
+        """
+        pass
+
     @abstractmethod
     def mark_download_started(self, episode_id: str) -> None:
         """
@@ -839,7 +1204,7 @@ class PodcastRepositoryInterface(ABC):
         """
         Get the transcript text for an episode.
 
-        Returns the transcript content from the database (`transcript_text` column).
+        Returns the transcript content from the compressed `episode_transcripts` store.
         For legacy episodes with only `transcript_path`, reads the file content.
 
         Parameters:
@@ -850,8 +1215,57 @@ class PodcastRepositoryInterface(ABC):
         """
         pass
 
+    @abstractmethod
+    def append_transcript_segments(
+        self, episode_id: str, segments: list[tuple[float, float, str]]
+    ) -> None:
+        """
+        Append transcript segments produced while transcribing an episode.
+
+        Parameters:
+            episode_id (str): ID of the episode.
+            segments (list[tuple[float, float, str]]): (start_seconds, end_seconds, text) tuples in decode order.
+        """
+        pass
+
+    @abstractmethod
+    def get_transcript_segments(self, episode_id: str) -> list[EpisodeSegment]:
+        """
+        Get the stored transcript segments for an episode.
+
+        Parameters:
+            episode_id (str): ID of the episode.
+
+        Returns:
+            list[EpisodeSegment]: Segments ordered by start time; empty if none are stored.
+        """
+        pass
+
     # --- Statistics ---
 
+    @abstractmethod
+    def get_pipeline_counters(self, podcast_id: str | None = None) -> dict[str, int]:
+        """
+        Read the incrementally maintained episode counts (see src.db.counters).
+
+        Parameters:
+            podcast_id (str | None): Restrict to one podcast; None sums all podcasts.
+
+        Returns:
+            Dict[str, int]: Count for every counter name in src.db.counters.COUNTERS.
+        """
+        pass
+
+    @abstractmethod
+    def rebuild_pipeline_counters(self) -> None:
+        """
+        Recompute the pipeline counters from the episodes table.
+
+        Only needed to repair counters after episodes were written with the
+        counter triggers missing or disabled.
+        """
+        pass
+
     @abstractmethod
     def get_podcast_stats(self, podcast_id: str) -> dict[str, Any]:
         """
@@ -939,45 +1353,184 @@ class PodcastRepositoryInterface(ABC):
         pass
 
     @abstractmethod
-    def get_next_for_transcription(self) -> Episode | None:
-        """Get the next episode ready for transcription.
+    def get_download_buffer_audio_seconds(
+        self, default_duration_seconds: int = 3600
+    ) -> int:
+        """Sum the audio duration of episodes in the download buffer.
 
-        Returns the most recently published episode that is downloaded
-        and pending transcription, excluding permanently failed episodes.
+        Args:
+            default_duration_seconds: Duration assumed for episodes whose
+                feed did not report one.
 
         Returns:
-            Episode ready for transcription, or None if none available.
+            Seconds of downloaded audio pending transcription.
         """
         pass
 
     @abstractmethod
-    def get_next_pending_post_processing(self) -> Episode | None:
-        """Get the next episode needing post-processing.
+    def refresh_episode_priorities(self, podcast_ids: list[str] | None = None) -> int:
+        """Recompute the queue priority of pending episodes.
 
-        Returns an episode that has completed transcription but still
-        needs metadata extraction, indexing, or cleanup.
+        Called after feed sync and subscription changes, since the score
+        depends on subscriber counts, recency and subscribers' digest hours.
+
+        Args:
+            podcast_ids: Only refresh episodes of these podcasts; None
+                refreshes every podcast.
 
         Returns:
-            Episode needing post-processing, or None if none available.
+            Number of episodes whose priority changed.
         """
         pass
 
     @abstractmethod
-    def increment_retry_count(self, episode_id: str, stage: str) -> int:
-        """Increment the retry count for a processing stage.
+    def get_next_for_transcription(self) -> Episode | None:
+        """Get the next episode ready for transcription.
 
-        Args:
-            episode_id: ID of the episode.
-            stage: Processing stage ("transcript", "metadata", or "indexing").
+        Returns the highest-priority episode that is downloaded and pending
+        transcription (newest first among equal priorities), excluding
+        permanently failed episodes.
 
         Returns:
-            The new retry count after incrementing.
+            Episode ready for transcription, or None if none available.
         """
         pass
 
     @abstractmethod
-    def mark_permanently_failed(
-        self, episode_id: str, stage: str, error: str
+    def claim_next_for_transcription(
+        self, worker_id: str, lease_seconds: int = 3600
+    ) -> Episode | None:
+        """Atomically claim the next episode ready for transcription.
+
+        Selects the same episode as get_next_for_transcription(), but marks it
+        "processing" and records the claiming worker and a lease expiry in the
+        same transaction, so concurrent pipeline nodes never claim the same row.
+
+        Args:
+            worker_id: Identifier of the claiming pipeline node.
+            lease_seconds: How long the claim is valid before it can be reaped.
+
+        Returns:
+            The claimed Episode, or None if no work is available.
+        """
+        pass
+
+    @abstractmethod
+    def renew_transcription_lease(
+        self, episode_id: str, worker_id: str, lease_seconds: int = 3600
+    ) -> bool:
+        """Extend the lease on an episode this worker is transcribing.
+
+        Args:
+            episode_id: ID of the claimed episode.
+            worker_id: Identifier of the worker holding the claim.
+            lease_seconds: New lease length, measured from now.
+
+        Returns:
+            True if the lease was extended, False if the worker no longer holds it.
+        """
+        pass
+
+    @abstractmethod
+    def release_expired_transcription_leases(self) -> int:
+        """Return episodes with expired transcription leases to the queue.
+
+        Episodes whose claiming worker died or stalled are reset to pending
+        so another worker can pick them up.
+
+        Returns:
+            Number of episodes returned to the queue.
+        """
+        pass
+
+    @abstractmethod
+    def get_episodes_pending_preprocessing(self, limit: int = 10) -> list[Episode]:
+        """Get downloaded episodes whose audio has not been preprocessed yet.
+
+        Args:
+            limit: Maximum number of episodes to return.
+
+        Returns:
+            Episodes pending transcription with preprocess_status "pending",
+            in transcription queue order.
+        """
+        pass
+
+    @abstractmethod
+    def count_episodes_pending_preprocessing(self) -> int:
+        """Count downloaded episodes awaiting preprocessing, from the pipeline counters.
+
+        Returns:
+            Number of episodes waiting to be preprocessed.
+        """
+        pass
+
+    @abstractmethod
+    def mark_preprocessing_complete(
+        self,
+        episode_id: str,
+        preprocessed_audio_path: str,
+        speech_regions: list[list[float]],
+    ) -> bool:
+        """Record preprocessed audio for an episode still waiting for transcription.
+
+        Args:
+            episode_id: ID of the episode.
+            preprocessed_audio_path: Path of the decoded 16 kHz PCM file.
+            speech_regions: [start, end] speech regions in seconds.
+
+        Returns:
+            True if recorded, False if transcription already started, in which
+            case the caller should discard the file.
+        """
+        pass
+
+    @abstractmethod
+    def mark_preprocessing_failed(self, episode_id: str) -> None:
+        """Mark preprocessing failed; the episode is transcribed from the original file.
+
+        Args:
+            episode_id: ID of the episode.
+        """
+        pass
+
+    @abstractmethod
+    def clear_preprocessed_audio(self, episode_id: str) -> None:
+        """Delete an episode's preprocessed audio file and clear its fields.
+
+        Args:
+            episode_id: ID of the episode.
+        """
+        pass
+
+    @abstractmethod
+    def get_next_pending_post_processing(self) -> Episode | None:
+        """Get the next episode needing post-processing.
+
+        Returns an episode that has completed transcription but still
+        needs metadata extraction, indexing, or cleanup.
+
+        Returns:
+            Episode needing post-processing, or None if none available.
+        """
+        pass
+
+    @abstractmethod
+    def increment_retry_count(self, episode_id: str, stage: str) -> int:
+        """Increment the retry count for a processing stage.
+
+        Args:
+            episode_id: ID of the episode.
+            stage: Processing stage ("transcript", "metadata", or "indexing").
+
+        Returns:
+            The new retry count after incrementing.
+        """
+        pass
+
+    @abstractmethod
+    def mark_permanently_failed(
+        self, episode_id: str, stage: str, error: str
     ) -> None:
         """Mark an episode as permanently failed for a processing stage.
 
@@ -1327,7 +1880,16 @@ class PodcastRepositoryInterface(ABC):
 
     @abstractmethod
     def get_briefing_by_id(self, briefing_id: str) -> "DailyBriefing | None":
-        """Fetch a single briefing by ID."""
+        """Fetch a single briefing by ID (audio_data deferred, not loaded)."""
+        pass
+
+    @abstractmethod
+    def get_briefing_audio_data(self, briefing_id: str) -> bytes | None:
+        """Fetch a briefing's legacy audio blob, or None if it has none.
+
+        Only briefings generated before audio storage have one; it is moved
+        to storage on first play.
+        """
         pass
 
     @abstractmethod
@@ -1353,20 +1915,44 @@ class PodcastRepositoryInterface(ABC):
     def update_briefing_audio(
         self,
         briefing_id: str,
-        audio_data: bytes,
+        audio_storage_key: str,
+        audio_size_bytes: int,
         audio_mime_type: str,
         audio_duration_sec: int | None,
         status: str,
     ) -> None:
-        """Update all audio fields on a briefing after successful generation."""
+        """Update all audio fields on a briefing after successful generation.
+
+        The audio itself must already be in audio storage under
+        audio_storage_key.
+        """
+        pass
+
+    @abstractmethod
+    def set_briefing_audio_storage_key(
+        self, briefing_id: str, audio_storage_key: str
+    ) -> None:
+        """Point a briefing with a legacy audio blob at its copy in audio storage.
+
+        Drops the blob; the other audio fields are left unchanged.
+        """
+        pass
+
+    @abstractmethod
+    def get_audio_storage_keys_before(self, cutoff: "datetime") -> list[str]:
+        """Storage keys of briefing audio generated before cutoff.
+
+        Used by retention to delete the stored audio that
+        clear_audio_data_before() unlinks.
+        """
         pass
 
     @abstractmethod
     def clear_audio_data_before(self, cutoff: "datetime") -> int:
-        """Clear audio blobs for briefings older than cutoff.
+        """Clear audio for briefings older than cutoff.
 
-        Keeps the text briefing; only nulls audio_data and related fields.
-        Returns number of rows affected.
+        Keeps the text briefing; only nulls audio_data, audio_storage_key and
+        related fields. Returns number of rows affected.
         """
         pass
 
@@ -1438,6 +2024,26 @@ class PodcastRepositoryInterface(ABC):
         """
         pass
 
+    @abstractmethod
+    def list_conversations_page(
+        self, user_id: str, limit: int = 50, cursor: str | None = None
+    ) -> tuple[list[Conversation], str | None]:
+        """List one page of a user's conversations using keyset pagination.
+
+        Args:
+            user_id: The user's UUID.
+            limit: Maximum number of conversations in the page.
+            cursor: Cursor returned with the previous page; None for the first page.
+
+        Returns:
+            tuple[List[Conversation], Optional[str]]: Conversations ordered by updated_at desc,
+            and the cursor for the next page (None on the last page).
+
+        Raises:
+            ValueError: If the cursor is malformed.
+        """
+        pass
+
     @abstractmethod
     def update_conversation(
         self, conversation_id: str, **kwargs
@@ -1502,6 +2108,26 @@ class PodcastRepositoryInterface(ABC):
         """
         pass
 
+    @abstractmethod
+    def get_messages_page(
+        self, conversation_id: str, limit: int = 100, cursor: str | None = None
+    ) -> tuple[list[ChatMessage], str | None]:
+        """Get one page of a conversation's messages using keyset pagination.
+
+        Args:
+            conversation_id: The conversation UUID.
+            limit: Maximum number of messages in the page.
+            cursor: Cursor returned with the previous page; None for the first page.
+
+        Returns:
+            tuple[List[ChatMessage], Optional[str]]: Messages ordered by created_at asc,
+            and the cursor for the next page (None on the last page).
+
+        Raises:
+            ValueError: If the cursor is malformed.
+        """
+        pass
+
     @abstractmethod
     def count_conversations(self, user_id: str) -> int:
         """Count total conversations for a user.
@@ -1532,6 +2158,9 @@ class SQLAlchemyPodcastRepository(PodcastRepositoryInterface):
     Supports SQLite for local development and PostgreSQL for production.
     """
 
+    # Compare-and-swap attempts before claim_next_for_transcription() gives up
+    _CLAIM_MAX_ATTEMPTS = 5
+
     def __init__(
         self,
         database_url: str,
@@ -1540,6 +2169,7 @@ class SQLAlchemyPodcastRepository(PodcastRepositoryInterface):
         echo: bool = False,
         pool_pre_ping: bool = True,  # Detect stale connections
         pool_recycle: int = 1800,  # Recycle connections after 30 minutes
+        priority_function: PriorityFunction = default_priority,
     ):
         """
         Initialize the repository and configure its SQLAlchemy engine and session factory.
@@ -1553,8 +2183,10 @@ class SQLAlchemyPodcastRepository(PodcastRepositoryInterface):
             echo (bool): If true, enable SQLAlchemy SQL statement logging.
             pool_pre_ping (bool): If true, test connections for liveness before using them (recommended for Supabase).
             pool_recycle (int): Seconds after which to recycle connections (default 1800 = 30 minutes).
+            priority_function (PriorityFunction): Scores pending episodes for the download and transcription queues.
         """
         self.database_url = database_url
+        self.priority_function = priority_function
 
         # SQLite doesn't support connection pooling
         if database_url.startswith("sqlite"):
@@ -1767,6 +2399,34 @@ class SQLAlchemyPodcastRepository(PodcastRepositoryInterface):
                 stmt = stmt.limit(limit)
             return list(session.scalars(stmt).all())
 
+    def list_podcasts_due_for_sync(
+        self, now: datetime, limit: int | None = None
+    ) -> list[Podcast]:
+        """List subscribed podcasts whose next feed check is due.
+
+        Args:
+            now: Podcasts with next_check_at at or before this time (or unset) are due.
+            limit: Maximum number of podcasts to return.
+
+        Returns:
+            List[Podcast]: Due podcasts with at least one subscriber, most overdue first.
+        """
+        with self._get_session() as session:
+            subquery = (
+                select(UserSubscription.podcast_id)
+                .distinct()
+                .subquery()
+            )
+            stmt = (
+                select(Podcast)
+                .where(or_(Podcast.next_check_at.is_(None), Podcast.next_check_at <= now))
+                .where(Podcast.id.in_(select(subquery)))
+                .order_by(Podcast.next_check_at.asc().nulls_first())
+            )
+            if limit:
+                stmt = stmt.limit(limit)
+            return list(session.scalars(stmt).all())
+
     # --- Episode Operations ---
 
     def create_episode(
@@ -1792,6 +2452,7 @@ class SQLAlchemyPodcastRepository(PodcastRepositoryInterface):
         Returns:
             episode (Episode): The persisted Episode instance with database-generated fields populated.
         """
+        transcript_text = kwargs.pop("transcript_text", None)
         with self._get_session() as session:
             episode = Episode(
                 podcast_id=podcast_id,
@@ -1801,6 +2462,8 @@ class SQLAlchemyPodcastRepository(PodcastRepositoryInterface):
                 enclosure_type=enclosure_type,
                 **kwargs,
             )
+            if transcript_text is not None:
+                episode.transcript = EpisodeTranscript(text=transcript_text)
             session.add(episode)
             session.commit()
             session.refresh(episode)
@@ -1850,6 +2513,27 @@ class SQLAlchemyPodcastRepository(PodcastRepositoryInterface):
             )
             return session.scalar(stmt)
 
+    def get_episode_published_dates(self, podcast_id: str, limit: int = 20) -> list[datetime]:
+        """
+        Retrieve the published dates of a podcast's most recent episodes.
+
+        Parameters:
+            podcast_id (str): The podcast's primary identifier.
+            limit (int): Maximum number of dates to return.
+
+        Returns:
+            List[datetime]: Published dates, newest first; episodes without one are skipped.
+        """
+        with self._get_session() as session:
+            stmt = (
+                select(Episode.published_date)
+                .where(Episode.podcast_id == podcast_id)
+                .where(Episode.published_date.isnot(None))
+                .order_by(Episode.published_date.desc())
+                .limit(limit)
+            )
+            return list(session.scalars(stmt).all())
+
     def get_episode_by_file_search_display_name(
         self, display_name: str
     ) -> Episode | None:
@@ -1885,6 +2569,50 @@ class SQLAlchemyPodcastRepository(PodcastRepositoryInterface):
             )
             return session.scalars(stmt).first()
 
+    def get_episodes_by_file_search_display_names(
+        self, display_names: list[str]
+    ) -> dict[str, Episode]:
+        """
+        Retrieve the episodes for several File Search display names in one query.
+
+        @returns Episodes keyed by display name; names without a match are absent.
+        """
+        names = set(display_names)
+        if not names:
+            return {}
+        with self._get_session() as session:
+            stmt = (
+                select(Episode)
+                .options(joinedload(Episode.podcast))
+                .where(Episode.file_search_display_name.in_(names))
+            )
+            episodes = {}
+            for episode in session.scalars(stmt).unique():
+                # Keep the first match, as the single-name lookup does
+                episodes.setdefault(episode.file_search_display_name, episode)
+            return episodes
+
+    def get_podcasts_by_description_display_names(
+        self, display_names: list[str]
+    ) -> dict[str, Podcast]:
+        """
+        Retrieve the podcasts for several description File Search display names in one query.
+
+        @returns Podcasts keyed by display name; names without a match are absent.
+        """
+        names = set(display_names)
+        if not names:
+            return {}
+        with self._get_session() as session:
+            stmt = (
+                select(Podcast)
+                .where(Podcast.description_file_search_display_name.in_(names))
+            )
+            podcasts = {}
+            for podcast in session.scalars(stmt):
+                podcasts.setdefault(podcast.description_file_search_display_name, podcast)
+            return podcasts
+
     def list_episodes(
         self,
         podcast_id: str | None = None,
@@ -1911,19 +2639,14 @@ class SQLAlchemyPodcastRepository(PodcastRepositoryInterface):
             List[Episode]: Episodes matching the supplied filters ordered by published date (newest first).
         """
         with self._get_session() as session:
-            stmt = select(Episode).options(joinedload(Episode.podcast))
-
-            if podcast_id:
-                stmt = stmt.where(Episode.podcast_id == podcast_id)
-            if download_status:
-                stmt = stmt.where(Episode.download_status == download_status)
-            if transcript_status:
-                stmt = stmt.where(Episode.transcript_status == transcript_status)
-            if metadata_status:
-                stmt = stmt.where(Episode.metadata_status == metadata_status)
-            if file_search_status:
-                stmt = stmt.where(Episode.file_search_status == file_search_status)
-
+            stmt = self._filter_episodes(
+                select(Episode).options(joinedload(Episode.podcast)),
+                podcast_id=podcast_id,
+                download_status=download_status,
+                transcript_status=transcript_status,
+                metadata_status=metadata_status,
+                file_search_status=file_search_status,
+            )
             stmt = stmt.order_by(Episode.published_date.desc())
             stmt = stmt.offset(offset)
             if limit:
@@ -1931,6 +2654,73 @@ class SQLAlchemyPodcastRepository(PodcastRepositoryInterface):
 
             return list(session.scalars(stmt).unique().all())
 
+    def list_episodes_page(
+        self,
+        podcast_id: str | None = None,
+        download_status: str | None = None,
+        transcript_status: str | None = None,
+        metadata_status: str | None = None,
+        file_search_status: str | None = None,
+        limit: int = 50,
+        cursor: str | None = None,
+    ) -> tuple[list[Episode], str | None]:
+        """
+        List one page of episodes using keyset pagination.
+
+        Seeks past the (published_date, id) position in the cursor instead of using OFFSET,
+        so deep pages cost the same as the first.
+
+        Parameters:
+            podcast_id (Optional[str]): Filter episodes belonging to the given podcast.
+            download_status (Optional[str]): Filter by download status.
+            transcript_status (Optional[str]): Filter by transcription status.
+            metadata_status (Optional[str]): Filter by metadata status.
+            file_search_status (Optional[str]): Filter by file-search/indexing status.
+            limit (int): Maximum number of episodes in the page.
+            cursor (Optional[str]): Cursor returned with the previous page; None for the first page.
+
+        Returns:
+            tuple[List[Episode], Optional[str]]: Episodes newest first (undated last), and the
+            cursor for the next page, or None when this is the last page.
+
+        Raises:
+            ValueError: If the cursor is malformed.
+        """
+        with self._get_session() as session:
+            stmt = self._filter_episodes(
+                select(Episode).options(joinedload(Episode.podcast)),
+                podcast_id=podcast_id,
+                download_status=download_status,
+                transcript_status=transcript_status,
+                metadata_status=metadata_status,
+                file_search_status=file_search_status,
+            )
+            return fetch_page(
+                session, stmt, Episode.published_date, Episode.id, limit, cursor
+            )
+
+    @staticmethod
+    def _filter_episodes(
+        stmt,
+        podcast_id: str | None = None,
+        download_status: str | None = None,
+        transcript_status: str | None = None,
+        metadata_status: str | None = None,
+        file_search_status: str | None = None,
+    ):
+        """Apply the list_episodes() filters to an episode query."""
+        if podcast_id:
+            stmt = stmt.where(Episode.podcast_id == podcast_id)
+        if download_status:
+            stmt = stmt.where(Episode.download_status == download_status)
+        if transcript_status:
+            stmt = stmt.where(Episode.transcript_status == transcript_status)
+        if metadata_status:
+            stmt = stmt.where(Episode.metadata_status == metadata_status)
+        if file_search_status:
+            stmt = stmt.where(Episode.file_search_status == file_search_status)
+        return stmt
+
     def count_episodes(
         self,
         podcast_id: str | None = None,
@@ -1976,7 +2766,7 @@ class SQLAlchemyPodcastRepository(PodcastRepositoryInterface):
 
         Parameters:
             episode_id (str): Primary key of the episode to update.
-            **kwargs: Episode attributes to set (only attributes that exist on the model are applied).
+            **kwargs: Episode attributes to set (only attributes that exist on the model are applied). `transcript_text` is written to the compressed transcript store.
 
         Returns:
             Optional[Episode]: The updated Episode instance, or `None` if no episode with `episode_id` exists.
@@ -1984,15 +2774,30 @@ class SQLAlchemyPodcastRepository(PodcastRepositoryInterface):
         with self._get_session() as session:
             episode = session.get(Episode, episode_id)
             if episode:
-                for key, value in kwargs.items():
-                    if hasattr(episode, key):
-                        setattr(episode, key, value)
-                episode.updated_at = datetime.now(UTC)
+                self._set_episode_fields(session, episode, kwargs)
                 session.commit()
                 session.refresh(episode)
                 logger.debug(f"Updated episode {episode_id}: {kwargs.keys()}")
             return episode
 
+    def _set_episode_fields(
+        self, session: Session, episode: Episode, fields: dict[str, Any]
+    ) -> None:
+        """
+        Apply attribute updates to an episode within the caller's session and bump `updated_at`.
+
+        Parameters:
+            session (Session): Open session holding `episode`; the caller commits.
+            episode (Episode): Episode to update.
+            fields (dict): Episode attributes to set, as for `update_episode`.
+        """
+        if "transcript_text" in fields:
+            self._store_transcript(session, episode.id, fields["transcript_text"])
+        for key, value in fields.items():
+            if key != "transcript_text" and hasattr(episode, key):
+                setattr(episode, key, value)
+        episode.updated_at = datetime.now(UTC)
+
     def delete_episode(self, episode_id: str, delete_files: bool = False) -> bool:
         """
         Delete an episode record from the database and optionally remove its associated files from disk.
@@ -2018,6 +2823,7 @@ class SQLAlchemyPodcastRepository(PodcastRepositoryInterface):
                         logger.debug(f"Deleted file: {path}")
 
             session.delete(episode)
+            fulltext.delete_document(session, episode_id)
             session.commit()
             logger.debug(f"Deleted episode: {episode.title} ({episode_id})")
             return True
@@ -2041,6 +2847,76 @@ class SQLAlchemyPodcastRepository(PodcastRepositoryInterface):
             stmt = select(Episode.guid).where(Episode.podcast_id == podcast_id)
             return set(session.scalars(stmt).all())
 
+    def bulk_create_episodes(self, podcast_id: str, episodes: list[dict[str, Any]]) -> int:
+        """
+        Insert many episodes for a podcast, skipping GUIDs that already exist.
+
+        Uses multi-row INSERT ... ON CONFLICT (podcast_id, guid) DO NOTHING in
+        chunks, each committed on its own, so an import of thousands of
+        episodes is a handful of statements, and episodes created concurrently
+        by another process are skipped rather than failing the batch. When a
+        chunk is rejected (e.g. a value too long for its column), its rows are
+        retried one at a time and the failing ones are logged and skipped.
+
+        Parameters:
+            podcast_id (str): ID of the parent podcast.
+            episodes (list[dict]): Episode fields per episode; each needs guid,
+                title, enclosure_url and enclosure_type. Repeated GUIDs keep
+                their first occurrence.
+
+        Returns:
+            int: Number of episodes created.
+
+        Raises:
+            ValueError: If a field is not an Episode column.
+        """
+        rows: dict[str, dict[str, Any]] = {}
+        for fields in episodes:
+            _validate_episode_fields(fields)
+            rows.setdefault(fields["guid"], {**fields, "podcast_id": podcast_id})
+        if not rows:
+            return 0
+
+        insert = pg_insert if self.engine.dialect.name == "postgresql" else sqlite_insert
+        stmt = insert(Episode).on_conflict_do_nothing(index_elements=["podcast_id", "guid"])
+        returning = self.engine.dialect.insert_returning
+        if returning:
+            stmt = stmt.returning(Episode.id)
+
+        # A multi-row VALUES needs the same columns in every row
+        batches: dict[tuple[str, ...], list[dict[str, Any]]] = {}
+        for row in rows.values():
+            batches.setdefault(tuple(sorted(row)), []).append(row)
+
+        def insert_rows(session: Session, chunk: list[dict[str, Any]]) -> int:
+            result = session.execute(stmt.values(chunk))
+            count = len(result.all()) if returning else result.rowcount
+            session.commit()
+            return count
+
+        created = 0
+        with self._get_session() as session:
+            for batch in batches.values():
+                for start in range(0, len(batch), _BULK_INSERT_CHUNK_SIZE):
+                    chunk = batch[start:start + _BULK_INSERT_CHUNK_SIZE]
+                    try:
+                        created += insert_rows(session, chunk)
+                        continue
+                    except DBAPIError:
+                        session.rollback()
+                    for row in chunk:
+                        try:
+                            created += insert_rows(session, [row])
+                        except DBAPIError as e:
+                            session.rollback()
+                            logger.warning(
+                                f"Skipping episode {row['guid']!r} for podcast "
+                                f"{podcast_id}: {e.orig}"
+                            )
+
+        logger.debug(f"Created {created} of {len(rows)} episodes for podcast {podcast_id}")
+        return created
+
     def get_or_create_episode(
         self,
         podcast_id: str,
@@ -2094,27 +2970,21 @@ class SQLAlchemyPodcastRepository(PodcastRepositoryInterface):
         self, keyword: str, limit: int = 50
     ) -> list[Episode]:
         """
-        Search for episodes containing the specified keyword in ai_keywords.
+        Search for episodes tagged with the specified keyword.
 
-        Uses case-insensitive JSON string matching for cross-database compatibility
-        (SQLite and PostgreSQL) via lower() + like() instead of ilike().
-        Special LIKE characters are escaped to prevent injection.
+        Looks the normalised keyword up in the keywords table and follows the
+        episode_keywords index, so no episode rows are scanned.
         """
-        # Lowercase and escape special characters for case-insensitive LIKE
-        escaped_keyword = _escape_like_pattern(keyword.lower())
-        pattern = f'%"{escaped_keyword}"%'
-
+        matching = (
+            select(EpisodeKeyword.episode_id)
+            .join(Keyword, Keyword.id == EpisodeKeyword.keyword_id)
+            .where(Keyword.name == _normalize_tag(keyword))
+        )
         with self._get_session() as session:
-            # Use func.lower() + like() for portable case-insensitive search
-            # (ilike is PostgreSQL-specific and not supported by SQLite)
             stmt = (
                 select(Episode)
                 .options(joinedload(Episode.podcast))
-                .where(
-                    func.lower(cast(Episode.ai_keywords, String)).like(
-                        pattern, escape='\\'
-                    )
-                )
+                .where(Episode.id.in_(matching))
                 .order_by(Episode.published_date.desc())
                 .limit(limit)
             )
@@ -2126,35 +2996,249 @@ class SQLAlchemyPodcastRepository(PodcastRepositoryInterface):
         """
         Search for episodes featuring the specified person as host or guest.
 
-        Uses case-insensitive JSON string matching for cross-database compatibility
-        (SQLite and PostgreSQL) via lower() + like() instead of ilike().
-        Special LIKE characters are escaped to prevent injection.
+        Looks the normalised name up in the people table and follows the
+        episode_people index, so no episode rows are scanned.
         """
-        # Lowercase and escape special characters for case-insensitive LIKE
-        escaped_name = _escape_like_pattern(name.lower())
-        pattern = f'%"{escaped_name}"%'
-
+        matching = (
+            select(EpisodePerson.episode_id)
+            .join(Person, Person.id == EpisodePerson.person_id)
+            .where(Person.name == _normalize_tag(name))
+        )
         with self._get_session() as session:
-            # Use func.lower() + like() for portable case-insensitive search
-            # (ilike is PostgreSQL-specific and not supported by SQLite)
             stmt = (
                 select(Episode)
                 .options(joinedload(Episode.podcast))
-                .where(
-                    or_(
-                        func.lower(cast(Episode.ai_hosts, String)).like(
-                            pattern, escape='\\'
-                        ),
-                        func.lower(cast(Episode.ai_guests, String)).like(
-                            pattern, escape='\\'
-                        ),
-                    )
-                )
+                .where(Episode.id.in_(matching))
                 .order_by(Episode.published_date.desc())
                 .limit(limit)
             )
             return list(session.scalars(stmt).unique().all())
 
+    def get_top_people(
+        self,
+        role: str | None = None,
+        since: datetime | None = None,
+        limit: int = 10,
+    ) -> list[tuple[str, int]]:
+        """
+        Rank people by the number of episodes they appear in.
+        """
+        episode_count = func.count(func.distinct(EpisodePerson.episode_id))
+        stmt = (
+            select(Person.display_name, episode_count)
+            .join(EpisodePerson, EpisodePerson.person_id == Person.id)
+            .group_by(Person.id, Person.display_name)
+            .order_by(episode_count.desc(), Person.display_name)
+            .limit(limit)
+        )
+        if role is not None:
+            stmt = stmt.where(EpisodePerson.role == role)
+        if since is not None:
+            stmt = stmt.join(Episode, Episode.id == EpisodePerson.episode_id).where(
+                Episode.published_date >= since
+            )
+
+        with self._get_session() as session:
+            return [(name, count) for name, count in session.execute(stmt).all()]
+
+    def get_episodes_sharing_people(
+        self, episode_id: str, role: str | None = None, limit: int = 10
+    ) -> list[Episode]:
+        """
+        Find other episodes featuring any of the people in an episode.
+        """
+        people = select(EpisodePerson.person_id).where(EpisodePerson.episode_id == episode_id)
+        if role is not None:
+            people = people.where(EpisodePerson.role == role)
+
+        shared = func.count(func.distinct(EpisodePerson.person_id))
+        related = (
+            select(EpisodePerson.episode_id, shared.label("shared"))
+            .where(
+                EpisodePerson.person_id.in_(people),
+                EpisodePerson.episode_id != episode_id,
+            )
+            .group_by(EpisodePerson.episode_id)
+        )
+        if role is not None:
+            related = related.where(EpisodePerson.role == role)
+        related = related.subquery()
+
+        with self._get_session() as session:
+            stmt = (
+                select(Episode)
+                .options(joinedload(Episode.podcast))
+                .join(related, related.c.episode_id == Episode.id)
+                .order_by(related.c.shared.desc(), Episode.published_date.desc())
+                .limit(limit)
+            )
+            return list(session.scalars(stmt).unique().all())
+
+    def backfill_episode_tags(self, batch_size: int = 500) -> int:
+        """
+        Populate the people and keyword tables from the ai_hosts, ai_guests and ai_keywords of every episode with completed metadata.
+
+        Walks episodes in primary-key order, one transaction per batch.
+        """
+        processed = 0
+        last_id = ""
+        while True:
+            with self._get_session() as session:
+                rows = session.execute(
+                    select(Episode.id, Episode.ai_hosts, Episode.ai_guests, Episode.ai_keywords)
+                    .where(Episode.metadata_status == "completed", Episode.id > last_id)
+                    .order_by(Episode.id)
+                    .limit(batch_size)
+                ).all()
+                if not rows:
+                    break
+                for episode_id, hosts, guests, keywords in rows:
+                    self._replace_episode_tags(session, episode_id, hosts, guests, keywords)
+                session.commit()
+            processed += len(rows)
+            last_id = rows[-1][0]
+            logger.info(f"Backfilled people and keywords for {processed} episodes")
+        return processed
+
+    def _get_or_create_tag_ids(
+        self, session: Session, model: type[Person] | type[Keyword], values: list[str]
+    ) -> dict[str, int]:
+        """
+        Map normalised names to ids of Person or Keyword rows, inserting any that are missing.
+
+        Inserts use ON CONFLICT DO NOTHING so concurrent workers adding the same name do not fail.
+
+        Parameters:
+            session (Session): Open session; the caller commits.
+            model: Person or Keyword.
+            values (list[str]): Names as extracted; blanks are ignored.
+
+        Returns:
+            dict[str, int]: Normalised name -> row id.
+        """
+        display_names: dict[str, str] = {}
+        for value in values:
+            name = _normalize_tag(value)[:_TAG_MAX_LENGTH]
+            if name:
+                display_names.setdefault(name, " ".join(value.split())[:_TAG_MAX_LENGTH])
+        if not display_names:
+            return {}
+
+        insert = pg_insert if self.engine.dialect.name == "postgresql" else sqlite_insert
+        session.execute(
+            insert(model)
+            .values([
+                {"name": name, "display_name": display_name}
+                for name, display_name in display_names.items()
+            ])
+            .on_conflict_do_nothing(index_elements=["name"])
+        )
+        rows = session.execute(
+            select(model.name, model.id).where(model.name.in_(list(display_names)))
+        )
+        return dict(rows.all())
+
+    def _replace_episode_tags(
+        self,
+        session: Session,
+        episode_id: str,
+        hosts: list[str] | None,
+        guests: list[str] | None,
+        keywords: list[str] | None,
+    ) -> None:
+        """
+        Replace an episode's rows in episode_people and episode_keywords.
+
+        Parameters:
+            session (Session): Open session; the caller commits.
+            episode_id (str): ID of the episode.
+            hosts (Optional[List[str]]): Host names.
+            guests (Optional[List[str]]): Guest names.
+            keywords (Optional[List[str]]): Keywords.
+        """
+        hosts, guests, keywords = hosts or [], guests or [], keywords or []
+        session.execute(delete(EpisodePerson).where(EpisodePerson.episode_id == episode_id))
+        session.execute(delete(EpisodeKeyword).where(EpisodeKeyword.episode_id == episode_id))
+
+        person_ids = self._get_or_create_tag_ids(session, Person, hosts + guests)
+        people_links = {
+            (person_ids[name], role)
+            for role, names in (("host", hosts), ("guest", guests))
+            for name in (_normalize_tag(n)[:_TAG_MAX_LENGTH] for n in names)
+            if name
+        }
+        if people_links:
+            session.execute(
+                sa_insert(EpisodePerson),
+                [
+                    {"episode_id": episode_id, "person_id": person_id, "role": role}
+                    for person_id, role in people_links
+                ],
+            )
+
+        keyword_ids = self._get_or_create_tag_ids(session, Keyword, keywords)
+        if keyword_ids:
+            session.execute(
+                sa_insert(EpisodeKeyword),
+                [
+                    {"episode_id": episode_id, "keyword_id": keyword_id}
+                    for keyword_id in keyword_ids.values()
+                ],
+            )
+
+    def search_episodes_fulltext(
+        self,
+        query: str,
+        podcast_ids: list[str] | None = None,
+        limit: int = 50,
+        cursor: str | None = None,
+    ) -> tuple[list[Episode], str | None]:
+        """
+        Search transcripts, titles, summaries, keywords, hosts and guests with the full-text index.
+
+        Ranked with ts_rank_cd on PostgreSQL and bm25 on SQLite. The cursor is the
+        offset into the ranked results.
+        """
+        try:
+            offset = int(cursor) if cursor else 0
+        except ValueError:
+            raise ValueError(f"Invalid cursor: {cursor}") from None
+        if offset < 0:
+            raise ValueError(f"Invalid cursor: {cursor}")
+
+        with self._get_session() as session:
+            # Fetch one extra hit to learn whether there is a next page
+            hits = fulltext.search(
+                session, query, podcast_ids=podcast_ids, limit=limit + 1, offset=offset
+            )
+            has_more = len(hits) > limit
+            ids = [episode_id for episode_id, _ in hits[:limit]]
+            if not ids:
+                return [], None
+
+            stmt = (
+                select(Episode)
+                .options(joinedload(Episode.podcast))
+                .where(Episode.id.in_(ids))
+            )
+            by_id = {ep.id: ep for ep in session.scalars(stmt).unique().all()}
+            episodes = [by_id[episode_id] for episode_id in ids if episode_id in by_id]
+
+        next_cursor = str(offset + len(ids)) if has_more else None
+        return episodes, next_cursor
+
+    def _refresh_search_document(self, session: Session, episode: Episode) -> None:
+        """
+        Rebuild an episode's row in the full-text search index within the caller's session.
+
+        Parameters:
+            session (Session): Open session holding `episode`; the caller commits.
+            episode (Episode): Episode to re-index from its current metadata and transcript.
+        """
+        record = session.get(EpisodeTranscript, episode.id)
+        document = fulltext.build_document(episode, record.text if record is not None else None)
+        fulltext.upsert_document(session, episode.id, document)
+
     def get_episodes_pending_download(self, limit: int = 10) -> list[Episode]:
         """
         Retrieve pending episodes awaiting download.
@@ -2163,22 +3247,31 @@ class SQLAlchemyPodcastRepository(PodcastRepositoryInterface):
             limit (int): Maximum number of episodes to return (default 10).
 
         Returns:
-            List[Episode]: Episodes with `download_status == "pending"`, ordered by `published_date` descending, up to `limit` items.
+            List[Episode]: Episodes with `download_status == "pending"`, ordered by `priority` then `published_date` descending, up to `limit` items.
         """
         with self._get_session() as session:
             stmt = (
                 select(Episode)
                 .where(Episode.download_status == "pending")
-                .order_by(Episode.published_date.desc())
+                .order_by(Episode.priority.desc(), Episode.published_date.desc())
                 .limit(limit)
             )
             return list(session.scalars(stmt).all())
 
+    def count_episodes_pending_download(self) -> int:
+        """
+        Count episodes awaiting download, from the pipeline counters.
+
+        Returns:
+            int: Number of episodes with download status "pending".
+        """
+        return self._get_pipeline_counter("pending_download")
+
     def get_episodes_pending_transcription(self, limit: int = 10) -> list[Episode]:
         """
         Return episodes that have been downloaded and are awaiting transcription.
 
-        @returns List[Episode]: Episodes with download_status == "completed", transcript_status == "pending", and a non-null local_file_path, ordered by published_date descending and limited to the provided `limit`.
+        @returns List[Episode]: Episodes with download_status == "completed", transcript_status == "pending", and a non-null local_file_path, ordered by priority then published_date descending and limited to the provided `limit`.
         """
         with self._get_session() as session:
             stmt = (
@@ -2188,7 +3281,7 @@ class SQLAlchemyPodcastRepository(PodcastRepositoryInterface):
                     Episode.transcript_status == "pending",
                     Episode.local_file_path.isnot(None),
                 )
-                .order_by(Episode.published_date.desc())
+                .order_by(Episode.priority.desc(), Episode.published_date.desc())
                 .limit(limit)
             )
             return list(session.scalars(stmt).all())
@@ -2226,7 +3319,7 @@ class SQLAlchemyPodcastRepository(PodcastRepositoryInterface):
             conditions = [
                 Episode.metadata_status == "completed",
                 Episode.ai_email_content.is_(None),
-                Episode.transcript_text.isnot(None),
+                Episode.transcript.has(),
             ]
 
             if since_hours > 0:
@@ -2243,11 +3336,7 @@ class SQLAlchemyPodcastRepository(PodcastRepositoryInterface):
             if limit and limit > 0:
                 stmt = stmt.limit(limit)
 
-            episodes = list(session.scalars(stmt).unique().all())
-            # Eagerly access transcript_text before session closes
-            for ep in episodes:
-                _ = ep.transcript_text
-            return episodes
+            return list(session.scalars(stmt).unique().all())
 
     def get_episodes_pending_metadata(self, limit: int = 10) -> list[Episode]:
         """
@@ -2258,7 +3347,7 @@ class SQLAlchemyPodcastRepository(PodcastRepositoryInterface):
 
         Returns:
             List[Episode]: Episodes whose `transcript_status` is "completed", `metadata_status` is "pending",
-            and have transcript content (either `transcript_text` or legacy `transcript_path`),
+            and have transcript content (a stored transcript or legacy `transcript_path`),
             ordered by `published_date` descending.
         """
         with self._get_session() as session:
@@ -2268,7 +3357,7 @@ class SQLAlchemyPodcastRepository(PodcastRepositoryInterface):
                     Episode.transcript_status == "completed",
                     Episode.metadata_status == "pending",
                     or_(
-                        Episode.transcript_text.isnot(None),
+                        Episode.transcript.has(),
                         Episode.transcript_path.isnot(None),
                     ),
                 )
@@ -2277,6 +3366,15 @@ class SQLAlchemyPodcastRepository(PodcastRepositoryInterface):
             )
             return list(session.scalars(stmt).all())
 
+    def count_episodes_pending_metadata(self) -> int:
+        """
+        Count transcribed episodes awaiting metadata extraction.
+
+        Returns:
+            int: Number of episodes waiting for metadata.
+        """
+        return self._get_pipeline_counter("metadata_queue")
+
     def get_episodes_pending_indexing(self, limit: int = 10) -> list[Episode]:
         """
         Return episodes that have completed metadata and are pending File Search indexing.
@@ -2296,7 +3394,7 @@ class SQLAlchemyPodcastRepository(PodcastRepositoryInterface):
                     Episode.metadata_status == "completed",
                     Episode.file_search_status == "pending",
                     or_(
-                        Episode.transcript_text.isnot(None),
+                        Episode.transcript.has(),
                         Episode.transcript_path.isnot(None),
                     ),
                 )
@@ -2312,20 +3410,7 @@ class SQLAlchemyPodcastRepository(PodcastRepositoryInterface):
         Returns:
             int: Number of episodes waiting to be indexed.
         """
-        with self._get_session() as session:
-            return (
-                session.scalar(
-                    select(func.count(Episode.id)).where(
-                        Episode.metadata_status == "completed",
-                        Episode.file_search_status == "pending",
-                        or_(
-                            Episode.transcript_text.isnot(None),
-                            Episode.transcript_path.isnot(None),
-                        ),
-                    )
-                )
-                or 0
-            )
+        return self._get_pipeline_counter("indexing_queue")
 
     def get_episodes_ready_for_cleanup(self, limit: int = 10) -> list[Episode]:
         """
@@ -2351,8 +3436,134 @@ class SQLAlchemyPodcastRepository(PodcastRepositoryInterface):
             )
             return list(session.scalars(stmt).all())
 
+    def count_episodes_ready_for_cleanup(self) -> int:
+        """
+        Count episodes whose audio files can be removed.
+
+        Returns:
+            int: Number of episodes eligible for audio cleanup.
+        """
+        return self._get_pipeline_counter("cleanup_queue")
+
     # --- Status Update Helpers ---
 
+    def mark_many(
+        self, stage: str, episode_ids: list[str], status: str, **fields: Any
+    ) -> int:
+        """
+        Set the status of a pipeline stage for many episodes with UPDATE ... WHERE id IN (...).
+
+        Large id lists are split into chunks, all written in one transaction.
+
+        Parameters:
+            stage (str): Stage name ('download', 'preprocess', 'transcript', 'metadata', or 'indexing').
+            episode_ids (list[str]): Episodes to update.
+            status (str): New status for the stage.
+            **fields: Additional Episode columns to set to the same value on every episode.
+
+        Returns:
+            int: Number of episodes updated.
+
+        Raises:
+            ValueError: If stage name or a field is invalid.
+        """
+        if stage not in STAGE_STATUS_FIELDS:
+            raise ValueError(f"Invalid stage: {stage}")
+        _validate_episode_fields(fields)
+        if not episode_ids:
+            return 0
+
+        values = {STAGE_STATUS_FIELDS[stage]: status, **fields, "updated_at": datetime.now(UTC)}
+        ids = list(dict.fromkeys(episode_ids))
+        updated = 0
+        with self._get_session() as session:
+            for start in range(0, len(ids), _BULK_UPDATE_CHUNK_SIZE):
+                chunk = ids[start:start + _BULK_UPDATE_CHUNK_SIZE]
+                result = session.execute(
+                    sa_update(Episode)
+                    .where(Episode.id.in_(chunk))
+                    .values(**values)
+                    .execution_options(synchronize_session=False)
+                )
+                updated += result.rowcount
+            session.commit()
+
+        logger.debug(f"Set {STAGE_STATUS_FIELDS[stage]}={status} on {updated} episodes")
+        return updated
+
+    @contextmanager
+    def unit_of_work(self, flush_every: int | None = None) -> Iterator[EpisodeUpdateBatch]:
+        """
+        Collect per-episode updates and write them in a single transaction.
+
+        Episodes updating the same set of columns are written with one executemany UPDATE, so a batch of results costs a handful of statements on one pooled connection rather than a session per episode.
+
+        Parameters:
+            flush_every (int, optional): Write the queued updates in their own transaction
+                whenever this many episodes are pending, instead of only at the end.
+
+        Yields:
+            EpisodeUpdateBatch: Batch to queue updates on.
+        """
+        batch = EpisodeUpdateBatch(write=self._write_episode_updates, flush_every=flush_every)
+        yield batch
+        batch.flush()
+
+    def _write_episode_updates(self, updates: dict[str, dict[str, Any]]) -> None:
+        """
+        Write queued per-episode updates in one transaction.
+
+        Parameters:
+            updates (dict): Column updates keyed by episode ID.
+        """
+        now = datetime.now(UTC)
+        groups: dict[tuple[str, ...], list[dict[str, Any]]] = {}
+        for episode_id, fields in updates.items():
+            keys = tuple(sorted(fields))
+            groups.setdefault(keys, []).append(
+                {"id": episode_id, **fields, "updated_at": now}
+            )
+
+        with self._get_session() as session:
+            for rows in groups.values():
+                session.execute(sa_update(Episode), rows)
+            session.commit()
+
+        logger.debug(f"Applied {len(updates)} episode updates in one transaction")
+
+    def requeue_stale_episodes(self, stage: str, status: str, older_than: datetime) -> int:
+        """
+        Return episodes left in an in-progress status of a stage to pending.
+
+        Parameters:
+            stage (str): Stage name ('download', 'preprocess', 'transcript', 'metadata', or 'indexing').
+            status (str): In-progress status to requeue from (e.g. "downloading").
+            older_than (datetime): Only episodes last updated before this are requeued.
+
+        Returns:
+            int: Number of episodes returned to pending.
+
+        Raises:
+            ValueError: If stage name is invalid.
+        """
+        if stage not in STAGE_STATUS_FIELDS:
+            raise ValueError(f"Invalid stage: {stage}")
+        column = getattr(Episode, STAGE_STATUS_FIELDS[stage])
+        with self._get_session() as session:
+            result = session.execute(
+                sa_update(Episode)
+                .where(column == status, Episode.updated_at < older_than)
+                .values({column: "pending", Episode.updated_at: datetime.now(UTC)})
+                .execution_options(synchronize_session=False)
+            )
+            session.commit()
+        if result.rowcount:
+            logger.info(
+                f"Returned {result.rowcount} episodes stuck in {STAGE_STATUS_FIELDS[stage]}="
+                f"{status} to pending"
+            )
+        return result.rowcount
+
     def mark_download_started(self, episode_id: str) -> None:
         """
         Mark an episode's download status as downloading.
@@ -2419,18 +3630,30 @@ class SQLAlchemyPodcastRepository(PodcastRepositoryInterface):
             transcript_path (str, optional): Legacy file path, kept for backward compatibility.
 
         Notes:
-            Sets `transcript_status` to "completed", stores `transcript_text` (and optionally
-            `transcript_path`), sets `transcribed_at` to the current UTC time, and clears
-            `transcript_error`.
+            Sets `transcript_status` to "completed", stores the compressed transcript (and optionally
+            `transcript_path`), sets `transcribed_at` to the current UTC time, clears
+            `transcript_error`, and refreshes the episode's full-text search document, all in
+            one transaction.
         """
-        self.update_episode(
-            episode_id,
-            transcript_status="completed",
-            transcript_text=transcript_text,
-            transcript_path=transcript_path,
-            transcribed_at=datetime.now(UTC),
-            transcript_error=None,
-        )
+        with self._get_session() as session:
+            episode = session.get(Episode, episode_id)
+            if not episode:
+                return
+            self._set_episode_fields(
+                session,
+                episode,
+                {
+                    "transcript_status": "completed",
+                    "transcript_text": transcript_text,
+                    "transcript_path": transcript_path,
+                    "transcribed_at": datetime.now(UTC),
+                    "transcript_error": None,
+                    "transcript_worker_id": None,
+                    "transcript_lease_expires_at": None,
+                },
+            )
+            self._refresh_search_document(session, episode)
+            session.commit()
 
     def mark_transcript_failed(self, episode_id: str, error: str) -> None:
         """
@@ -2444,6 +3667,8 @@ class SQLAlchemyPodcastRepository(PodcastRepositoryInterface):
             episode_id,
             transcript_status="failed",
             transcript_error=error,
+            transcript_worker_id=None,
+            transcript_lease_expires_at=None,
         )
 
     def mark_metadata_started(self, episode_id: str) -> None:
@@ -2480,20 +3705,34 @@ class SQLAlchemyPodcastRepository(PodcastRepositoryInterface):
             mp3_album (Optional[str]): MP3 ID3 album tag from the audio file.
             email_content (Optional[Dict[str, Any]]): Email-optimized content for digest emails.
             metadata_path (Optional[str]): Legacy file path, kept for backward compatibility.
+
+        Notes:
+            Also replaces the episode's rows in the people and keyword tables and
+            refreshes its full-text search document, all in one transaction.
         """
-        self.update_episode(
-            episode_id,
-            metadata_status="completed",
-            metadata_path=metadata_path,
-            ai_summary=summary,
-            ai_keywords=keywords,
-            ai_hosts=hosts,
-            ai_guests=guests,
-            mp3_artist=mp3_artist,
-            mp3_album=mp3_album,
-            ai_email_content=email_content,
-            metadata_error=None,
-        )
+        with self._get_session() as session:
+            episode = session.get(Episode, episode_id)
+            if not episode:
+                return
+            self._set_episode_fields(
+                session,
+                episode,
+                {
+                    "metadata_status": "completed",
+                    "metadata_path": metadata_path,
+                    "ai_summary": summary,
+                    "ai_keywords": keywords,
+                    "ai_hosts": hosts,
+                    "ai_guests": guests,
+                    "mp3_artist": mp3_artist,
+                    "mp3_album": mp3_album,
+                    "ai_email_content": email_content,
+                    "metadata_error": None,
+                },
+            )
+            self._replace_episode_tags(session, episode_id, hosts, guests, keywords)
+            self._refresh_search_document(session, episode)
+            session.commit()
 
     def mark_metadata_failed(self, episode_id: str, error: str) -> None:
         """
@@ -2558,7 +3797,7 @@ class SQLAlchemyPodcastRepository(PodcastRepositoryInterface):
         """
         Remove an episode's local audio file (if present) and clear its stored file path.
 
-        If the episode exists and has a non-empty local_file_path, this will remove the file from disk when it exists and update the episode record to set local_file_path to None.
+        If the episode exists and has a non-empty local_file_path, this will remove the file from disk when it exists and update the episode record to set local_file_path to None. Any leftover preprocessed audio is removed as well.
 
         Parameters:
             episode_id (str): The ID of the episode whose audio file should be cleaned up.
@@ -2569,6 +3808,8 @@ class SQLAlchemyPodcastRepository(PodcastRepositoryInterface):
                 os.remove(episode.local_file_path)
                 logger.info(f"Deleted audio file: {episode.local_file_path}")
             self.update_episode(episode_id, local_file_path=None)
+        if episode and episode.preprocessed_audio_path:
+            self.clear_preprocessed_audio(episode_id)
 
     # --- Podcast Description Indexing ---
 
@@ -2727,58 +3968,158 @@ class SQLAlchemyPodcastRepository(PodcastRepositoryInterface):
                 """)
             )
             session.commit()
-            return result.rowcount
+            return result.rowcount
+
+    def count_podcasts_not_pending_description_indexing(self) -> int:
+        """
+        Count podcasts that are not in pending description indexing status.
+
+        Returns:
+            int: Number of podcasts with description_file_search_status != 'pending'.
+        """
+        from sqlalchemy import text
+
+        with self._get_session() as session:
+            result = session.execute(
+                text("SELECT COUNT(*) FROM podcasts WHERE description_file_search_status != 'pending'")
+            )
+            return result.scalar() or 0
+
+    # --- Transcript Access ---
+
+    def get_transcript_text(self, episode_id: str) -> str | None:
+        """
+        Get the transcript text for an episode.
+
+        Returns the transcript content from the compressed `episode_transcripts` store.
+        For legacy episodes with only `transcript_path`, reads the file content.
+
+        Parameters:
+            episode_id (str): ID of the episode.
+
+        Returns:
+            The transcript text if available, None otherwise.
+        """
+        with self._get_session() as session:
+            # Prefer database-stored text (an empty transcript is still a transcript)
+            record = session.get(EpisodeTranscript, episode_id)
+            if record is not None:
+                return record.text
+
+            transcript_path = session.scalar(
+                select(Episode.transcript_path).where(Episode.id == episode_id)
+            )
+
+        # Fall back to reading from file for legacy episodes
+        if transcript_path and os.path.exists(transcript_path):
+            try:
+                with open(transcript_path, encoding="utf-8") as f:
+                    return f.read()
+            except (OSError, UnicodeDecodeError) as e:
+                logger.warning(f"Failed to read transcript file {transcript_path}: {e}")
+                return None
+
+        return None
+
+    def _store_transcript(self, session: Session, episode_id: str, text: str | None) -> None:
+        """
+        Write (or with None, delete) an episode's compressed transcript within the caller's session.
+
+        Parameters:
+            session (Session): Open session; the caller commits.
+            episode_id (str): ID of the episode.
+            text (str | None): Full transcript content.
+        """
+        record = session.get(EpisodeTranscript, episode_id)
+        if text is None:
+            if record is not None:
+                session.delete(record)
+            return
+        if record is None:
+            record = EpisodeTranscript(episode_id=episode_id)
+            session.add(record)
+        record.text = text
+
+    def append_transcript_segments(
+        self, episode_id: str, segments: list[tuple[float, float, str]]
+    ) -> None:
+        """
+        Append transcript segments produced while transcribing an episode.
+
+        Parameters:
+            episode_id (str): ID of the episode.
+            segments (list[tuple[float, float, str]]): (start_seconds, end_seconds, text) tuples in decode order.
+        """
+        if not segments:
+            return
+
+        with self._get_session() as session:
+            session.add_all(
+                EpisodeSegment(
+                    episode_id=episode_id,
+                    start_seconds=start,
+                    end_seconds=end,
+                    text=text,
+                )
+                for start, end, text in segments
+            )
+            session.commit()
 
-    def count_podcasts_not_pending_description_indexing(self) -> int:
+    def get_transcript_segments(self, episode_id: str) -> list[EpisodeSegment]:
         """
-        Count podcasts that are not in pending description indexing status.
+        Get the stored transcript segments for an episode.
+
+        Parameters:
+            episode_id (str): ID of the episode.
 
         Returns:
-            int: Number of podcasts with description_file_search_status != 'pending'.
+            list[EpisodeSegment]: Segments ordered by start time; empty if none are stored.
         """
-        from sqlalchemy import text
-
         with self._get_session() as session:
-            result = session.execute(
-                text("SELECT COUNT(*) FROM podcasts WHERE description_file_search_status != 'pending'")
+            stmt = (
+                select(EpisodeSegment)
+                .where(EpisodeSegment.episode_id == episode_id)
+                .order_by(EpisodeSegment.start_seconds, EpisodeSegment.id)
             )
-            return result.scalar() or 0
+            return list(session.scalars(stmt).all())
 
-    # --- Transcript Access ---
+    # --- Statistics ---
 
-    def get_transcript_text(self, episode_id: str) -> str | None:
+    def get_pipeline_counters(self, podcast_id: str | None = None) -> dict[str, int]:
         """
-        Get the transcript text for an episode.
+        Read the incrementally maintained episode counts.
 
-        Returns the transcript content from the database (`transcript_text` column).
-        For legacy episodes with only `transcript_path`, reads the file content.
+        Sums at most one row per podcast and counter, however many episodes there are.
 
         Parameters:
-            episode_id (str): ID of the episode.
+            podcast_id (str | None): Restrict to one podcast; None sums all podcasts.
 
         Returns:
-            The transcript text if available, None otherwise.
+            Dict[str, int]: Count for every counter name in COUNTERS (0 if no row exists).
         """
-        episode = self.get_episode(episode_id)
-        if not episode:
-            return None
-
-        # Prefer database-stored text (use 'is not None' to allow empty strings)
-        if episode.transcript_text is not None:
-            return episode.transcript_text
-
-        # Fall back to reading from file for legacy episodes
-        if episode.transcript_path and os.path.exists(episode.transcript_path):
-            try:
-                with open(episode.transcript_path, encoding="utf-8") as f:
-                    return f.read()
-            except (OSError, UnicodeDecodeError) as e:
-                logger.warning(f"Failed to read transcript file {episode.transcript_path}: {e}")
-                return None
+        with self._get_session() as session:
+            stmt = select(PipelineCounter.name, func.sum(PipelineCounter.value)).group_by(
+                PipelineCounter.name
+            )
+            if podcast_id is not None:
+                stmt = stmt.where(PipelineCounter.podcast_id == podcast_id)
+            totals = dict(session.execute(stmt).all())
+        return {name: int(totals.get(name) or 0) for name in COUNTERS}
 
-        return None
+    def rebuild_pipeline_counters(self) -> None:
+        """Recompute the pipeline counters from the episodes table."""
+        with self._get_session() as session:
+            rebuild_counters(session)
+            session.commit()
 
-    # --- Statistics ---
+    def _get_pipeline_counter(self, name: str) -> int:
+        """Sum one pipeline counter across all podcasts."""
+        with self._get_session() as session:
+            return session.scalar(
+                select(func.coalesce(func.sum(PipelineCounter.value), 0)).where(
+                    PipelineCounter.name == name
+                )
+            )
 
     def get_podcast_stats(self, podcast_id: str) -> dict[str, Any]:
         """
@@ -2804,36 +4145,27 @@ class SQLAlchemyPodcastRepository(PodcastRepositoryInterface):
             podcast = session.get(Podcast, podcast_id)
             if not podcast:
                 return {}
-
-            episodes = self.list_episodes(podcast_id=podcast_id, limit=None)
-
-            return {
-                "podcast_id": podcast_id,
-                "title": podcast.title,
-                "total_episodes": len(episodes),
-                "pending_download": sum(
-                    1 for e in episodes if e.download_status == "pending"
-                ),
-                "downloading": sum(
-                    1 for e in episodes if e.download_status == "downloading"
-                ),
-                "downloaded": sum(
-                    1 for e in episodes if e.download_status == "completed"
-                ),
-                "download_failed": sum(
-                    1 for e in episodes if e.download_status == "failed"
-                ),
-                "pending_transcription": sum(
-                    1 for e in episodes if e.transcript_status == "pending"
-                ),
-                "transcribed": sum(
-                    1 for e in episodes if e.transcript_status == "completed"
-                ),
-                "indexed": sum(
-                    1 for e in episodes if e.file_search_status == "indexed"
-                ),
-                "fully_processed": sum(1 for e in episodes if e.is_fully_processed),
-            }
+            title = podcast.title
+
+        counters = self.get_pipeline_counters(podcast_id)
+        return {
+            "podcast_id": podcast_id,
+            "title": title,
+            **{
+                name: counters[name]
+                for name in (
+                    "total_episodes",
+                    "pending_download",
+                    "downloading",
+                    "downloaded",
+                    "download_failed",
+                    "pending_transcription",
+                    "transcribed",
+                    "indexed",
+                    "fully_processed",
+                )
+            },
+        }
 
     def get_podcast_episode_counts(self, podcast_ids: list[str]) -> dict[str, int]:
         """
@@ -2921,7 +4253,8 @@ class SQLAlchemyPodcastRepository(PodcastRepositoryInterface):
         """
         Return aggregated system-wide counts for podcasts and episodes across processing stages.
 
-        Optimized to use SQL aggregations instead of loading all records into memory.
+        Episode counts are read from the pipeline counters, so the cost does not
+        grow with the number of episodes.
 
         @returns:
             stats (Dict[str, Any]): Mapping of statistic names to integer counts:
@@ -2940,8 +4273,6 @@ class SQLAlchemyPodcastRepository(PodcastRepositoryInterface):
                 - indexed: Episodes with file_search_status == "indexed".
                 - fully_processed: Episodes considered fully processed (all final processing steps complete).
         """
-        from sqlalchemy import case
-
         with self._get_session() as session:
             # Podcast counts (efficient SQL aggregations)
             total_podcasts = session.scalar(select(func.count(Podcast.id))) or 0
@@ -2950,52 +4281,29 @@ class SQLAlchemyPodcastRepository(PodcastRepositoryInterface):
                 select(func.count(func.distinct(UserSubscription.podcast_id)))
             ) or 0
 
-            # Episode counts by status (single query with conditional aggregation)
-            episode_stats = session.execute(
-                select(
-                    func.count(Episode.id).label('total_episodes'),
-                    # Download status counts
-                    func.count(case((Episode.download_status == 'pending', 1))).label('pending_download'),
-                    func.count(case((Episode.download_status == 'downloading', 1))).label('downloading'),
-                    func.count(case((Episode.download_status == 'completed', 1))).label('downloaded'),
-                    func.count(case((Episode.download_status == 'failed', 1))).label('download_failed'),
-                    # Transcript status counts
-                    func.count(case((Episode.transcript_status == 'pending', 1))).label('pending_transcription'),
-                    func.count(case((Episode.transcript_status == 'processing', 1))).label('transcribing'),
-                    func.count(case((Episode.transcript_status == 'completed', 1))).label('transcribed'),
-                    func.count(case((Episode.transcript_status == 'failed', 1))).label('transcript_failed'),
-                    # File search status counts
-                    func.count(case((Episode.file_search_status == 'pending', 1))).label('pending_indexing'),
-                    func.count(case((Episode.file_search_status == 'indexed', 1))).label('indexed'),
-                )
-            ).one()
-
-            # Fully processed count (separate query as it involves computed property)
-            # Episodes are fully processed when all stages are complete
-            fully_processed = session.scalar(
-                select(func.count(Episode.id)).where(
-                    Episode.download_status == 'completed',
-                    Episode.transcript_status == 'completed',
-                    Episode.file_search_status == 'indexed'
+        # Episode counts come from the pipeline counters rather than a table scan
+        counters = self.get_pipeline_counters()
+        return {
+            "total_podcasts": total_podcasts,
+            "subscribed_podcasts": subscribed_podcasts,
+            **{
+                name: counters[name]
+                for name in (
+                    "total_episodes",
+                    "pending_download",
+                    "downloading",
+                    "downloaded",
+                    "download_failed",
+                    "pending_transcription",
+                    "transcribing",
+                    "transcribed",
+                    "transcript_failed",
+                    "pending_indexing",
+                    "indexed",
+                    "fully_processed",
                 )
-            ) or 0
-
-            return {
-                "total_podcasts": total_podcasts,
-                "subscribed_podcasts": subscribed_podcasts,
-                "total_episodes": episode_stats.total_episodes,
-                "pending_download": episode_stats.pending_download,
-                "downloading": episode_stats.downloading,
-                "downloaded": episode_stats.downloaded,
-                "download_failed": episode_stats.download_failed,
-                "pending_transcription": episode_stats.pending_transcription,
-                "transcribing": episode_stats.transcribing,
-                "transcribed": episode_stats.transcribed,
-                "transcript_failed": episode_stats.transcript_failed,
-                "pending_indexing": episode_stats.pending_indexing,
-                "indexed": episode_stats.indexed,
-                "fully_processed": fully_processed,
-            }
+            },
+        }
 
     # --- Pipeline Mode Methods ---
 
@@ -3005,22 +4313,124 @@ class SQLAlchemyPodcastRepository(PodcastRepositoryInterface):
         Returns:
             Number of episodes that are downloaded and pending transcription.
         """
+        return self._get_pipeline_counter("transcription_queue")
+
+    def get_download_buffer_audio_seconds(
+        self, default_duration_seconds: int = 3600
+    ) -> int:
+        """Sum the audio duration of episodes in the download buffer.
+
+        Args:
+            default_duration_seconds: Duration assumed for episodes whose
+                feed did not report one.
+
+        Returns:
+            Seconds of downloaded audio pending transcription.
+        """
         with self._get_session() as session:
             stmt = (
-                select(func.count(Episode.id))
+                select(
+                    func.sum(
+                        func.coalesce(Episode.duration_seconds, default_duration_seconds)
+                    )
+                )
                 .where(
                     Episode.download_status == "completed",
                     Episode.transcript_status == "pending",
                     Episode.local_file_path.isnot(None),
                 )
             )
-            return session.scalar(stmt) or 0
+            return int(session.scalar(stmt) or 0)
+
+    def refresh_episode_priorities(self, podcast_ids: list[str] | None = None) -> int:
+        """Recompute the queue priority of pending episodes.
+
+        Scores episodes that are waiting for download or transcription with
+        the repository's priority function and writes back only the scores
+        that changed.
+
+        Args:
+            podcast_ids: Only refresh episodes of these podcasts; None
+                refreshes every podcast.
+
+        Returns:
+            Number of episodes whose priority changed.
+        """
+        with self._get_session() as session:
+            return self._refresh_episode_priorities(session, podcast_ids)
+
+    def _refresh_episode_priorities(
+        self, session: Session, podcast_ids: list[str] | None
+    ) -> int:
+        """Recompute and commit pending episode priorities within a session."""
+        if podcast_ids is not None and not podcast_ids:
+            return 0
+
+        now = datetime.now(UTC)
+        episodes_stmt = select(
+            Episode.id,
+            Episode.podcast_id,
+            Episode.published_date,
+            Episode.duration_seconds,
+            Episode.priority,
+        ).where(
+            or_(
+                Episode.download_status == "pending",
+                and_(
+                    Episode.download_status == "completed",
+                    Episode.transcript_status == "pending",
+                ),
+            )
+        )
+        counts_stmt = select(
+            UserSubscription.podcast_id, func.count(UserSubscription.user_id)
+        ).group_by(UserSubscription.podcast_id)
+        digests_stmt = (
+            select(UserSubscription.podcast_id, User.email_digest_hour, User.timezone)
+            .join(User, User.id == UserSubscription.user_id)
+            .where(User.email_digest_enabled.is_(True), User.is_active.is_(True))
+        )
+        if podcast_ids is not None:
+            episodes_stmt = episodes_stmt.where(Episode.podcast_id.in_(podcast_ids))
+            counts_stmt = counts_stmt.where(UserSubscription.podcast_id.in_(podcast_ids))
+            digests_stmt = digests_stmt.where(UserSubscription.podcast_id.in_(podcast_ids))
+
+        rows = session.execute(episodes_stmt).all()
+        if not rows:
+            return 0
+
+        subscriber_counts = dict(session.execute(counts_stmt).all())
+        digest_hours: dict[str, float] = {}
+        for podcast_id, digest_hour, timezone_name in session.execute(digests_stmt):
+            hours = hours_until_digest(digest_hour, timezone_name, now)
+            digest_hours[podcast_id] = min(hours, digest_hours.get(podcast_id, hours))
+
+        updates = []
+        for row in rows:
+            score = self.priority_function(
+                PriorityInputs(
+                    subscriber_count=subscriber_counts.get(row.podcast_id, 0),
+                    published_date=row.published_date,
+                    duration_seconds=row.duration_seconds,
+                    hours_until_digest=digest_hours.get(row.podcast_id),
+                ),
+                now,
+            )
+            if score != row.priority:
+                updates.append({"id": row.id, "priority": score})
+
+        if updates:
+            session.execute(sa_update(Episode), updates)
+            session.commit()
+
+        logger.debug(f"Refreshed priority of {len(updates)} episodes")
+        return len(updates)
 
     def get_next_for_transcription(self) -> Episode | None:
         """Get the next single episode ready for transcription.
 
-        Returns episodes ordered by published_date (newest first),
-        excluding permanently failed episodes.
+        Returns the highest-priority episode (newest first among equal
+        priorities), excluding permanently failed episodes.
 
         Returns:
             Episode to transcribe, or None if no work available.
@@ -3033,11 +4443,238 @@ class SQLAlchemyPodcastRepository(PodcastRepositoryInterface):
                     Episode.transcript_status == "pending",
                     Episode.local_file_path.isnot(None),
                 )
-                .order_by(Episode.published_date.desc())
+                .order_by(Episode.priority.desc(), Episode.published_date.desc())
                 .limit(1)
             )
             return session.scalars(stmt).first()
 
+    def claim_next_for_transcription(
+        self, worker_id: str, lease_seconds: int = 3600
+    ) -> Episode | None:
+        """Atomically claim the next episode ready for transcription.
+
+        PostgreSQL uses SELECT ... FOR UPDATE SKIP LOCKED so concurrent claimers
+        skip rows another transaction is claiming. Other databases (SQLite) use
+        an optimistic compare-and-swap UPDATE that only succeeds while the row
+        is still pending, retrying with the next candidate if it loses a race.
+
+        Args:
+            worker_id: Identifier of the claiming pipeline node.
+            lease_seconds: How long the claim is valid before it can be reaped.
+
+        Returns:
+            The claimed Episode, or None if no work is available.
+        """
+        now = datetime.now(UTC)
+        claim_values = {
+            "transcript_status": "processing",
+            "transcript_worker_id": worker_id,
+            "transcript_lease_expires_at": now + timedelta(seconds=lease_seconds),
+            "updated_at": now,
+        }
+        candidates = (
+            select(Episode)
+            .where(
+                Episode.download_status == "completed",
+                Episode.transcript_status == "pending",
+                Episode.local_file_path.isnot(None),
+            )
+            .order_by(Episode.priority.desc(), Episode.published_date.desc())
+            .limit(1)
+        )
+
+        with self._get_session() as session:
+            if self.engine.dialect.name == "postgresql":
+                episode = session.scalars(
+                    candidates.with_for_update(skip_locked=True)
+                ).first()
+                if episode is None:
+                    session.rollback()
+                    return None
+                for key, value in claim_values.items():
+                    setattr(episode, key, value)
+                session.commit()
+                logger.debug(f"Worker {worker_id} claimed episode {episode.id}")
+                return episode
+
+            for _ in range(self._CLAIM_MAX_ATTEMPTS):
+                candidate_id = session.scalar(
+                    candidates.with_only_columns(Episode.id)
+                )
+                if candidate_id is None:
+                    return None
+
+                result = session.execute(
+                    sa_update(Episode)
+                    .where(
+                        Episode.id == candidate_id,
+                        Episode.transcript_status == "pending",
+                    )
+                    .values(**claim_values)
+                )
+                session.commit()
+
+                if result.rowcount == 1:
+                    logger.debug(f"Worker {worker_id} claimed episode {candidate_id}")
+                    return session.get(Episode, candidate_id)
+
+            logger.warning(
+                f"Worker {worker_id} lost {self._CLAIM_MAX_ATTEMPTS} consecutive "
+                f"transcription claim races, backing off"
+            )
+            return None
+
+    def renew_transcription_lease(
+        self, episode_id: str, worker_id: str, lease_seconds: int = 3600
+    ) -> bool:
+        """Extend the lease on an episode this worker is transcribing.
+
+        Args:
+            episode_id: ID of the claimed episode.
+            worker_id: Identifier of the worker holding the claim.
+            lease_seconds: New lease length, measured from now.
+
+        Returns:
+            True if the lease was extended, False if the worker no longer holds it.
+        """
+        now = datetime.now(UTC)
+        with self._get_session() as session:
+            result = session.execute(
+                sa_update(Episode)
+                .where(
+                    Episode.id == episode_id,
+                    Episode.transcript_status == "processing",
+                    Episode.transcript_worker_id == worker_id,
+                )
+                .values(
+                    transcript_lease_expires_at=now + timedelta(seconds=lease_seconds),
+                    updated_at=now,
+                )
+            )
+            session.commit()
+            return result.rowcount > 0
+
+    def release_expired_transcription_leases(self) -> int:
+        """Return episodes with expired transcription leases to the queue.
+
+        Only rows claimed through claim_next_for_transcription() carry a lease;
+        episodes marked processing without one are left untouched.
+
+        Returns:
+            Number of episodes returned to the queue.
+        """
+        now = datetime.now(UTC)
+        with self._get_session() as session:
+            result = session.execute(
+                sa_update(Episode)
+                .where(
+                    Episode.transcript_status == "processing",
+                    Episode.transcript_lease_expires_at.isnot(None),
+                    Episode.transcript_lease_expires_at < now,
+                )
+                .values(
+                    transcript_status="pending",
+                    transcript_worker_id=None,
+                    transcript_lease_expires_at=None,
+                    updated_at=now,
+                )
+            )
+            session.commit()
+            if result.rowcount:
+                logger.info(
+                    f"Returned {result.rowcount} expired transcription leases to the queue"
+                )
+            return result.rowcount
+
+    def get_episodes_pending_preprocessing(self, limit: int = 10) -> list[Episode]:
+        """Get downloaded episodes whose audio has not been preprocessed yet.
+
+        Args:
+            limit: Maximum number of episodes to return.
+
+        Returns:
+            Episodes pending transcription with preprocess_status "pending",
+            in transcription queue order.
+        """
+        with self._get_session() as session:
+            stmt = (
+                select(Episode)
+                .where(
+                    Episode.download_status == "completed",
+                    Episode.transcript_status == "pending",
+                    Episode.local_file_path.isnot(None),
+                    Episode.preprocess_status == "pending",
+                )
+                .order_by(Episode.priority.desc(), Episode.published_date.desc())
+                .limit(limit)
+            )
+            return list(session.scalars(stmt).all())
+
+    def count_episodes_pending_preprocessing(self) -> int:
+        """Count downloaded episodes awaiting preprocessing.
+
+        Returns:
+            Number of episodes waiting to be preprocessed.
+        """
+        return self._get_pipeline_counter("preprocessing_queue")
+
+    def mark_preprocessing_complete(
+        self,
+        episode_id: str,
+        preprocessed_audio_path: str,
+        speech_regions: list[list[float]],
+    ) -> bool:
+        """Record preprocessed audio for an episode still waiting for transcription.
+
+        Args:
+            episode_id: ID of the episode.
+            preprocessed_audio_path: Path of the decoded 16 kHz PCM file.
+            speech_regions: [start, end] speech regions in seconds.
+
+        Returns:
+            True if recorded, False if transcription already started, in which
+            case the caller should discard the file.
+        """
+        with self._get_session() as session:
+            result = session.execute(
+                sa_update(Episode)
+                .where(
+                    Episode.id == episode_id,
+                    Episode.transcript_status == "pending",
+                )
+                .values(
+                    preprocess_status="completed",
+                    preprocessed_audio_path=preprocessed_audio_path,
+                    speech_regions=speech_regions,
+                    updated_at=datetime.now(UTC),
+                )
+            )
+            session.commit()
+            return result.rowcount > 0
+
+    def mark_preprocessing_failed(self, episode_id: str) -> None:
+        """Mark preprocessing failed; the episode is transcribed from the original file.
+
+        Args:
+            episode_id: ID of the episode.
+        """
+        self.update_episode(episode_id, preprocess_status="failed")
+
+    def clear_preprocessed_audio(self, episode_id: str) -> None:
+        """Delete an episode's preprocessed audio file and clear its fields.
+
+        Args:
+            episode_id: ID of the episode.
+        """
+        episode = self.get_episode(episode_id)
+        if episode and episode.preprocessed_audio_path:
+            if os.path.exists(episode.preprocessed_audio_path):
+                os.remove(episode.preprocessed_audio_path)
+                logger.info(f"Deleted preprocessed audio: {episode.preprocessed_audio_path}")
+            self.update_episode(
+                episode_id, preprocessed_audio_path=None, speech_regions=None
+            )
+
     def get_next_pending_post_processing(self) -> Episode | None:
         """Get the next episode needing post-processing (metadata or indexing).
 
@@ -3056,7 +4693,7 @@ class SQLAlchemyPodcastRepository(PodcastRepositoryInterface):
                     Episode.transcript_status == "completed",
                     Episode.metadata_status == "pending",
                     or_(
-                        Episode.transcript_text.isnot(None),
+                        Episode.transcript.has(),
                         Episode.transcript_path.isnot(None),
                     ),
                 )
@@ -3075,7 +4712,7 @@ class SQLAlchemyPodcastRepository(PodcastRepositoryInterface):
                     Episode.metadata_status == "completed",
                     Episode.file_search_status == "pending",
                     or_(
-                        Episode.transcript_text.isnot(None),
+                        Episode.transcript.has(),
                         Episode.transcript_path.isnot(None),
                     ),
                 )
@@ -3140,10 +4777,10 @@ class SQLAlchemyPodcastRepository(PodcastRepositoryInterface):
             raise ValueError(f"Invalid stage: {stage}")
 
         status_field, error_field = status_map[stage]
-        self.update_episode(
-            episode_id,
-            **{status_field: "permanently_failed", error_field: error}
-        )
+        fields = {status_field: "permanently_failed", error_field: error}
+        if stage == "transcript":
+            fields.update(transcript_worker_id=None, transcript_lease_expires_at=None)
+        self.update_episode(episode_id, **fields)
 
     def reset_episode_for_retry(self, episode_id: str, stage: str) -> None:
         """Reset an episode's status to pending for retry.
@@ -3163,10 +4800,10 @@ class SQLAlchemyPodcastRepository(PodcastRepositoryInterface):
             raise ValueError(f"Invalid stage: {stage}")
 
         status_field, error_field = status_map[stage]
-        self.update_episode(
-            episode_id,
-            **{status_field: "pending", error_field: None}
-        )
+        fields = {status_field: "pending", error_field: None}
+        if stage == "transcript":
+            fields.update(transcript_worker_id=None, transcript_lease_expires_at=None)
+        self.update_episode(episode_id, **fields)
 
     # --- User Operations ---
 
@@ -3313,6 +4950,7 @@ class SQLAlchemyPodcastRepository(PodcastRepositoryInterface):
                 session.commit()
                 session.refresh(subscription)
                 logger.info(f"User {user_id} subscribed to podcast {podcast_id}")
+                self._refresh_episode_priorities(session, [podcast_id])
                 return subscription
             except IntegrityError:
                 # Race condition: another request created the subscription
@@ -3347,6 +4985,7 @@ class SQLAlchemyPodcastRepository(PodcastRepositoryInterface):
             session.delete(subscription)
             session.commit()
             logger.info(f"User {user_id} unsubscribed from podcast {podcast_id}")
+            self._refresh_episode_priorities(session, [podcast_id])
             return True
 
     def get_user_subscriptions(
@@ -3566,8 +5205,6 @@ class SQLAlchemyPodcastRepository(PodcastRepositoryInterface):
 
         Defers audio_data loading to avoid pulling MB-scale blobs in feed reads.
         """
-        from sqlalchemy.orm import defer
-
         with self._get_session() as session:
             stmt = (
                 select(DailyBriefing)
@@ -3719,8 +5356,6 @@ class SQLAlchemyPodcastRepository(PodcastRepositoryInterface):
 
     def release_briefing_claim(self, user_id: str, briefing_date: date) -> None:
         """Release a briefing generation claim by deleting the placeholder row."""
-        from sqlalchemy import delete
-
         with self._get_session() as session:
             session.execute(
                 delete(DailyBriefing).where(
@@ -3732,9 +5367,18 @@ class SQLAlchemyPodcastRepository(PodcastRepositoryInterface):
             session.commit()
 
     def get_briefing_by_id(self, briefing_id: str) -> DailyBriefing | None:
-        """Fetch a single briefing by ID."""
+        """Fetch a single briefing by ID (audio_data deferred, not loaded)."""
         with self._get_session() as session:
-            return session.get(DailyBriefing, briefing_id)
+            return session.get(
+                DailyBriefing, briefing_id, options=[defer(DailyBriefing.audio_data)]
+            )
+
+    def get_briefing_audio_data(self, briefing_id: str) -> bytes | None:
+        """Fetch a briefing's legacy audio blob, or None if it has none."""
+        with self._get_session() as session:
+            return session.scalar(
+                select(DailyBriefing.audio_data).where(DailyBriefing.id == briefing_id)
+            )
 
     def claim_briefing_audio(
         self, briefing_id: str, stale_claim_timeout_sec: int = 1800
@@ -3797,7 +5441,8 @@ class SQLAlchemyPodcastRepository(PodcastRepositoryInterface):
     def update_briefing_audio(
         self,
         briefing_id: str,
-        audio_data: bytes,
+        audio_storage_key: str,
+        audio_size_bytes: int,
         audio_mime_type: str,
         audio_duration_sec: int | None,
         status: str,
@@ -3810,7 +5455,9 @@ class SQLAlchemyPodcastRepository(PodcastRepositoryInterface):
                 sa_update(DailyBriefing)
                 .where(DailyBriefing.id == briefing_id)
                 .values(
-                    audio_data=audio_data,
+                    audio_data=None,
+                    audio_storage_key=audio_storage_key,
+                    audio_size_bytes=audio_size_bytes,
                     audio_mime_type=audio_mime_type,
                     audio_duration_sec=audio_duration_sec,
                     audio_status=status,
@@ -3820,8 +5467,32 @@ class SQLAlchemyPodcastRepository(PodcastRepositoryInterface):
             )
             session.commit()
 
+    def set_briefing_audio_storage_key(
+        self, briefing_id: str, audio_storage_key: str
+    ) -> None:
+        """Point a briefing with a legacy audio blob at its copy in audio storage."""
+        with self._get_session() as session:
+            session.execute(
+                sa_update(DailyBriefing)
+                .where(DailyBriefing.id == briefing_id)
+                .values(audio_storage_key=audio_storage_key, audio_data=None)
+            )
+            session.commit()
+
+    def get_audio_storage_keys_before(self, cutoff: datetime) -> list[str]:
+        """Storage keys of briefing audio generated before cutoff."""
+        with self._get_session() as session:
+            return list(
+                session.scalars(
+                    select(DailyBriefing.audio_storage_key).where(
+                        DailyBriefing.audio_storage_key.isnot(None),
+                        DailyBriefing.audio_generated_at < cutoff,
+                    )
+                )
+            )
+
     def clear_audio_data_before(self, cutoff: datetime) -> int:
-        """Clear audio blobs for briefings older than cutoff."""
+        """Clear audio for briefings older than cutoff."""
         with self._get_session() as session:
             result = session.execute(
                 sa_update(DailyBriefing)
@@ -3831,6 +5502,8 @@ class SQLAlchemyPodcastRepository(PodcastRepositoryInterface):
                 )
                 .values(
                     audio_data=None,
+                    audio_storage_key=None,
+                    audio_size_bytes=None,
                     audio_mime_type=None,
                     audio_duration_sec=None,
                     audio_status=None,
@@ -3916,6 +5589,23 @@ class SQLAlchemyPodcastRepository(PodcastRepositoryInterface):
             )
             return list(session.scalars(stmt).unique().all())
 
+    def list_conversations_page(
+        self, user_id: str, limit: int = 50, cursor: str | None = None
+    ) -> tuple[list[Conversation], str | None]:
+        """List one page of a user's conversations, most recent first, by keyset."""
+        with self._get_session() as session:
+            stmt = (
+                select(Conversation)
+                .options(
+                    joinedload(Conversation.podcast),
+                    joinedload(Conversation.episode),
+                )
+                .where(Conversation.user_id == user_id)
+            )
+            return fetch_page(
+                session, stmt, Conversation.updated_at, Conversation.id, limit, cursor
+            )
+
     def update_conversation(
         self, conversation_id: str, **kwargs
     ) -> Conversation | None:
@@ -3987,6 +5677,22 @@ class SQLAlchemyPodcastRepository(PodcastRepositoryInterface):
             )
             return list(session.scalars(stmt).all())
 
+    def get_messages_page(
+        self, conversation_id: str, limit: int = 100, cursor: str | None = None
+    ) -> tuple[list[ChatMessage], str | None]:
+        """Get one page of a conversation's messages, oldest first, by keyset."""
+        with self._get_session() as session:
+            stmt = select(ChatMessage).where(ChatMessage.conversation_id == conversation_id)
+            return fetch_page(
+                session,
+                stmt,
+                ChatMessage.created_at,
+                ChatMessage.id,
+                limit,
+                cursor,
+                descending=False,
+            )
+
     def count_conversations(self, user_id: str) -> int:
         """Count total conversations for a user."""
         with self._get_session() as session:
@@ -8,7 +8,7 @@ Provides functionality for:
 """
 
 from .downloader import EpisodeDownloader
-from .feed_parser import FeedParser, ParsedEpisode, ParsedPodcast
+from .feed_parser import FeedParser, FetchedFeed, ParsedEpisode, ParsedPodcast
 from .feed_sync import FeedSyncService
 from .opml_parser import OPMLParser, PodcastFeed
 
@@ -16,6 +16,7 @@ __all__ = [
     "OPMLParser",
     "PodcastFeed",
     "FeedParser",
+    "FetchedFeed",
     "ParsedPodcast",
     "ParsedEpisode",
     "FeedSyncService",
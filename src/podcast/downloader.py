@@ -15,7 +15,7 @@ import re
 from collections.abc import Callable
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import UTC, datetime
 from typing import Any
 from urllib.parse import unquote, urlparse
 
@@ -26,6 +26,7 @@ from urllib3.util.retry import Retry
 
 from ..db.models import Episode
 from ..db.repository import PodcastRepositoryInterface
+from ..utils.metrics import record_stage
 
 logger = logging.getLogger(__name__)
 
@@ -132,12 +133,13 @@ class EpisodeDownloader:
 
         return session
 
-    def download_episode(self, episode: Episode) -> DownloadResult:
+    def download_episode(self, episode: Episode, track_status: bool = True) -> DownloadResult:
         """
         Download a single Episode, save it to disk, and update repository state.
 
         Parameters:
             episode (Episode): Episode to download; used to determine source URL, expected size, and identifiers for repository updates.
+            track_status (bool): If False, leave the episode's download status untouched so the caller can record results in bulk.
 
         Returns:
             DownloadResult: Outcome of the download. On success, `success` is `True` and `local_path`, `file_size`, `file_hash`, and `duration_seconds` are populated. On failure, `success` is `False` and `error` contains the failure message.
@@ -164,7 +166,8 @@ class EpisodeDownloader:
         except PermissionError as e:
             error_msg = f"Permission denied creating directory {podcast_dir}: {e}"
             logger.error(error_msg)
-            self.repository.mark_download_failed(episode.id, error_msg)
+            if track_status:
+                self.repository.mark_download_failed(episode.id, error_msg)
             return DownloadResult(
                 episode_id=episode.id,
                 success=False,
@@ -175,7 +178,8 @@ class EpisodeDownloader:
         output_path = os.path.join(podcast_dir, filename)
 
         # Mark download as started
-        self.repository.mark_download_started(episode.id)
+        if track_status:
+            self.repository.mark_download_started(episode.id)
         logger.info(f"Downloading: {episode.title}")
 
         try:
@@ -191,12 +195,13 @@ class EpisodeDownloader:
             duration = (datetime.utcnow() - start_time).total_seconds()
 
             # Mark download complete
-            self.repository.mark_download_complete(
-                episode_id=episode.id,
-                local_path=output_path,
-                file_size=file_size,
-                file_hash=file_hash,
-            )
+            if track_status:
+                self.repository.mark_download_complete(
+                    episode_id=episode.id,
+                    local_path=output_path,
+                    file_size=file_size,
+                    file_hash=file_hash,
+                )
 
             logger.info(
                 f"Downloaded: {episode.title} "
@@ -223,7 +228,8 @@ class EpisodeDownloader:
                     pass
 
             # Mark download as failed
-            self.repository.mark_download_failed(episode.id, str(e))
+            if track_status:
+                self.repository.mark_download_failed(episode.id, str(e))
 
             return DownloadResult(
                 episode_id=episode.id,
@@ -281,10 +287,15 @@ class EpisodeDownloader:
 
         return downloaded, hasher.hexdigest()
 
-    def download_pending(self, limit: int = 50) -> dict[str, Any]:
+    def download_pending(self, limit: int = 50, bulk_status: bool = False) -> dict[str, Any]:
         """
         Download pending episodes up to the given limit using a thread pool and collect per-episode results.
 
+        With bulk_status, the batch is marked downloading with one UPDATE and
+        each result is written with a single UPDATE as it completes, instead
+        of two or three status writes per episode. Rows a crash leaves
+        downloading are requeued by the orchestrator once stale.
+
         Returns:
             dict: Summary with keys:
                 - downloaded (int): number of successful downloads.
@@ -309,15 +320,26 @@ class EpisodeDownloader:
         downloaded = 0
         failed = 0
 
+        if bulk_status:
+            self.repository.mark_many(
+                "download", [episode.id for episode in episodes], "downloading"
+            )
+
         with ThreadPoolExecutor(max_workers=self.max_concurrent) as executor:
             future_to_episode = {
-                executor.submit(self.download_episode, episode): episode
+                executor.submit(
+                    self.download_episode, episode, track_status=not bulk_status
+                ): episode
                 for episode in episodes
             }
 
             for future in as_completed(future_to_episode):
                 result = future.result()
                 results.append(result)
+                record_stage("download", result.duration_seconds, result.success)
+
+                if bulk_status:
+                    self._record_download_result(result)
 
                 if result.success:
                     downloaded += 1
@@ -333,6 +355,25 @@ class EpisodeDownloader:
             "results": results,
         }
 
+    def _record_download_result(self, result: DownloadResult) -> None:
+        """Write the outcome of one download of a bulk-status batch."""
+        with self.repository.unit_of_work() as batch:
+            if result.success:
+                batch.mark(
+                    "download",
+                    result.episode_id,
+                    "completed",
+                    local_file_path=result.local_path,
+                    file_size_bytes=result.file_size,
+                    file_hash=result.file_hash,
+                    downloaded_at=datetime.now(UTC),
+                    download_error=None,
+                )
+            else:
+                batch.mark(
+                    "download", result.episode_id, "failed", download_error=result.error
+                )
+
     async def download_pending_async(self, limit: int = 50) -> dict[str, Any]:
         """
         Download pending episodes up to the given limit using bounded concurrency and return per-episode results.
@@ -382,6 +423,8 @@ class EpisodeDownloader:
         # Create tasks
         tasks = [download_with_semaphore(episode) for episode in episodes]
         results = await asyncio.gather(*tasks)
+        for result in results:
+            record_stage("download", result.duration_seconds, result.success)
 
         downloaded = sum(1 for r in results if r.success)
         failed = sum(1 for r in results if not r.success)
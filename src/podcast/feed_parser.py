@@ -2,15 +2,28 @@
 
 Uses feedparser library to handle various feed formats and extract
 podcast metadata including iTunes namespace extensions.
+
+Feeds that have already been imported can also be parsed incrementally:
+the document is streamed with ElementTree's iterparse and each item is
+converted as soon as it has been read, stopping once the newest part of the
+feed has been seen. Each item still goes through feedparser, so both modes
+produce the same episodes.
 """
 
+import asyncio
+import hashlib
+import io
 import logging
 import re
+import xml.etree.ElementTree as ET
+from collections.abc import Container, Iterator
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import UTC, datetime
 from email.utils import parsedate_to_datetime
+from functools import cached_property
 from urllib.parse import urlparse
 
+import aiohttp
 import feedparser
 import requests
 from requests.adapters import HTTPAdapter
@@ -18,6 +31,20 @@ from urllib3.util.retry import Retry
 
 logger = logging.getLogger(__name__)
 
+# Documents wrapping streamed channel elements or items for feedparser
+_ATOM_NAMESPACE = "http://www.w3.org/2005/Atom"
+_RSS_WRAPPER = b'<rss version="2.0"><channel>%s</channel></rss>'
+_ATOM_WRAPPER = b'<feed xmlns="' + _ATOM_NAMESPACE.encode() + b'">%s</feed>'
+
+# Elements holding channel metadata and items: RSS <channel>, RSS 1.0 <rdf:RDF>, Atom <feed>
+_CHANNEL_ELEMENTS = ("channel", "RDF", "feed")
+_ITEM_ELEMENTS = ("item", "entry")
+
+
+def _local_name(tag: str) -> str:
+    """Element name without its namespace."""
+    return tag.rsplit("}", 1)[-1]
+
 
 @dataclass
 class ParsedEpisode:
@@ -84,6 +111,30 @@ class ParsedPodcast:
     ttl: int | None = None  # Time to live in minutes
 
 
+@dataclass
+class FetchedFeed:
+    """Raw result of a (conditional) feed fetch."""
+
+    # Response body; None when the server answered 304 Not Modified
+    content: bytes | None
+
+    # Validators to send on the next fetch
+    etag: str | None = None
+    last_modified: str | None = None
+
+    @property
+    def not_modified(self) -> bool:
+        """Whether the server reported the feed unchanged (304)."""
+        return self.content is None
+
+    @cached_property
+    def content_hash(self) -> str | None:
+        """SHA-256 hex digest of the body, or None for a 304."""
+        if self.content is None:
+            return None
+        return hashlib.sha256(self.content).hexdigest()
+
+
 class FeedParser:
     """Parser for podcast RSS/Atom feeds.
 
@@ -101,6 +152,9 @@ class FeedParser:
     # User agent for feed requests
     USER_AGENT = "PodcastRAG/1.0 (+https://github.com/podcast-rag)"
 
+    # HTTP statuses worth retrying
+    RETRYABLE_STATUSES = (429, 500, 502, 503, 504)
+
     def __init__(
         self,
         user_agent: str | None = None,
@@ -126,7 +180,7 @@ class FeedParser:
         retry_strategy = Retry(
             total=self.retry_attempts,
             backoff_factor=1,
-            status_forcelist=[429, 500, 502, 503, 504],
+            status_forcelist=list(self.RETRYABLE_STATUSES),
             allowed_methods=["GET", "HEAD"],
         )
 
@@ -156,11 +210,140 @@ class FeedParser:
         logger.info(f"Parsing feed: {feed_url}")
 
         # Fetch the feed content with retry logic
-        response = self._session.get(feed_url, timeout=self.timeout)
+        fetched = self.fetch(feed_url)
+
+        return self.parse_content(fetched.content, feed_url)
+
+    @staticmethod
+    def _conditional_headers(etag: str | None, last_modified: str | None) -> dict[str, str]:
+        """Request headers for a conditional GET with the validators from the last fetch."""
+        headers = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        return headers
+
+    def fetch(
+        self,
+        feed_url: str,
+        etag: str | None = None,
+        last_modified: str | None = None,
+    ) -> FetchedFeed:
+        """
+        Fetch a feed's raw content, conditionally when validators are given.
+
+        Parameters:
+            feed_url (str): URL of the RSS/Atom feed.
+            etag (str | None): ETag from the last fetch, sent as If-None-Match.
+            last_modified (str | None): Last-Modified from the last fetch, sent as
+                If-Modified-Since.
+
+        Returns:
+            FetchedFeed: The body and new validators; `content` is None on 304.
+
+        Raises:
+            requests.RequestException: If the feed cannot be fetched after retries.
+        """
+        response = self._session.get(
+            feed_url,
+            timeout=self.timeout,
+            headers=self._conditional_headers(etag, last_modified),
+        )
+        if response.status_code == 304:
+            return FetchedFeed(
+                content=None,
+                etag=response.headers.get("ETag") or etag,
+                last_modified=response.headers.get("Last-Modified") or last_modified,
+            )
         response.raise_for_status()
+        return FetchedFeed(
+            content=response.content,
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+        )
+
+    async def fetch_async(
+        self,
+        session: aiohttp.ClientSession,
+        feed_url: str,
+        etag: str | None = None,
+        last_modified: str | None = None,
+    ) -> FetchedFeed:
+        """
+        Fetch a feed's raw content over a shared aiohttp session.
+
+        Sends a conditional GET when validators are given. Retries transient
+        failures (connection errors and retryable statuses) with exponential
+        backoff, like parse_url's retrying session. The session's own timeout
+        and connection limits apply.
+
+        Parameters:
+            session (aiohttp.ClientSession): Session used for the request.
+            feed_url (str): URL of the RSS/Atom feed.
+            etag (str | None): ETag from the last fetch.
+            last_modified (str | None): Last-Modified from the last fetch.
+
+        Returns:
+            FetchedFeed: The body and new validators; `content` is None on 304.
 
-        # Parse the fetched content
-        feed = feedparser.parse(response.content)
+        Raises:
+            aiohttp.ClientError: If the feed cannot be fetched after retries.
+        """
+        headers = self._conditional_headers(etag, last_modified)
+        for attempt in range(self.retry_attempts + 1):
+            last_attempt = attempt == self.retry_attempts
+            try:
+                async with session.get(
+                    feed_url, headers=headers, allow_redirects=True
+                ) as response:
+                    if response.status == 304:
+                        return FetchedFeed(
+                            content=None,
+                            etag=response.headers.get("ETag") or etag,
+                            last_modified=response.headers.get("Last-Modified") or last_modified,
+                        )
+                    if response.status in self.RETRYABLE_STATUSES and not last_attempt:
+                        logger.warning(
+                            f"Retryable status {response.status} for {feed_url}, "
+                            f"attempt {attempt + 1}/{self.retry_attempts + 1}"
+                        )
+                    else:
+                        response.raise_for_status()
+                        return FetchedFeed(
+                            content=await response.read(),
+                            etag=response.headers.get("ETag"),
+                            last_modified=response.headers.get("Last-Modified"),
+                        )
+            except (aiohttp.ClientConnectionError, TimeoutError) as e:
+                if last_attempt:
+                    raise
+                logger.warning(
+                    f"Fetch error for {feed_url}: {e}, "
+                    f"attempt {attempt + 1}/{self.retry_attempts + 1}"
+                )
+            await asyncio.sleep(2 ** attempt)  # Exponential backoff
+
+        # Should not reach here, but just in case
+        raise aiohttp.ClientError(f"Failed to fetch {feed_url}")
+
+    def parse_content(self, content: bytes, feed_url: str) -> ParsedPodcast:
+        """
+        Parse fetched feed content into its parsed podcast representation.
+
+        CPU-bound; the async sync engine runs it on a worker pool.
+
+        Parameters:
+            content (bytes): Raw RSS/Atom document.
+            feed_url (str): URL the content was fetched from.
+
+        Returns:
+            ParsedPodcast: Podcast metadata and a list of parsed episodes.
+
+        Raises:
+            ValueError: If the content contains no feed data.
+        """
+        feed = feedparser.parse(content)
 
         # Check for errors
         if feed.bozo and feed.bozo_exception:
@@ -184,6 +367,132 @@ class FeedParser:
         feed = feedparser.parse(content)
         return self._parse_feed(feed, feed_url)
 
+    def iter_episodes(
+        self, content: bytes, channel: list[ET.Element] | None = None
+    ) -> Iterator[ParsedEpisode]:
+        """
+        Lazily parse a feed's episodes in document order.
+
+        Streams the document with iterparse and converts each item once it has
+        been read, then drops it, so memory does not grow with the back
+        catalogue and a consumer that stops early never parses the rest.
+        Items without an audio enclosure are skipped.
+
+        Parameters:
+            content (bytes): Raw RSS/Atom document.
+            channel (list | None): If given, receives the channel-level
+                elements (title, artwork, ...) as they are read.
+
+        Yields:
+            ParsedEpisode: Each episode, as parse_content would produce it.
+
+        Raises:
+            xml.etree.ElementTree.ParseError: If the document is not well-formed XML.
+        """
+        wrapper = _RSS_WRAPPER
+        ancestors: list[ET.Element] = []
+        for event, elem in ET.iterparse(io.BytesIO(content), events=("start", "end")):
+            if event == "start":
+                if not ancestors and elem.tag == f"{{{_ATOM_NAMESPACE}}}feed":
+                    wrapper = _ATOM_WRAPPER
+                ancestors.append(elem)
+                continue
+
+            ancestors.pop()
+            if not ancestors or _local_name(ancestors[-1].tag) not in _CHANNEL_ELEMENTS:
+                continue
+            parent = ancestors[-1]
+
+            if _local_name(elem.tag) in _ITEM_ELEMENTS:
+                parent.remove(elem)
+                entries = feedparser.parse(wrapper % ET.tostring(elem)).entries
+                episode = self._parse_episode(entries[0]) if entries else None
+                if episode:
+                    yield episode
+            elif _local_name(elem.tag) != "channel":
+                parent.remove(elem)
+                if channel is not None:
+                    channel.append(elem)
+
+    def parse_content_incremental(
+        self,
+        content: bytes,
+        feed_url: str,
+        known_guids: Container[str],
+        stop_after_known: int,
+    ) -> ParsedPodcast:
+        """
+        Parse the newest part of a feed, stopping at episodes already stored.
+
+        For feeds that have already been imported: items are streamed in
+        document order (see iter_episodes) and parsing stops after
+        `stop_after_known` consecutive known GUIDs, so a feed with thousands
+        of back-catalogue items costs about as much as its newest few. It
+        only stops once it has seen dated items in newest-first order.
+
+        Falls back to parse_content (the whole feed, in one feedparser pass)
+        when the items turn out to be oldest-first, since new episodes are
+        then at the end; when the document is not well-formed XML, which
+        feedparser tolerates; or when no channel metadata precedes the items.
+
+        Parameters:
+            content (bytes): Raw RSS/Atom document.
+            feed_url (str): URL the content was fetched from.
+            known_guids (Container[str]): GUIDs of the podcast's stored episodes.
+            stop_after_known (int): Consecutive known GUIDs after which to stop.
+
+        Returns:
+            ParsedPodcast: Metadata from the channel elements read before
+                stopping, and every episode read (known ones included).
+
+        Raises:
+            ValueError: If the content contains no feed data.
+        """
+        channel: list[ET.Element] = []
+        episodes: list[ParsedEpisode] = []
+        known_run = 0
+        dated = 0
+        previous_date = None
+        stopped = False
+
+        try:
+            for episode in self.iter_episodes(content, channel):
+                episodes.append(episode)
+
+                if episode.published_date:
+                    published = episode.published_date
+                    if published.tzinfo is not None:
+                        published = published.astimezone(UTC).replace(tzinfo=None)
+                    if previous_date is not None and published > previous_date:
+                        logger.debug(f"Feed {feed_url} is not newest-first; parsing the whole feed")
+                        return self.parse_content(content, feed_url)
+                    previous_date = published
+                    dated += 1
+
+                known_run = known_run + 1 if episode.guid in known_guids else 0
+                if known_run >= stop_after_known and dated >= 2:
+                    stopped = True
+                    break
+        except ET.ParseError as e:
+            logger.warning(f"Streaming parse failed for {feed_url} ({e}); parsing the whole feed")
+            return self.parse_content(content, feed_url)
+
+        if not channel:
+            # No channel metadata before the items read (or not a feed at all)
+            return self.parse_content(content, feed_url)
+
+        atom = any(elem.tag.startswith(f"{{{_ATOM_NAMESPACE}}}") for elem in channel)
+        wrapper = _ATOM_WRAPPER if atom else _RSS_WRAPPER
+        feed = feedparser.parse(wrapper % b"".join(ET.tostring(elem) for elem in channel))
+        podcast = self._parse_podcast_metadata(feed.feed, feed_url)
+        podcast.episodes = episodes
+
+        logger.info(
+            f"Parsed podcast '{podcast.title}' incrementally: {len(episodes)} episodes read"
+            + (", stopped at known episodes" if stopped else "")
+        )
+        return podcast
+
     def _parse_feed(self, feed: feedparser.FeedParserDict, feed_url: str) -> ParsedPodcast:
         """
         Convert a feedparser result into a ParsedPodcast containing podcast-level metadata and its parsed episodes.
@@ -195,9 +504,30 @@ class FeedParser:
         Returns:
             ParsedPodcast: A ParsedPodcast populated with metadata (title, description, author, iTunes fields, image, dates, TTL) and a list of parsed ParsedEpisode objects.
         """
-        f = feed.feed
+        podcast = self._parse_podcast_metadata(feed.feed, feed_url)
+
+        # Parse episodes
+        for entry in feed.entries:
+            episode = self._parse_episode(entry)
+            if episode:
+                podcast.episodes.append(episode)
+
+        logger.info(f"Parsed podcast '{podcast.title}' with {len(podcast.episodes)} episodes")
+        return podcast
+
+    def _parse_podcast_metadata(
+        self, f: feedparser.FeedParserDict, feed_url: str
+    ) -> ParsedPodcast:
+        """
+        Build a ParsedPodcast, without episodes, from a feedparser channel.
+
+        Parameters:
+            f (feedparser.FeedParserDict): The channel (`feed.feed`) of a feedparser result.
+            feed_url (str): Original URL of the feed.
 
-        # Extract podcast metadata
+        Returns:
+            ParsedPodcast: Metadata (title, description, author, iTunes fields, image, dates, TTL).
+        """
         podcast = ParsedPodcast(
             feed_url=feed_url,
             title=f.get("title", "Unknown Podcast"),
@@ -238,13 +568,6 @@ class FeedParser:
             except (ValueError, TypeError):
                 pass
 
-        # Parse episodes
-        for entry in feed.entries:
-            episode = self._parse_episode(entry)
-            if episode:
-                podcast.episodes.append(episode)
-
-        logger.info(f"Parsed podcast '{podcast.title}' with {len(podcast.episodes)} episodes")
         return podcast
 
     def _parse_episode(self, entry: feedparser.FeedParserDict) -> ParsedEpisode | None:
@@ -2,22 +2,71 @@
 
 Syncs podcast feeds with the database, detecting new episodes
 and updating metadata.
+
+Sync passes over many feeds run on an asyncio engine: feeds are fetched
+concurrently over one shared aiohttp session (bounded per host), parsed on
+a thread pool, and written to the database one feed at a time on a single
+DB thread, with one priority refresh for the whole pass. At most
+`max_concurrent` feeds are in flight from fetch until stored, so fetched
+bodies cannot pile up behind the parse and DB threads.
+
+Fetches are conditional (If-None-Match / If-Modified-Since from the last
+processed fetch). A 304, or a body whose hash matches the last processed
+one, skips parsing and the metadata and episode writes entirely.
+
+Every check schedules the feed's next one from its publishing cadence (see
+poll_schedule); the pipeline syncs only feeds that are due.
+
+Changed feeds of podcasts that have already been imported are parsed
+incrementally, stopping after a run of already-stored episodes. A full
+parse runs on the first sync and every `reconcile_interval_hours` to pick
+up anything older that was added or edited.
 """
 
+import asyncio
 import logging
 import os
 import re
-from datetime import UTC, datetime
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, datetime, timedelta
 from typing import Any
+from urllib.parse import urlparse
 
-from sqlalchemy.exc import IntegrityError
+import aiohttp
 
 from ..db.repository import PodcastRepositoryInterface
-from .feed_parser import FeedParser, ParsedPodcast
+from .feed_parser import FeedParser, FetchedFeed, ParsedPodcast
+from .poll_schedule import HISTORY_SIZE, schedule_next_check
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class _SyncPass:
+    """Shared resources for one concurrent sync pass."""
+
+    session: aiohttp.ClientSession
+    parse_pool: ThreadPoolExecutor
+    db_pool: ThreadPoolExecutor
+    # Held from fetch until the feed is stored, bounding the feed bodies and
+    # parse results in memory while they queue for the parse and DB threads
+    feed_slots: asyncio.Semaphore
+    max_per_host: int
+    host_slots: dict[str, asyncio.Semaphore] = field(default_factory=dict)
+
+    @asynccontextmanager
+    async def fetch_slot(self, feed_url: str):
+        """Hold a per-host fetch slot."""
+        host = urlparse(feed_url).hostname or ""
+        if host not in self.host_slots:
+            self.host_slots[host] = asyncio.Semaphore(self.max_per_host)
+        async with self.host_slots[host]:
+            yield
+
+
 class FeedSyncService:
     """Service for synchronizing podcast feeds with the database.
 
@@ -33,6 +82,13 @@ class FeedSyncService:
         self,
         repository: PodcastRepositoryInterface,
         download_directory: str | None = None,
+        max_concurrent: int = 20,
+        max_per_host: int = 4,
+        parse_workers: int = 4,
+        min_check_interval_minutes: int = 30,
+        max_check_interval_hours: int = 168,
+        stop_after_known: int = 20,
+        reconcile_interval_hours: int = 168,
     ):
         """
         Create a FeedSyncService that synchronizes podcast feeds with the given repository.
@@ -40,9 +96,24 @@ class FeedSyncService:
         Parameters:
             download_directory (Optional[str]): Base directory for storing downloaded podcast files.
                 If `None`, local download directories are not created.
+            max_concurrent (int): Max feeds fetched at once during a sync pass.
+            max_per_host (int): Max feeds fetched at once from the same host.
+            parse_workers (int): Threads parsing fetched feeds during a sync pass.
+            min_check_interval_minutes (int): Shortest time between checks of a feed.
+            max_check_interval_hours (int): Longest time between checks of a feed.
+            stop_after_known (int): Consecutive stored episodes after which an
+                incremental parse stops.
+            reconcile_interval_hours (int): Time between full parses of a feed.
         """
         self.repository = repository
         self.download_directory = download_directory
+        self.max_concurrent = max_concurrent
+        self.max_per_host = max_per_host
+        self.parse_workers = parse_workers
+        self.min_check_interval = timedelta(minutes=min_check_interval_minutes)
+        self.max_check_interval = timedelta(hours=max_check_interval_hours)
+        self.stop_after_known = stop_after_known
+        self.reconcile_interval = timedelta(hours=reconcile_interval_hours)
         self.feed_parser = FeedParser()
 
     def sync_podcast(self, podcast_id: str) -> dict[str, Any]:
@@ -57,12 +128,14 @@ class FeedSyncService:
                 - podcast_id (str): The podcast identifier.
                 - new_episodes (int): Number of new episodes added.
                 - updated (bool): `True` if podcast metadata was updated, `False` otherwise.
+                - not_modified (bool): `True` if the feed was unchanged and not parsed.
                 - error (str|None): Error message if the sync failed, `None` on success.
         """
         result = {
             "podcast_id": podcast_id,
             "new_episodes": 0,
             "updated": False,
+            "not_modified": False,
             "error": None,
         }
 
@@ -75,38 +148,155 @@ class FeedSyncService:
         logger.info(f"Syncing podcast: {podcast.title}")
 
         try:
-            # Parse the feed
-            parsed = self.feed_parser.parse_url(podcast.feed_url)
-
-            # Update podcast metadata
-            self._update_podcast_metadata(podcast, parsed)
-            result["updated"] = True
-
-            # Add new episodes
-            new_count = self._add_new_episodes(podcast, parsed)
-            result["new_episodes"] = new_count
-
-            # Get the actual latest episode's published date
-            latest_episode = self.repository.get_latest_episode(podcast_id)
+            fetched = self.feed_parser.fetch(
+                podcast.feed_url,
+                etag=podcast.feed_etag,
+                last_modified=podcast.feed_last_modified,
+            )
 
-            # Update last checked timestamp and last_new_episode with actual episode date
-            update_fields = {"last_checked": datetime.now(UTC)}
-            if latest_episode and latest_episode.published_date:
-                update_fields["last_new_episode"] = latest_episode.published_date
+            if self._feed_unchanged(podcast, fetched):
+                self._record_unchanged_feed(podcast, fetched)
+                result["not_modified"] = True
+                logger.info(f"Feed unchanged for '{podcast.title}'")
             else:
-                # Clear last_new_episode if no valid episodes exist
-                update_fields["last_new_episode"] = None
+                known_guids = self._known_guids_for_parse(podcast)
+                parsed = self._parse_fetched_feed(podcast, fetched, known_guids)
+                new_count = self._apply_parsed_feed(podcast, parsed, fetched, known_guids)
+                result["updated"] = True
+                result["new_episodes"] = new_count
+                logger.info(f"Sync complete for '{podcast.title}': {new_count} new episodes")
 
-            self.repository.update_podcast(podcast_id, **update_fields)
-
-            logger.info(f"Sync complete for '{podcast.title}': {new_count} new episodes")
+            # Re-score queued episodes: new arrivals and recency decay
+            self.repository.refresh_episode_priorities([podcast_id])
 
         except Exception as e:
             logger.error(f"Failed to sync podcast {podcast.title}: {e}")
             result["error"] = str(e)
+            self._schedule_after_failure(podcast)
 
         return result
 
+    @staticmethod
+    def _feed_unchanged(podcast, fetched: FetchedFeed) -> bool:
+        """Whether a fetch returned the feed last processed for the podcast (304 or same body hash)."""
+        if fetched.not_modified:
+            return True
+        return (
+            podcast.feed_content_hash is not None
+            and fetched.content_hash == podcast.feed_content_hash
+        )
+
+    def _record_unchanged_feed(self, podcast, fetched: FetchedFeed) -> None:
+        """Record a check of an unchanged feed: timestamp, refreshed validators and next check."""
+        self.repository.update_podcast(
+            podcast.id,
+            last_checked=datetime.now(UTC),
+            feed_etag=fetched.etag,
+            feed_last_modified=fetched.last_modified,
+            **self._next_check_fields(podcast),
+        )
+
+    def _next_check_fields(self, podcast) -> dict[str, Any]:
+        """Podcast fields scheduling the feed's next check from its publishing history."""
+        schedule = schedule_next_check(
+            self.repository.get_episode_published_dates(podcast.id, limit=HISTORY_SIZE),
+            now=datetime.now(UTC),
+            fallback_interval=timedelta(hours=podcast.check_frequency_hours or 24),
+            min_interval=self.min_check_interval,
+            max_interval=self.max_check_interval,
+        )
+        return {
+            "next_check_at": schedule.next_check_at,
+            "check_frequency_hours": schedule.check_frequency_hours,
+        }
+
+    def _schedule_after_failure(self, podcast) -> None:
+        """Schedule the next check of a feed that failed, so it is not retried every pass."""
+        try:
+            self.repository.update_podcast(podcast.id, **self._next_check_fields(podcast))
+        except Exception as e:
+            logger.warning(f"Failed to schedule next check for {podcast.title}: {e}")
+
+    def _known_guids_for_parse(self, podcast) -> set[str] | None:
+        """
+        Stored episode GUIDs for an incremental parse, or None when a full parse is due.
+
+        A full parse runs when the podcast has never been reconciled (its
+        first sync) or was last reconciled `reconcile_interval` ago.
+        """
+        reconciled_at = podcast.feed_reconciled_at
+        if reconciled_at is None:
+            return None
+        if reconciled_at.tzinfo is None:
+            reconciled_at = reconciled_at.replace(tzinfo=UTC)
+        if datetime.now(UTC) - reconciled_at >= self.reconcile_interval:
+            return None
+        return self.repository.get_existing_episode_guids(podcast.id)
+
+    def _parse_fetched_feed(
+        self, podcast, fetched: FetchedFeed, known_guids: set[str] | None
+    ) -> ParsedPodcast:
+        """Parse a fetched feed in full, or incrementally when known GUIDs are given."""
+        if known_guids is None:
+            return self.feed_parser.parse_content(fetched.content, podcast.feed_url)
+        return self.feed_parser.parse_content_incremental(
+            fetched.content, podcast.feed_url, known_guids, self.stop_after_known
+        )
+
+    def _apply_parsed_feed(
+        self,
+        podcast,
+        parsed: ParsedPodcast,
+        fetched: FetchedFeed | None = None,
+        known_guids: set[str] | None = None,
+    ) -> int:
+        """
+        Write a parsed feed to the database: metadata, new episodes, check timestamps
+        and the next scheduled check.
+
+        Does not refresh episode priorities; callers do that once per podcast
+        or once per sync pass.
+
+        Parameters:
+            podcast: Podcast database object the feed belongs to.
+            parsed (ParsedPodcast): Parsed feed data.
+            fetched (FetchedFeed | None): The fetch `parsed` came from; its
+                validators and body hash are stored last, so a failed write
+                is retried in full on the next sync.
+            known_guids (set[str] | None): Stored GUIDs the feed was parsed
+                incrementally against; None for a full parse, which is
+                recorded as the podcast's latest reconciliation.
+
+        Returns:
+            int: Number of episodes added.
+        """
+        # Update podcast metadata
+        self._update_podcast_metadata(podcast, parsed)
+
+        # Add new episodes
+        new_count = self._add_new_episodes(podcast, parsed, known_guids)
+
+        # Get the actual latest episode's published date
+        latest_episode = self.repository.get_latest_episode(podcast.id)
+
+        # Update last checked timestamp and last_new_episode with actual episode date
+        update_fields = {"last_checked": datetime.now(UTC)}
+        if latest_episode and latest_episode.published_date:
+            update_fields["last_new_episode"] = latest_episode.published_date
+        else:
+            # Clear last_new_episode if no valid episodes exist
+            update_fields["last_new_episode"] = None
+        update_fields.update(self._next_check_fields(podcast))
+        if known_guids is None:
+            update_fields["feed_reconciled_at"] = datetime.now(UTC)
+        if fetched is not None:
+            update_fields["feed_etag"] = fetched.etag
+            update_fields["feed_last_modified"] = fetched.last_modified
+            update_fields["feed_content_hash"] = fetched.content_hash
+
+        self.repository.update_podcast(podcast.id, **update_fields)
+        return new_count
+
     def sync_all_podcasts(self) -> dict[str, Any]:
         """
         Synchronize all podcasts from the repository.
@@ -126,8 +316,8 @@ class FeedSyncService:
         """
         Synchronize podcasts that have at least one user subscribed.
 
-        This is the primary method used by the pipeline to sync feeds.
-        Only podcasts with active user subscriptions are synced.
+        Syncs every podcast with active user subscriptions, whether or not
+        its next check is due.
 
         Returns:
             overall_result (dict): Aggregated sync results with keys:
@@ -140,9 +330,27 @@ class FeedSyncService:
 
         return self._sync_podcasts(podcasts)
 
+    def sync_due_podcasts(self) -> dict[str, Any]:
+        """
+        Synchronize subscribed podcasts whose next scheduled check is due.
+
+        This is the method used by the pipeline: each check schedules the
+        feed's next one, so frequent publishers are polled often and
+        dormant feeds rarely.
+
+        Returns:
+            overall_result (dict): Aggregated sync results, as from `sync_podcasts_with_subscribers`.
+        """
+        podcasts = self.repository.list_podcasts_due_for_sync(datetime.now(UTC))
+
+        return self._sync_podcasts(podcasts)
+
     def _sync_podcasts(self, podcasts: list) -> dict[str, Any]:
         """
-        Internal method to sync a list of podcasts.
+        Internal method to sync a list of podcasts on the concurrent sync engine.
+
+        Must not be called from a running event loop; async callers use
+        `sync_podcasts_async` directly.
 
         Parameters:
             podcasts: List of Podcast objects to sync.
@@ -150,30 +358,183 @@ class FeedSyncService:
         Returns:
             overall_result (dict): Aggregated sync results.
         """
+        return asyncio.run(self.sync_podcasts_async(podcasts))
+
+    async def sync_podcasts_async(self, podcasts: list) -> dict[str, Any]:
+        """
+        Sync a list of podcasts concurrently.
+
+        Feeds are fetched over one shared HTTP session with at most
+        `max_concurrent` fetches in flight (`max_per_host` per host), parsed
+        on a pool of `parse_workers` threads, and written to the database
+        from a single thread so a pass never holds more than one connection.
+        Episode priorities are refreshed once for all synced podcasts.
+
+        Parameters:
+            podcasts: List of Podcast objects to sync.
+
+        Returns:
+            overall_result (dict): Aggregated sync results with keys:
+                - synced (int): Number of podcasts successfully synced.
+                - failed (int): Number of podcasts that failed to sync.
+                - not_modified (int): Synced podcasts whose feed was unchanged.
+                - new_episodes (int): Total number of new episodes added across all podcasts.
+                - results (list): Per-podcast result dictionaries, as from `sync_podcast`
+                  plus `fetch_seconds` and `parse_seconds` timings.
+        """
         overall_result = {
             "synced": 0,
             "failed": 0,
+            "not_modified": 0,
             "new_episodes": 0,
             "results": [],
         }
+        if not podcasts:
+            return overall_result
+
+        start = time.perf_counter()
+        with (
+            ThreadPoolExecutor(
+                max_workers=self.parse_workers, thread_name_prefix="feed-parse"
+            ) as parse_pool,
+            ThreadPoolExecutor(max_workers=1, thread_name_prefix="feed-sync-db") as db_pool,
+        ):
+            async with aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=self.max_concurrent, limit_per_host=self.max_per_host
+                ),
+                timeout=aiohttp.ClientTimeout(total=self.feed_parser.timeout),
+                headers={"User-Agent": self.feed_parser.user_agent},
+            ) as session:
+                sync_pass = _SyncPass(
+                    session=session,
+                    parse_pool=parse_pool,
+                    db_pool=db_pool,
+                    feed_slots=asyncio.Semaphore(self.max_concurrent),
+                    max_per_host=self.max_per_host,
+                )
+                results = await asyncio.gather(
+                    *(self._sync_podcast_async(podcast, sync_pass) for podcast in podcasts)
+                )
 
-        for podcast in podcasts:
-            result = self.sync_podcast(podcast.id)
-            overall_result["results"].append(result)
+            synced_ids = [result["podcast_id"] for result in results if not result["error"]]
+            if synced_ids:
+                # Re-score queued episodes: new arrivals and recency decay
+                await asyncio.get_running_loop().run_in_executor(
+                    db_pool, self.repository.refresh_episode_priorities, synced_ids
+                )
 
+        for result in results:
+            overall_result["results"].append(result)
             if result["error"]:
                 overall_result["failed"] += 1
             else:
                 overall_result["synced"] += 1
                 overall_result["new_episodes"] += result["new_episodes"]
+                if result.get("not_modified"):
+                    overall_result["not_modified"] += 1
+
+        self._log_sync_timings(overall_result, time.perf_counter() - start)
+        return overall_result
+
+    async def _sync_podcast_async(self, podcast, sync_pass: _SyncPass) -> dict[str, Any]:
+        """
+        Fetch, parse and store one podcast's feed within a sync pass.
+
+        Parameters:
+            podcast: Podcast database object to sync.
+            sync_pass (_SyncPass): Shared session, pools and concurrency limits.
+
+        Returns:
+            result (dict): As from `sync_podcast`, plus `fetch_seconds` and
+                `parse_seconds` (None for stages that did not run).
+        """
+        result = {
+            "podcast_id": podcast.id,
+            "new_episodes": 0,
+            "updated": False,
+            "not_modified": False,
+            "error": None,
+            "fetch_seconds": None,
+            "parse_seconds": None,
+        }
+        loop = asyncio.get_running_loop()
+
+        async with sync_pass.feed_slots:
+            try:
+                started = time.perf_counter()
+                async with sync_pass.fetch_slot(podcast.feed_url):
+                    fetched = await self.feed_parser.fetch_async(
+                        sync_pass.session,
+                        podcast.feed_url,
+                        etag=podcast.feed_etag,
+                        last_modified=podcast.feed_last_modified,
+                    )
+                result["fetch_seconds"] = round(time.perf_counter() - started, 3)
+
+                if self._feed_unchanged(podcast, fetched):
+                    await loop.run_in_executor(
+                        sync_pass.db_pool, self._record_unchanged_feed, podcast, fetched
+                    )
+                    result["not_modified"] = True
+                    return result
+
+                known_guids = await loop.run_in_executor(
+                    sync_pass.db_pool, self._known_guids_for_parse, podcast
+                )
+                started = time.perf_counter()
+                parsed = await loop.run_in_executor(
+                    sync_pass.parse_pool, self._parse_fetched_feed, podcast, fetched, known_guids
+                )
+                result["parse_seconds"] = round(time.perf_counter() - started, 3)
+
+                new_count = await loop.run_in_executor(
+                    sync_pass.db_pool,
+                    self._apply_parsed_feed,
+                    podcast,
+                    parsed,
+                    fetched,
+                    known_guids,
+                )
+                result["updated"] = True
+                result["new_episodes"] = new_count
+
+                logger.debug(
+                    f"Synced '{podcast.title}': {new_count} new episodes "
+                    f"(fetch {result['fetch_seconds']}s, parse {result['parse_seconds']}s)"
+                )
+
+            except Exception as e:
+                logger.error(f"Failed to sync podcast {podcast.title}: {e}")
+                result["error"] = str(e) or type(e).__name__
+                await loop.run_in_executor(sync_pass.db_pool, self._schedule_after_failure, podcast)
+
+        return result
+
+    def _log_sync_timings(self, overall_result: dict[str, Any], elapsed: float) -> None:
+        """Log a sync pass summary with fetch/parse totals and the slowest feeds."""
+        results = overall_result["results"]
+        fetch_total = sum(r["fetch_seconds"] or 0 for r in results)
+        parse_total = sum(r["parse_seconds"] or 0 for r in results)
 
         logger.info(
-            f"Sync complete: {overall_result['synced']} synced, "
+            f"Sync complete: {overall_result['synced']} synced "
+            f"({overall_result['not_modified']} unchanged), "
             f"{overall_result['failed']} failed, "
-            f"{overall_result['new_episodes']} new episodes"
+            f"{overall_result['new_episodes']} new episodes "
+            f"in {elapsed:.1f}s (fetch {fetch_total:.1f}s, parse {parse_total:.1f}s summed)"
         )
 
-        return overall_result
+        slowest = sorted(
+            results,
+            key=lambda r: (r["fetch_seconds"] or 0) + (r["parse_seconds"] or 0),
+            reverse=True,
+        )[:5]
+        for result in slowest:
+            logger.debug(
+                f"Slow feed {result['podcast_id']}: fetch {result['fetch_seconds']}s, "
+                f"parse {result['parse_seconds']}s"
+            )
 
     def add_podcast_from_url(self, feed_url: str) -> dict[str, Any]:
         """
@@ -205,8 +566,9 @@ class FeedSyncService:
             return result
 
         try:
-            # Parse the feed
-            parsed = self.feed_parser.parse_url(feed_url)
+            # Fetch and parse the feed
+            fetched = self.feed_parser.fetch(feed_url)
+            parsed = self.feed_parser.parse_content(fetched.content, feed_url)
 
             # Create podcast
             podcast = self.repository.create_podcast(
@@ -231,6 +593,17 @@ class FeedSyncService:
             # Add episodes
             new_count = self._add_new_episodes(podcast, parsed)
             result["episodes"] = new_count
+            self.repository.refresh_episode_priorities([podcast.id])
+
+            # Remember the fetch so the next sync can skip an unchanged feed
+            self.repository.update_podcast(
+                podcast.id,
+                feed_etag=fetched.etag,
+                feed_last_modified=fetched.last_modified,
+                feed_content_hash=fetched.content_hash,
+                feed_reconciled_at=datetime.now(UTC),
+                **self._next_check_fields(podcast),
+            )
 
             logger.info(f"Added podcast '{podcast.title}' with {new_count} episodes")
 
@@ -280,67 +653,40 @@ class FeedSyncService:
             self.repository.update_podcast(podcast.id, **updates)
             logger.debug(f"Updated podcast metadata: {updates.keys()}")
 
-    def _add_new_episodes(self, podcast, parsed: ParsedPodcast) -> int:
+    def _add_new_episodes(
+        self, podcast, parsed: ParsedPodcast, existing_guids: set[str] | None = None
+    ) -> int:
         """
         Add episodes from a parsed feed into the repository for the given podcast.
 
-        Uses batch GUID lookup to avoid N+1 query problem - fetches all existing
-        GUIDs in one query, then only creates episodes that don't exist.
+        Episodes whose GUIDs are already stored are filtered out in memory (one
+        GUID query), and the rest are inserted in bulk. The insert skips GUIDs
+        another process created in the meantime, so concurrent syncs of the
+        same feed do not fail.
 
         Parameters:
             podcast: Podcast database object to associate new episodes with.
             parsed (ParsedPodcast): Parsed feed data containing episodes to add.
+            existing_guids (set[str] | None): GUIDs already stored, if they were
+                just looked up; fetched otherwise.
 
         Returns:
             int: Number of episodes that were newly created and added to the repository.
         """
         # Batch fetch all existing GUIDs in one query (instead of N queries)
-        existing_guids = self.repository.get_existing_episode_guids(podcast.id)
-
-        new_count = 0
-        for episode_data in parsed.episodes:
-            # Skip if episode already exists (checked via in-memory set)
-            if episode_data.guid in existing_guids:
-                continue
-
-            # Only create new episodes
-            try:
-                self.repository.create_episode(
-                    podcast_id=podcast.id,
-                    guid=episode_data.guid,
-                    title=episode_data.title,
-                    enclosure_url=episode_data.enclosure_url,
-                    enclosure_type=episode_data.enclosure_type,
-                    description=episode_data.description,
-                    link=episode_data.link,
-                    published_date=episode_data.published_date,
-                    duration_seconds=episode_data.duration_seconds,
-                    episode_number=episode_data.episode_number,
-                    season_number=episode_data.season_number,
-                    episode_type=episode_data.episode_type,
-                    itunes_title=episode_data.itunes_title,
-                    itunes_episode=episode_data.itunes_episode,
-                    itunes_season=episode_data.itunes_season,
-                    itunes_explicit=episode_data.itunes_explicit,
-                    itunes_duration=episode_data.itunes_duration,
-                    enclosure_length=episode_data.enclosure_length,
-                )
-                new_count += 1
-                logger.debug(f"Added episode: {episode_data.title}")
-            except IntegrityError:
-                # Race condition: another process created the episode between
-                # our GUID check and INSERT. This is expected and safe to ignore.
-                logger.warning(
-                    f"Episode already exists (race condition): "
-                    f"podcast={podcast.id}, guid={episode_data.guid}"
-                )
-            except Exception:
-                # Genuine error - log with full traceback for debugging
-                logger.exception(
-                    f"Failed to create episode: podcast={podcast.id}, "
-                    f"guid={episode_data.guid}"
-                )
-
+        if existing_guids is None:
+            existing_guids = self.repository.get_existing_episode_guids(podcast.id)
+
+        new_episodes = [
+            asdict(episode_data)
+            for episode_data in parsed.episodes
+            if episode_data.guid not in existing_guids
+        ]
+        if not new_episodes:
+            return 0
+
+        new_count = self.repository.bulk_create_episodes(podcast.id, new_episodes)
+        logger.debug(f"Added {new_count} episodes to '{podcast.title}'")
         return new_count
 
     def _get_podcast_directory(self, title: str) -> str | None:
@@ -0,0 +1,120 @@
+"""Adaptive polling schedule for podcast feeds.
+
+Each feed's publishing cadence is learned from the published dates of its
+recent episodes (the median gap between them). Feeds are then polled a few
+times per cadence, and every ``min_interval`` around the time the next
+episode is expected - the last release plus a whole number of cadences, so
+a daily show is watched closely near its usual release hour. Feeds that
+have gone quiet for several cadences are treated as dormant and polled less
+often the longer they stay quiet.
+"""
+
+import math
+import statistics
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from itertools import pairwise
+
+# Recent episodes used to learn a feed's cadence
+HISTORY_SIZE = 20
+
+# Polls per publishing cadence outside the release window
+POLLS_PER_CADENCE = 4
+
+# Release window: this fraction of the cadence on either side of the expected release
+RELEASE_WINDOW_FRACTION = 1 / 8
+MAX_RELEASE_WINDOW = timedelta(hours=6)
+
+# A feed silent for this many cadences is dormant
+DORMANT_AFTER_CADENCES = 4
+
+
+@dataclass
+class PollSchedule:
+    """When to check a feed next."""
+
+    next_check_at: datetime
+
+    # Regular polling interval for the feed, in whole hours (at least 1)
+    check_frequency_hours: int
+
+
+def _as_utc(value: datetime) -> datetime:
+    """Treat naive datetimes (as stored by the database) as UTC."""
+    return value.replace(tzinfo=UTC) if value.tzinfo is None else value.astimezone(UTC)
+
+
+def publishing_cadence(published_dates: Iterable[datetime | None]) -> timedelta | None:
+    """
+    Typical time between a feed's episodes.
+
+    Parameters:
+        published_dates: Published dates of the feed's episodes, in any order;
+            None values are ignored.
+
+    Returns:
+        timedelta | None: Median gap between the most recent `HISTORY_SIZE`
+            distinct dates, or None with fewer than two.
+    """
+    dates = sorted({_as_utc(d) for d in published_dates if d}, reverse=True)[:HISTORY_SIZE]
+    gaps = [newer - older for newer, older in pairwise(dates)]
+    if not gaps:
+        return None
+    return statistics.median(gaps)
+
+
+def schedule_next_check(
+    published_dates: Iterable[datetime | None],
+    now: datetime,
+    fallback_interval: timedelta,
+    min_interval: timedelta,
+    max_interval: timedelta,
+) -> PollSchedule:
+    """
+    Compute when a feed should next be checked.
+
+    Parameters:
+        published_dates: Published dates of the feed's episodes.
+        now: Time of the check being scheduled from.
+        fallback_interval: Interval used while the cadence is unknown.
+        min_interval: Shortest interval between checks.
+        max_interval: Longest interval between checks.
+
+    Returns:
+        PollSchedule: The next check time and the feed's regular interval.
+    """
+    now = _as_utc(now)
+
+    def clamp(interval: timedelta) -> timedelta:
+        return min(max(interval, min_interval), max_interval)
+
+    def schedule(next_check_at: datetime, interval: timedelta) -> PollSchedule:
+        hours = max(1, round(interval.total_seconds() / 3600))
+        return PollSchedule(
+            next_check_at=max(next_check_at, now + min_interval),
+            check_frequency_hours=hours,
+        )
+
+    dates = [_as_utc(d) for d in published_dates if d]
+    cadence = publishing_cadence(dates)
+    if cadence is None:
+        interval = clamp(fallback_interval)
+        return schedule(now + interval, interval)
+
+    interval = clamp(cadence / POLLS_PER_CADENCE)
+    silence = now - max(dates)
+
+    if silence > cadence * DORMANT_AFTER_CADENCES:
+        # Back off in proportion to how long the feed has been quiet
+        interval = clamp(max(interval, silence / POLLS_PER_CADENCE))
+        return schedule(now + interval, interval)
+
+    # Next release on the feed's rhythm whose window has not yet closed
+    window = min(cadence * RELEASE_WINDOW_FRACTION, MAX_RELEASE_WINDOW)
+    cadences = max(1, math.ceil((silence - window) / cadence))
+    window_start = max(dates) + cadence * cadences - window
+
+    if now >= window_start:
+        return schedule(now + min_interval, interval)
+    return schedule(min(now + interval, window_start), interval)
@@ -0,0 +1,209 @@
+"""Storage for generated briefing audio.
+
+Audio is written once, when a briefing's audio is generated, and read many
+times by the streaming endpoint. Keeping it out of the database means a play
+no longer pulls a multi-megabyte blob through the connection pool: local
+files are served with sendfile and S3 objects are streamed in chunks.
+
+Keys are content-addressed (they embed a hash of the audio), so a key never
+points at different bytes and doubles as the HTTP ETag.
+"""
+
+import hashlib
+import logging
+import mimetypes
+import os
+import tempfile
+from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from pathlib import PurePosixPath
+
+from src.config import Config
+
+logger = logging.getLogger(__name__)
+
+# Bytes read per chunk when streaming audio
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+def briefing_audio_key(briefing_id: str, data: bytes, mime_type: str) -> str:
+    """Build the storage key for a briefing's audio.
+
+    Args:
+        briefing_id: Briefing the audio belongs to.
+        data: The audio bytes.
+        mime_type: MIME type of the audio, used for the file extension.
+
+    Returns:
+        Key of the form ``briefings/<briefing_id>/<sha256 prefix><ext>``.
+    """
+    digest = hashlib.sha256(data).hexdigest()[:32]
+    extension = mimetypes.guess_extension(mime_type) or ""
+    return f"briefings/{briefing_id}/{digest}{extension}"
+
+
+def audio_etag(key: str) -> str:
+    """Strong ETag for the audio stored under a key (its content hash)."""
+    return f'"{PurePosixPath(key).stem}"'
+
+
+class AudioStorage(ABC):
+    """Where briefing audio bytes live."""
+
+    @abstractmethod
+    def put(self, key: str, data: bytes, mime_type: str) -> None:
+        """Store audio under a key, replacing anything already there."""
+        pass
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Delete the audio stored under a key; missing keys are ignored."""
+        pass
+
+    @abstractmethod
+    def iter_range(
+        self, key: str, start: int, end: int, chunk_size: int = STREAM_CHUNK_SIZE
+    ) -> Iterator[bytes]:
+        """Yield bytes ``start`` to ``end`` (inclusive) of the stored audio in chunks."""
+        pass
+
+    def local_path(self, key: str) -> str | None:
+        """Filesystem path for the audio under a key, or None if storage is not local disk.
+
+        When available, the web app serves the file directly (sendfile). The
+        file is not guaranteed to exist.
+        """
+        return None
+
+
+class LocalAudioStorage(AudioStorage):
+    """Audio stored as files under a directory."""
+
+    def __init__(self, root: str):
+        """
+        Args:
+            root: Directory holding the audio; created on first write.
+        """
+        self.root = os.path.abspath(root)
+
+    def _path(self, key: str) -> str:
+        path = os.path.abspath(os.path.join(self.root, key))
+        if os.path.commonpath([self.root, path]) != self.root:
+            raise ValueError(f"Audio storage key escapes the storage root: {key}")
+        return path
+
+    def put(self, key: str, data: bytes, mime_type: str) -> None:
+        """Write the file atomically (temporary file, then rename)."""
+        path = self._path(key)
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(temp_path, path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+    def delete(self, key: str) -> None:
+        path = self._path(key)
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            # Usually a sign this process does not share the web service's directory
+            logger.warning("Briefing audio to delete not found: %s", path)
+
+    def iter_range(
+        self, key: str, start: int, end: int, chunk_size: int = STREAM_CHUNK_SIZE
+    ) -> Iterator[bytes]:
+        with open(self._path(key), "rb") as f:
+            f.seek(start)
+            remaining = end - start + 1
+            while remaining > 0:
+                chunk = f.read(min(chunk_size, remaining))
+                if not chunk:
+                    break
+                remaining -= len(chunk)
+                yield chunk
+
+    def local_path(self, key: str) -> str | None:
+        return self._path(key)
+
+
+class S3AudioStorage(AudioStorage):
+    """Audio stored as objects in an S3-compatible bucket.
+
+    Requires boto3, which is not a core dependency (``pip install boto3``).
+    Credentials come from the usual boto3 sources (environment, config files,
+    instance roles).
+    """
+
+    def __init__(self, bucket: str, prefix: str = "", endpoint_url: str | None = None):
+        """
+        Args:
+            bucket: Bucket name.
+            prefix: Key prefix for all audio objects.
+            endpoint_url: Endpoint for S3-compatible services (MinIO, R2, GCS
+                interoperability); None for AWS.
+        """
+        try:
+            import boto3
+        except ImportError as e:
+            raise ImportError(
+                "BRIEFING_AUDIO_STORAGE=s3 requires boto3; install it with `pip install boto3`"
+            ) from e
+        self.bucket = bucket
+        self.prefix = prefix.strip("/")
+        self._client = boto3.client("s3", endpoint_url=endpoint_url or None)
+
+    def _object_key(self, key: str) -> str:
+        return f"{self.prefix}/{key}" if self.prefix else key
+
+    def put(self, key: str, data: bytes, mime_type: str) -> None:
+        self._client.put_object(
+            Bucket=self.bucket,
+            Key=self._object_key(key),
+            Body=data,
+            ContentType=mime_type,
+        )
+
+    def delete(self, key: str) -> None:
+        self._client.delete_object(Bucket=self.bucket, Key=self._object_key(key))
+
+    def iter_range(
+        self, key: str, start: int, end: int, chunk_size: int = STREAM_CHUNK_SIZE
+    ) -> Iterator[bytes]:
+        response = self._client.get_object(
+            Bucket=self.bucket,
+            Key=self._object_key(key),
+            Range=f"bytes={start}-{end}",
+        )
+        body = response["Body"]
+        try:
+            yield from body.iter_chunks(chunk_size)
+        finally:
+            body.close()
+
+
+def create_audio_storage(config: Config) -> AudioStorage:
+    """Create the audio storage selected by BRIEFING_AUDIO_STORAGE.
+
+    Raises:
+        ValueError: If the storage type is unknown or S3 has no bucket.
+    """
+    storage_type = config.BRIEFING_AUDIO_STORAGE
+    if storage_type == "local":
+        return LocalAudioStorage(config.BRIEFING_AUDIO_DIRECTORY)
+    if storage_type == "s3":
+        if not config.BRIEFING_AUDIO_S3_BUCKET:
+            raise ValueError("BRIEFING_AUDIO_STORAGE=s3 requires BRIEFING_AUDIO_S3_BUCKET")
+        return S3AudioStorage(
+            bucket=config.BRIEFING_AUDIO_S3_BUCKET,
+            prefix=config.BRIEFING_AUDIO_S3_PREFIX,
+            endpoint_url=config.BRIEFING_AUDIO_S3_ENDPOINT_URL,
+        )
+    raise ValueError(
+        f"BRIEFING_AUDIO_STORAGE must be 'local' or 's3', got {storage_type!r}"
+    )
@@ -2,12 +2,20 @@
 
 Uses a column-based atomic claim with stale-claim recovery (30min timeout)
 to prevent duplicate generation and recover from crashed workers.
+
+Generated audio is written once to audio storage (see audio_storage); the
+briefing row keeps only its key, size and metadata.
 """
 
 import logging
 
 from src.config import Config
 from src.db.repository import PodcastRepositoryInterface
+from src.services.audio_storage import (
+    AudioStorage,
+    briefing_audio_key,
+    create_audio_storage,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -20,9 +28,32 @@ def audio_is_ready(briefing) -> bool:
     """Check if a briefing has valid, playable audio.
 
     Used by feed_service and app.py to avoid duplicating the ready+data
-    invariant check.
+    invariant check. Reads only the recorded size, never the audio itself.
+    """
+    return briefing.audio_status == "ready" and bool(briefing.audio_size_bytes)
+
+
+def store_legacy_audio(
+    briefing,
+    repository: PodcastRepositoryInterface,
+    storage: AudioStorage,
+) -> str | None:
+    """Move a briefing's audio from its database blob into audio storage.
+
+    For audio generated before audio storage existed; the blob is dropped
+    once the stored copy is recorded.
+
+    Returns:
+        The new storage key, or None if the briefing has no blob.
     """
-    return briefing.audio_status == "ready" and bool(briefing.audio_data)
+    data = repository.get_briefing_audio_data(briefing.id)
+    if not data:
+        return None
+    mime_type = briefing.audio_mime_type or "audio/mpeg"
+    key = briefing_audio_key(briefing.id, data, mime_type)
+    storage.put(key, data, mime_type)
+    repository.set_briefing_audio_storage_key(briefing.id, key)
+    return key
 
 
 def generate_briefing_audio(
@@ -30,6 +61,7 @@ def generate_briefing_audio(
     repository: PodcastRepositoryInterface,
     config: Config,
     force_retry: bool = False,
+    storage: AudioStorage | None = None,
 ) -> str | None:
     """Generate audio for a briefing. Lazy + cached.
 
@@ -38,6 +70,8 @@ def generate_briefing_audio(
             attempt failed. Without this, a "failed" status is terminal
             and the caller gets the failed status back without a paid
             Gemini TTS call.
+        storage: Audio storage to write to; defaults to the one configured
+            by BRIEFING_AUDIO_STORAGE.
 
     Returns:
         - "ready": audio was already generated or just generated successfully
@@ -53,7 +87,7 @@ def generate_briefing_audio(
         return BRIEFING_AUDIO_READY
 
     # Inconsistent state: ready status but no data — treat as failed so claim can recover
-    if briefing.audio_status == "ready" and not briefing.audio_data:
+    if briefing.audio_status == "ready" and not briefing.audio_size_bytes:
         repository.update_briefing_audio_status(briefing_id, "failed")
 
     # Terminal failure: don't re-attempt unless caller explicitly requests retry
@@ -89,10 +123,15 @@ def generate_briefing_audio(
             repository.update_briefing_audio_status(briefing_id, "failed")
             return None
 
-        # 3. Persist blob + metadata
+        # 3. Write to audio storage, then record key + metadata
+        if storage is None:
+            storage = create_audio_storage(config)
+        key = briefing_audio_key(briefing_id, mp3_bytes, AUDIO_MIME_TYPE)
+        storage.put(key, mp3_bytes, AUDIO_MIME_TYPE)
         repository.update_briefing_audio(
             briefing_id=briefing_id,
-            audio_data=mp3_bytes,
+            audio_storage_key=key,
+            audio_size_bytes=len(mp3_bytes),
             audio_mime_type=AUDIO_MIME_TYPE,
             audio_duration_sec=duration,  # None if ffprobe failed, not 0
             status="ready",
@@ -110,12 +149,14 @@ def get_audio_url_or_trigger(
     repository: PodcastRepositoryInterface,
     config: Config,
     force_retry: bool = False,
+    storage: AudioStorage | None = None,
 ) -> dict:
     """Check audio status; generate if needed.
 
     Args:
         force_retry: If True, re-attempt generation even if the last
             attempt failed. Without this, a "failed" status is terminal.
+        storage: Audio storage to write generated audio to.
 
     Returns dict with:
         - status: "ready" | "pending" | "failed"
@@ -140,7 +181,7 @@ def get_audio_url_or_trigger(
 
     # Trigger generation (handles ready-without-data recovery internally)
     result = generate_briefing_audio(
-        briefing_id, repository, config, force_retry=force_retry
+        briefing_id, repository, config, force_retry=force_retry, storage=storage
     )
 
     if result == BRIEFING_AUDIO_PENDING:
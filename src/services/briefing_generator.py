@@ -16,6 +16,7 @@ from pydantic import ValidationError
 from src.config import Config
 from src.db.gemini_file_search import GeminiFileSearchManager
 from src.schemas import DigestBriefing
+from src.utils.metrics import GEMINI_CALL_SECONDS, GEMINI_RETRIES
 
 logger = logging.getLogger(__name__)
 
@@ -175,13 +176,16 @@ def _retry_generate_content(client, *, model, contents, config, max_retries=_MAX
         The last exception if all retries are exhausted.
     """
     last_exc = None
+    started = time.monotonic()
     for attempt in range(max_retries):
         try:
-            return client.models.generate_content(
+            response = client.models.generate_content(
                 model=model,
                 contents=contents,
                 config=config,
             )
+            GEMINI_CALL_SECONDS.observe(time.monotonic() - started, operation="briefing")
+            return response
         except Exception as exc:
             last_exc = exc
             status = getattr(exc, "status_code", None) or getattr(exc, "code", None)
@@ -199,6 +203,7 @@ def _retry_generate_content(client, *, model, contents, config, max_retries=_MAX
                 "Gemini API call failed (attempt %d/%d), retrying in %.1fs: %s",
                 attempt + 1, max_retries, delay, exc,
             )
+            GEMINI_RETRIES.inc(operation="briefing")
             time.sleep(delay)
     raise last_exc  # type: ignore[misc]
 
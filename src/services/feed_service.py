@@ -161,10 +161,11 @@ def get_feed(
                 "episode_count": day_briefing.episode_count,
                 "audio_status": "pending" if day_briefing.audio_status == "generating" else day_briefing.audio_status,
                 # Status only: the feed query defers audio_data, so touching
-                # the blob here (via audio_is_ready) triggers a lazy load on a
+                # the legacy blob here would trigger a lazy load on a
                 # session-detached instance -> DetachedInstanceError. Status is
-                # written atomically with the blob in update_briefing_audio, so
-                # "ready" reliably implies the audio exists.
+                # written atomically with the storage key in
+                # update_briefing_audio, so "ready" reliably implies the audio
+                # exists.
                 "audio_url": (
                     f"/api/feed/briefing/{day_briefing.id}/audio"
                     if day_briefing.audio_status == "ready"
@@ -327,7 +328,7 @@ def _briefing_to_response(briefing, briefing_date: date) -> dict:
         "episode_count": briefing.episode_count,
         "audio_status": "pending" if briefing.audio_status == "generating" else briefing.audio_status,
         # Status only (see get_feed): avoids loading the deferred audio_data
-        # blob on a detached instance. "ready" implies the blob was persisted.
+        # blob on a detached instance. "ready" implies the audio was stored.
         "audio_url": (
             f"/api/feed/briefing/{briefing.id}/audio"
             if briefing.audio_status == "ready"
@@ -16,6 +16,7 @@ from google import genai
 from google.genai import types
 
 from src.config import Config
+from src.utils.metrics import GEMINI_CALL_SECONDS, GEMINI_RETRIES
 
 logger = logging.getLogger(__name__)
 
@@ -53,11 +54,14 @@ def _is_retryable(exc: Exception) -> bool:
 def _retry_tts_call(client, *, model, contents, config):
     """Call generate_content with exponential backoff on transient errors."""
     last_exc = None
+    started = time.monotonic()
     for attempt in range(_MAX_RETRIES):
         try:
-            return client.models.generate_content(
+            response = client.models.generate_content(
                 model=model, contents=contents, config=config
             )
+            GEMINI_CALL_SECONDS.observe(time.monotonic() - started, operation="tts")
+            return response
         except Exception as exc:
             last_exc = exc
             if not _is_retryable(exc) or attempt == _MAX_RETRIES - 1:
@@ -67,6 +71,7 @@ def _retry_tts_call(client, *, model, contents, config):
                 "Gemini TTS call failed (attempt %d/%d), retrying in %.1fs: %s",
                 attempt + 1, _MAX_RETRIES, delay, exc,
             )
+            GEMINI_RETRIES.inc(operation="tts")
             time.sleep(delay)
     raise last_exc  # type: ignore[misc]
 
@@ -0,0 +1,426 @@
+"""Prometheus-compatible metrics for the pipeline process.
+
+A small in-process registry of counters, gauges and histograms rendered in
+the Prometheus text exposition format, plus a background HTTP listener that
+serves it. Metrics are module-level singletons so any layer (downloader,
+workers, Gemini clients, the database engine) can record into them without
+threading a registry through constructors; nothing is exported unless the
+pipeline starts a MetricsServer.
+
+Example:
+    from src.utils.metrics import STAGE_SECONDS, MetricsServer
+
+    with STAGE_SECONDS.time(stage="download"):
+        download()
+
+    server = MetricsServer(port=9464)
+    server.start()  # GET http://host:9464/metrics
+"""
+
+import json
+import logging
+import math
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _escape_label_value(value: str) -> str:
+    """Escape a label value for the text exposition format."""
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    """Format a sample value the way Prometheus expects."""
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _format_labels(names: tuple[str, ...], values: tuple[str, ...]) -> str:
+    """Render a label set, e.g. {stage="download"}."""
+    if not names:
+        return ""
+    pairs = ",".join(
+        f'{name}="{_escape_label_value(value)}"' for name, value in zip(names, values, strict=True)
+    )
+    return "{" + pairs + "}"
+
+
+class _Metric:
+    """Base class for a metric family with optional labels."""
+
+    type_name = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: dict[str, str]) -> tuple[str, ...]:
+        """Convert keyword labels into an ordered tuple of values."""
+        if set(labels) != set(self.labelnames):
+            raise ValueError(
+                f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}"
+            )
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def _samples(self) -> Iterator[str]:
+        """Yield sample lines for this family."""
+        raise NotImplementedError
+
+    def render(self) -> str:
+        """Render HELP, TYPE and sample lines."""
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.type_name}",
+            *self._samples(),
+        ]
+        return "\n".join(lines)
+
+
+class Counter(_Metric):
+    """Monotonically increasing count."""
+
+    type_name = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        """Increase the counter for a label set."""
+        if amount < 0:
+            raise ValueError("Counters can only increase")
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: str) -> float:
+        """Current value for a label set."""
+        with self._lock:
+            return self._values.get(self._key(labels), 0.0)
+
+    def _samples(self) -> Iterator[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        for key, value in items:
+            yield f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+
+
+class Gauge(_Metric):
+    """Value that can go up and down."""
+
+    type_name = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def set(self, value: float, **labels: str) -> None:
+        """Set the gauge for a label set."""
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = float(value)
+
+    def value(self, **labels: str) -> float:
+        """Current value for a label set."""
+        with self._lock:
+            return self._values.get(self._key(labels), 0.0)
+
+    def _samples(self) -> Iterator[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        for key, value in items:
+            yield f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+
+
+class Histogram(_Metric):
+    """Distribution of observed values in cumulative buckets."""
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+        # label values -> [per-bucket counts, sum, count]
+        self._values: dict[tuple[str, ...], list] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        """Record one observation for a label set."""
+        key = self._key(labels)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = [[0] * len(self.buckets), 0.0, 0]
+                self._values[key] = state
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    state[0][i] += 1
+                    break
+            state[1] += value
+            state[2] += 1
+
+    @contextmanager
+    def time(self, **labels: str) -> Iterator[None]:
+        """Observe the wall-clock duration of a block."""
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            self.observe(time.monotonic() - started, **labels)
+
+    def count(self, **labels: str) -> int:
+        """Number of observations for a label set."""
+        with self._lock:
+            state = self._values.get(self._key(labels))
+            return state[2] if state else 0
+
+    def sum(self, **labels: str) -> float:
+        """Sum of observations for a label set."""
+        with self._lock:
+            state = self._values.get(self._key(labels))
+            return state[1] if state else 0.0
+
+    def _samples(self) -> Iterator[str]:
+        with self._lock:
+            items = sorted((key, (list(s[0]), s[1], s[2])) for key, s in self._values.items())
+        bucket_names = self.labelnames + ("le",)
+        for key, (counts, total, count) in items:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, counts, strict=True):
+                cumulative += bucket_count
+                labels = _format_labels(bucket_names, key + (_format_value(bound),))
+                yield f"{self.name}_bucket{labels} {cumulative}"
+            labels = _format_labels(self.labelnames, key)
+            yield f"{self.name}_sum{labels} {_format_value(total)}"
+            yield f"{self.name}_count{labels} {count}"
+
+
+class MetricsRegistry:
+    """Collection of metric families rendered together."""
+
+    def __init__(self):
+        self._metrics: dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def _register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"Metric already registered: {metric.name}")
+            self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()) -> Counter:
+        """Create and register a counter."""
+        return self._register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()) -> Gauge:
+        """Create and register a gauge."""
+        return self._register(Gauge(name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        """Create and register a histogram."""
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def render(self) -> str:
+        """Render every metric in the text exposition format."""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        return "\n".join(metric.render() for metric in metrics) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+# --- Pipeline metrics ---
+
+STAGE_SECONDS = REGISTRY.histogram(
+    "podcast_rag_stage_seconds",
+    "Wall-clock seconds spent on one episode in a pipeline stage.",
+    ("stage",),
+    buckets=(0.5, 1, 5, 15, 30, 60, 120, 300, 600, 1200, 1800, 3600, 7200),
+)
+STAGE_EPISODES = REGISTRY.counter(
+    "podcast_rag_stage_episodes_total",
+    "Episodes finished by a pipeline stage, by outcome.",
+    ("stage", "outcome"),
+)
+QUEUE_DEPTH = REGISTRY.gauge(
+    "podcast_rag_queue_depth",
+    "Episodes waiting for a pipeline stage.",
+    ("stage",),
+)
+TRANSCRIPTION_REALTIME_FACTOR = REGISTRY.histogram(
+    "podcast_rag_transcription_realtime_factor",
+    "Transcription seconds per second of audio (below 1 is faster than realtime).",
+    buckets=(0.02, 0.05, 0.1, 0.2, 0.3, 0.5, 0.75, 1, 1.5, 2, 5),
+)
+GEMINI_CALL_SECONDS = REGISTRY.histogram(
+    "podcast_rag_gemini_call_seconds",
+    "Latency of Gemini API calls, including retries.",
+    ("operation",),
+    buckets=(0.25, 0.5, 1, 2, 5, 10, 20, 30, 60, 120, 300),
+)
+GEMINI_RETRIES = REGISTRY.counter(
+    "podcast_rag_gemini_retries_total",
+    "Gemini API calls retried after a transient error.",
+    ("operation",),
+)
+DB_QUERY_SECONDS = REGISTRY.histogram(
+    "podcast_rag_db_query_seconds",
+    "Database statement execution time.",
+    ("operation",),
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5),
+)
+
+_DB_OPERATIONS = frozenset({"SELECT", "INSERT", "UPDATE", "DELETE"})
+
+
+def record_stage(stage: str, seconds: float | None, success: bool) -> None:
+    """Record the outcome and duration of one episode in a pipeline stage.
+
+    Args:
+        stage: Stage name (download, transcribe, metadata, index, cleanup).
+        seconds: Time spent, or None if not measured.
+        success: Whether the stage succeeded.
+    """
+    STAGE_EPISODES.inc(stage=stage, outcome="success" if success else "failure")
+    if seconds is not None:
+        STAGE_SECONDS.observe(seconds, stage=stage)
+
+
+def instrument_engine(engine) -> None:
+    """Time every statement executed through a SQLAlchemy engine.
+
+    Statements are labelled by their leading keyword (SELECT, INSERT,
+    UPDATE, DELETE or OTHER). Instrumenting the same engine twice is a no-op.
+
+    Args:
+        engine: SQLAlchemy Engine.
+    """
+    from sqlalchemy import event
+
+    if getattr(engine, "_podcast_rag_metrics", False):
+        return
+    engine._podcast_rag_metrics = True
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("_query_started", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        started = conn.info.get("_query_started")
+        if not started:
+            return
+        operation = statement.lstrip().split(None, 1)[0].upper() if statement.strip() else ""
+        DB_QUERY_SECONDS.observe(
+            time.perf_counter() - started.pop(),
+            operation=operation if operation in _DB_OPERATIONS else "OTHER",
+        )
+
+
+class MetricsServer:
+    """Background HTTP listener serving /metrics (and optionally /status).
+
+    Example:
+        server = MetricsServer(port=9464, status_provider=orchestrator.get_status)
+        server.start()
+        ...
+        server.stop()
+    """
+
+    def __init__(
+        self,
+        port: int,
+        host: str = "0.0.0.0",
+        registry: MetricsRegistry = REGISTRY,
+        status_provider: Callable[[], dict] | None = None,
+    ):
+        """Initialize the server. The socket is bound by start().
+
+        Args:
+            port: TCP port to listen on; 0 picks a free port.
+            host: Interface to bind.
+            registry: Registry rendered at /metrics.
+            status_provider: Optional callable whose dict result is served
+                as JSON at /status.
+        """
+        self.host = host
+        self.port = port
+        self.registry = registry
+        self.status_provider = status_provider
+        self._server: ThreadingHTTPServer | None = None
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        """Bind the socket and serve requests on a daemon thread."""
+        if self._server is not None:
+            return
+
+        registry = self.registry
+        status_provider = self.status_provider
+
+        class _Handler(BaseHTTPRequestHandler):
+            def do_GET(self):  # noqa: N802 - BaseHTTPRequestHandler API
+                path = self.path.split("?", 1)[0]
+                if path == "/metrics":
+                    body = registry.render().encode("utf-8")
+                    content_type = CONTENT_TYPE
+                elif path == "/status" and status_provider is not None:
+                    body = json.dumps(status_provider(), default=str).encode("utf-8")
+                    content_type = "application/json"
+                else:
+                    self.send_error(404)
+                    return
+                self.send_response(200)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                logger.debug("metrics: " + format, *args)
+
+        self._server = ThreadingHTTPServer((self.host, self.port), _Handler)
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="metrics-server", daemon=True
+        )
+        self._thread.start()
+        logger.info(f"Metrics server listening on {self.host}:{self.port}")
+
+    def stop(self) -> None:
+        """Stop serving and close the socket."""
+        if self._server is None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        self._server = None
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
@@ -12,8 +12,10 @@ from typing import Literal
 from fastapi import APIRouter, Depends, HTTPException, Request
 from pydantic import BaseModel
 
+from src.db.cached_repository import CachingPodcastRepository
 from src.db.repository import PodcastRepositoryInterface
 from src.web.auth import get_current_admin
+from src.web.db import run_read
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/admin", tags=["admin"])
@@ -57,7 +59,8 @@ async def get_admin_stats(
     """
     Get comprehensive admin dashboard statistics.
 
-    Returns workflow stats (from get_overall_stats) and user counts.
+    Returns workflow stats (from get_overall_stats), user counts and, when
+    the repository is cached, cache hit/miss counts.
     Requires admin access.
     """
     repository: PodcastRepositoryInterface = request.app.state.repository
@@ -66,10 +69,10 @@ async def get_admin_stats(
     workflow_stats = await asyncio.to_thread(repository.get_overall_stats)
 
     # Add user stats
-    user_count = await asyncio.to_thread(repository.get_user_count)
-    admin_count = await asyncio.to_thread(repository.get_user_count, is_admin=True)
+    user_count = await run_read(request.app.state, repository.get_user_count)
+    admin_count = await run_read(request.app.state, repository.get_user_count, is_admin=True)
 
-    return {
+    stats = {
         "workflow": workflow_stats,
         "users": {
             "total": user_count,
@@ -77,6 +80,12 @@ async def get_admin_stats(
         }
     }
 
+    # Hit/miss counters when the repository is cached (REPOSITORY_CACHE=true)
+    if isinstance(repository, CachingPodcastRepository):
+        stats["cache"] = repository.cache_stats()
+
+    return stats
+
 
 @router.get("/users")
 async def list_users(
@@ -98,14 +107,15 @@ async def list_users(
     """
     repository: PodcastRepositoryInterface = request.app.state.repository
 
-    users = await asyncio.to_thread(
+    users = await run_read(
+        request.app.state,
         repository.list_users,
         is_admin=is_admin,
         limit=limit,
         offset=offset
     )
 
-    total = await asyncio.to_thread(repository.get_user_count, is_admin=is_admin)
+    total = await run_read(request.app.state, repository.get_user_count, is_admin=is_admin)
 
     return {
         "users": [
@@ -186,12 +196,15 @@ async def list_admin_episodes(
     filter_type: EpisodeFilterType,
     limit: int = 50,
     offset: int = 0,
+    cursor: str | None = None,
     current_admin: dict = Depends(get_current_admin),
 ):
     """
     List episodes filtered by processing status.
 
-    Returns episodes matching the filter with pagination.
+    Returns episodes matching the filter with pagination. Pass the returned
+    next_cursor to fetch the following page; offset is still accepted for
+    older clients but gets slower the deeper it goes.
     Requires admin access.
     """
     repository: PodcastRepositoryInterface = request.app.state.repository
@@ -200,10 +213,21 @@ async def list_admin_episodes(
     filter_params = FILTER_MAP.get(filter_type, {})
 
     # Get episodes and count
-    episodes = await asyncio.to_thread(
-        repository.list_episodes, **filter_params, limit=limit, offset=offset
-    )
-    total = await asyncio.to_thread(repository.count_episodes, **filter_params)
+    next_cursor = None
+    if offset and not cursor:
+        episodes = await run_read(
+            request.app.state,
+            repository.list_episodes, **filter_params, limit=limit, offset=offset
+        )
+    else:
+        try:
+            episodes, next_cursor = await run_read(
+                request.app.state,
+                repository.list_episodes_page, **filter_params, limit=limit, cursor=cursor
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e)) from None
+    total = await run_read(request.app.state, repository.count_episodes, **filter_params)
 
     return {
         "episodes": [
@@ -229,6 +253,7 @@ async def list_admin_episodes(
         "total": total,
         "limit": limit,
         "offset": offset,
+        "next_cursor": next_cursor,
     }
 
 
@@ -247,7 +272,7 @@ async def retry_episode(
     repository: PodcastRepositoryInterface = request.app.state.repository
 
     # Check episode exists
-    episode = await asyncio.to_thread(repository.get_episode, episode_id)
+    episode = await run_read(request.app.state, repository.get_episode, episode_id)
     if not episode:
         raise HTTPException(status_code=404, detail="Episode not found")
 
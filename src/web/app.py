@@ -26,14 +26,22 @@ from slowapi.util import get_remote_address
 from starlette.middleware.sessions import SessionMiddleware
 
 from src.config import Config
-from src.db.factory import create_repository
+from src.db.factory import create_async_repository, create_repository
 from src.db.gemini_file_search import GeminiFileSearchManager
 from src.db.repository import PodcastRepositoryInterface
 from src.prompt_manager import PromptManager
+from src.services.audio_storage import audio_etag, create_audio_storage
 from src.web.admin_routes import router as admin_router
 from src.web.auth import get_current_user
 from src.web.auth_routes import router as auth_router
 from src.web.chat_routes import router as chat_router
+from src.web.db import (
+    ReadReplicas,
+    Replica,
+    read_repository,
+    read_your_writes_middleware,
+    run_read,
+)
 from src.web.models import ChatRequest
 from src.web.podcast_routes import router as podcast_router
 from src.web.user_routes import router as user_router
@@ -89,7 +97,28 @@ def _validate_jwt_config():
 _validate_jwt_config()
 
 # Initialize repository for database access
-_repository = create_repository(config.DATABASE_URL)
+_repository = create_repository(config.DATABASE_URL, cache=config.REPOSITORY_CACHE)
+
+# Native asyncio repository for request-path reads (WEB_ASYNC_DB=true)
+_async_repository = (
+    create_async_repository(config.DATABASE_URL) if config.WEB_ASYNC_DB else None
+)
+
+# Read replicas for request-path reads (DATABASE_REPLICA_URLS)
+_read_replicas = (
+    ReadReplicas([
+        Replica(
+            repository=create_repository(url),
+            async_repository=create_async_repository(url) if config.WEB_ASYNC_DB else None,
+        )
+        for url in config.DATABASE_REPLICA_URLS
+    ])
+    if config.DATABASE_REPLICA_URLS
+    else None
+)
+
+# Storage for generated briefing audio (BRIEFING_AUDIO_STORAGE)
+_audio_storage = create_audio_storage(config)
 
 
 @asynccontextmanager
@@ -103,7 +132,11 @@ async def lifespan(_app: FastAPI):
 
     yield
 
-    # Shutdown: cleanup if needed
+    # Shutdown: release pooled async connections
+    if _async_repository is not None:
+        await _async_repository.close()
+    if _read_replicas is not None:
+        await _read_replicas.close()
     logger.info("Application shutdown")
 
 # Initialize rate limiter
@@ -143,9 +176,19 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Pin a client's reads to the primary just after it writes (only matters with replicas)
+if _read_replicas is not None:
+    app.middleware("http")(
+        read_your_writes_middleware(
+            config.DB_READ_YOUR_WRITES_SECONDS, secure=config.COOKIE_SECURE
+        )
+    )
+
 # Store config and repository in app state for access in routes
 app.state.config = config
 app.state.repository = _repository
+app.state.async_repository = _async_repository
+app.state.read_replicas = _read_replicas
 
 # Include auth routes
 app.include_router(auth_router)
@@ -532,7 +575,7 @@ async def _build_scope_context(
     what data is available and relevant.
     """
     if episode_id:
-        episode = await asyncio.to_thread(repository.get_episode, episode_id)
+        episode = await run_read(app.state, repository.get_episode, episode_id)
         if episode:
             podcast = episode.podcast
             context_parts = [
@@ -547,7 +590,7 @@ async def _build_scope_context(
             return "\n".join(context_parts)
 
     if podcast_id:
-        podcast = await asyncio.to_thread(repository.get_podcast, podcast_id)
+        podcast = await run_read(app.state, repository.get_podcast, podcast_id)
         if podcast:
             context_parts = [
                 f"Currently viewing podcast: \"{podcast.title}\"",
@@ -559,7 +602,8 @@ async def _build_scope_context(
                 if len(desc) > 300:
                     desc = desc[:300] + "..."
                 context_parts.append(f"Description: {desc}")
-            episodes = await asyncio.to_thread(
+            episodes = await run_read(
+                app.state,
                 repository.list_episodes, podcast_id=podcast.id
             )
             context_parts.append(f"Episodes available: {len(episodes)}")
@@ -643,7 +687,8 @@ async def list_podcasts(
         List of podcasts with id, title, and optionally more metadata
     """
     user_id = current_user["sub"]
-    podcasts = await asyncio.to_thread(
+    podcasts = await run_read(
+        app.state,
         _repository.get_user_subscriptions,
         user_id,
         sort_by=sort_by,
@@ -662,10 +707,12 @@ async def list_podcasts(
     # Extended response with stats for podcasts grid page
     # Use optimized batch counting instead of N separate queries
     podcast_ids = [p.id for p in podcasts]
-    episode_counts = await asyncio.to_thread(
+    episode_counts = await run_read(
+        app.state,
         _repository.get_podcast_episode_counts, podcast_ids
     )
-    subscriber_counts = await asyncio.to_thread(
+    subscriber_counts = await run_read(
+        app.state,
         _repository.get_podcast_subscriber_counts, podcast_ids
     )
 
@@ -704,14 +751,16 @@ async def list_all_podcasts(
         List of all podcasts with subscription status for current user
     """
     user_id = current_user["sub"]
-    all_podcasts = await asyncio.to_thread(
+    all_podcasts = await run_read(
+        app.state,
         _repository.list_podcasts,
         sort_by=sort_by,
         sort_order=sort_order
     )
 
     # Batch fetch user's subscribed podcast IDs to avoid N+1 queries
-    user_subs = await asyncio.to_thread(
+    user_subs = await run_read(
+        app.state,
         _repository.get_user_subscriptions, user_id
     )
     subscribed_ids = {p.id for p in user_subs}
@@ -721,10 +770,12 @@ async def list_all_podcasts(
     subscriber_counts = {}
     if include_stats:
         podcast_ids = [p.id for p in all_podcasts]
-        episode_counts = await asyncio.to_thread(
+        episode_counts = await run_read(
+            app.state,
             _repository.get_podcast_episode_counts, podcast_ids
         )
-        subscriber_counts = await asyncio.to_thread(
+        subscriber_counts = await run_read(
+            app.state,
             _repository.get_podcast_subscriber_counts, podcast_ids
         )
 
@@ -797,12 +848,13 @@ async def subscribe_to_podcast(
     user_id = current_user["sub"]
 
     # Verify podcast exists
-    podcast = await asyncio.to_thread(_repository.get_podcast, podcast_id)
+    podcast = await run_read(app.state, _repository.get_podcast, podcast_id)
     if not podcast:
         raise HTTPException(status_code=404, detail="Podcast not found")
 
     # Check if already subscribed (idempotent - return success)
-    already_subscribed = await asyncio.to_thread(
+    already_subscribed = await run_read(
+        app.state,
         _repository.is_user_subscribed, user_id, podcast_id
     )
     if already_subscribed:
@@ -851,7 +903,7 @@ async def unsubscribe_from_podcast(
     user_id = current_user["sub"]
 
     # Verify podcast exists
-    podcast = await asyncio.to_thread(_repository.get_podcast, podcast_id)
+    podcast = await run_read(app.state, _repository.get_podcast, podcast_id)
     if not podcast:
         raise HTTPException(status_code=404, detail="Podcast not found")
 
@@ -885,12 +937,13 @@ async def get_podcast_detail(
         422 if podcast_id is not a valid UUID
     """
     podcast_id = _validate_podcast_id(podcast_id)
-    podcast = await asyncio.to_thread(_repository.get_podcast, podcast_id)
+    podcast = await run_read(app.state, _repository.get_podcast, podcast_id)
     if not podcast:
         raise HTTPException(status_code=404, detail="Podcast not found")
 
     # Get all episodes for this podcast (already sorted by published_date desc)
-    episodes = await asyncio.to_thread(
+    episodes = await run_read(
+        app.state,
         _repository.list_episodes, podcast_id=podcast_id
     )
 
@@ -934,7 +987,7 @@ async def get_episode_detail(
     Returns:
         Episode details including summary, metadata, and audio URL
     """
-    episode = await asyncio.to_thread(_repository.get_episode, episode_id)
+    episode = await run_read(app.state, _repository.get_episode, episode_id)
     if not episode:
         raise HTTPException(status_code=404, detail="Episode not found")
 
@@ -970,19 +1023,26 @@ async def get_episode_detail(
 async def search_episodes(
     type: str,
     q: str,
+    cursor: str | None = None,
+    limit: int = 50,
     current_user: dict = Depends(get_current_user)
 ):
     """
     Search episodes by keyword or person and return matching episode records with podcast metadata.
 
     Parameters:
-        type (str): Search mode, either "keyword" to match episode content/keywords or "person" to match hosts/guests.
-        q (str): Search query string; must be non-empty after trimming.
+        type (str): Search mode, either "keyword" for ranked full-text search over transcripts,
+            titles, summaries, keywords, hosts and guests, or "person" to match hosts/guests.
+        q (str): Search query string; must be non-empty after trimming. Keyword search
+            matches all words and supports "quoted phrases".
+        cursor (str, optional): next_cursor from a previous keyword search, to fetch the next page.
+        limit (int): Maximum number of results (1-100).
 
     Returns:
         dict: {
             "query": str,        # trimmed query string
             "type": str,         # echo of the requested search type
+            "next_cursor": str | None,  # cursor for the next page of keyword results
             "results": [         # list of matching episodes
                 {
                     "id": str,
@@ -1005,13 +1065,22 @@ async def search_episodes(
 
     query = q.strip()
 
+    if limit < 1 or limit > 100:
+        raise HTTPException(status_code=400, detail="limit must be between 1 and 100")
+
+    next_cursor = None
     if type == "keyword":
-        episodes = await asyncio.to_thread(
-            _repository.search_episodes_by_keyword, query
-        )
+        try:
+            episodes, next_cursor = await run_read(
+                app.state,
+                _repository.search_episodes_fulltext, query, limit=limit, cursor=cursor
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e)) from None
     elif type == "person":
-        episodes = await asyncio.to_thread(
-            _repository.search_episodes_by_person, query
+        episodes = await run_read(
+            app.state,
+            _repository.search_episodes_by_person, query, limit
         )
     else:
         raise HTTPException(status_code=400, detail="Invalid search type. Use 'keyword' or 'person'")
@@ -1019,6 +1088,7 @@ async def search_episodes(
     return {
         "query": query,
         "type": type,
+        "next_cursor": next_cursor,
         "results": [
             {
                 "id": str(ep.id),
@@ -1064,7 +1134,8 @@ async def get_feed(
     from src.services.feed_service import resolve_user_timezone
 
     user_id = current_user["sub"]
-    user_timezone = await asyncio.to_thread(resolve_user_timezone, tz, user_id, _repository)
+    repository = read_repository(app.state)
+    user_timezone = await asyncio.to_thread(resolve_user_timezone, tz, user_id, repository)
 
     if days < 1 or days > 30:
         raise HTTPException(status_code=400, detail="days must be between 1 and 30")
@@ -1073,7 +1144,7 @@ async def get_feed(
         result = await asyncio.to_thread(
             build_feed,
             user_id=user_id,
-            repository=_repository,
+            repository=repository,
             config=config,
             cursor=cursor,
             days=days,
@@ -1148,7 +1219,7 @@ async def generate_feed_briefing(
 
 
 # ---------------------------------------------------------------------------
-# Briefing audio endpoints (lazy generation + streaming from DB blob)
+# Briefing audio endpoints (lazy generation + streaming from audio storage)
 # ---------------------------------------------------------------------------
 
 
@@ -1180,6 +1251,14 @@ def _parse_range(range_header: str, total: int) -> tuple[int, int] | None:
         return None
 
 
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Whether an If-None-Match header value matches an ETag (weak comparison)."""
+    if not if_none_match:
+        return False
+    tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return "*" in tags or etag in tags
+
+
 @app.post("/api/feed/briefing/{briefing_id}/audio")
 @limiter.limit(config.WEB_RATE_LIMIT)
 async def trigger_briefing_audio(
@@ -1205,12 +1284,12 @@ async def trigger_briefing_audio(
     from src.services.briefing_audio import audio_is_ready, get_audio_url_or_trigger
 
     # Verify ownership
-    briefing = await asyncio.to_thread(_repository.get_briefing_by_id, briefing_id)
+    briefing = await run_read(app.state, _repository.get_briefing_by_id, briefing_id)
     if not briefing or briefing.user_id != current_user["sub"]:
         raise HTTPException(status_code=404, detail="Briefing not found")
 
     result = await asyncio.to_thread(
-        get_audio_url_or_trigger, briefing_id, _repository, config, retry
+        get_audio_url_or_trigger, briefing_id, _repository, config, retry, _audio_storage
     )
 
     if result["status"] == "ready":
@@ -1228,25 +1307,50 @@ async def serve_briefing_audio(
     briefing_id: str,
     current_user: dict = Depends(get_current_user),
 ):
-    """Stream the briefing audio MP3 from the DB blob.
+    """Stream the briefing audio MP3 from audio storage.
 
-    Supports HTTP Range requests for audio seeking.
+    Supports HTTP Range requests for audio seeking, and If-None-Match
+    revalidation against the content-derived ETag. Local files are served
+    with FileResponse (which handles Range itself); other storage is
+    streamed in chunks.
     """
-    from starlette.responses import Response
+    from starlette.responses import FileResponse, Response
 
-    from src.services.briefing_audio import audio_is_ready
+    from src.services.briefing_audio import audio_is_ready, store_legacy_audio
 
-    briefing = await asyncio.to_thread(_repository.get_briefing_by_id, briefing_id)
+    briefing = await run_read(app.state, _repository.get_briefing_by_id, briefing_id)
     if not briefing or briefing.user_id != current_user["sub"]:
         raise HTTPException(status_code=404, detail="Briefing not found")
 
     if not audio_is_ready(briefing):
         raise HTTPException(status_code=404, detail="Audio not generated")
 
-    data = briefing.audio_data
-    total = len(data)
+    key = briefing.audio_storage_key
+    if key is None:
+        # Generated before audio storage: move the DB blob there on first play
+        key = await asyncio.to_thread(
+            store_legacy_audio, briefing, _repository, _audio_storage
+        )
+        if key is None:
+            raise HTTPException(status_code=404, detail="Audio not generated")
+
     mime = briefing.audio_mime_type or "audio/mpeg"
+    headers = {
+        "ETag": audio_etag(key),
+        "Accept-Ranges": "bytes",
+        "Cache-Control": "private, max-age=86400",
+    }
+    if _etag_matches(request.headers.get("if-none-match"), headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+
+    path = _audio_storage.local_path(key)
+    if path is not None:
+        if not os.path.isfile(path):
+            logger.warning("Audio file missing for briefing %s: %s", briefing_id, path)
+            raise HTTPException(status_code=404, detail="Audio not generated")
+        return FileResponse(path, media_type=mime, headers=headers)
 
+    total = briefing.audio_size_bytes
     range_header = request.headers.get("range")
     if range_header:
         parsed = _parse_range(range_header, total)
@@ -1261,27 +1365,21 @@ async def serve_briefing_audio(
                 },
             )
         start, end = parsed
-        chunk = data[start:end + 1]
-        return Response(
-            content=chunk,
+        return StreamingResponse(
+            _audio_storage.iter_range(key, start, end),
             media_type=mime,
             status_code=206,
             headers={
+                **headers,
                 "Content-Range": f"bytes {start}-{end}/{total}",
-                "Accept-Ranges": "bytes",
-                "Content-Length": str(len(chunk)),
-                "Cache-Control": "private, max-age=86400",
+                "Content-Length": str(end - start + 1),
             },
         )
 
-    return Response(
-        content=data,
+    return StreamingResponse(
+        _audio_storage.iter_range(key, 0, total - 1),
         media_type=mime,
-        headers={
-            "Accept-Ranges": "bytes",
-            "Content-Length": str(total),
-            "Cache-Control": "private, max-age=86400",
-        },
+        headers={**headers, "Content-Length": str(total)},
     )
 
 
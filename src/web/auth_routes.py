@@ -17,6 +17,7 @@ from fastapi.responses import RedirectResponse
 
 from src.db.repository import PodcastRepositoryInterface
 from src.web.auth import create_access_token, get_current_user, get_oauth
+from src.web.db import mark_write, run_read
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/auth", tags=["authentication"])
@@ -79,8 +80,9 @@ async def auth_callback(request: Request):
     if not google_id or not email:
         raise HTTPException(status_code=400, detail="Missing required user info")
 
-    # Get or create user in database
-    user = await asyncio.to_thread(repository.get_user_by_google_id, google_id)
+    # Get or create user in database (a write, so read from the primary)
+    mark_write(request)
+    user = await run_read(request.app.state, repository.get_user_by_google_id, google_id)
     if user:
         # Update user info and last login
         await asyncio.to_thread(
@@ -177,7 +179,7 @@ async def get_current_user_info(
     repository: PodcastRepositoryInterface = request.app.state.repository
 
     # Fetch user from database to get current admin status
-    user = await asyncio.to_thread(repository.get_user, current_user["sub"])
+    user = await run_read(request.app.state, repository.get_user, current_user["sub"])
 
     return {
         "id": current_user["sub"],
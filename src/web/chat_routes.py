@@ -13,6 +13,7 @@ from fastapi import APIRouter, Depends, HTTPException, Request
 from fastapi.responses import StreamingResponse
 
 from src.web.auth import get_current_user
+from src.web.db import run_read
 from src.web.models import (
     ChatMessageResponse,
     Citation,
@@ -21,6 +22,7 @@ from src.web.models import (
     ConversationListResponse,
     ConversationSummary,
     CreateConversationRequest,
+    MessagePageResponse,
     SendMessageRequest,
     UpdateConversationRequest,
 )
@@ -35,25 +37,61 @@ def _get_repository(request: Request):
     return request.app.state.repository
 
 
+def _message_response(msg) -> ChatMessageResponse:
+    """Convert a stored chat message to its API representation."""
+    return ChatMessageResponse(
+        id=msg.id,
+        role=msg.role,
+        content=msg.content,
+        citations=[
+            Citation(
+                index=c.get("index", 0),
+                metadata=CitationMetadata(
+                    podcast=c.get("metadata", {}).get("podcast", ""),
+                    episode=c.get("metadata", {}).get("episode", ""),
+                    release_date=c.get("metadata", {}).get("release_date", ""),
+                ),
+            )
+            for c in (msg.citations or [])
+        ]
+        if msg.citations
+        else None,
+        created_at=msg.created_at.isoformat(),
+    )
+
+
 @router.get("", response_model=ConversationListResponse)
 async def list_conversations(
     request: Request,
     limit: int = 50,
     offset: int = 0,
+    cursor: str | None = None,
     current_user: dict = Depends(get_current_user),
 ):
     """
     List conversations for the authenticated user.
 
-    Returns conversations ordered by most recently updated first.
+    Returns conversations ordered by most recently updated first. Pass the
+    returned next_cursor to fetch the following page.
     """
     user_id = current_user["sub"]
     repository = _get_repository(request)
 
-    conversations = await asyncio.to_thread(
-        repository.list_conversations, user_id, limit=limit, offset=offset
-    )
-    total = await asyncio.to_thread(repository.count_conversations, user_id)
+    next_cursor = None
+    if offset and not cursor:
+        conversations = await run_read(
+            request.app.state,
+            repository.list_conversations, user_id, limit=limit, offset=offset
+        )
+    else:
+        try:
+            conversations, next_cursor = await run_read(
+                request.app.state,
+                repository.list_conversations_page, user_id, limit=limit, cursor=cursor
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e)) from None
+    total = await run_read(request.app.state, repository.count_conversations, user_id)
 
     return ConversationListResponse(
         conversations=[
@@ -72,6 +110,7 @@ async def list_conversations(
             for conv in conversations
         ],
         total=total,
+        next_cursor=next_cursor,
     )
 
 
@@ -104,7 +143,7 @@ async def create_conversation(
     # Validate podcast exists if specified
     podcast_title = None
     if body.podcast_id:
-        podcast = await asyncio.to_thread(repository.get_podcast, body.podcast_id)
+        podcast = await run_read(request.app.state, repository.get_podcast, body.podcast_id)
         if not podcast:
             raise HTTPException(status_code=404, detail="Podcast not found")
         podcast_title = podcast.title
@@ -112,7 +151,7 @@ async def create_conversation(
     # Validate episode exists if specified
     episode_title = None
     if body.episode_id:
-        episode = await asyncio.to_thread(repository.get_episode, body.episode_id)
+        episode = await run_read(request.app.state, repository.get_episode, body.episode_id)
         if not episode:
             raise HTTPException(status_code=404, detail="Episode not found")
         episode_title = episode.title
@@ -153,7 +192,8 @@ async def get_conversation(
     user_id = current_user["sub"]
     repository = _get_repository(request)
 
-    conversation = await asyncio.to_thread(
+    conversation = await run_read(
+        request.app.state,
         repository.get_conversation, conversation_id
     )
     if not conversation:
@@ -165,25 +205,7 @@ async def get_conversation(
 
     # Convert messages
     messages = [
-        ChatMessageResponse(
-            id=msg.id,
-            role=msg.role,
-            content=msg.content,
-            citations=[
-                Citation(
-                    index=c.get("index", 0),
-                    metadata=CitationMetadata(
-                        podcast=c.get("metadata", {}).get("podcast", ""),
-                        episode=c.get("metadata", {}).get("episode", ""),
-                        release_date=c.get("metadata", {}).get("release_date", ""),
-                    ),
-                )
-                for c in (msg.citations or [])
-            ]
-            if msg.citations
-            else None,
-            created_at=msg.created_at.isoformat(),
-        )
+        _message_response(msg)
         for msg in sorted(conversation.messages, key=lambda m: m.created_at)
     ]
 
@@ -201,6 +223,44 @@ async def get_conversation(
     )
 
 
+@router.get("/{conversation_id}/messages", response_model=MessagePageResponse)
+async def list_messages(
+    request: Request,
+    conversation_id: str,
+    limit: int = 100,
+    cursor: str | None = None,
+    current_user: dict = Depends(get_current_user),
+):
+    """
+    Get one page of a conversation's messages, oldest first.
+
+    Pass the returned next_cursor to fetch the following page.
+    Returns 404 if conversation doesn't exist or doesn't belong to user.
+    """
+    user_id = current_user["sub"]
+    repository = _get_repository(request)
+
+    conversation = await run_read(
+        request.app.state,
+        repository.get_conversation, conversation_id
+    )
+    if not conversation or conversation.user_id != user_id:
+        raise HTTPException(status_code=404, detail="Conversation not found")
+
+    try:
+        messages, next_cursor = await run_read(
+            request.app.state,
+            repository.get_messages_page, conversation_id, limit=limit, cursor=cursor
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from None
+
+    return MessagePageResponse(
+        messages=[_message_response(msg) for msg in messages],
+        next_cursor=next_cursor,
+    )
+
+
 @router.patch("/{conversation_id}", response_model=ConversationSummary)
 async def update_conversation(
     request: Request,
@@ -215,7 +275,8 @@ async def update_conversation(
     repository = _get_repository(request)
 
     # Verify conversation exists and belongs to user
-    conversation = await asyncio.to_thread(
+    conversation = await run_read(
+        request.app.state,
         repository.get_conversation, conversation_id
     )
     if not conversation:
@@ -256,7 +317,8 @@ async def delete_conversation(
     repository = _get_repository(request)
 
     # Verify conversation exists and belongs to user
-    conversation = await asyncio.to_thread(
+    conversation = await run_read(
+        request.app.state,
         repository.get_conversation, conversation_id
     )
     if not conversation:
@@ -288,7 +350,8 @@ async def send_message(
     repository = _get_repository(request)
 
     # Verify conversation exists and belongs to user
-    conversation = await asyncio.to_thread(
+    conversation = await run_read(
+        request.app.state,
         repository.get_conversation, conversation_id
     )
     if not conversation:
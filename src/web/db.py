@@ -0,0 +1,205 @@
+"""Repository access for request handlers.
+
+When the app is configured with the asyncio repository (WEB_ASYNC_DB), reads
+it implements are awaited on it directly. Everything else - and every read
+when it is not configured - runs the synchronous repository method on the
+default thread pool, as handlers did before.
+
+When read replicas are configured (DATABASE_REPLICA_URLS), run_read() sends
+reads to them in turn instead of the primary, except:
+
+- during requests that write: non-GET/HEAD/OPTIONS requests, and handlers
+  that call mark_write();
+- for the read-your-writes window after a client's write, tracked with a
+  cookie so that it holds whichever web instance serves the next request.
+
+Writes always go to the primary, since handlers call them on
+``app.state.repository`` directly.
+
+When the primary is wrapped in the repository cache (REPOSITORY_CACHE), its
+cached reads are answered from that cache whichever repository would serve
+them, and misses fill it.
+"""
+
+import asyncio
+import inspect
+import itertools
+import math
+import threading
+import time
+from collections.abc import Awaitable, Callable
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any
+
+from fastapi import Request, Response
+
+from src.db.cached_repository import CachingPodcastRepository
+
+# Cookie holding the time (epoch seconds) until which the client reads from the primary
+READ_PRIMARY_COOKIE = "read_primary_until"
+
+# Methods that never count as writes
+_SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+# Whether reads in the current request must see the primary
+_read_primary: ContextVar[bool] = ContextVar("read_primary", default=False)
+
+
+@dataclass
+class Replica:
+    """Repositories bound to one read replica."""
+
+    repository: Any
+    async_repository: Any = None
+
+
+class ReadReplicas:
+    """Read replicas used in rotation."""
+
+    def __init__(self, replicas: list[Replica]):
+        """
+        Args:
+            replicas: At least one replica.
+        """
+        if not replicas:
+            raise ValueError("ReadReplicas needs at least one replica")
+        self.replicas = replicas
+        self._cycle = itertools.cycle(replicas)
+        self._lock = threading.Lock()
+
+    def next(self) -> Replica:
+        """Return the replica to use for the next read."""
+        with self._lock:
+            return next(self._cycle)
+
+    async def close(self) -> None:
+        """Dispose every replica's connection pools."""
+        for replica in self.replicas:
+            replica.repository.close()
+            if replica.async_repository is not None:
+                await replica.async_repository.close()
+
+
+def mark_write(request: Request) -> None:
+    """Read from the primary for the rest of this request and the client's next few.
+
+    Requests with a mutating method get this automatically; GET handlers that
+    write (such as the OAuth callback) call it before their first read.
+    """
+    _read_primary.set(True)
+    request.state.db_write = True
+
+
+def read_your_writes_middleware(
+    window_seconds: float, secure: bool = True
+) -> Callable[[Request, Callable[[Request], Awaitable[Response]]], Awaitable[Response]]:
+    """Build the HTTP middleware that pins a client's reads to the primary after it writes.
+
+    Args:
+        window_seconds: How long after a write the client's reads use the primary;
+            should exceed the replicas' usual replication lag.
+        secure: Whether the cookie requires HTTPS.
+
+    Returns:
+        Middleware function for ``app.middleware("http")``.
+    """
+
+    async def middleware(
+        request: Request, call_next: Callable[[Request], Awaitable[Response]]
+    ) -> Response:
+        writes = request.method not in _SAFE_METHODS
+        try:
+            primary_until = float(request.cookies.get(READ_PRIMARY_COOKIE, 0))
+        except ValueError:
+            primary_until = 0.0
+        token = _read_primary.set(writes or primary_until > time.time())
+        try:
+            response = await call_next(request)
+        finally:
+            _read_primary.reset(token)
+
+        wrote = writes or getattr(request.state, "db_write", False)
+        if wrote and response.status_code < 400:
+            response.set_cookie(
+                READ_PRIMARY_COOKIE,
+                f"{time.time() + window_seconds:.3f}",
+                max_age=math.ceil(window_seconds),
+                httponly=True,
+                secure=secure,
+                samesite="lax",
+            )
+        return response
+
+    return middleware
+
+
+def _replica_for_read(state: Any) -> Replica | None:
+    """Replica the current request should read from, or None for the primary."""
+    read_replicas = getattr(state, "read_replicas", None)
+    if read_replicas is None or _read_primary.get():
+        return None
+    return read_replicas.next()
+
+
+def read_repository(state: Any) -> Any:
+    """Return the synchronous repository the current request should read from.
+
+    For read-only code that takes a repository (such as the feed service)
+    rather than going through run_read().
+
+    Args:
+        state: Application state holding ``repository`` and, optionally,
+            ``read_replicas``.
+    """
+    replica = _replica_for_read(state)
+    return replica.repository if replica is not None else state.repository
+
+
+async def run_read(state: Any, method: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """Run a repository read without blocking the event loop.
+
+    Args:
+        state: Application state holding ``repository`` and, optionally,
+            ``async_repository`` and ``read_replicas``.
+        method: Bound method of the synchronous repository, e.g.
+            ``repository.get_episode``. The method of the same name on a read
+            replica and/or the asyncio repository is used in its place when
+            available. If ``method`` belongs to a CachingPodcastRepository and
+            is one of its cached reads, that cache is consulted first and
+            filled from whichever repository answers.
+        *args: Positional arguments for the method.
+        **kwargs: Keyword arguments for the method.
+
+    Returns:
+        The method's return value.
+    """
+    name = getattr(method, "__name__", None)
+    cache = getattr(method, "__self__", None)
+    if (
+        isinstance(cache, CachingPodcastRepository)
+        and name in CachingPodcastRepository.CACHED_READS
+        and not kwargs
+    ):
+        return await cache.read_through_async(
+            name, args, lambda: _dispatch_read(state, method, name, args, kwargs)
+        )
+    return await _dispatch_read(state, method, name, args, kwargs)
+
+
+async def _dispatch_read(
+    state: Any, method: Callable[..., Any], name: str | None, args: tuple, kwargs: dict
+) -> Any:
+    """Run a read on the replica, asyncio or synchronous repository, as configured."""
+    async_repository = getattr(state, "async_repository", None)
+
+    replica = _replica_for_read(state) if name else None
+    if replica is not None:
+        method = getattr(replica.repository, name)
+        async_repository = replica.async_repository
+
+    if async_repository is not None and name:
+        async_method = getattr(async_repository, name, None)
+        if inspect.iscoroutinefunction(async_method):
+            return await async_method(*args, **kwargs)
+    return await asyncio.to_thread(method, *args, **kwargs)
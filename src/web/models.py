@@ -197,6 +197,9 @@ class ConversationListResponse(BaseModel):
     """List of user's conversations."""
     conversations: list[ConversationSummary] = Field(..., description="Conversations")
     total: int = Field(..., description="Total number of conversations")
+    next_cursor: str | None = Field(
+        default=None, description="Cursor for the next page, if there is one"
+    )
 
 
 class ChatMessageResponse(BaseModel):
@@ -224,6 +227,14 @@ class ConversationDetailResponse(BaseModel):
     updated_at: str = Field(..., description="Last update timestamp (ISO format)")
 
 
+class MessagePageResponse(BaseModel):
+    """One page of a conversation's messages."""
+    messages: list[ChatMessageResponse] = Field(..., description="Messages, oldest first")
+    next_cursor: str | None = Field(
+        default=None, description="Cursor for the next page, if there is one"
+    )
+
+
 class SendMessageRequest(BaseModel):
     """Request to send a message in a conversation."""
     content: str = Field(..., min_length=1, max_length=2000, description="Message content")
@@ -15,6 +15,7 @@ from fastapi import APIRouter, Depends, HTTPException, Request
 from src.podcast.feed_sync import FeedSyncService
 from src.podcast.opml_parser import OPMLParser
 from src.web.auth import get_current_user
+from src.web.db import run_read
 from src.web.models import (
     AddPodcastByUrlRequest,
     AddPodcastResponse,
@@ -69,13 +70,15 @@ async def add_podcast_by_url(
         feed_url = "https://" + feed_url[7:]
 
     # Check if podcast already exists (run in thread to avoid blocking)
-    existing_podcast = await asyncio.to_thread(
+    existing_podcast = await run_read(
+        request.app.state,
         repository.get_podcast_by_feed_url, feed_url
     )
 
     if existing_podcast:
         # Podcast exists - just subscribe the user
-        was_subscribed = await asyncio.to_thread(
+        was_subscribed = await run_read(
+            request.app.state,
             repository.is_user_subscribed, user_id, existing_podcast.id
         )
 
@@ -85,7 +88,8 @@ async def add_podcast_by_url(
             )
 
         # Get episode count
-        episodes = await asyncio.to_thread(
+        episodes = await run_read(
+            request.app.state,
             repository.list_episodes, podcast_id=existing_podcast.id
         )
 
@@ -198,12 +202,14 @@ async def search_podcasts(
             # Check if podcast exists in database and if user is subscribed
             is_subscribed = False
             podcast_id = None
-            existing_podcast = await asyncio.to_thread(
+            existing_podcast = await run_read(
+                request.app.state,
                 repository.get_podcast_by_feed_url, feed_url
             )
             if existing_podcast:
                 podcast_id = existing_podcast.id
-                is_subscribed = await asyncio.to_thread(
+                is_subscribed = await run_read(
+                    request.app.state,
                     repository.is_user_subscribed, user_id, existing_podcast.id
                 )
 
@@ -305,13 +311,15 @@ async def import_opml(
 
         try:
             # Check if podcast already exists (run in thread to avoid blocking)
-            existing = await asyncio.to_thread(
+            existing = await run_read(
+                request.app.state,
                 repository.get_podcast_by_feed_url, feed_url
             )
 
             if existing:
                 # Subscribe user to existing podcast
-                was_subscribed = await asyncio.to_thread(
+                was_subscribed = await run_read(
+                    request.app.state,
                     repository.is_user_subscribed, user_id, existing.id
                 )
                 if not was_subscribed:
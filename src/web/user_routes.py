@@ -18,6 +18,7 @@ from src.services.briefing_generator import generate_digest_briefing
 from src.services.email_renderer import render_digest_html, render_digest_text
 from src.services.email_service import EmailService
 from src.web.auth import get_current_user
+from src.web.db import run_read
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/user", tags=["user"])
@@ -116,7 +117,7 @@ async def get_user_settings(
     repository: PodcastRepositoryInterface = request.app.state.repository
     user_id = current_user["sub"]
 
-    user = await asyncio.to_thread(repository.get_user, user_id)
+    user = await run_read(request.app.state, repository.get_user, user_id)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
 
@@ -153,7 +154,7 @@ async def update_user_settings(
     user_id = current_user["sub"]
 
     # Verify user exists
-    user = await asyncio.to_thread(repository.get_user, user_id)
+    user = await run_read(request.app.state, repository.get_user, user_id)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
 
@@ -172,7 +173,7 @@ async def update_user_settings(
         logger.debug("User %s updated settings: %s", user_id, list(updates.keys()))
 
     # Return updated settings
-    user = await asyncio.to_thread(repository.get_user, user_id)
+    user = await run_read(request.app.state, repository.get_user, user_id)
     return {
         "message": "Settings updated",
         "email_digest_enabled": user.email_digest_enabled,
@@ -195,14 +196,15 @@ async def get_email_preview(
     repository: PodcastRepositoryInterface = request.app.state.repository
     user_id = current_user["sub"]
 
-    user = await asyncio.to_thread(repository.get_user, user_id)
+    user = await run_read(request.app.state, repository.get_user, user_id)
     user_name = user.name if user else current_user.get("name")
 
     # Look back 24 hours for episodes
     since = datetime.now(UTC) - timedelta(hours=24)
 
     # Try to get episodes from user's subscriptions
-    episodes = await asyncio.to_thread(
+    episodes = await run_read(
+        request.app.state,
         repository.get_new_episodes_for_user_since,
         user_id=user_id,
         since=since,
@@ -212,7 +214,8 @@ async def get_email_preview(
     preview_notice = None
     if not episodes:
         # Fall back to recent episodes from any podcast
-        episodes = await asyncio.to_thread(
+        episodes = await run_read(
+            request.app.state,
             repository.get_recent_processed_episodes, limit=5
         )
         if episodes:
@@ -277,7 +280,7 @@ async def send_digest_now(
     user_id = current_user["sub"]
 
     # Get user from repository
-    user = await asyncio.to_thread(repository.get_user, user_id)
+    user = await run_read(request.app.state, repository.get_user, user_id)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
 
@@ -291,7 +294,8 @@ async def send_digest_now(
 
     # Fetch episodes from last 24 hours
     since = datetime.now(UTC) - timedelta(hours=24)
-    episodes = await asyncio.to_thread(
+    episodes = await run_read(
+        request.app.state,
         repository.get_new_episodes_for_user_since,
         user_id=user_id,
         since=since,
@@ -6,6 +6,7 @@ and other workflow-related settings.
 
 import math
 import os
+import socket
 from dataclasses import dataclass
 
 
@@ -102,6 +103,11 @@ def _get_float_env(
     return value
 
 
+def _default_worker_id() -> str:
+    """Build a worker identifier that is unique per host and process."""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
 @dataclass
 class PipelineConfig:
     """Configuration for pipeline-oriented orchestrator.
@@ -112,27 +118,54 @@ class PipelineConfig:
 
     # Sync settings
     sync_interval_seconds: int = 900  # 15 minutes
+    priority_refresh_interval_seconds: int = 3600  # Re-score every queued episode
 
     # Download buffer settings
     download_buffer_size: int = 10  # Target number of downloaded episodes ready
     download_buffer_threshold: int = 5  # Refill when buffer drops below this
     download_batch_size: int = 10  # How many to download when refilling
     download_workers: int = 5  # Concurrent download threads
+    download_buffer_hours: float = 0.0  # Audio hours kept buffered by the background prefetcher (0 = off)
+    download_min_free_disk_mb: int = 2048  # Prefetcher stops downloading below this much free disk
+
+    # Audio preprocessing settings
+    preprocess_workers: int = 0  # Episodes decoded/VAD-trimmed ahead of transcription (0 = off)
+
+    # Transcription settings
+    transcription_workers: int = 1  # Episodes transcribed concurrently (1 = one at a time)
+    transcription_batch_size: int = 0  # Batched-inference segments per pass (0 = off)
+    transcription_processes: int = 0  # Worker processes holding a model (0 = in-process)
+    transcription_timeout_seconds: int = 14400  # Per-episode limit in process mode (0 = none)
 
     # Post-processing settings
     post_processing_workers: int = 4  # Thread pool size for async post-processing
 
     # Pipeline timing
     idle_wait_seconds: int = 10  # Wait time when no work available
+    event_idle_wait_seconds: int = 60  # Idle wait when PostgreSQL LISTEN/NOTIFY wakes stages
 
     # Retry settings
     max_retries: int = 3  # Max retry attempts before marking permanently failed
 
+    # Transcription work claiming (multi-node pipelines sharing one database)
+    worker_id: str = ""  # Defaults to "<hostname>:<pid>"
+    transcription_lease_seconds: int = 3600  # Claim lifetime, renewed while transcribing
+    lease_reap_interval_seconds: int = 300  # How often to requeue expired claims
+    stale_claim_seconds: int = 3600  # Downloading/uploading rows older than this are requeued
+
+    # Prometheus metrics listener (0 disables)
+    metrics_port: int = 0
+    metrics_host: str = "0.0.0.0"
+
     # Transient DB error retry settings
     max_consecutive_db_errors: int = 5  # Consecutive DB errors before shutdown
     db_retry_base_wait: float = 5.0  # Base wait in seconds for exponential backoff
     db_retry_max_wait: float = 60.0  # Cap on backoff wait time
 
+    def __post_init__(self) -> None:
+        if not self.worker_id:
+            self.worker_id = _default_worker_id()
+
     @classmethod
     def from_env(cls) -> "PipelineConfig":
         """Create configuration from environment variables.
@@ -147,6 +180,9 @@ class PipelineConfig:
         sync_interval_seconds = _get_int_env(
             "PIPELINE_SYNC_INTERVAL_SECONDS", 900, min_val=1
         )
+        priority_refresh_interval_seconds = _get_int_env(
+            "PIPELINE_PRIORITY_REFRESH_INTERVAL_SECONDS", 3600, min_val=60
+        )
         download_buffer_size = _get_int_env(
             "PIPELINE_DOWNLOAD_BUFFER_SIZE", 10, min_val=1
         )
@@ -159,15 +195,53 @@ class PipelineConfig:
         download_workers = _get_int_env(
             "PIPELINE_DOWNLOAD_WORKERS", 5, min_val=1
         )
+        download_buffer_hours = _get_float_env(
+            "PIPELINE_DOWNLOAD_BUFFER_HOURS", 0.0, min_val=0.0
+        )
+        download_min_free_disk_mb = _get_int_env(
+            "PIPELINE_DOWNLOAD_MIN_FREE_DISK_MB", 2048, min_val=0
+        )
+        preprocess_workers = _get_int_env(
+            "PIPELINE_PREPROCESS_WORKERS", 0, min_val=0
+        )
+        transcription_workers = _get_int_env(
+            "PIPELINE_TRANSCRIPTION_WORKERS", 1, min_val=1
+        )
+        transcription_batch_size = _get_int_env(
+            "PIPELINE_TRANSCRIPTION_BATCH_SIZE", 0, min_val=0
+        )
+        transcription_processes = _get_int_env(
+            "PIPELINE_TRANSCRIPTION_PROCESSES", 0, min_val=0
+        )
+        transcription_timeout_seconds = _get_int_env(
+            "PIPELINE_TRANSCRIPTION_TIMEOUT_SECONDS", 14400, min_val=0
+        )
         post_processing_workers = _get_int_env(
             "PIPELINE_POST_PROCESSING_WORKERS", 4, min_val=0
         )
         idle_wait_seconds = _get_int_env(
             "PIPELINE_IDLE_WAIT_SECONDS", 10, min_val=0
         )
+        event_idle_wait_seconds = _get_int_env(
+            "PIPELINE_EVENT_IDLE_WAIT_SECONDS", 60, min_val=0
+        )
         max_retries = _get_int_env(
             "PIPELINE_MAX_RETRIES", 3, min_val=0
         )
+        worker_id = os.getenv("PIPELINE_WORKER_ID", "")
+        transcription_lease_seconds = _get_int_env(
+            "PIPELINE_TRANSCRIPTION_LEASE_SECONDS", 3600, min_val=60
+        )
+        lease_reap_interval_seconds = _get_int_env(
+            "PIPELINE_LEASE_REAP_INTERVAL_SECONDS", 300, min_val=1
+        )
+        stale_claim_seconds = _get_int_env(
+            "PIPELINE_STALE_CLAIM_SECONDS", 3600, min_val=60
+        )
+        metrics_port = _get_int_env(
+            "PIPELINE_METRICS_PORT", 0, min_val=0, max_val=65535
+        )
+        metrics_host = os.getenv("PIPELINE_METRICS_HOST", "0.0.0.0")
         max_consecutive_db_errors = _get_int_env(
             "PIPELINE_MAX_CONSECUTIVE_DB_ERRORS", 5, min_val=1
         )
@@ -186,15 +260,37 @@ class PipelineConfig:
                 f"PIPELINE_DOWNLOAD_BUFFER_SIZE ({download_buffer_size})"
             )
 
+        if transcription_workers > download_buffer_size:
+            raise ValueError(
+                f"Invalid configuration: PIPELINE_TRANSCRIPTION_WORKERS "
+                f"({transcription_workers}) must not exceed "
+                f"PIPELINE_DOWNLOAD_BUFFER_SIZE ({download_buffer_size})"
+            )
+
         return cls(
             sync_interval_seconds=sync_interval_seconds,
+            priority_refresh_interval_seconds=priority_refresh_interval_seconds,
             download_buffer_size=download_buffer_size,
             download_buffer_threshold=download_buffer_threshold,
             download_batch_size=download_batch_size,
             download_workers=download_workers,
+            download_buffer_hours=download_buffer_hours,
+            download_min_free_disk_mb=download_min_free_disk_mb,
+            preprocess_workers=preprocess_workers,
+            transcription_workers=transcription_workers,
+            transcription_batch_size=transcription_batch_size,
+            transcription_processes=transcription_processes,
+            transcription_timeout_seconds=transcription_timeout_seconds,
             post_processing_workers=post_processing_workers,
             idle_wait_seconds=idle_wait_seconds,
+            event_idle_wait_seconds=event_idle_wait_seconds,
             max_retries=max_retries,
+            worker_id=worker_id,
+            transcription_lease_seconds=transcription_lease_seconds,
+            lease_reap_interval_seconds=lease_reap_interval_seconds,
+            stale_claim_seconds=stale_claim_seconds,
+            metrics_port=metrics_port,
+            metrics_host=metrics_host,
             max_consecutive_db_errors=max_consecutive_db_errors,
             db_retry_base_wait=db_retry_base_wait,
             db_retry_max_wait=db_retry_max_wait,
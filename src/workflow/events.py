@@ -0,0 +1,220 @@
+"""Event bus for waking pipeline stages when new work appears.
+
+Stages publish a topic when they produce work for the next stage (feed sync
+adds episodes, a download finishes, a transcript is stored) and idle
+consumers wait on the bus instead of sleeping for a fixed interval.
+
+On PostgreSQL, events are also sent with NOTIFY and received with LISTEN,
+so pipeline nodes, the web app and CLI commands sharing one database wake
+each other. Other databases use an in-process bus only.
+
+Example:
+    events = create_event_bus(repository)
+    events.start()
+    events.subscribe(AUDIO_DOWNLOADED, prefetcher.notify)
+    events.publish(EPISODES_ADDED)
+    topics = events.wait(timeout=60)
+    events.stop()
+"""
+
+import logging
+import select
+import threading
+from collections import defaultdict
+from collections.abc import Callable
+
+logger = logging.getLogger(__name__)
+
+# Topics
+EPISODES_ADDED = "episodes_added"  # Feed sync created pending episodes
+AUDIO_DOWNLOADED = "audio_downloaded"  # Episode audio is ready to transcribe
+TRANSCRIPT_READY = "transcript_ready"  # Transcript stored, ready for post-processing
+
+TOPICS = frozenset({EPISODES_ADDED, AUDIO_DOWNLOADED, TRANSCRIPT_READY})
+
+# PostgreSQL NOTIFY channel; the payload is the topic
+NOTIFY_CHANNEL = "podcast_rag_events"
+
+# Seconds between reconnection attempts of the LISTEN connection
+_RECONNECT_DELAY_SECONDS = 5.0
+# Seconds the LISTEN loop blocks before re-checking for shutdown
+_LISTEN_POLL_SECONDS = 1.0
+
+
+class EventBus:
+    """In-process event bus.
+
+    publish() records the topic, runs subscribers and wakes every thread
+    blocked in wait(). Events are level-triggered: topics published while
+    nobody is waiting are returned by the next wait().
+    """
+
+    def __init__(self):
+        self._condition = threading.Condition()
+        self._pending: set[str] = set()
+        self._subscribers: dict[str, list[Callable[[], None]]] = defaultdict(list)
+
+    def start(self) -> None:
+        """Start background delivery (no-op for the in-process bus)."""
+
+    def stop(self) -> None:
+        """Stop background delivery and release waiters."""
+        self.interrupt()
+
+    def subscribe(self, topic: str, callback: Callable[[], None]) -> None:
+        """Call callback whenever topic is published.
+
+        Callbacks run on the publishing (or listening) thread and must not
+        block.
+        """
+        with self._condition:
+            self._subscribers[topic].append(callback)
+
+    def publish(self, topic: str) -> None:
+        """Announce that work is available for the stage consuming topic."""
+        self._deliver(topic)
+
+    def _deliver(self, topic: str) -> None:
+        """Record a topic, wake waiters and run subscribers."""
+        with self._condition:
+            self._pending.add(topic)
+            callbacks = list(self._subscribers.get(topic, ()))
+            self._condition.notify_all()
+
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception:
+                logger.exception(f"Event subscriber for {topic} failed")
+
+    def interrupt(self) -> None:
+        """Wake waiters without publishing a topic (e.g. on shutdown)."""
+        with self._condition:
+            self._condition.notify_all()
+
+    def wait(self, timeout: float) -> set[str]:
+        """Block until a topic is published, interrupt() is called, or timeout.
+
+        Args:
+            timeout: Maximum seconds to wait.
+
+        Returns:
+            Topics published since the previous wait(); empty on timeout or
+            interrupt.
+        """
+        with self._condition:
+            if not self._pending:
+                self._condition.wait(timeout=timeout)
+            topics, self._pending = self._pending, set()
+        return topics
+
+
+class PostgresEventBus(EventBus):
+    """Event bus that also delivers events between processes via LISTEN/NOTIFY.
+
+    A dedicated DBAPI connection (outside the engine's pool) listens on
+    NOTIFY_CHANNEL from a background thread and reconnects on failure.
+    """
+
+    def __init__(self, engine):
+        """Initialize the bus.
+
+        Args:
+            engine: SQLAlchemy engine for a PostgreSQL database.
+        """
+        super().__init__()
+        self.engine = engine
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        """Start the LISTEN thread."""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._listen_loop, name="event-listener", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the LISTEN thread."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=_LISTEN_POLL_SECONDS * 5)
+            self._thread = None
+        super().stop()
+
+    def publish(self, topic: str) -> None:
+        """Deliver locally and NOTIFY other processes.
+
+        A failed NOTIFY is logged and ignored: listeners fall back to their
+        idle poll.
+        """
+        self._deliver(topic)
+
+        from sqlalchemy import text
+
+        try:
+            with self.engine.connect() as conn:
+                conn.execute(
+                    text("SELECT pg_notify(:channel, :payload)"),
+                    {"channel": NOTIFY_CHANNEL, "payload": topic},
+                )
+                conn.commit()
+        except Exception:
+            logger.warning(f"Failed to NOTIFY {topic}", exc_info=True)
+
+    def _connect(self):
+        """Open an autocommit DBAPI connection listening on NOTIFY_CHANNEL."""
+        cargs, cparams = self.engine.dialect.create_connect_args(self.engine.url)
+        connection = self.engine.dialect.connect(*cargs, **cparams)
+        connection.autocommit = True
+        with connection.cursor() as cursor:
+            cursor.execute(f"LISTEN {NOTIFY_CHANNEL}")
+        return connection
+
+    def _listen_loop(self) -> None:
+        """Receive notifications until stopped."""
+        connection = None
+        while not self._stop.is_set():
+            try:
+                if connection is None:
+                    connection = self._connect()
+                    logger.info(f"Listening for pipeline events on {NOTIFY_CHANNEL}")
+
+                readable, _, _ = select.select([connection], [], [], _LISTEN_POLL_SECONDS)
+                if not readable:
+                    continue
+                connection.poll()
+                while connection.notifies:
+                    notify = connection.notifies.pop(0)
+                    if notify.payload in TOPICS:
+                        self._deliver(notify.payload)
+            except Exception:
+                logger.warning("Event listener connection failed, reconnecting", exc_info=True)
+                if connection is not None:
+                    try:
+                        connection.close()
+                    except Exception:
+                        pass
+                    connection = None
+                self._stop.wait(_RECONNECT_DELAY_SECONDS)
+
+        if connection is not None:
+            connection.close()
+
+
+def create_event_bus(repository) -> EventBus:
+    """Create the event bus suited to the repository's database.
+
+    Args:
+        repository: Repository whose engine (if any) selects the backend.
+
+    Returns:
+        PostgresEventBus for PostgreSQL, otherwise an in-process EventBus.
+    """
+    engine = getattr(repository, "engine", None)
+    if engine is not None and engine.dialect.name == "postgresql":
+        return PostgresEventBus(engine)
+    return EventBus()
@@ -5,6 +5,7 @@ Transcription runs as the driver with async post-processing.
 """
 
 import logging
+import os
 import signal
 import time
 from concurrent.futures import Future, ThreadPoolExecutor
@@ -15,12 +16,30 @@ from sqlalchemy.exc import OperationalError, SQLAlchemyError
 
 from src.config import Config
 from src.db.repository import PodcastRepositoryInterface
+from src.services.audio_storage import AudioStorage, LocalAudioStorage, create_audio_storage
+from src.utils.metrics import QUEUE_DEPTH, MetricsServer, instrument_engine
 from src.workflow.config import PipelineConfig
+from src.workflow.events import (
+    AUDIO_DOWNLOADED,
+    EPISODES_ADDED,
+    TRANSCRIPT_READY,
+    EventBus,
+    PostgresEventBus,
+    create_event_bus,
+)
 from src.workflow.post_processor import PostProcessingStats, PostProcessor
+from src.workflow.prefetcher import DownloadPrefetcher
 from src.workflow.workers.base import WorkerResult
 
 logger = logging.getLogger(__name__)
 
+# Seconds between queue-depth gauge refreshes while metrics are served
+QUEUE_METRICS_INTERVAL_SECONDS = 60
+
+# (stage, status) pairs that batch workers set on a whole batch before working
+# through it; rows a crash leaves behind are requeued once stale
+STALE_BATCH_CLAIMS = (("download", "downloading"), ("indexing", "uploading"))
+
 
 @dataclass
 class PipelineStats:
@@ -52,10 +71,12 @@ class PipelineOrchestrator:
 
     Architecture:
     - Transcription is the driver (continuous, one at a time, model stays loaded)
-    - Download buffer ensures episodes are ready for transcription
+    - Download buffer ensures episodes are ready for transcription (optionally
+      refilled by a background prefetcher sized in hours of audio)
     - Post-processing runs async in thread pool after each transcription
     - Sync runs every N minutes independent of transcription
-    - Main thread helps with post-processing when idle
+    - Main thread helps with post-processing when idle, then waits on the
+      event bus until another stage (or node) publishes work
 
     Example:
         config = Config()
@@ -91,21 +112,34 @@ class PipelineOrchestrator:
 
         self._running = False
         self._last_sync: datetime | None = None
+        self._last_priority_refresh: datetime | None = None
         self._last_email_digest_check: datetime | None = None
         self._last_audio_retention: datetime | None = None
+        self._last_lease_reap: datetime | None = None
+        self._last_queue_metrics: datetime | None = None
         self._stats = PipelineStats()
 
         # Workers (created lazily)
         self._sync_worker = None
         self._download_worker = None
+        self._preprocess_worker = None
         self._transcription_worker = None
         self._email_digest_worker = None
         self._post_processor: PostProcessor | None = None
+        self._prefetcher: DownloadPrefetcher | None = None
+        self._metrics_server: MetricsServer | None = None
+
+        # Wakes the idle loop when another stage (or node) produces work
+        self._events: EventBus = create_event_bus(repository)
 
         # Background executor for SMTP/network I/O (email digests)
         self._background_executor: ThreadPoolExecutor | None = None
         self._email_digest_future: Future | None = None
 
+        # Background executor for audio preprocessing (decode + VAD)
+        self._preprocess_executor: ThreadPoolExecutor | None = None
+        self._preprocess_future: Future | None = None
+
     def _get_sync_worker(self):
         """Get or create the sync worker."""
         if self._sync_worker is None:
@@ -114,6 +148,7 @@ class PipelineOrchestrator:
             self._sync_worker = SyncWorker(
                 config=self.config,
                 repository=self.repository,
+                event_bus=self._events,
             )
         return self._sync_worker
 
@@ -129,6 +164,18 @@ class PipelineOrchestrator:
             )
         return self._download_worker
 
+    def _get_preprocess_worker(self):
+        """Get or create the audio preprocessing worker."""
+        if self._preprocess_worker is None:
+            from src.workflow.workers.preprocess import PreprocessWorker
+
+            self._preprocess_worker = PreprocessWorker(
+                config=self.config,
+                repository=self.repository,
+                preprocess_workers=self.pipeline_config.preprocess_workers,
+            )
+        return self._preprocess_worker
+
     def _get_transcription_worker(self):
         """Get or create the transcription worker."""
         if self._transcription_worker is None:
@@ -137,6 +184,14 @@ class PipelineOrchestrator:
             self._transcription_worker = TranscriptionWorker(
                 config=self.config,
                 repository=self.repository,
+                worker_id=self.pipeline_config.worker_id,
+                lease_seconds=self.pipeline_config.transcription_lease_seconds,
+                num_workers=self.pipeline_config.transcription_workers,
+                batch_size=self.pipeline_config.transcription_batch_size,
+                num_processes=self.pipeline_config.transcription_processes,
+                episode_timeout_seconds=(
+                    self.pipeline_config.transcription_timeout_seconds or None
+                ),
             )
         return self._transcription_worker
 
@@ -157,9 +212,9 @@ class PipelineOrchestrator:
         The pipeline loop:
         1. Check sync timer (run sync every N minutes)
         2. Maintain download buffer
-        3. Transcribe one episode (blocking, GPU-bound)
+        3. Claim and transcribe one episode (blocking, GPU-bound)
         4. Submit for async post-processing
-        5. If no work, help with post-processing or sleep
+        5. If no work, help with post-processing or wait for an event
 
         Returns:
             PipelineStats with run statistics.
@@ -189,11 +244,12 @@ class PipelineOrchestrator:
                         helped = self._help_post_process()
 
                         if not helped:
-                            # Nothing to do - sleep briefly
-                            logger.debug(
-                                f"No work available, sleeping {self.pipeline_config.idle_wait_seconds}s"
-                            )
-                            time.sleep(self.pipeline_config.idle_wait_seconds)
+                            # Nothing to do - wait for another stage to publish work
+                            idle_wait = self._idle_wait_seconds()
+                            logger.debug(f"No work available, waiting up to {idle_wait}s")
+                            topics = self._events.wait(timeout=idle_wait)
+                            if topics:
+                                logger.debug(f"Woken by {', '.join(sorted(topics))}")
 
                 except OperationalError as e:
                     consecutive_db_errors += 1
@@ -241,6 +297,7 @@ class PipelineOrchestrator:
         """Signal the pipeline to stop gracefully."""
         logger.info("Stopping pipeline...")
         self._running = False
+        self._events.interrupt()
 
     def _handle_signal(self, signum, frame) -> None:
         """Handle interrupt signals gracefully."""
@@ -252,6 +309,9 @@ class PipelineOrchestrator:
         """Initialize pipeline components."""
         logger.info("Initializing pipeline components...")
 
+        # Start receiving events from other processes (LISTEN on PostgreSQL)
+        self._events.start()
+
         # Load transcription model
         transcription_worker = self._get_transcription_worker()
         transcription_worker.load_model()
@@ -269,6 +329,37 @@ class PipelineOrchestrator:
             max_workers=1, thread_name_prefix="email-digest"
         )
 
+        # Start background download prefetcher (replaces the inline buffer refill)
+        if self.pipeline_config.download_buffer_hours > 0:
+            self._prefetcher = DownloadPrefetcher(
+                pipeline_config=self.pipeline_config,
+                repository=self.repository,
+                download_worker=self._get_download_worker(),
+                download_directory=self.config.PODCAST_DOWNLOAD_DIRECTORY,
+                event_bus=self._events,
+            )
+            self._events.subscribe(EPISODES_ADDED, self._prefetcher.notify)
+            self._events.subscribe(TRANSCRIPT_READY, self._prefetcher.notify)
+            self._prefetcher.start()
+
+        # Start background executor for audio preprocessing
+        if self.pipeline_config.preprocess_workers > 0:
+            self._preprocess_executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="preprocess-batch"
+            )
+
+        # Serve Prometheus metrics and get_status() over HTTP
+        if self.pipeline_config.metrics_port > 0:
+            engine = getattr(self.repository, "engine", None)
+            if engine is not None:
+                instrument_engine(engine)
+            self._metrics_server = MetricsServer(
+                port=self.pipeline_config.metrics_port,
+                host=self.pipeline_config.metrics_host,
+                status_provider=self.get_status,
+            )
+            self._metrics_server.start()
+
         # Run initial sync
         self._run_sync()
 
@@ -291,6 +382,17 @@ class PipelineOrchestrator:
             self._background_executor.shutdown(wait=True)
             self._background_executor = None
 
+        # Stop download prefetcher (waits for the in-flight batch)
+        if self._prefetcher:
+            self._prefetcher.stop()
+            self._stats.episodes_downloaded += self._prefetcher.episodes_downloaded
+            self._prefetcher = None
+
+        # Shutdown preprocessing executor (waits for the in-flight batch)
+        if self._preprocess_executor:
+            self._preprocess_executor.shutdown(wait=True)
+            self._preprocess_executor = None
+
         # Stop post-processor (wait for pending jobs)
         if self._post_processor:
             pending = self._post_processor.get_pending_count()
@@ -303,6 +405,13 @@ class PipelineOrchestrator:
         if self._transcription_worker:
             self._transcription_worker.unload_model()
 
+        # Stop metrics listener
+        if self._metrics_server:
+            self._metrics_server.stop()
+            self._metrics_server = None
+
+        self._events.stop()
+
         self._stats.stopped_at = datetime.now(UTC)
         logger.info(
             f"Pipeline stopped. Stats: "
@@ -320,72 +429,145 @@ class PipelineOrchestrator:
         # 1. Check sync timer
         self._maybe_run_sync()
 
+        # 1.1. Re-score queued episodes as recency and digest terms drift
+        self._maybe_refresh_priorities()
+
         # 1.5. Check email digest timer (hourly, per-user timezone delivery)
         self._maybe_run_email_digests()
 
         # 1.6. Check audio retention cleanup (daily)
         self._maybe_run_audio_retention()
 
-        # 2. Maintain download buffer
-        self._maintain_download_buffer()
+        # 1.7. Requeue episodes whose transcription claim expired
+        self._maybe_reap_expired_leases()
+
+        # 1.8. Refresh queue-depth gauges for the metrics endpoint
+        self._maybe_update_queue_metrics()
+
+        # 2. Maintain download buffer (inline unless the prefetcher owns it)
+        if self._prefetcher is None:
+            self._maintain_download_buffer()
+
+        # 2.5. Decode and VAD-trim buffered audio in the background
+        self._maybe_run_preprocessing()
 
-        # 3. Get next episode to transcribe
-        episode = self.repository.get_next_for_transcription()
+        # 3. Claim episodes to transcribe from the download buffer
+        #    (safe across pipeline nodes)
+        episodes = self._claim_episodes(self.pipeline_config.transcription_workers)
 
-        if episode is None:
+        if not episodes:
             return False
 
-        # 4. Transcribe (blocking, GPU-bound)
-        logger.info(f"Transcribing: {episode.title}")
+        # 4. Transcribe (blocking, GPU/CPU-bound)
         transcription_worker = self._get_transcription_worker()
-        transcript_path = transcription_worker.transcribe_single(episode)
+        started = time.monotonic()
+        if len(episodes) == 1:
+            episode = episodes[0]
+            logger.info(f"Transcribing: {episode.title}")
+            transcript_text = transcription_worker.transcribe_single(episode)
+            results = [(episode, transcript_text)]
+        else:
+            logger.info(f"Transcribing {len(episodes)} episodes concurrently")
+            results = [
+                (outcome.episode, outcome.transcript_text)
+                for outcome in transcription_worker.transcribe_many(episodes)
+            ]
+        elapsed = time.monotonic() - started
+
+        for episode, transcript_text in results:
+            self._handle_transcription_result(episode, transcript_text)
+
+        # Feed measured throughput back into the prefetcher's buffer sizing
+        if self._prefetcher is not None:
+            audio_seconds = sum(
+                episode.duration_seconds or 0
+                for episode, transcript_text in results
+                if transcript_text
+            )
+            self._prefetcher.record_transcription(audio_seconds, elapsed)
+
+        return True
+
+    def _claim_episodes(self, limit: int) -> list:
+        """Claim up to limit downloaded episodes for transcription.
+
+        Args:
+            limit: Maximum number of episodes to claim.
 
-        if transcript_path:
+        Returns:
+            Claimed episodes, newest first. Empty if none are ready.
+        """
+        episodes = []
+        while len(episodes) < limit:
+            episode = self.repository.claim_next_for_transcription(
+                worker_id=self.pipeline_config.worker_id,
+                lease_seconds=self.pipeline_config.transcription_lease_seconds,
+            )
+            if episode is None:
+                break
+            episodes.append(episode)
+        return episodes
+
+    def _handle_transcription_result(self, episode, transcript_text: str | None) -> None:
+        """Record a transcription result and queue follow-up work.
+
+        Successful episodes are submitted for post-processing. Failures are
+        retried until max_retries, then marked permanently failed.
+
+        Args:
+            episode: The transcribed episode.
+            transcript_text: Transcript text, or None if transcription failed.
+        """
+        if transcript_text:
             self._stats.episodes_transcribed += 1
 
             # 5. Submit for async post-processing
             if self._post_processor:
                 self._post_processor.submit(episode.id)
-        else:
-            # Check if failure was due to shutdown
-            if not self._running:
-                # Reset to pending so it will be retried on next run
-                logger.info(
-                    f"Transcription interrupted during shutdown, "
-                    f"resetting episode {episode.id} to pending"
-                )
-                self.repository.reset_episode_for_retry(episode.id, "transcript")
-            else:
-                # Increment retry count and check if max retries exceeded
-                self._stats.transcription_failures += 1
-                retry_count = self.repository.increment_retry_count(
-                    episode.id, "transcript"
-                )
-                logger.warning(f"Transcription failed for episode {episode.id}")
+            self._events.publish(TRANSCRIPT_READY)
+            return
 
-                if retry_count > self.pipeline_config.max_retries:
-                    self.repository.mark_permanently_failed(
-                        episode.id,
-                        "transcript",
-                        f"Exceeded max retries ({self.pipeline_config.max_retries})",
-                    )
-                    self._stats.transcription_permanent_failures += 1
-                    logger.warning(
-                        f"Episode {episode.id} marked as permanently failed "
-                        f"after {retry_count} attempts"
-                    )
-                else:
-                    # Reset to pending so it can be picked up for retry
-                    self.repository.reset_episode_for_retry(episode.id, "transcript")
-                    logger.info(
-                        f"Episode {episode.id} transcription reset for retry "
-                        f"{retry_count}/{self.pipeline_config.max_retries}"
-                    )
+        # Check if failure was due to shutdown
+        if not self._running:
+            # Reset to pending so it will be retried on next run
+            logger.info(
+                f"Transcription interrupted during shutdown, "
+                f"resetting episode {episode.id} to pending"
+            )
+            self.repository.reset_episode_for_retry(episode.id, "transcript")
+            return
 
-        return True
+        # Increment retry count and check if max retries exceeded
+        self._stats.transcription_failures += 1
+        retry_count = self.repository.increment_retry_count(episode.id, "transcript")
+        logger.warning(f"Transcription failed for episode {episode.id}")
+
+        if retry_count > self.pipeline_config.max_retries:
+            self.repository.mark_permanently_failed(
+                episode.id,
+                "transcript",
+                f"Exceeded max retries ({self.pipeline_config.max_retries})",
+            )
+            self._stats.transcription_permanent_failures += 1
+            logger.warning(
+                f"Episode {episode.id} marked as permanently failed "
+                f"after {retry_count} attempts"
+            )
+        else:
+            # Reset to pending so it can be picked up for retry
+            self.repository.reset_episode_for_retry(episode.id, "transcript")
+            logger.info(
+                f"Episode {episode.id} transcription reset for retry "
+                f"{retry_count}/{self.pipeline_config.max_retries}"
+            )
 
     def _maybe_run_sync(self) -> None:
-        """Run sync if enough time has passed since last sync."""
+        """Run sync if enough time has passed since last sync.
+
+        Each run only checks the feeds whose adaptive schedule says they are
+        due, so the interval bounds how late a due feed is checked rather
+        than how often every feed is.
+        """
         now = datetime.now(UTC)
 
         if self._last_sync is None:
@@ -397,7 +579,7 @@ class PipelineOrchestrator:
             self._run_sync()
 
     def _run_sync(self) -> None:
-        """Run RSS feed sync for all subscribed podcasts."""
+        """Run RSS feed sync for subscribed podcasts that are due for a check."""
         logger.info("Running feed sync...")
 
         try:
@@ -500,9 +682,14 @@ class PipelineOrchestrator:
     def _maybe_run_audio_retention(self) -> None:
         """Run briefing audio retention cleanup once per day.
 
-        Purges audio blobs older than BRIEFING_AUDIO_RETENTION_DAYS to
-        prevent unbounded DB growth. The text briefing is preserved; only
-        the audio_data blob and related fields are cleared.
+        Purges briefing audio older than BRIEFING_AUDIO_RETENTION_DAYS to
+        prevent unbounded storage growth. The text briefing is preserved;
+        the audio fields are cleared, then the stored audio is deleted.
+
+        The audio is written by the web service, so with local storage the
+        pipeline must see the same BRIEFING_AUDIO_DIRECTORY. If that
+        directory does not exist here, retention is skipped (and logged)
+        rather than clearing rows whose files it cannot delete.
         """
         now = datetime.now(UTC)
 
@@ -520,17 +707,133 @@ class PipelineOrchestrator:
             self._last_audio_retention = now
             return  # Retention disabled
 
+        try:
+            storage = create_audio_storage(self.config)
+        except (ImportError, ValueError):
+            self._last_audio_retention = now
+            logger.exception("Audio retention: audio storage unavailable")
+            return
+        if isinstance(storage, LocalAudioStorage) and not os.path.isdir(storage.root):
+            self._last_audio_retention = now
+            logger.error(
+                "Audio retention skipped: BRIEFING_AUDIO_DIRECTORY %s does not exist in the "
+                "pipeline; mount the web service's audio directory here",
+                storage.root,
+            )
+            return
+
         cutoff = now - timedelta(days=retention_days)
         try:
+            keys = self.repository.get_audio_storage_keys_before(cutoff)
             cleared = self.repository.clear_audio_data_before(cutoff)
             self._last_audio_retention = now
             if cleared > 0:
                 logger.info(
-                    "Audio retention: cleared %d briefing audio blobs older than %d days",
+                    "Audio retention: cleared %d briefing audio files older than %d days",
                     cleared, retention_days,
                 )
         except SQLAlchemyError:
             logger.exception("Audio retention cleanup failed")
+            return
+
+        if keys:
+            self._delete_stored_audio(storage, keys)
+
+    def _delete_stored_audio(self, storage: AudioStorage, keys: list[str]) -> None:
+        """Delete briefing audio from audio storage, logging failures.
+
+        Failures leave orphaned objects behind but never block retention.
+        """
+        for key in keys:
+            try:
+                storage.delete(key)
+            except Exception:
+                logger.exception("Audio retention: failed to delete %s", key)
+
+    def _maybe_refresh_priorities(self) -> None:
+        """Recompute the priority of every queued episode.
+
+        Syncs only re-score the podcasts they touched, and feeds may go days
+        between checks, so the recency and digest-hour terms of other queued
+        episodes would go stale. Runs every priority_refresh_interval_seconds.
+        """
+        now = datetime.now(UTC)
+
+        if self._last_priority_refresh is not None:
+            seconds_since = (now - self._last_priority_refresh).total_seconds()
+            if seconds_since < self.pipeline_config.priority_refresh_interval_seconds:
+                return
+
+        self._last_priority_refresh = now
+        try:
+            self.repository.refresh_episode_priorities()
+        except SQLAlchemyError:
+            logger.exception("Episode priority refresh failed")
+
+    def _maybe_reap_expired_leases(self) -> None:
+        """Return expired transcription claims and stale batch claims to the queue.
+
+        Claims expire when the worker that took them crashed or stalled
+        without renewing its lease. Download and indexing batches are marked
+        in progress up front, so episodes still downloading or uploading
+        after stale_claim_seconds are requeued too. Runs every
+        lease_reap_interval_seconds.
+        """
+        now = datetime.now(UTC)
+
+        if self._last_lease_reap is not None:
+            seconds_since = (now - self._last_lease_reap).total_seconds()
+            if seconds_since < self.pipeline_config.lease_reap_interval_seconds:
+                return
+
+        self._last_lease_reap = now
+        try:
+            self.repository.release_expired_transcription_leases()
+            stale_before = now - timedelta(seconds=self.pipeline_config.stale_claim_seconds)
+            for stage, status in STALE_BATCH_CLAIMS:
+                self.repository.requeue_stale_episodes(stage, status, stale_before)
+        except SQLAlchemyError:
+            logger.exception("Transcription lease reaping failed")
+
+    def _maybe_update_queue_metrics(self) -> None:
+        """Refresh queue-depth gauges if metrics are being served.
+
+        Runs every QUEUE_METRICS_INTERVAL_SECONDS so scrapes never hit the
+        database directly.
+        """
+        if self._metrics_server is None:
+            return
+
+        now = datetime.now(UTC)
+        if self._last_queue_metrics is not None:
+            seconds_since = (now - self._last_queue_metrics).total_seconds()
+            if seconds_since < QUEUE_METRICS_INTERVAL_SECONDS:
+                return
+
+        self._last_queue_metrics = now
+        try:
+            stats = self.repository.get_overall_stats()
+            QUEUE_DEPTH.set(stats["pending_download"], stage="download")
+            QUEUE_DEPTH.set(self.repository.get_download_buffer_count(), stage="transcribe")
+            QUEUE_DEPTH.set(stats["pending_indexing"], stage="index")
+        except SQLAlchemyError:
+            logger.exception("Queue metrics refresh failed")
+
+        if self._post_processor:
+            QUEUE_DEPTH.set(self._post_processor.get_pending_count(), stage="post_process")
+
+    def _idle_wait_seconds(self) -> float:
+        """Longest time to wait for an event before polling the database again.
+
+        With LISTEN/NOTIFY every producer, including other processes, wakes
+        the loop, so the fallback poll can be much less frequent.
+        """
+        if isinstance(self._events, PostgresEventBus):
+            return max(
+                self.pipeline_config.idle_wait_seconds,
+                self.pipeline_config.event_idle_wait_seconds,
+            )
+        return self.pipeline_config.idle_wait_seconds
 
     def _maintain_download_buffer(self) -> None:
         """Ensure download buffer has enough episodes ready for transcription."""
@@ -548,10 +851,35 @@ class PipelineOrchestrator:
 
                 self._stats.episodes_downloaded += result.processed
                 download_worker.log_result(result)
+                if result.processed:
+                    self._events.publish(AUDIO_DOWNLOADED)
 
             except Exception:
                 logger.exception("Download buffer refill failed")
 
+    def _maybe_run_preprocessing(self) -> None:
+        """Submit a preprocessing batch if none is running.
+
+        Preprocessing runs on a background thread so decoding of upcoming
+        episodes overlaps with transcription of the current one.
+        """
+        if self._preprocess_executor is None:
+            return
+
+        if self._preprocess_future and not self._preprocess_future.done():
+            return
+
+        preprocess_worker = self._get_preprocess_worker()
+
+        def _preprocess() -> None:
+            result = preprocess_worker.process_batch(
+                limit=self.pipeline_config.download_buffer_size
+            )
+            if result.total > 0:
+                preprocess_worker.log_result(result)
+
+        self._preprocess_future = self._preprocess_executor.submit(_preprocess)
+
     def _help_post_process(self) -> bool:
         """Use main thread to help with post-processing when idle.
 
@@ -583,18 +911,11 @@ class PipelineOrchestrator:
         if self._post_processor:
             status["post_processing_pending"] = self._post_processor.get_pending_count()
 
-        # Get buffer status
+        # Get buffer status (the download buffer is the transcription queue)
         try:
             status["download_buffer"] = self.repository.get_download_buffer_count()
         except Exception:
             status["download_buffer"] = -1
-
-        # Get pending counts
-        try:
-            status["pending_transcription"] = len(
-                self.repository.get_episodes_pending_transcription(limit=1000)
-            )
-        except Exception:
-            status["pending_transcription"] = -1
+        status["pending_transcription"] = status["download_buffer"]
 
         return status
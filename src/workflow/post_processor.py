@@ -6,12 +6,14 @@ while the main transcription loop continues.
 
 import logging
 import threading
+import time
 from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
 
 from src.config import Config
 from src.db.models import Episode
 from src.db.repository import PodcastRepositoryInterface
+from src.utils.metrics import record_stage
 from src.workflow.config import PipelineConfig
 
 logger = logging.getLogger(__name__)
@@ -274,6 +276,7 @@ class PostProcessor:
         Returns:
             True if successful, False otherwise.
         """
+        started = time.monotonic()
         try:
             worker = worker_class(config=self.config, repository=self.repository)
 
@@ -293,6 +296,7 @@ class PostProcessor:
             )
 
             self._stats.increment_metadata_processed()
+            record_stage("metadata", time.monotonic() - started, True)
             logger.info(f"Metadata complete for episode {episode.id}")
             return True
 
@@ -317,6 +321,7 @@ class PostProcessor:
                 )
 
             self._stats.increment_metadata_failed()
+            record_stage("metadata", time.monotonic() - started, False)
             return False
 
     def _process_indexing(
@@ -331,6 +336,7 @@ class PostProcessor:
         Returns:
             True if successful, False otherwise.
         """
+        started = time.monotonic()
         try:
             worker = worker_class(config=self.config, repository=self.repository)
 
@@ -343,6 +349,7 @@ class PostProcessor:
             )
 
             self._stats.increment_indexing_processed()
+            record_stage("index", time.monotonic() - started, True)
             logger.info(f"Indexing complete for episode {episode.id}")
             return True
 
@@ -367,6 +374,7 @@ class PostProcessor:
                 )
 
             self._stats.increment_indexing_failed()
+            record_stage("index", time.monotonic() - started, False)
             return False
 
     def _process_cleanup(
@@ -381,17 +389,20 @@ class PostProcessor:
         Returns:
             True if successful, False otherwise.
         """
+        started = time.monotonic()
         try:
             worker = worker_class(config=self.config, repository=self.repository)
             worker._cleanup_episode(episode)
 
             self._stats.increment_cleanup_processed()
+            record_stage("cleanup", time.monotonic() - started, True)
             logger.info(f"Cleanup complete for episode {episode.id}")
             return True
 
         except Exception:
             logger.exception(f"Cleanup failed for episode {episode.id}")
             self._stats.increment_cleanup_failed()
+            record_stage("cleanup", time.monotonic() - started, False)
             return False
 
     def _on_job_complete(self, episode_id: str, future: Future) -> None:
@@ -0,0 +1,245 @@
+"""Background download prefetcher for the transcription buffer.
+
+Keeps enough downloaded audio on disk that the transcriber never waits on
+the network, without letting surplus MP3s fill the disk. The buffer target
+is measured in seconds of audio and adapts to the observed transcription
+throughput and download bandwidth.
+"""
+
+import logging
+import shutil
+import threading
+from collections import deque
+from dataclasses import dataclass, field
+
+from src.db.repository import PodcastRepositoryInterface
+from src.workflow.config import PipelineConfig
+from src.workflow.events import AUDIO_DOWNLOADED, EventBus
+
+logger = logging.getLogger(__name__)
+
+# Assumed length of episodes whose feed does not report a duration
+DEFAULT_EPISODE_SECONDS = 3600
+# Assumed size of an episode before any download has been measured
+DEFAULT_EPISODE_BYTES = 64 * 1024 * 1024
+# Number of recent samples used for rolling throughput/bandwidth estimates
+ROLLING_WINDOW = 20
+# Buffer must cover this many replacement downloads at current throughput
+DOWNLOAD_SAFETY_FACTOR = 2.0
+
+
+@dataclass
+class RollingRate:
+    """Ratio of two quantities summed over the most recent samples."""
+
+    window: int = ROLLING_WINDOW
+    _samples: deque = field(default_factory=deque, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def add(self, amount: float, seconds: float) -> None:
+        """Record that amount was processed in the given wall-clock seconds."""
+        if amount <= 0 or seconds <= 0:
+            return
+        with self._lock:
+            self._samples.append((amount, seconds))
+            while len(self._samples) > self.window:
+                self._samples.popleft()
+
+    @property
+    def rate(self) -> float | None:
+        """Amount per wall-clock second, or None before the first sample."""
+        with self._lock:
+            if not self._samples:
+                return None
+            total_amount = sum(amount for amount, _ in self._samples)
+            total_seconds = sum(seconds for _, seconds in self._samples)
+        return total_amount / total_seconds
+
+    @property
+    def average_amount(self) -> float | None:
+        """Mean amount per sample, or None before the first sample."""
+        with self._lock:
+            if not self._samples:
+                return None
+            return sum(amount for amount, _ in self._samples) / len(self._samples)
+
+
+class DownloadPrefetcher:
+    """Refills the download buffer continuously from a background thread.
+
+    The target amount of buffered audio is the larger of
+    ``download_buffer_hours`` and the audio the transcriber will consume while
+    replacement downloads complete (throughput x expected download time x
+    safety factor). Refills stop when the target or ``download_buffer_size``
+    episodes is reached, or when free disk would drop below
+    ``download_min_free_disk_mb``.
+
+    Example:
+        prefetcher = DownloadPrefetcher(pipeline_config, repository, download_worker)
+        prefetcher.start()
+        ...
+        prefetcher.record_transcription(audio_seconds=3600, wall_seconds=400)
+        prefetcher.stop()
+    """
+
+    def __init__(
+        self,
+        pipeline_config: PipelineConfig,
+        repository: PodcastRepositoryInterface,
+        download_worker,
+        download_directory: str,
+        poll_interval_seconds: float = 30.0,
+        event_bus: EventBus | None = None,
+    ):
+        """Initialize the prefetcher.
+
+        Args:
+            pipeline_config: Pipeline-specific configuration.
+            repository: Database repository for episode operations.
+            download_worker: DownloadWorker whose downloader fetches episodes.
+            download_directory: Directory downloads are written to; used to
+                check free disk space.
+            poll_interval_seconds: Maximum time between refill checks.
+            event_bus: Bus notified when downloaded audio becomes available.
+        """
+        self.pipeline_config = pipeline_config
+        self.repository = repository
+        self.download_worker = download_worker
+        self.download_directory = download_directory
+        self.poll_interval_seconds = poll_interval_seconds
+        self.event_bus = event_bus
+
+        self.transcription_throughput = RollingRate()  # audio s per wall s
+        self.download_bandwidth = RollingRate()  # bytes per wall s
+        self.episodes_downloaded = 0
+
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        """Start the background refill thread."""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="download-prefetcher", daemon=True
+        )
+        self._thread.start()
+        logger.info("Download prefetcher started")
+
+    def stop(self, timeout: float | None = None) -> None:
+        """Stop the refill thread, waiting for an in-flight batch to finish."""
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._wake.set()
+        self._thread.join(timeout=timeout)
+        self._thread = None
+        logger.info("Download prefetcher stopped")
+
+    def notify(self) -> None:
+        """Wake the refill thread early, e.g. after the buffer was consumed."""
+        self._wake.set()
+
+    def record_transcription(self, audio_seconds: float, wall_seconds: float) -> None:
+        """Record transcription throughput and wake the refill thread.
+
+        Args:
+            audio_seconds: Seconds of audio transcribed.
+            wall_seconds: Wall-clock seconds it took.
+        """
+        self.transcription_throughput.add(audio_seconds, wall_seconds)
+        self.notify()
+
+    def target_audio_seconds(self) -> float:
+        """Seconds of downloaded audio the buffer should hold right now."""
+        target = self.pipeline_config.download_buffer_hours * 3600
+
+        throughput = self.transcription_throughput.rate
+        bandwidth = self.download_bandwidth.rate
+        if throughput and bandwidth:
+            episode_bytes = self.download_bandwidth.average_amount or DEFAULT_EPISODE_BYTES
+            download_seconds = episode_bytes / bandwidth
+            target = max(
+                target, throughput * download_seconds * DOWNLOAD_SAFETY_FACTOR
+            )
+        return target
+
+    def _episodes_fitting_on_disk(self, limit: int) -> int:
+        """Count how many episodes, up to limit, fit above the free-disk floor.
+
+        Args:
+            limit: Number of episodes about to be downloaded at once.
+
+        Returns:
+            Number of those episodes that can be downloaded together.
+        """
+        try:
+            free_bytes = shutil.disk_usage(self.download_directory).free
+        except OSError:
+            logger.warning(
+                f"Cannot read free space for {self.download_directory}", exc_info=True
+            )
+            return 0
+
+        episode_bytes = self.download_bandwidth.average_amount or DEFAULT_EPISODE_BYTES
+        floor_bytes = self.pipeline_config.download_min_free_disk_mb * 1024 * 1024
+        fitting = int((free_bytes - floor_bytes) // episode_bytes)
+        return max(0, min(limit, fitting))
+
+    def refill(self) -> int:
+        """Download episodes until the buffer target is met.
+
+        Returns:
+            Number of episodes downloaded.
+        """
+        downloaded = 0
+        while not self._stop.is_set():
+            count = self.repository.get_download_buffer_count()
+            if count >= self.pipeline_config.download_buffer_size:
+                break
+
+            buffered = self.repository.get_download_buffer_audio_seconds(
+                default_duration_seconds=DEFAULT_EPISODE_SECONDS
+            )
+            if buffered >= self.target_audio_seconds():
+                break
+
+            # The whole batch downloads at once, so all of it must fit
+            limit = self._episodes_fitting_on_disk(min(
+                self.pipeline_config.download_workers,
+                self.pipeline_config.download_buffer_size - count,
+            ))
+            if limit == 0:
+                logger.warning("Download buffer refill paused: low disk space")
+                break
+            batch = self.download_worker.downloader.download_pending(
+                limit=limit, bulk_status=True
+            )
+            for result in batch.get("results", []):
+                if result.success and result.file_size and result.duration_seconds:
+                    self.download_bandwidth.add(result.file_size, result.duration_seconds)
+
+            batch_downloaded = batch.get("downloaded", 0)
+            downloaded += batch_downloaded
+            self.episodes_downloaded += batch_downloaded
+            if batch_downloaded == 0:
+                break  # Nothing left to download, or everything failed
+            if self.event_bus is not None:
+                self.event_bus.publish(AUDIO_DOWNLOADED)
+
+        return downloaded
+
+    def _run(self) -> None:
+        """Refill loop executed on the background thread."""
+        while not self._stop.is_set():
+            try:
+                downloaded = self.refill()
+                if downloaded:
+                    logger.info(f"Prefetched {downloaded} episodes")
+            except Exception:
+                logger.exception("Download prefetch failed")
+
+            self._wake.wait(timeout=self.poll_interval_seconds)
+            self._wake.clear()
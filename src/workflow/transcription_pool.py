@@ -0,0 +1,337 @@
+"""Process-pool transcription backend.
+
+Runs faster-whisper in long-lived child processes so that decoding happens
+outside the orchestrator's interpreter. Each process loads its own
+WhisperModel once and transcribes audio files sent to it over a queue,
+streaming segments back as they are decoded.
+
+A hung decode is killed after the per-episode timeout and a crashed process
+(for example a CTranslate2 segfault) is restarted; in both cases only the
+affected episode fails and the scheduler loop keeps running.
+"""
+
+import logging
+import multiprocessing
+import os
+import queue
+import time
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from typing import NamedTuple
+
+logger = logging.getLogger(__name__)
+
+# Seconds between liveness checks while waiting on a child process
+_POLL_INTERVAL_SECONDS = 1.0
+# Seconds to wait for a child to exit after asking it to stop
+_STOP_TIMEOUT_SECONDS = 10.0
+
+
+class PooledSegment(NamedTuple):
+    """A transcript segment produced by a pool process."""
+
+    start: float
+    end: float
+    text: str
+
+
+@dataclass
+class PooledTranscriptionInfo:
+    """Subset of faster-whisper's TranscriptionInfo returned by the pool."""
+
+    duration: float
+
+
+def load_whisper_model(
+    model_size: str, device: str, compute_type: str, cpu_threads: int
+):
+    """Load a faster-whisper model inside a pool process.
+
+    Args:
+        model_size: Model size or path.
+        device: Device to run on ("cpu", "cuda", "auto").
+        compute_type: CTranslate2 compute type.
+        cpu_threads: Threads per process; 0 lets CTranslate2 decide.
+
+    Returns:
+        A WhisperModel instance.
+    """
+    from faster_whisper import WhisperModel
+
+    return WhisperModel(
+        model_size,
+        device=device,
+        compute_type=compute_type,
+        cpu_threads=cpu_threads,
+    )
+
+
+def _pool_process_main(
+    model_loader: Callable,
+    model_args: tuple,
+    tasks: multiprocessing.Queue,
+    results: multiprocessing.Queue,
+) -> None:
+    """Entry point of a pool process.
+
+    Loads the model, then serves (audio_path, transcribe_kwargs) tasks until
+    it receives None. For each task it sends ("info", duration), one
+    ("segment", (start, end, text)) per decoded segment, and finally
+    ("done", None) or ("error", message).
+    """
+    from src.workflow.workers.preprocess import (
+        PREPROCESSED_SUFFIX,
+        load_preprocessed_audio,
+    )
+
+    model = model_loader(*model_args)
+    batched = None
+
+    while True:
+        task = tasks.get()
+        if task is None:
+            return
+
+        audio_path, kwargs = task
+        try:
+            audio = audio_path
+            if audio_path.endswith(PREPROCESSED_SUFFIX):
+                audio = load_preprocessed_audio(audio_path)
+
+            target = model
+            if kwargs.get("batch_size"):
+                if batched is None:
+                    from faster_whisper import BatchedInferencePipeline
+
+                    batched = BatchedInferencePipeline(model=model)
+                target = batched
+            else:
+                kwargs.pop("batch_size", None)
+
+            segments, info = target.transcribe(audio, **kwargs)
+            results.put(("info", getattr(info, "duration", None)))
+            for segment in segments:
+                results.put(
+                    ("segment", (segment.start, segment.end, segment.text))
+                )
+            results.put(("done", None))
+        except Exception as e:
+            results.put(("error", f"{type(e).__name__}: {e}"))
+
+
+class _PoolProcess:
+    """A single pool process together with its private queues."""
+
+    def __init__(self, context, index: int, target_args: tuple):
+        self.index = index
+        self.tasks = context.Queue()
+        self.results = context.Queue()
+        self.process = context.Process(
+            target=_pool_process_main,
+            args=(*target_args, self.tasks, self.results),
+            name=f"transcription-pool-{index}",
+            daemon=True,
+        )
+        self.process.start()
+
+    def stop(self, kill: bool = False) -> None:
+        """Stop the process, politely unless kill is True."""
+        if self.process.is_alive():
+            if kill:
+                self.process.kill()
+            else:
+                try:
+                    self.tasks.put(None)
+                except (OSError, ValueError):
+                    pass  # Queue already closed
+            self.process.join(timeout=_STOP_TIMEOUT_SECONDS)
+            if self.process.is_alive():
+                self.process.kill()
+                self.process.join(timeout=_STOP_TIMEOUT_SECONDS)
+        self.tasks.close()
+        self.results.close()
+
+
+class TranscriptionProcessPool:
+    """Pool of long-lived transcription processes.
+
+    transcribe() mirrors WhisperModel.transcribe(): it returns a lazy
+    segment iterator and an info object, so it can stand in for the
+    in-process model. Calls from several threads are served concurrently,
+    one per process; extra callers wait for a free process.
+
+    Example:
+        pool = TranscriptionProcessPool("medium", "cpu", "int8", num_processes=2)
+        pool.start()
+        segments, info = pool.transcribe("/path/episode.mp3", language="en")
+        text = " ".join(s.text.strip() for s in segments)
+        pool.stop()
+    """
+
+    def __init__(
+        self,
+        model_size: str,
+        device: str,
+        compute_type: str,
+        num_processes: int = 1,
+        episode_timeout_seconds: float | None = None,
+        model_loader: Callable = load_whisper_model,
+    ):
+        """Initialize the pool. Processes are started by start().
+
+        Args:
+            model_size: Model size or path loaded in each process.
+            device: Device each process runs the model on.
+            compute_type: CTranslate2 compute type.
+            num_processes: Number of worker processes.
+            episode_timeout_seconds: Wall-clock limit for one episode. The
+                process is killed and restarted when exceeded. None disables.
+            model_loader: Picklable top-level callable that builds the model
+                from (model_size, device, compute_type, cpu_threads).
+        """
+        self.num_processes = max(1, num_processes)
+        self.episode_timeout_seconds = episode_timeout_seconds
+
+        # Split cores between processes so they don't oversubscribe the CPU
+        cpu_threads = 0
+        if device == "cpu":
+            cpu_threads = max(1, (os.cpu_count() or 1) // self.num_processes)
+
+        self._target_args = (
+            model_loader,
+            (model_size, device, compute_type, cpu_threads),
+        )
+        # spawn: CUDA and CTranslate2 are not fork-safe
+        self._context = multiprocessing.get_context("spawn")
+        self._processes: list[_PoolProcess] = []
+        self._idle: queue.Queue[int] = queue.Queue()
+        self.restarts = 0
+
+    def start(self) -> None:
+        """Start all pool processes."""
+        if self._processes:
+            return
+        logger.info(f"Starting {self.num_processes} transcription process(es)")
+        for index in range(self.num_processes):
+            self._processes.append(
+                _PoolProcess(self._context, index, self._target_args)
+            )
+            self._idle.put(index)
+
+    def stop(self) -> None:
+        """Stop all pool processes."""
+        if not self._processes:
+            return
+        logger.info("Stopping transcription processes")
+        for proc in self._processes:
+            proc.stop()
+        self._processes = []
+        self._idle = queue.Queue()
+
+    def is_running(self) -> bool:
+        """Check whether the pool has been started."""
+        return bool(self._processes)
+
+    def _restart(self, index: int, reason: str) -> None:
+        """Kill and replace the process at index."""
+        logger.warning(f"Restarting transcription process {index}: {reason}")
+        self._processes[index].stop(kill=True)
+        self._processes[index] = _PoolProcess(self._context, index, self._target_args)
+        self.restarts += 1
+
+    def _receive(self, index: int, deadline: float | None, audio_path: str):
+        """Wait for the next message from a process.
+
+        Raises:
+            TimeoutError: If the deadline passes; the process is restarted.
+            RuntimeError: If the process died; it is restarted.
+        """
+        proc = self._processes[index]
+        while True:
+            wait = _POLL_INTERVAL_SECONDS
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self._restart(index, f"timed out on {audio_path}")
+                    raise TimeoutError(
+                        f"Transcription exceeded {self.episode_timeout_seconds}s: "
+                        f"{audio_path}"
+                    )
+                wait = min(wait, remaining)
+            try:
+                return proc.results.get(timeout=wait)
+            except queue.Empty:
+                if not proc.process.is_alive():
+                    exitcode = proc.process.exitcode
+                    self._restart(index, f"exited with code {exitcode}")
+                    raise RuntimeError(
+                        f"Transcription process crashed (exit code {exitcode}) "
+                        f"while transcribing {audio_path}"
+                    ) from None
+
+    def transcribe(
+        self, audio_path: str, **kwargs
+    ) -> tuple[Iterator[PooledSegment], PooledTranscriptionInfo]:
+        """Transcribe an audio file in a pool process.
+
+        Blocks until a process is free and has started decoding. The
+        returned iterator must be consumed (or closed) to release the
+        process; the per-episode timeout covers the whole transcription.
+
+        Args:
+            audio_path: Path to the audio file.
+            **kwargs: Passed to WhisperModel.transcribe() in the process.
+                A non-zero batch_size uses BatchedInferencePipeline.
+
+        Returns:
+            Tuple of (segment iterator, info).
+
+        Raises:
+            RuntimeError: If the pool is not started, the process crashed or
+                the model raised an error.
+            TimeoutError: If the episode timeout was exceeded.
+        """
+        if not self._processes:
+            raise RuntimeError("Transcription process pool is not started")
+
+        index = self._idle.get()
+        deadline = None
+        if self.episode_timeout_seconds:
+            deadline = time.monotonic() + self.episode_timeout_seconds
+
+        try:
+            self._processes[index].tasks.put((audio_path, kwargs))
+            kind, payload = self._receive(index, deadline, audio_path)
+            if kind == "error":
+                raise RuntimeError(payload)
+        except BaseException:
+            self._idle.put(index)
+            raise
+
+        info = PooledTranscriptionInfo(duration=payload or 0.0)
+        return self._stream(index, deadline, audio_path), info
+
+    def _stream(
+        self, index: int, deadline: float | None, audio_path: str
+    ) -> Iterator[PooledSegment]:
+        """Yield segments from a process until its task finishes."""
+        finished = False
+        try:
+            while True:
+                kind, payload = self._receive(index, deadline, audio_path)
+                if kind == "segment":
+                    yield PooledSegment(*payload)
+                elif kind == "done":
+                    finished = True
+                    return
+                else:
+                    finished = True
+                    raise RuntimeError(payload)
+        except (TimeoutError, RuntimeError):
+            finished = True  # Process already restarted (or reported an error)
+            raise
+        finally:
+            if not finished:
+                # Abandoned mid-stream; the process is still sending segments
+                self._restart(index, f"stream abandoned for {audio_path}")
+            self._idle.put(index)
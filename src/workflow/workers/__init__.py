@@ -3,6 +3,7 @@
 Each worker handles a single stage of the pipeline:
 - SyncWorker: Syncs RSS feeds to discover new episodes
 - DownloadWorker: Downloads pending episodes
+- PreprocessWorker: Decodes audio to 16 kHz PCM and detects speech ahead of transcription
 - TranscriptionWorker: Transcribes downloaded episodes using Whisper
 - MetadataWorker: Extracts and merges metadata from multiple sources
 - IndexingWorker: Uploads transcripts to Gemini File Search
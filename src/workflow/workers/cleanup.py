@@ -5,6 +5,7 @@ Deletes local audio files after episodes have been fully processed
 """
 
 import logging
+import os
 
 from src.config import Config
 from src.db.models import Episode
@@ -13,6 +14,9 @@ from src.workflow.workers.base import WorkerInterface, WorkerResult
 
 logger = logging.getLogger(__name__)
 
+# Cleaned-up episodes whose cleared paths are written per transaction
+CLEANUP_FLUSH_EVERY = 20
+
 
 class CleanupWorker(WorkerInterface):
     """Worker that cleans up processed audio files.
@@ -47,8 +51,7 @@ class CleanupWorker(WorkerInterface):
         Returns:
             Number of episodes with audio files ready for deletion.
         """
-        episodes = self.repository.get_episodes_ready_for_cleanup(limit=1000)
-        return len(episodes)
+        return self.repository.count_episodes_ready_for_cleanup()
 
     def _cleanup_episode(self, episode: Episode) -> None:
         """Delete audio file for a single episode.
@@ -61,6 +64,17 @@ class CleanupWorker(WorkerInterface):
             # mark_audio_cleaned_up handles file deletion and clearing the path
             self.repository.mark_audio_cleaned_up(episode.id)
 
+    def _delete_audio_files(self, episode: Episode) -> None:
+        """Delete an episode's downloaded and preprocessed audio from disk.
+
+        Args:
+            episode: Episode to clean up.
+        """
+        for path in (episode.local_file_path, episode.preprocessed_audio_path):
+            if path and os.path.exists(path):
+                os.remove(path)
+                logger.info(f"Deleted audio file: {path}")
+
     def process_batch(self, limit: int) -> WorkerResult:
         """Clean up a batch of processed episode audio files.
 
@@ -81,16 +95,25 @@ class CleanupWorker(WorkerInterface):
 
             logger.info(f"Processing {len(episodes)} episodes for cleanup")
 
-            for episode in episodes:
-                try:
-                    self._cleanup_episode(episode)
-                    result.processed += 1
-
-                except Exception as e:
-                    error_msg = f"Episode {episode.id}: {e}"
-                    logger.exception(error_msg)
-                    result.failed += 1
-                    result.errors.append(error_msg)
+            # Delete files here and clear their paths in small transactions,
+            # so the database never lags far behind the disk
+            with self.repository.unit_of_work(flush_every=CLEANUP_FLUSH_EVERY) as batch:
+                for episode in episodes:
+                    try:
+                        self._delete_audio_files(episode)
+                        batch.update(
+                            episode.id,
+                            local_file_path=None,
+                            preprocessed_audio_path=None,
+                            speech_regions=None,
+                        )
+                        result.processed += 1
+
+                    except Exception as e:
+                        error_msg = f"Episode {episode.id}: {e}"
+                        logger.exception(error_msg)
+                        result.failed += 1
+                        result.errors.append(error_msg)
 
         except Exception as e:
             logger.exception(f"Cleanup batch failed: {e}")
@@ -74,8 +74,7 @@ class DownloadWorker(WorkerInterface):
         Returns:
             Number of episodes waiting to be downloaded.
         """
-        episodes = self.repository.get_episodes_pending_download(limit=1000)
-        return len(episodes)
+        return self.repository.count_episodes_pending_download()
 
     def process_batch(self, limit: int) -> WorkerResult:
         """Download a batch of pending episodes.
@@ -89,7 +88,7 @@ class DownloadWorker(WorkerInterface):
         result = WorkerResult()
 
         try:
-            download_result = self.downloader.download_pending(limit=limit)
+            download_result = self.downloader.download_pending(limit=limit, bulk_status=True)
 
             result.processed = download_result.get("downloaded", 0)
             result.failed = download_result.get("failed", 0)
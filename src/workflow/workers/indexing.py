@@ -5,6 +5,7 @@ Uploads transcripts to Gemini File Search for semantic search.
 
 import logging
 import os
+from datetime import UTC, datetime
 from typing import Any
 
 from src.config import Config
@@ -160,35 +161,43 @@ class IndexingWorker(WorkerInterface):
 
             logger.info(f"Processing {len(episodes)} episodes for indexing")
 
-            for episode in episodes:
-                try:
-                    # Mark as processing
-                    self.repository.mark_indexing_started(episode.id)
-
-                    # Index
-                    resource_name, display_name = self._index_episode(episode)
-
-                    # Mark as complete
-                    self.repository.mark_indexing_complete(
-                        episode_id=episode.id,
-                        resource_name=resource_name,
-                        display_name=display_name,
-                    )
-                    result.processed += 1
-
-                except FileNotFoundError as e:
-                    error_msg = str(e)
-                    logger.exception(f"Episode {episode.id} indexing failed: file not found")
-                    self.repository.mark_indexing_failed(episode.id, error_msg)
-                    result.failed += 1
-                    result.errors.append(f"Episode {episode.id}: {error_msg}")
-
-                except Exception as e:
-                    error_msg = str(e)
-                    logger.exception(f"Episode {episode.id} indexing failed")
-                    self.repository.mark_indexing_failed(episode.id, error_msg)
-                    result.failed += 1
-                    result.errors.append(f"Episode {episode.id}: {error_msg}")
+            # One UPDATE for the whole batch. Each outcome is written as soon as
+            # its upload finishes, so a crash mid-batch cannot lose uploads that
+            # already happened; rows left "uploading" are requeued by the
+            # orchestrator once stale.
+            self.repository.mark_many(
+                "indexing", [episode.id for episode in episodes], "uploading"
+            )
+
+            with self.repository.unit_of_work(flush_every=1) as batch:
+                for episode in episodes:
+                    try:
+                        resource_name, display_name = self._index_episode(episode)
+
+                        batch.mark(
+                            "indexing",
+                            episode.id,
+                            "indexed",
+                            file_search_resource_name=resource_name,
+                            file_search_display_name=display_name,
+                            file_search_uploaded_at=datetime.now(UTC),
+                            file_search_error=None,
+                        )
+                        result.processed += 1
+
+                    except FileNotFoundError as e:
+                        error_msg = str(e)
+                        logger.exception(f"Episode {episode.id} indexing failed: file not found")
+                        batch.mark("indexing", episode.id, "failed", file_search_error=error_msg)
+                        result.failed += 1
+                        result.errors.append(f"Episode {episode.id}: {error_msg}")
+
+                    except Exception as e:
+                        error_msg = str(e)
+                        logger.exception(f"Episode {episode.id} indexing failed")
+                        batch.mark("indexing", episode.id, "failed", file_search_error=error_msg)
+                        result.failed += 1
+                        result.errors.append(f"Episode {episode.id}: {error_msg}")
 
         except Exception as e:
             logger.exception("Indexing batch failed")
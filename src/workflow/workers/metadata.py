@@ -19,6 +19,7 @@ from src.db.models import Episode
 from src.db.repository import PodcastRepositoryInterface
 from src.prompt_manager import PromptManager
 from src.schemas import PodcastMetadata
+from src.utils.metrics import GEMINI_CALL_SECONDS
 from src.workflow.workers.base import WorkerInterface, WorkerResult
 
 logger = logging.getLogger(__name__)
@@ -176,14 +177,15 @@ class MetadataWorker(WorkerInterface):
             self._rate_limiter.acquire()
             logger.debug("Making AI metadata extraction request")
 
-            response = client.models.generate_content(
-                model=self.config.GEMINI_MODEL_FLASH,
-                contents=prompt,
-                config={
-                    "response_mime_type": "application/json",
-                    "response_schema": PodcastMetadata,
-                },
-            )
+            with GEMINI_CALL_SECONDS.time(operation="metadata"):
+                response = client.models.generate_content(
+                    model=self.config.GEMINI_MODEL_FLASH,
+                    contents=prompt,
+                    config={
+                        "response_mime_type": "application/json",
+                        "response_schema": PodcastMetadata,
+                    },
+                )
 
             if response.text:
                 data = json.loads(response.text)
@@ -264,8 +266,7 @@ class MetadataWorker(WorkerInterface):
         Returns:
             Number of episodes waiting for metadata.
         """
-        episodes = self.repository.get_episodes_pending_metadata(limit=1000)
-        return len(episodes)
+        return self.repository.count_episodes_pending_metadata()
 
     def _process_episode(self, episode: Episode) -> MergedMetadata:
         """Process a single episode for metadata extraction.
@@ -0,0 +1,218 @@
+"""Audio preprocessing worker.
+
+Decodes downloaded episodes to 16 kHz mono PCM and detects speech regions
+ahead of transcription. The transcription worker then consumes the ready
+arrays instead of decoding the MP3 and running VAD on its own thread.
+"""
+
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from src.config import Config
+from src.db.models import Episode
+from src.db.repository import PodcastRepositoryInterface
+from src.workflow.workers.base import WorkerInterface, WorkerResult
+
+logger = logging.getLogger(__name__)
+
+SAMPLE_RATE = 16000
+PREPROCESSED_SUFFIX = ".pcm16k.npy"
+
+# Speech regions are capped at Whisper's 30 s window so the same regions can
+# be passed to BatchedInferencePipeline as clip_timestamps
+MAX_REGION_SECONDS = 30
+MIN_SILENCE_MS = 160
+
+
+def preprocess_audio(audio_path: str, output_path: str) -> list[list[float]]:
+    """Decode an audio file to 16 kHz mono PCM and detect speech regions.
+
+    The PCM samples are saved as an int16 .npy file (half the size of
+    float32). The file is written under a temporary name and renamed, so
+    readers never see a partial file.
+
+    Args:
+        audio_path: Path to the downloaded audio file.
+        output_path: Path for the .npy output.
+
+    Returns:
+        Speech regions as [start, end] pairs in seconds.
+    """
+    import numpy as np
+    from faster_whisper.audio import decode_audio
+    from faster_whisper.vad import VadOptions, get_speech_timestamps
+
+    audio = decode_audio(audio_path, sampling_rate=SAMPLE_RATE)
+    regions = get_speech_timestamps(
+        audio,
+        VadOptions(
+            max_speech_duration_s=MAX_REGION_SECONDS,
+            min_silence_duration_ms=MIN_SILENCE_MS,
+        ),
+    )
+
+    pcm = (np.clip(audio, -1.0, 1.0) * 32767).astype(np.int16)
+    tmp_path = output_path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        np.save(f, pcm)
+    os.replace(tmp_path, output_path)
+
+    return [
+        [round(region["start"] / SAMPLE_RATE, 3), round(region["end"] / SAMPLE_RATE, 3)]
+        for region in regions
+    ]
+
+
+def open_preprocessed_audio(path: str):
+    """Memory-map audio written by preprocess_audio() without reading the samples.
+
+    Args:
+        path: Path to the .npy file.
+
+    Returns:
+        1-D int16 numpy memmap at 16 kHz.
+
+    Raises:
+        ValueError, EOFError, OSError: If the file is truncated, corrupt or
+            not 1-D int16 PCM.
+    """
+    import numpy as np
+
+    pcm = np.load(path, mmap_mode="r")
+    if pcm.dtype != np.int16 or pcm.ndim != 1:
+        raise ValueError(f"Expected 1-D int16 PCM, got {pcm.dtype} with shape {pcm.shape}")
+    return pcm
+
+
+def load_preprocessed_audio(path: str):
+    """Load audio written by preprocess_audio() as float32 samples for faster-whisper.
+
+    The samples are converted straight from the memory map into a single
+    float32 array.
+
+    Args:
+        path: Path to the .npy file.
+
+    Returns:
+        1-D float32 numpy array at 16 kHz.
+
+    Raises:
+        ValueError, EOFError, OSError: If the file is truncated, corrupt or
+            not 1-D int16 PCM.
+    """
+    import numpy as np
+
+    return np.divide(open_preprocessed_audio(path), 32768.0, dtype=np.float32)
+
+
+class PreprocessWorker(WorkerInterface):
+    """Worker that prepares downloaded audio for transcription.
+
+    Runs between download and transcription, typically on a background
+    thread while the previous episode is being transcribed. Episodes that
+    fail preprocessing are still transcribed from the original file.
+    """
+
+    def __init__(
+        self,
+        config: Config,
+        repository: PodcastRepositoryInterface,
+        preprocess_workers: int = 2,
+    ):
+        """Initialize the preprocessing worker.
+
+        Args:
+            config: Application configuration.
+            repository: Database repository for episode operations.
+            preprocess_workers: Number of episodes decoded concurrently.
+        """
+        self.config = config
+        self.repository = repository
+        self._preprocess_workers = max(1, preprocess_workers)
+
+    @property
+    def name(self) -> str:
+        """Human-readable name for this worker."""
+        return "Preprocess"
+
+    def get_pending_count(self) -> int:
+        """Get the count of downloaded episodes awaiting preprocessing.
+
+        Returns:
+            Number of episodes waiting to be preprocessed.
+        """
+        return self.repository.count_episodes_pending_preprocessing()
+
+    def _build_output_path(self, local_file_path: str) -> str:
+        """Build the preprocessed audio path next to the downloaded file."""
+        return os.path.splitext(local_file_path)[0] + PREPROCESSED_SUFFIX
+
+    def _preprocess_episode(self, episode: Episode) -> None:
+        """Preprocess a single episode and record the result.
+
+        Args:
+            episode: Episode to preprocess.
+        """
+        output_path = self._build_output_path(episode.local_file_path)
+        speech_regions = preprocess_audio(episode.local_file_path, output_path)
+
+        if self.repository.mark_preprocessing_complete(
+            episode.id, output_path, speech_regions
+        ):
+            logger.info(
+                f"Preprocessed episode {episode.id}: "
+                f"{len(speech_regions)} speech regions"
+            )
+        else:
+            # Transcription started from the original file in the meantime
+            logger.info(
+                f"Episode {episode.id} already transcribing, discarding preprocessed audio"
+            )
+            os.remove(output_path)
+
+    def process_batch(self, limit: int) -> WorkerResult:
+        """Preprocess a batch of downloaded episodes.
+
+        Args:
+            limit: Maximum number of episodes to preprocess.
+
+        Returns:
+            WorkerResult with preprocessing statistics.
+        """
+        result = WorkerResult()
+
+        try:
+            episodes = self.repository.get_episodes_pending_preprocessing(limit=limit)
+
+            if not episodes:
+                return result
+
+            logger.info(f"Preprocessing audio for {len(episodes)} episodes")
+
+            def run(episode: Episode) -> str | None:
+                try:
+                    self._preprocess_episode(episode)
+                    return None
+                except Exception as e:
+                    logger.exception(f"Episode {episode.id} preprocessing failed")
+                    self.repository.mark_preprocessing_failed(episode.id)
+                    return f"Episode {episode.id}: {e}"
+
+            with ThreadPoolExecutor(
+                max_workers=min(self._preprocess_workers, len(episodes)),
+                thread_name_prefix="preprocess",
+            ) as executor:
+                for error in executor.map(run, episodes):
+                    if error is None:
+                        result.processed += 1
+                    else:
+                        result.failed += 1
+                        result.errors.append(error)
+
+        except Exception as e:
+            logger.exception(f"Preprocess batch failed: {e}")
+            result.failed += 1
+            result.errors.append(str(e))
+
+        return result
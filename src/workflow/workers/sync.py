@@ -1,13 +1,16 @@
 """Sync worker for RSS feed synchronization.
 
-Syncs all subscribed podcast feeds to discover new episodes.
+Syncs subscribed podcast feeds that are due for a check to discover new
+episodes; each feed is scheduled from its own publishing cadence.
 """
 
 import logging
+from datetime import UTC, datetime
 
 from src.config import Config
 from src.db.repository import PodcastRepositoryInterface
 from src.podcast.feed_sync import FeedSyncService
+from src.workflow.events import EPISODES_ADDED, EventBus
 from src.workflow.workers.base import WorkerInterface, WorkerResult
 
 logger = logging.getLogger(__name__)
@@ -24,15 +27,18 @@ class SyncWorker(WorkerInterface):
         self,
         config: Config,
         repository: PodcastRepositoryInterface,
+        event_bus: EventBus | None = None,
     ):
         """Initialize the sync worker.
 
         Args:
             config: Application configuration.
             repository: Database repository for podcast operations.
+            event_bus: Bus notified when new episodes are discovered.
         """
         self.config = config
         self.repository = repository
+        self.event_bus = event_bus
         self._feed_sync_service: FeedSyncService | None = None
 
     @property
@@ -47,23 +53,30 @@ class SyncWorker(WorkerInterface):
             self._feed_sync_service = FeedSyncService(
                 repository=self.repository,
                 download_directory=self.config.PODCAST_DOWNLOAD_DIRECTORY,
+                max_concurrent=self.config.FEED_SYNC_MAX_CONCURRENT,
+                max_per_host=self.config.FEED_SYNC_MAX_PER_HOST,
+                parse_workers=self.config.FEED_SYNC_PARSE_WORKERS,
+            min_check_interval_minutes=self.config.FEED_SYNC_MIN_INTERVAL_MINUTES,
+            max_check_interval_hours=self.config.FEED_SYNC_MAX_INTERVAL_HOURS,
+            stop_after_known=self.config.FEED_SYNC_STOP_AFTER_KNOWN,
+            reconcile_interval_hours=self.config.FEED_SYNC_RECONCILE_HOURS,
             )
         return self._feed_sync_service
 
     def get_pending_count(self) -> int:
-        """Get the count of podcasts with subscribers to sync.
+        """Get the count of podcasts due for a feed check.
 
         Returns:
-            Number of podcasts with at least one subscriber.
+            Number of podcasts with at least one subscriber whose next check is due.
         """
-        podcasts = self.repository.list_podcasts_with_subscribers()
+        podcasts = self.repository.list_podcasts_due_for_sync(datetime.now(UTC))
         return len(podcasts)
 
     def process_batch(self, limit: int = 0) -> WorkerResult:
-        """Sync podcast feeds for podcasts with subscribers.
+        """Sync podcast feeds that are due for podcasts with subscribers.
 
         Args:
-            limit: Ignored for sync worker (always syncs all feeds).
+            limit: Ignored for sync worker (always syncs every due feed).
 
         Returns:
             WorkerResult with sync statistics.
@@ -71,7 +84,7 @@ class SyncWorker(WorkerInterface):
         result = WorkerResult()
 
         try:
-            sync_result = self.feed_sync_service.sync_podcasts_with_subscribers()
+            sync_result = self.feed_sync_service.sync_due_podcasts()
 
             result.processed = sync_result.get("synced", 0)
             result.failed = sync_result.get("failed", 0)
@@ -80,6 +93,8 @@ class SyncWorker(WorkerInterface):
             new_episodes = sync_result.get("new_episodes", 0)
             if new_episodes > 0:
                 logger.info(f"Discovered {new_episodes} new episodes")
+                if self.event_bus is not None:
+                    self.event_bus.publish(EPISODES_ADDED)
 
             # Collect error messages
             for podcast_result in sync_result.get("results", []):
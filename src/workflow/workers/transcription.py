@@ -11,15 +11,32 @@ for detailed benchmark results.
 import gc
 import logging
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any
 
 from src.config import Config
 from src.db.models import Episode
 from src.db.repository import PodcastRepositoryInterface
+from src.utils.metrics import TRANSCRIPTION_REALTIME_FACTOR, record_stage
 from src.workflow.workers.base import WorkerInterface, WorkerResult
+from src.workflow.workers.preprocess import load_preprocessed_audio, open_preprocessed_audio
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class TranscriptionOutcome:
+    """Result of transcribing one episode in batched mode."""
+
+    episode: Episode
+    transcript_text: str | None
+    # Processing seconds per second of audio (< 1.0 is faster than realtime).
+    # None when no decoding happened, e.g. the transcript already existed.
+    realtime_factor: float | None = None
+
+
 class TranscriptionWorker(WorkerInterface):
     """Worker that transcribes downloaded episode audio files.
 
@@ -30,41 +47,90 @@ class TranscriptionWorker(WorkerInterface):
         WHISPER_MODEL: Model size (default: "medium")
         WHISPER_DEVICE: Device to use (default: "cuda")
         WHISPER_COMPUTE_TYPE: Compute type (default: "float16")
+
+    Batched mode (transcribe_many) runs up to ``num_workers`` transcribe()
+    streams at once against a single model loaded with that many CTranslate2
+    workers. With ``batch_size`` > 0 each stream additionally decodes through
+    faster-whisper's BatchedInferencePipeline.
+
+    With ``num_processes`` > 0 decoding moves into a
+    TranscriptionProcessPool: each process holds its own model, and crashed
+    or timed-out processes are restarted without taking down the caller.
+
+    Segments are persisted to the database as they are decoded. If an
+    episode's transcription is interrupted, the next attempt keeps the
+    stored segments and resumes decoding after the last one.
     """
 
+    # Decoded segments buffered before each database write
+    SEGMENT_FLUSH_SIZE = 20
+
     def __init__(
         self,
         config: Config,
         repository: PodcastRepositoryInterface,
+        worker_id: str | None = None,
+        lease_seconds: int | None = None,
+        num_workers: int = 1,
+        batch_size: int = 0,
+        num_processes: int = 0,
+        episode_timeout_seconds: float | None = None,
     ):
         """Initialize the transcription worker.
 
         Args:
             config: Application configuration.
             repository: Database repository for episode operations.
+            worker_id: Identifier used when the episode was claimed with
+                claim_next_for_transcription(). When set together with
+                lease_seconds, the claim is renewed while decoding.
+            lease_seconds: Lease length to renew the claim with.
+            num_workers: Number of episodes transcribe_many() decodes
+                concurrently.
+            batch_size: Segments per forward pass for faster-whisper's
+                batched inference pipeline; 0 decodes sequentially.
+            num_processes: Transcription processes to run the model in;
+                0 keeps the model in this process.
+            episode_timeout_seconds: Per-episode limit in process-pool mode.
         """
         self.config = config
         self.repository = repository
         self._model = None
+        self._pipeline = None
+        self._worker_id = worker_id
+        self._lease_seconds = lease_seconds
+        self._num_workers = max(1, num_workers)
+        self._batch_size = batch_size
+        self._num_processes = num_processes
+        self._episode_timeout_seconds = episode_timeout_seconds
+        self._process_pool = None
+        # Realtime factor of the most recent decode, keyed by episode ID
+        self._realtime_factors: dict[str, float] = {}
 
     @property
     def name(self) -> str:
         """Human-readable name for this worker."""
         return "Transcription"
 
+    def _model_settings(self) -> tuple[str, str, str]:
+        """Resolve (model_size, device, compute_type) from config."""
+        model_size = self.config.WHISPER_MODEL
+        device = self.config.WHISPER_DEVICE
+        compute_type = self.config.WHISPER_COMPUTE_TYPE
+
+        # CPU doesn't support float16, use int8 instead
+        if device == "cpu" and compute_type == "float16":
+            logger.info("CPU device: switching compute_type from float16 to int8")
+            compute_type = "int8"
+
+        return model_size, device, compute_type
+
     def _get_model(self):
         """Lazily load the faster-whisper model."""
         if self._model is None:
             from faster_whisper import WhisperModel
 
-            model_size = self.config.WHISPER_MODEL
-            device = self.config.WHISPER_DEVICE
-            compute_type = self.config.WHISPER_COMPUTE_TYPE
-
-            # CPU doesn't support float16, use int8 instead
-            if device == "cpu" and compute_type == "float16":
-                logger.info("CPU device: switching compute_type from float16 to int8")
-                compute_type = "int8"
+            model_size, device, compute_type = self._model_settings()
 
             logger.info(
                 f"Loading faster-whisper model ({model_size}) on {device} "
@@ -74,13 +140,62 @@ class TranscriptionWorker(WorkerInterface):
                 model_size,
                 device=device,
                 compute_type=compute_type,
+                num_workers=self._num_workers,
             )
         return self._model
 
+    def _get_process_pool(self):
+        """Lazily start the transcription process pool."""
+        if self._process_pool is None:
+            from src.workflow.transcription_pool import TranscriptionProcessPool
+
+            model_size, device, compute_type = self._model_settings()
+            self._process_pool = TranscriptionProcessPool(
+                model_size,
+                device,
+                compute_type,
+                num_processes=self._num_processes,
+                episode_timeout_seconds=self._episode_timeout_seconds,
+            )
+            self._process_pool.start()
+        return self._process_pool
+
+    def _get_pipeline(self):
+        """Get the object to call transcribe() on.
+
+        Returns the process pool when configured. Otherwise returns the plain
+        model, or a BatchedInferencePipeline wrapping it when a batch size is
+        configured and the installed faster-whisper has one.
+        """
+        if self._num_processes > 0:
+            return self._get_process_pool()
+
+        model = self._get_model()
+        if self._batch_size <= 0:
+            return model
+
+        if self._pipeline is None:
+            try:
+                from faster_whisper import BatchedInferencePipeline
+            except ImportError:
+                logger.warning(
+                    "Installed faster-whisper has no BatchedInferencePipeline "
+                    "(requires >= 1.1); decoding sequentially"
+                )
+                self._batch_size = 0
+                return model
+            self._pipeline = BatchedInferencePipeline(model=model)
+        return self._pipeline
+
     def _release_model(self) -> None:
         """Release the faster-whisper model from memory."""
+        if self._process_pool is not None:
+            self._process_pool.stop()
+            self._process_pool = None
+
         if self._model is not None:
             logger.info("Releasing faster-whisper model from memory")
+            self._pipeline = None
             del self._model
             self._model = None
 
@@ -101,7 +216,7 @@ class TranscriptionWorker(WorkerInterface):
         Use this in pipeline mode to load the model once at startup
         and keep it loaded across multiple transcriptions.
         """
-        self._get_model()
+        self._get_pipeline()
         logger.info("faster-whisper model loaded for continuous transcription")
 
     def unload_model(self) -> None:
@@ -117,7 +232,7 @@ class TranscriptionWorker(WorkerInterface):
         Returns:
             True if model is loaded, False otherwise.
         """
-        return self._model is not None
+        return self._model is not None or self._process_pool is not None
 
     def _build_transcript_path(self, local_file_path: str) -> str:
         """Build the transcript file path from the audio file path.
@@ -137,8 +252,7 @@ class TranscriptionWorker(WorkerInterface):
         Returns:
             Number of episodes waiting to be transcribed.
         """
-        episodes = self.repository.get_episodes_pending_transcription(limit=1000)
-        return len(episodes)
+        return self.repository.get_download_buffer_count()
 
     def _transcribe_episode(self, episode: Episode) -> str:
         """Transcribe a single episode.
@@ -163,12 +277,13 @@ class TranscriptionWorker(WorkerInterface):
             )
 
         # Check if transcript already exists in database
-        if episode.transcript_text:
+        existing_text = self.repository.get_transcript_text(episode.id)
+        if existing_text:
             logger.info(
                 f"Transcript already exists in database for episode {episode.id}, "
                 f"returning existing text"
             )
-            return episode.transcript_text
+            return existing_text
 
         # Build transcript path for backward compatibility check
         transcript_path = self._build_transcript_path(episode.local_file_path)
@@ -186,24 +301,160 @@ class TranscriptionWorker(WorkerInterface):
                 logger.warning(f"Failed to read legacy transcript {transcript_path}: {e}")
                 # Continue to transcribe if file read fails
 
-        logger.info(f"Transcribing episode: {episode.title}")
+        # Resume after the segments stored by an interrupted earlier attempt
+        stored_segments = self.repository.get_transcript_segments(episode.id)
+        transcript_parts = [segment.text for segment in stored_segments]
+        resume_from = stored_segments[-1].end_seconds if stored_segments else 0.0
+
+        if resume_from > 0:
+            logger.info(
+                f"Resuming episode {episode.title} at {resume_from:.1f}s "
+                f"({len(stored_segments)} segments already stored)"
+            )
+        else:
+            logger.info(f"Transcribing episode: {episode.title}")
 
         # Get the faster-whisper model and transcribe
-        model = self._get_model()
-        segments, _info = model.transcribe(
-            episode.local_file_path,
-            beam_size=5,
-            language="en",
-            vad_filter=True,  # Filter out silence for cleaner transcripts
-        )
-
-        # Collect all segment texts (segments is a generator)
-        transcript_parts = [segment.text.strip() for segment in segments]
+        pipeline = self._get_pipeline()
+        audio, speech_regions = self._audio_input(episode)
+        batched = self._batch_size > 0
+        transcribe_kwargs = {
+            "beam_size": 5,
+            "language": "en",
+            "vad_filter": True,  # Filter out silence for cleaner transcripts
+        }
+
+        if speech_regions:
+            # Decode only the precomputed speech regions past the resume point
+            clips = [
+                [max(start, resume_from), end]
+                for start, end in speech_regions
+                if end > resume_from
+            ]
+            if not clips:
+                return " ".join(transcript_parts)
+            transcribe_kwargs["vad_filter"] = False
+            if batched:
+                transcribe_kwargs["clip_timestamps"] = [
+                    {"start": start, "end": end} for start, end in clips
+                ]
+            else:
+                transcribe_kwargs["clip_timestamps"] = [t for clip in clips for t in clip]
+        elif resume_from > 0:
+            # BatchedInferencePipeline takes clip ranges in a different
+            # form, so the remainder is decoded sequentially. Clip timestamps
+            # are positions in the original audio only without VAD, which
+            # faster-whisper skips when clips are given; turn it off
+            # explicitly so the stated settings match what runs.
+            transcribe_kwargs["clip_timestamps"] = [resume_from]
+            transcribe_kwargs["vad_filter"] = False
+            batched = False
+
+        if batched:
+            transcribe_kwargs["batch_size"] = self._batch_size
+        elif self._process_pool is None:
+            pipeline = self._get_model()
+
+        started = time.monotonic()
+        segments, info = pipeline.transcribe(audio, **transcribe_kwargs)
+
+        # Collect and persist segments as they are decoded (segments is a
+        # generator, so decoding happens lazily inside this loop)
+        pending_segments = []
+        last_renewal = time.monotonic()
+        for segment in segments:
+            text = segment.text.strip()
+            transcript_parts.append(text)
+            pending_segments.append((segment.start, segment.end, text))
+            if len(pending_segments) >= self.SEGMENT_FLUSH_SIZE:
+                self.repository.append_transcript_segments(episode.id, pending_segments)
+                pending_segments = []
+            last_renewal = self._maybe_renew_lease(episode.id, last_renewal)
+        self.repository.append_transcript_segments(episode.id, pending_segments)
         transcript_text = " ".join(transcript_parts)
 
-        logger.info(f"Transcription complete for episode {episode.id}")
+        elapsed = time.monotonic() - started
+        audio_seconds = getattr(info, "duration", None)
+        if isinstance(audio_seconds, (int, float)) and audio_seconds > resume_from:
+            audio_seconds -= resume_from
+            realtime_factor = elapsed / audio_seconds
+            self._realtime_factors[episode.id] = realtime_factor
+            logger.info(
+                f"Transcription complete for episode {episode.id} "
+                f"({audio_seconds:.0f}s audio in {elapsed:.1f}s, "
+                f"realtime factor {realtime_factor:.3f})"
+            )
+        else:
+            logger.info(f"Transcription complete for episode {episode.id}")
         return transcript_text
 
+    def _audio_input(self, episode: Episode) -> tuple[Any, list[list[float]] | None]:
+        """Pick the audio to decode for an episode.
+
+        Uses the preprocessed 16 kHz PCM and its speech regions when the
+        preprocessing stage has produced them, else (or if that file is
+        unreadable) the downloaded file.
+
+        Args:
+            episode: Episode to transcribe.
+
+        Returns:
+            Tuple of (audio path or samples, speech regions or None).
+        """
+        path = episode.preprocessed_audio_path
+        if path and os.path.exists(path):
+            try:
+                if self._num_processes > 0:
+                    # Loaded inside the pool process rather than pickled across;
+                    # mapping it here checks the file is intact
+                    open_preprocessed_audio(path)
+                    return path, episode.speech_regions
+                return load_preprocessed_audio(path), episode.speech_regions
+            except (ValueError, EOFError, OSError) as e:
+                logger.warning(
+                    f"Preprocessed audio for episode {episode.id} is unreadable, "
+                    f"decoding the downloaded file instead: {e}"
+                )
+        return episode.local_file_path, None
+
+    def _maybe_renew_lease(self, episode_id: str, last_renewal: float) -> float:
+        """Renew the episode's transcription lease once a third of it has elapsed.
+
+        Args:
+            episode_id: ID of the episode being transcribed.
+            last_renewal: time.monotonic() value of the previous renewal.
+
+        Returns:
+            The monotonic time of the latest renewal.
+        """
+        if not self._worker_id or not self._lease_seconds:
+            return last_renewal
+
+        now = time.monotonic()
+        if now - last_renewal < self._lease_seconds / 3:
+            return last_renewal
+
+        if not self.repository.renew_transcription_lease(
+            episode_id, self._worker_id, self._lease_seconds
+        ):
+            logger.warning(
+                f"Lost transcription lease for episode {episode_id}; "
+                f"another worker may also be transcribing it"
+            )
+        return now
+
+    def _discard_preprocessed_audio(self, episode: Episode) -> None:
+        """Delete preprocessed audio once the episode no longer needs it."""
+        if not episode.preprocessed_audio_path:
+            return
+        try:
+            self.repository.clear_preprocessed_audio(episode.id)
+        except Exception:
+            logger.warning(
+                f"Failed to remove preprocessed audio for episode {episode.id}",
+                exc_info=True,
+            )
+
     def transcribe_single(self, episode: Episode) -> str | None:
         """Transcribe a single episode without releasing the model.
 
@@ -221,6 +472,18 @@ class TranscriptionWorker(WorkerInterface):
         Returns:
             Transcript text if successful, None on failure.
         """
+        return self._transcribe_outcome(episode).transcript_text
+
+    def _transcribe_outcome(self, episode: Episode) -> TranscriptionOutcome:
+        """Transcribe an episode, update its status and capture timing.
+
+        Args:
+            episode: Episode to transcribe.
+
+        Returns:
+            TranscriptionOutcome; transcript_text is None on failure.
+        """
+        started = time.monotonic()
         try:
             self.repository.mark_transcript_started(episode.id)
             transcript_text = self._transcribe_episode(episode)
@@ -228,19 +491,55 @@ class TranscriptionWorker(WorkerInterface):
                 episode_id=episode.id,
                 transcript_text=transcript_text,
             )
-            return transcript_text
+            self._discard_preprocessed_audio(episode)
+            realtime_factor = self._realtime_factors.pop(episode.id, None)
+            record_stage("transcribe", time.monotonic() - started, True)
+            if realtime_factor is not None:
+                TRANSCRIPTION_REALTIME_FACTOR.observe(realtime_factor)
+            return TranscriptionOutcome(
+                episode=episode,
+                transcript_text=transcript_text,
+                realtime_factor=realtime_factor,
+            )
 
         except FileNotFoundError as e:
             error_msg = str(e)
             logger.exception(f"Episode {episode.id} transcription failed: file not found")
             self.repository.mark_transcript_failed(episode.id, error_msg)
-            return None
 
         except Exception as e:
             error_msg = str(e)
             logger.exception(f"Episode {episode.id} transcription failed")
             self.repository.mark_transcript_failed(episode.id, error_msg)
-            return None
+
+        self._realtime_factors.pop(episode.id, None)
+        record_stage("transcribe", time.monotonic() - started, False)
+        return TranscriptionOutcome(episode=episode, transcript_text=None)
+
+    def transcribe_many(self, episodes: list[Episode]) -> list[TranscriptionOutcome]:
+        """Transcribe several episodes concurrently without releasing the model.
+
+        Runs up to num_workers transcriptions at once. Each
+        episode's database status is updated exactly as in transcribe_single.
+
+        Args:
+            episodes: Episodes to transcribe, typically claimed from the
+                download buffer.
+
+        Returns:
+            One TranscriptionOutcome per episode, in input order.
+        """
+        if not episodes:
+            return []
+
+        # Load the model before fanning out so threads don't race to load it
+        self._get_pipeline()
+
+        max_workers = min(self._num_workers, len(episodes))
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="transcribe"
+        ) as executor:
+            return list(executor.map(self._transcribe_outcome, episodes))
 
     def process_batch(self, limit: int) -> WorkerResult:
         """Transcribe a batch of pending episodes.
@@ -276,6 +575,7 @@ class TranscriptionWorker(WorkerInterface):
                         episode_id=episode.id,
                         transcript_text=transcript_text,
                     )
+                    self._discard_preprocessed_audio(episode)
                     result.processed += 1
 
                 except FileNotFoundError as e:
@@ -300,5 +600,6 @@ class TranscriptionWorker(WorkerInterface):
         finally:
             # Release model after batch to free memory
             self._release_model()
+            self._realtime_factors.clear()
 
         return result
@@ -203,7 +203,7 @@ class TestListAdminEpisodes:
         mock_ep.metadata_error = None
         mock_ep.file_search_error = None
 
-        mock_repository.list_episodes.return_value = [mock_ep]
+        mock_repository.list_episodes_page.return_value = ([mock_ep], None)
         mock_repository.count_episodes.return_value = 1
 
         response = client.get("/api/admin/episodes?filter_type=pending_download")
@@ -230,7 +230,7 @@ class TestListAdminEpisodes:
         mock_ep.metadata_error = None
         mock_ep.file_search_error = None
 
-        mock_repository.list_episodes.return_value = [mock_ep]
+        mock_repository.list_episodes_page.return_value = ([mock_ep], None)
         mock_repository.count_episodes.return_value = 1
 
         response = client.get("/api/admin/episodes?filter_type=download_failed")
@@ -256,7 +256,7 @@ class TestListAdminEpisodes:
         mock_ep.metadata_error = None
         mock_ep.file_search_error = None
 
-        mock_repository.list_episodes.return_value = [mock_ep]
+        mock_repository.list_episodes_page.return_value = ([mock_ep], None)
         mock_repository.count_episodes.return_value = 1
 
         response = client.get("/api/admin/episodes?filter_type=pending_download")
@@ -279,6 +279,30 @@ class TestListAdminEpisodes:
         assert data["limit"] == 10
         assert data["offset"] == 5
 
+    def test_list_episodes_cursor(self, client, mock_repository):
+        """Test keyset pagination passes the cursor through and returns the next one."""
+        mock_repository.list_episodes_page.return_value = ([], "next-page")
+        mock_repository.count_episodes.return_value = 0
+
+        response = client.get(
+            "/api/admin/episodes?filter_type=pending_download&limit=10&cursor=abc"
+        )
+
+        assert response.status_code == 200
+        assert response.json()["next_cursor"] == "next-page"
+        mock_repository.list_episodes_page.assert_called_with(
+            download_status="pending", limit=10, cursor="abc"
+        )
+        mock_repository.list_episodes.assert_not_called()
+
+    def test_list_episodes_invalid_cursor(self, client, mock_repository):
+        """Test a malformed cursor is rejected."""
+        mock_repository.list_episodes_page.side_effect = ValueError("Invalid cursor: x")
+
+        response = client.get("/api/admin/episodes?filter_type=pending_download&cursor=x")
+
+        assert response.status_code == 400
+
 
 class TestRetryEpisode:
     """Tests for POST /api/admin/episodes/{episode_id}/retry endpoint."""
@@ -5,9 +5,13 @@ from unittest.mock import MagicMock, patch
 import pytest
 from fastapi.testclient import TestClient
 
+from src.services.audio_storage import LocalAudioStorage, audio_etag, briefing_audio_key
 from src.web.app import _parse_range, app
 from src.web.auth import get_current_user
 
+AUDIO = b"\x00\x01\x02\x03" * 25  # 100 bytes
+AUDIO_KEY = briefing_audio_key("briefing-123", AUDIO, "audio/mpeg")
+
 
 @pytest.fixture
 def client():
@@ -91,7 +95,8 @@ class TestAudioEndpointAuth:
         try:
             briefing = MagicMock()
             briefing.user_id = "user-2"
-            briefing.audio_data = b"mp3"
+            briefing.audio_storage_key = AUDIO_KEY
+            briefing.audio_size_bytes = 100
             briefing.audio_status = "ready"
             briefing.audio_mime_type = "audio/mpeg"
             mock_repo.get_briefing_by_id.return_value = briefing
@@ -108,7 +113,7 @@ class TestAudioEndpointAuth:
         try:
             briefing = MagicMock()
             briefing.user_id = "user-1"
-            briefing.audio_data = None
+            briefing.audio_size_bytes = None
             briefing.audio_status = None
             mock_repo.get_briefing_by_id.return_value = briefing
 
@@ -118,69 +123,131 @@ class TestAudioEndpointAuth:
             _clear_auth()
 
 
+class _RemoteAudioStorage(LocalAudioStorage):
+    """Local storage that reports no local path, like S3 storage."""
+
+    def local_path(self, key):
+        return None
+
+
+def _ready_briefing(key=AUDIO_KEY):
+    briefing = MagicMock()
+    briefing.id = "briefing-123"
+    briefing.user_id = "user-1"
+    briefing.audio_storage_key = key
+    briefing.audio_size_bytes = len(AUDIO)
+    briefing.audio_status = "ready"
+    briefing.audio_mime_type = "audio/mpeg"
+    return briefing
+
+
+@pytest.fixture(params=[LocalAudioStorage, _RemoteAudioStorage], ids=["file", "streamed"])
+def storage(request, tmp_path):
+    """Audio storage holding AUDIO, served as a file or streamed in chunks."""
+    storage = request.param(str(tmp_path))
+    storage.put(AUDIO_KEY, AUDIO, "audio/mpeg")
+    with patch("src.web.app._audio_storage", storage):
+        yield storage
+
+
+@pytest.fixture
+def user_client(client):
+    """Client signed in as user-1, with a fresh rate-limit window."""
+    app.state.limiter.reset()
+    _override_auth("user-1")
+    yield client
+    _clear_auth()
+
+
 class TestServeAudioRange:
     """Test Range header handling on the GET endpoint."""
 
     @patch("src.web.app._repository")
-    def test_full_response_200(self, mock_repo, client):
+    def test_full_response_200(self, mock_repo, user_client, storage):
         """GET without Range returns 200 with full body."""
-        _override_auth("user-1")
-        try:
-            briefing = MagicMock()
-            briefing.user_id = "user-1"
-            briefing.audio_data = b"\x00\x01\x02\x03" * 25  # 100 bytes
-            briefing.audio_status = "ready"
-            briefing.audio_mime_type = "audio/mpeg"
-            mock_repo.get_briefing_by_id.return_value = briefing
+        mock_repo.get_briefing_by_id.return_value = _ready_briefing()
 
-            response = client.get("/api/feed/briefing/briefing-123/audio")
-            assert response.status_code == 200
-            assert response.headers["Content-Length"] == "100"
-            assert response.headers["Accept-Ranges"] == "bytes"
-            assert len(response.content) == 100
-        finally:
-            _clear_auth()
+        response = user_client.get("/api/feed/briefing/briefing-123/audio")
+        assert response.status_code == 200
+        assert response.headers["Content-Length"] == "100"
+        assert response.headers["Accept-Ranges"] == "bytes"
+        assert response.content == AUDIO
 
     @patch("src.web.app._repository")
-    def test_partial_response_206(self, mock_repo, client):
+    def test_partial_response_206(self, mock_repo, user_client, storage):
         """GET with valid Range returns 206 with chunk."""
-        _override_auth("user-1")
-        try:
-            briefing = MagicMock()
-            briefing.user_id = "user-1"
-            briefing.audio_data = b"\x00\x01\x02\x03" * 25  # 100 bytes
-            briefing.audio_status = "ready"
-            briefing.audio_mime_type = "audio/mpeg"
-            mock_repo.get_briefing_by_id.return_value = briefing
+        mock_repo.get_briefing_by_id.return_value = _ready_briefing()
 
-            response = client.get(
-                "/api/feed/briefing/briefing-123/audio",
-                headers={"Range": "bytes=0-49"},
-            )
-            assert response.status_code == 206
-            assert response.headers["Content-Range"] == "bytes 0-49/100"
-            assert response.headers["Content-Length"] == "50"
-            assert len(response.content) == 50
-        finally:
-            _clear_auth()
+        response = user_client.get(
+            "/api/feed/briefing/briefing-123/audio",
+            headers={"Range": "bytes=0-49"},
+        )
+        assert response.status_code == 206
+        assert response.headers["Content-Range"] == "bytes 0-49/100"
+        assert response.headers["Content-Length"] == "50"
+        assert response.content == AUDIO[:50]
 
     @patch("src.web.app._repository")
-    def test_unsatisfiable_range_416(self, mock_repo, client):
+    def test_unsatisfiable_range_416(self, mock_repo, user_client, storage):
         """GET with out-of-bounds Range returns 416."""
-        _override_auth("user-1")
-        try:
-            briefing = MagicMock()
-            briefing.user_id = "user-1"
-            briefing.audio_data = b"\x00\x01\x02\x03" * 25  # 100 bytes
-            briefing.audio_status = "ready"
-            briefing.audio_mime_type = "audio/mpeg"
-            mock_repo.get_briefing_by_id.return_value = briefing
+        mock_repo.get_briefing_by_id.return_value = _ready_briefing()
 
-            response = client.get(
-                "/api/feed/briefing/briefing-123/audio",
-                headers={"Range": "bytes=200-300"},
-            )
-            assert response.status_code == 416
-            assert response.headers["Content-Range"] == "bytes */100"
-        finally:
-            _clear_auth()
\ No newline at end of file
+        response = user_client.get(
+            "/api/feed/briefing/briefing-123/audio",
+            headers={"Range": "bytes=200-300"},
+        )
+        assert response.status_code == 416
+        assert response.headers["Content-Range"] == "bytes */100"
+
+
+class TestServeAudioCaching:
+    """Test ETag revalidation, legacy blobs and missing files."""
+
+    @patch("src.web.app._repository")
+    def test_etag_and_304(self, mock_repo, user_client, storage):
+        mock_repo.get_briefing_by_id.return_value = _ready_briefing()
+
+        response = user_client.get("/api/feed/briefing/briefing-123/audio")
+        assert response.headers["ETag"] == audio_etag(AUDIO_KEY)
+
+        response = user_client.get(
+            "/api/feed/briefing/briefing-123/audio",
+            headers={"If-None-Match": audio_etag(AUDIO_KEY)},
+        )
+        assert response.status_code == 304
+        assert response.content == b""
+
+    @patch("src.web.app._repository")
+    def test_stale_etag_gets_body(self, mock_repo, user_client, storage):
+        mock_repo.get_briefing_by_id.return_value = _ready_briefing()
+
+        response = user_client.get(
+            "/api/feed/briefing/briefing-123/audio",
+            headers={"If-None-Match": '"something-else"'},
+        )
+        assert response.status_code == 200
+        assert response.content == AUDIO
+
+    @patch("src.web.app._repository")
+    def test_legacy_blob_moved_on_first_play(self, mock_repo, user_client, tmp_path):
+        storage = LocalAudioStorage(str(tmp_path))
+        mock_repo.get_briefing_by_id.return_value = _ready_briefing(key=None)
+        mock_repo.get_briefing_audio_data.return_value = AUDIO
+
+        with patch("src.web.app._audio_storage", storage):
+            response = user_client.get("/api/feed/briefing/briefing-123/audio")
+
+        assert response.status_code == 200
+        assert response.content == AUDIO
+        mock_repo.set_briefing_audio_storage_key.assert_called_once_with(
+            "briefing-123", AUDIO_KEY
+        )
+
+    @patch("src.web.app._repository")
+    def test_missing_file_404(self, mock_repo, user_client, tmp_path):
+        mock_repo.get_briefing_by_id.return_value = _ready_briefing()
+
+        with patch("src.web.app._audio_storage", LocalAudioStorage(str(tmp_path))):
+            response = user_client.get("/api/feed/briefing/briefing-123/audio")
+
+        assert response.status_code == 404
@@ -0,0 +1,95 @@
+"""Tests for briefing audio storage."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.config import Config
+from src.services.audio_storage import (
+    LocalAudioStorage,
+    audio_etag,
+    briefing_audio_key,
+    create_audio_storage,
+)
+
+
+@pytest.fixture
+def storage(tmp_path):
+    return LocalAudioStorage(str(tmp_path / "audio"))
+
+
+class TestKeys:
+    def test_key_is_content_addressed(self):
+        key = briefing_audio_key("b1", b"mp3 bytes", "audio/mpeg")
+        assert key.startswith("briefings/b1/")
+        assert key.endswith(".mp3")
+        assert key == briefing_audio_key("b1", b"mp3 bytes", "audio/mpeg")
+        assert key != briefing_audio_key("b1", b"other bytes", "audio/mpeg")
+
+    def test_etag_is_quoted_hash(self):
+        key = briefing_audio_key("b1", b"mp3 bytes", "audio/mpeg")
+        etag = audio_etag(key)
+        assert etag.startswith('"') and etag.endswith('"')
+        assert etag.strip('"') in key
+
+
+class TestLocalAudioStorage:
+    def test_put_and_read_range(self, storage):
+        storage.put("briefings/b1/a.mp3", b"0123456789", "audio/mpeg")
+
+        assert b"".join(storage.iter_range("briefings/b1/a.mp3", 0, 9)) == b"0123456789"
+        assert b"".join(storage.iter_range("briefings/b1/a.mp3", 2, 5)) == b"2345"
+
+    def test_read_in_chunks(self, storage):
+        storage.put("a.mp3", b"0123456789", "audio/mpeg")
+        assert list(storage.iter_range("a.mp3", 0, 9, chunk_size=4)) == [b"0123", b"4567", b"89"]
+
+    def test_put_replaces(self, storage):
+        storage.put("a.mp3", b"old", "audio/mpeg")
+        storage.put("a.mp3", b"new", "audio/mpeg")
+        assert b"".join(storage.iter_range("a.mp3", 0, 2)) == b"new"
+
+    def test_local_path(self, storage):
+        storage.put("briefings/b1/a.mp3", b"mp3", "audio/mpeg")
+        with open(storage.local_path("briefings/b1/a.mp3"), "rb") as f:
+            assert f.read() == b"mp3"
+
+    def test_delete(self, storage, caplog):
+        storage.put("a.mp3", b"mp3", "audio/mpeg")
+        storage.delete("a.mp3")
+        assert "not found" not in caplog.text
+        storage.delete("a.mp3")  # missing keys are ignored, but logged
+        assert "Briefing audio to delete not found" in caplog.text
+
+        with pytest.raises(FileNotFoundError):
+            list(storage.iter_range("a.mp3", 0, 2))
+
+    def test_rejects_key_outside_root(self, storage):
+        with pytest.raises(ValueError):
+            storage.put("../escape.mp3", b"mp3", "audio/mpeg")
+
+
+class TestCreateAudioStorage:
+    def _config(self, **values):
+        config = MagicMock(spec=Config)
+        config.BRIEFING_AUDIO_STORAGE = "local"
+        config.BRIEFING_AUDIO_DIRECTORY = "/tmp/briefing_audio"
+        config.BRIEFING_AUDIO_S3_BUCKET = ""
+        config.BRIEFING_AUDIO_S3_PREFIX = ""
+        config.BRIEFING_AUDIO_S3_ENDPOINT_URL = ""
+        for name, value in values.items():
+            setattr(config, name, value)
+        return config
+
+    def test_local(self):
+        storage = create_audio_storage(self._config())
+        assert isinstance(storage, LocalAudioStorage)
+        assert storage.root == "/tmp/briefing_audio"
+
+    def test_s3_requires_bucket(self):
+        with pytest.raises(ValueError):
+            create_audio_storage(self._config(BRIEFING_AUDIO_STORAGE="s3"))
+
+    def test_unknown_type(self):
+        with pytest.raises(ValueError):
+            create_audio_storage(self._config(BRIEFING_AUDIO_STORAGE="ftp"))
@@ -5,18 +5,25 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from src.config import Config
+from src.services.audio_storage import LocalAudioStorage, briefing_audio_key
 from src.services.briefing_audio import (
     BRIEFING_AUDIO_FAILED,
     BRIEFING_AUDIO_PENDING,
     BRIEFING_AUDIO_READY,
+    audio_is_ready,
     generate_briefing_audio,
     get_audio_url_or_trigger,
+    store_legacy_audio,
 )
 
+MP3_KEY = briefing_audio_key("briefing-123", b"mp3 bytes", "audio/mpeg")
+
 
 @pytest.fixture
-def mock_config():
+def mock_config(tmp_path):
     config = MagicMock(spec=Config)
+    config.BRIEFING_AUDIO_STORAGE = "local"
+    config.BRIEFING_AUDIO_DIRECTORY = str(tmp_path)
     config.GEMINI_API_KEY = "test_key"
     config.GEMINI_TTS_MODEL = "gemini-3.1-flash-tts-preview"
     config.GEMINI_TTS_VOICE = "Puck"
@@ -38,15 +45,16 @@ def mock_briefing():
     ]
     briefing.connection_insight = "A connection"
     briefing.audio_status = None
-    briefing.audio_data = None
+    briefing.audio_storage_key = None
+    briefing.audio_size_bytes = None
     return briefing
 
 
 class TestGenerateBriefingAudio:
     def test_already_ready_returns_cached(self, mock_config, mock_briefing):
-        """Briefing with audio_status='ready' and audio_data should return ready."""
+        """Briefing with audio_status='ready' and stored audio should return ready."""
         mock_briefing.audio_status = "ready"
-        mock_briefing.audio_data = b"fake mp3"
+        mock_briefing.audio_size_bytes = 8
         repo = MagicMock()
         repo.get_briefing_by_id.return_value = mock_briefing
 
@@ -68,9 +76,9 @@ class TestGenerateBriefingAudio:
     @patch("src.services.briefing_generator.generate_audio_script")
     @patch("src.services.tts.render_tts_to_mp3")
     def test_ready_without_data_recovers(self, mock_tts, mock_script, mock_config, mock_briefing):
-        """Ready status with no audio_data should reset to failed and regenerate."""
+        """Ready status with no stored audio should reset to failed and regenerate."""
         mock_briefing.audio_status = "ready"
-        mock_briefing.audio_data = None
+        mock_briefing.audio_size_bytes = None
         mock_script.return_value = "spoken script text"
         mock_tts.return_value = (b"mp3 bytes", 180)
         repo = MagicMock()
@@ -102,11 +110,15 @@ class TestGenerateBriefingAudio:
         assert result == BRIEFING_AUDIO_READY
         repo.update_briefing_audio.assert_called_once_with(
             briefing_id="briefing-123",
-            audio_data=b"mp3 bytes",
+            audio_storage_key=MP3_KEY,
+            audio_size_bytes=9,
             audio_mime_type="audio/mpeg",
             audio_duration_sec=180,
             status="ready",
         )
+        # Written to the configured audio storage, not the database
+        stored = LocalAudioStorage(mock_config.BRIEFING_AUDIO_DIRECTORY)
+        assert b"".join(stored.iter_range(MP3_KEY, 0, 8)) == b"mp3 bytes"
 
     @patch("src.services.briefing_generator.generate_audio_script")
     def test_script_failure_marks_failed(self, mock_script, mock_config, mock_briefing):
@@ -135,7 +147,8 @@ class TestGenerateBriefingAudio:
         assert result == BRIEFING_AUDIO_READY
         repo.update_briefing_audio.assert_called_once_with(
             briefing_id="briefing-123",
-            audio_data=b"mp3 bytes",
+            audio_storage_key=MP3_KEY,
+            audio_size_bytes=9,
             audio_mime_type="audio/mpeg",
             audio_duration_sec=None,
             status="ready",
@@ -208,7 +221,7 @@ class TestGenerateBriefingAudio:
 class TestGetAudioUrlOrTrigger:
     def test_ready_returns_url(self, mock_config, mock_briefing):
         mock_briefing.audio_status = "ready"
-        mock_briefing.audio_data = b"mp3"
+        mock_briefing.audio_size_bytes = 3
         repo = MagicMock()
         repo.get_briefing_by_id.return_value = mock_briefing
 
@@ -223,3 +236,40 @@ class TestGetAudioUrlOrTrigger:
         result = get_audio_url_or_trigger("missing", repo, mock_config)
         assert result["status"] == "failed"
         assert result["audio_url"] is None
+
+
+class TestAudioIsReady:
+    def test_ready_with_size(self, mock_briefing):
+        mock_briefing.audio_status = "ready"
+        mock_briefing.audio_size_bytes = 100
+        assert audio_is_ready(mock_briefing) is True
+
+    def test_ready_without_size(self, mock_briefing):
+        mock_briefing.audio_status = "ready"
+        assert audio_is_ready(mock_briefing) is False
+
+    def test_not_ready(self, mock_briefing):
+        mock_briefing.audio_status = "generating"
+        mock_briefing.audio_size_bytes = 100
+        assert audio_is_ready(mock_briefing) is False
+
+
+class TestStoreLegacyAudio:
+    def test_moves_blob_to_storage(self, tmp_path, mock_briefing):
+        mock_briefing.audio_mime_type = "audio/mpeg"
+        repo = MagicMock()
+        repo.get_briefing_audio_data.return_value = b"mp3 bytes"
+        storage = LocalAudioStorage(str(tmp_path))
+
+        key = store_legacy_audio(mock_briefing, repo, storage)
+
+        assert key == MP3_KEY
+        assert b"".join(storage.iter_range(key, 0, 8)) == b"mp3 bytes"
+        repo.set_briefing_audio_storage_key.assert_called_once_with("briefing-123", key)
+
+    def test_no_blob(self, tmp_path, mock_briefing):
+        repo = MagicMock()
+        repo.get_briefing_audio_data.return_value = None
+
+        assert store_legacy_audio(mock_briefing, repo, LocalAudioStorage(str(tmp_path))) is None
+        repo.set_briefing_audio_storage_key.assert_not_called()
@@ -72,7 +72,8 @@ class TestClaimBriefingAudio:
     def test_claim_after_ready_fails(self, repository, sample_briefing):
         repository.update_briefing_audio(
             briefing_id=sample_briefing.id,
-            audio_data=b"fake mp3",
+            audio_storage_key="briefings/b/fake.mp3",
+            audio_size_bytes=8,
             audio_mime_type="audio/mpeg",
             audio_duration_sec=120,
             status="ready",
@@ -85,17 +86,53 @@ class TestUpdateBriefingAudio:
     def test_update_sets_all_fields(self, repository, sample_briefing):
         repository.update_briefing_audio(
             briefing_id=sample_briefing.id,
-            audio_data=b"mp3 bytes",
+            audio_storage_key="briefings/b/abc.mp3",
+            audio_size_bytes=9,
             audio_mime_type="audio/mpeg",
             audio_duration_sec=180,
             status="ready",
         )
         briefing = repository.get_briefing_by_id(sample_briefing.id)
-        assert briefing.audio_data == b"mp3 bytes"
+        assert briefing.audio_storage_key == "briefings/b/abc.mp3"
+        assert briefing.audio_size_bytes == 9
         assert briefing.audio_mime_type == "audio/mpeg"
         assert briefing.audio_duration_sec == 180
         assert briefing.audio_status == "ready"
         assert briefing.audio_generated_at is not None
+        assert repository.get_briefing_audio_data(sample_briefing.id) is None
+
+
+class TestLegacyAudioData:
+    def _add_blob(self, repository, briefing_id):
+        from sqlalchemy import update
+
+        from src.db.models import DailyBriefing
+
+        with repository._get_session() as session:
+            session.execute(
+                update(DailyBriefing)
+                .where(DailyBriefing.id == briefing_id)
+                .values(audio_data=b"legacy mp3", audio_size_bytes=10, audio_status="ready")
+            )
+            session.commit()
+
+    def test_get_briefing_by_id_defers_blob(self, repository, sample_briefing):
+        from sqlalchemy import inspect
+
+        self._add_blob(repository, sample_briefing.id)
+        briefing = repository.get_briefing_by_id(sample_briefing.id)
+        assert "audio_data" in inspect(briefing).unloaded
+        assert repository.get_briefing_audio_data(sample_briefing.id) == b"legacy mp3"
+
+    def test_set_storage_key_drops_blob(self, repository, sample_briefing):
+        self._add_blob(repository, sample_briefing.id)
+        repository.set_briefing_audio_storage_key(sample_briefing.id, "briefings/b/legacy.mp3")
+
+        briefing = repository.get_briefing_by_id(sample_briefing.id)
+        assert briefing.audio_storage_key == "briefings/b/legacy.mp3"
+        assert briefing.audio_size_bytes == 10
+        assert briefing.audio_status == "ready"
+        assert repository.get_briefing_audio_data(sample_briefing.id) is None
 
 
 class TestUpdateBriefingAudioStatus:
@@ -133,22 +170,27 @@ class TestClearAudioDataBefore:
 
         # Add audio to both
         repository.update_briefing_audio(
-            old_briefing.id, b"old mp3", "audio/mpeg", 100, "ready"
+            old_briefing.id, "briefings/old/a.mp3", 7, "audio/mpeg", 100, "ready"
         )
         repository.update_briefing_audio(
-            new_briefing.id, b"new mp3", "audio/mpeg", 100, "ready"
+            new_briefing.id, "briefings/new/b.mp3", 7, "audio/mpeg", 100, "ready"
         )
 
         # Clear audio older than now
         cutoff = datetime.now(UTC)
+        assert sorted(repository.get_audio_storage_keys_before(cutoff)) == [
+            "briefings/new/b.mp3",
+            "briefings/old/a.mp3",
+        ]
         affected = repository.clear_audio_data_before(cutoff)
 
         assert affected >= 1
         old = repository.get_briefing_by_id(old_briefing.id)
         new = repository.get_briefing_by_id(new_briefing.id)
-        assert old.audio_data is None
+        assert old.audio_storage_key is None
+        assert old.audio_size_bytes is None
         assert old.audio_status is None
-        assert new.audio_data is None  # both are older than now
+        assert new.audio_storage_key is None  # both are older than now
         assert new.audio_status is None
 
     def test_clears_only_old(self, repository, sample_user):
@@ -175,10 +217,10 @@ class TestClearAudioDataBefore:
             episode_ids=["ep-new"],
         )
         repository.update_briefing_audio(
-            old_briefing.id, b"old mp3", "audio/mpeg", 100, "ready"
+            old_briefing.id, "briefings/old/a.mp3", 7, "audio/mpeg", 100, "ready"
         )
         repository.update_briefing_audio(
-            new_briefing.id, b"new mp3", "audio/mpeg", 100, "ready"
+            new_briefing.id, "briefings/new/b.mp3", 7, "audio/mpeg", 100, "ready"
         )
 
         # Clear audio older than 1 second ago — both will be cleared since
@@ -187,11 +229,12 @@ class TestClearAudioDataBefore:
         # clearing with cutoff = now (both are <= now).
         # To test selective clearing, use cutoff = 1 day ago (both newer).
         yesterday = datetime.now(UTC) - timedelta(days=1)
+        assert repository.get_audio_storage_keys_before(yesterday) == []
         repository.clear_audio_data_before(yesterday)
 
         old = repository.get_briefing_by_id(old_briefing.id)
         new = repository.get_briefing_by_id(new_briefing.id)
         # Both have audio_generated_at = now(), which is after yesterday,
         # so neither should be cleared.
-        assert old.audio_data is not None
-        assert new.audio_data is not None
+        assert old.audio_storage_key is not None
+        assert new.audio_storage_key is not None
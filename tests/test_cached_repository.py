@@ -0,0 +1,198 @@
+"""Tests for the read-through caching repository."""
+
+from unittest.mock import patch
+
+import pytest
+
+from src.db.cached_repository import _MISSING, CachingPodcastRepository, TTLCache
+from src.db.factory import create_repository
+from src.db.repository import PodcastRepositoryInterface
+
+
+class FakeClock:
+    """Manually advanced time source."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def inner(tmp_path):
+    """Uncached repository backed by a temporary SQLite database."""
+    repo = create_repository(f"sqlite:///{tmp_path / 'test.db'}", create_tables=True)
+    yield repo
+    repo.close()
+
+
+@pytest.fixture
+def repository(inner, clock):
+    """Caching repository wrapping the temporary database."""
+    return CachingPodcastRepository(inner, clock=clock)
+
+
+@pytest.fixture
+def podcast(inner):
+    return inner.create_podcast(feed_url="https://example.com/feed.xml", title="Test Podcast")
+
+
+@pytest.fixture
+def user(inner):
+    return inner.create_user(google_id="google-1", email="user@example.com", name="User")
+
+
+class TestTTLCache:
+    """Tests for the bounded TTL cache."""
+
+    def test_get_and_set(self, clock):
+        cache = TTLCache(maxsize=2, ttl=10, clock=clock)
+
+        assert cache.get("a") is _MISSING
+        cache.set("a", 1)
+        assert cache.get("a") == 1
+        assert cache.stats() == {"hits": 1, "misses": 1, "size": 1}
+
+    def test_entries_expire(self, clock):
+        cache = TTLCache(maxsize=2, ttl=10, clock=clock)
+        cache.set("a", 1)
+
+        clock.now = 9.9
+        assert cache.get("a") == 1
+        clock.now = 10.0
+        assert cache.get("a") is _MISSING
+        assert cache.stats()["size"] == 0
+
+    def test_least_recently_used_is_evicted(self, clock):
+        cache = TTLCache(maxsize=2, ttl=10, clock=clock)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("b") is _MISSING
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+
+    def test_stale_generation_is_not_stored(self, clock):
+        cache = TTLCache(maxsize=2, ttl=10, clock=clock)
+        generation = cache.generation
+        cache.discard_where(lambda key, value: True)
+        cache.set("a", 1, generation)
+
+        assert cache.get("a") is _MISSING
+
+    def test_discard_where(self, clock):
+        cache = TTLCache(maxsize=4, ttl=10, clock=clock)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.discard_where(lambda key, value: value == 2)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is _MISSING
+
+
+class TestCachingPodcastRepository:
+    """Tests for CachingPodcastRepository."""
+
+    def test_is_a_repository_interface(self, repository):
+        assert isinstance(repository, PodcastRepositoryInterface)
+
+    def test_factory_wraps_when_cache_enabled(self, tmp_path):
+        repo = create_repository(
+            f"sqlite:///{tmp_path / 'factory.db'}", create_tables=True, cache=True
+        )
+        try:
+            assert isinstance(repo, CachingPodcastRepository)
+        finally:
+            repo.close()
+
+    def test_get_podcast_is_cached(self, repository, inner, podcast):
+        with patch.object(inner, "get_podcast", wraps=inner.get_podcast) as get_podcast:
+            first = repository.get_podcast(podcast.id)
+            second = repository.get_podcast(podcast.id)
+
+        assert first is second
+        get_podcast.assert_called_once_with(podcast.id)
+        assert repository.cache_stats()["podcasts"]["hits"] == 1
+
+    def test_missing_podcast_is_not_cached(self, repository, inner):
+        assert repository.get_podcast("missing") is None
+        created = inner.create_podcast(feed_url="https://example.com/new.xml", title="New")
+
+        assert repository.get_podcast_by_feed_url("https://example.com/new.xml").id == created.id
+
+    def test_update_podcast_invalidates(self, repository, podcast):
+        repository.get_podcast(podcast.id)
+        repository.get_podcast_by_feed_url(podcast.feed_url)
+
+        repository.update_podcast(podcast.id, title="Renamed")
+
+        assert repository.get_podcast(podcast.id).title == "Renamed"
+        assert repository.get_podcast_by_feed_url(podcast.feed_url).title == "Renamed"
+
+    def test_description_indexing_invalidates(self, repository, podcast):
+        repository.get_podcast(podcast.id)
+
+        repository.mark_description_indexing_failed(podcast.id, "boom")
+
+        assert repository.get_podcast(podcast.id).description_file_search_status == "failed"
+
+    def test_podcast_entries_expire(self, repository, inner, podcast, clock):
+        repository.get_podcast(podcast.id)
+        inner.update_podcast(podcast.id, title="Changed elsewhere")
+
+        assert repository.get_podcast(podcast.id).title == "Test Podcast"
+        clock.now += 301
+        assert repository.get_podcast(podcast.id).title == "Changed elsewhere"
+
+    def test_user_lookups_are_cached(self, repository, inner, user):
+        with patch.object(
+            inner, "get_user_by_google_id", wraps=inner.get_user_by_google_id
+        ) as lookup:
+            repository.get_user_by_google_id("google-1")
+            repository.get_user_by_google_id("google-1")
+
+        lookup.assert_called_once()
+
+    def test_update_user_invalidates_every_key(self, repository, user):
+        repository.get_user(user.id)
+        repository.get_user_by_email("user@example.com")
+
+        repository.set_user_admin_status(user.id, True)
+
+        assert repository.get_user(user.id).is_admin is True
+        assert repository.get_user_by_email("user@example.com").is_admin is True
+
+    def test_subscription_checks_are_cached_and_invalidated(
+        self, repository, inner, user, podcast
+    ):
+        with patch.object(
+            inner, "is_user_subscribed", wraps=inner.is_user_subscribed
+        ) as check:
+            assert repository.is_user_subscribed(user.id, podcast.id) is False
+            assert repository.is_user_subscribed(user.id, podcast.id) is False
+        check.assert_called_once()
+
+        repository.subscribe_user_to_podcast(user.id, podcast.id)
+        assert repository.is_user_subscribed(user.id, podcast.id) is True
+
+        repository.unsubscribe_user_from_podcast(user.id, podcast.id)
+        assert repository.is_user_subscribed(user.id, podcast.id) is False
+
+    def test_uncached_methods_are_delegated(self, repository, podcast):
+        assert [p.id for p in repository.list_podcasts()] == [podcast.id]
+
+    def test_clear_cache(self, repository, inner, podcast):
+        repository.get_podcast(podcast.id)
+        inner.update_podcast(podcast.id, title="Changed elsewhere")
+
+        repository.clear_cache()
+
+        assert repository.get_podcast(podcast.id).title == "Changed elsewhere"
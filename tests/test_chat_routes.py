@@ -63,7 +63,7 @@ class TestListConversations:
         mock_conv.created_at = datetime(2024, 1, 15, tzinfo=timezone.utc)
         mock_conv.updated_at = datetime(2024, 1, 15, tzinfo=timezone.utc)
 
-        mock_repository.list_conversations.return_value = [mock_conv]
+        mock_repository.list_conversations_page.return_value = ([mock_conv], None)
         mock_repository.count_conversations.return_value = 1
 
         response = client.get("/api/conversations")
@@ -76,7 +76,7 @@ class TestListConversations:
 
     def test_list_conversations_empty(self, client, mock_repository):
         """Test listing when no conversations exist."""
-        mock_repository.list_conversations.return_value = []
+        mock_repository.list_conversations_page.return_value = ([], None)
         mock_repository.count_conversations.return_value = 0
 
         response = client.get("/api/conversations")
@@ -99,6 +99,20 @@ class TestListConversations:
         )
 
 
+    def test_list_conversations_with_cursor(self, client, mock_repository):
+        """Test keyset pagination of conversations."""
+        mock_repository.list_conversations_page.return_value = ([], "next-page")
+        mock_repository.count_conversations.return_value = 0
+
+        response = client.get("/api/conversations?limit=10&cursor=abc")
+
+        assert response.status_code == 200
+        assert response.json()["next_cursor"] == "next-page"
+        mock_repository.list_conversations_page.assert_called_with(
+            "user-123", limit=10, cursor="abc"
+        )
+
+
 class TestCreateConversation:
     """Tests for POST /api/conversations endpoint."""
 
@@ -312,6 +326,56 @@ class TestGetConversation:
         assert data["messages"][0]["citations"][0]["metadata"]["podcast"] == "Test Podcast"
 
 
+class TestListMessages:
+    """Tests for GET /api/conversations/{id}/messages endpoint."""
+
+    def test_list_messages(self, client, mock_repository, mock_current_user):
+        """Test fetching a page of messages."""
+        mock_conv = Mock()
+        mock_conv.user_id = mock_current_user["sub"]
+        mock_repository.get_conversation.return_value = mock_conv
+
+        mock_msg = Mock()
+        mock_msg.id = "msg-1"
+        mock_msg.role = "user"
+        mock_msg.content = "Hello"
+        mock_msg.citations = None
+        mock_msg.created_at = datetime(2024, 1, 15, tzinfo=timezone.utc)
+        mock_repository.get_messages_page.return_value = ([mock_msg], "next-page")
+
+        response = client.get("/api/conversations/conv-1/messages?limit=1")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert [m["id"] for m in data["messages"]] == ["msg-1"]
+        assert data["next_cursor"] == "next-page"
+        mock_repository.get_messages_page.assert_called_with(
+            "conv-1", limit=1, cursor=None
+        )
+
+    def test_list_messages_wrong_user(self, client, mock_repository):
+        """Test another user's messages are not returned."""
+        mock_conv = Mock()
+        mock_conv.user_id = "other-user"
+        mock_repository.get_conversation.return_value = mock_conv
+
+        response = client.get("/api/conversations/conv-1/messages")
+
+        assert response.status_code == 404
+        mock_repository.get_messages_page.assert_not_called()
+
+    def test_list_messages_invalid_cursor(self, client, mock_repository, mock_current_user):
+        """Test a malformed cursor is rejected."""
+        mock_conv = Mock()
+        mock_conv.user_id = mock_current_user["sub"]
+        mock_repository.get_conversation.return_value = mock_conv
+        mock_repository.get_messages_page.side_effect = ValueError("Invalid cursor: x")
+
+        response = client.get("/api/conversations/conv-1/messages?cursor=x")
+
+        assert response.status_code == 400
+
+
 class TestUpdateConversation:
     """Tests for PATCH /api/conversations/{id} endpoint."""
 
@@ -114,7 +114,7 @@ class TestExtractCitationsFromResponse:
         mock_response.candidates = [mock_candidate]
 
         mock_repo = MagicMock()
-        mock_repo.get_episode_by_file_search_display_name.return_value = mock_episode
+        mock_repo.get_episodes_by_file_search_display_names.side_effect = lambda names: dict.fromkeys(names, mock_episode)
 
         citations = _extract_citations_from_response(
             mock_response, mock_repo, source_type="transcript"
@@ -157,7 +157,7 @@ class TestExtractCitationsFromResponse:
         mock_response.candidates = [mock_candidate]
 
         mock_repo = MagicMock()
-        mock_repo.get_podcast_by_description_display_name.return_value = mock_podcast
+        mock_repo.get_podcasts_by_description_display_names.side_effect = lambda names: dict.fromkeys(names, mock_podcast)
 
         citations = _extract_citations_from_response(
             mock_response, mock_repo, source_type="description"
@@ -203,12 +203,16 @@ class TestExtractCitationsFromResponse:
         mock_response.candidates = [mock_candidate]
 
         mock_repo = MagicMock()
-        mock_repo.get_episode_by_file_search_display_name.return_value = mock_episode
+        mock_repo.get_episodes_by_file_search_display_names.side_effect = lambda names: dict.fromkeys(names, mock_episode)
 
         citations = _extract_citations_from_response(mock_response, mock_repo)
 
         # Should only have one citation due to deduplication
         assert len(citations) == 1
+        # All chunks are resolved with one lookup
+        mock_repo.get_episodes_by_file_search_display_names.assert_called_once_with(
+            ["same_title.txt"]
+        )
 
     def test_extract_citations_handles_db_error(self):
         """Test that database errors are handled gracefully."""
@@ -230,7 +234,7 @@ class TestExtractCitationsFromResponse:
         mock_response.candidates = [mock_candidate]
 
         mock_repo = MagicMock()
-        mock_repo.get_episode_by_file_search_display_name.side_effect = Exception("DB error")
+        mock_repo.get_episodes_by_file_search_display_names.side_effect = Exception("DB error")
 
         citations = _extract_citations_from_response(mock_response, mock_repo)
 
@@ -257,7 +261,7 @@ class TestExtractCitationsFromResponse:
         mock_response.candidates = [mock_candidate]
 
         mock_repo = MagicMock()
-        mock_repo.get_episode_by_file_search_display_name.return_value = None
+        mock_repo.get_episodes_by_file_search_display_names.return_value = {}
 
         citations = _extract_citations_from_response(mock_response, mock_repo)
 
@@ -0,0 +1,55 @@
+"""Tests for transcript compression codecs."""
+
+import pytest
+
+from src.db import compression
+from src.db.compression import (
+    CODEC_ZLIB,
+    CODEC_ZSTD,
+    compress_text,
+    decompress_text,
+    default_codec,
+)
+
+
+class TestCompression:
+    """Tests for compress_text / decompress_text."""
+
+    def test_zlib_round_trip(self):
+        text = "Hello, wörld — ünïcode transcript. " * 200
+        codec, data = compress_text(text, CODEC_ZLIB)
+        assert codec == CODEC_ZLIB
+        assert len(data) < len(text.encode("utf-8"))
+        assert decompress_text(codec, data) == text
+
+    def test_zstd_round_trip(self):
+        text = "Hello, wörld — ünïcode transcript. " * 200
+        codec, data = compress_text(text, CODEC_ZSTD)
+        assert codec == CODEC_ZSTD
+        assert data.startswith(b"\x28\xb5\x2f\xfd")  # zstd frame magic
+        assert len(data) < len(text.encode("utf-8"))
+        assert decompress_text(codec, data) == text
+
+    def test_zstd_is_default_codec(self):
+        assert default_codec() == CODEC_ZSTD
+
+    def test_empty_text_round_trip(self):
+        codec, data = compress_text("")
+        assert decompress_text(codec, data) == ""
+
+    def test_default_codec_round_trip(self):
+        codec, data = compress_text("some transcript")
+        assert codec == default_codec()
+        assert decompress_text(codec, data) == "some transcript"
+
+    def test_default_codec_falls_back_to_zlib(self, monkeypatch):
+        monkeypatch.setattr(compression, "zstandard", None)
+        assert default_codec() == CODEC_ZLIB
+        with pytest.raises(ValueError, match="zstandard"):
+            compress_text("text", CODEC_ZSTD)
+
+    def test_unknown_codec(self):
+        with pytest.raises(ValueError, match="Unknown codec"):
+            compress_text("text", "lz4")
+        with pytest.raises(ValueError, match="Unknown codec"):
+            decompress_text("lz4", b"")
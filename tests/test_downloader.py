@@ -2,10 +2,12 @@
 
 import pytest
 import os
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
 
+from src.db.repository import EpisodeUpdateBatch
 from src.podcast.downloader import EpisodeDownloader, DownloadResult
 
 
@@ -501,6 +503,58 @@ class TestEpisodeDownloaderAdvanced:
         assert result["downloaded"] == 3
         assert result["failed"] == 0
 
+    def test_download_pending_bulk_status(self, downloader, mock_repository, download_dir):
+        """Test bulk mode marks the batch once and records results in one unit of work."""
+        episodes = []
+        for i in range(2):
+            ep = Mock()
+            ep.id = f"ep-{i}"
+            ep.podcast_id = "pod-1"
+            ep.title = f"Episode {i}"
+            ep.enclosure_url = f"https://example.com/ep{i}.mp3"
+            ep.enclosure_type = "audio/mpeg"
+            ep.enclosure_length = None
+            ep.episode_number = None
+            ep.itunes_episode = None
+            episodes.append(ep)
+
+        mock_repository.get_episodes_pending_download.return_value = episodes
+        mock_podcast = Mock()
+        mock_podcast.title = "Test Podcast"
+        mock_podcast.local_directory = None
+        mock_repository.get_podcast.return_value = mock_podcast
+
+        batch = EpisodeUpdateBatch()
+
+        @contextmanager
+        def unit_of_work():
+            yield batch
+
+        mock_repository.unit_of_work.side_effect = unit_of_work
+
+        def fake_download(url, output_path, episode_id, expected_size=None):
+            if episode_id == "ep-1":
+                raise Exception("Connection reset")
+            return 4, "hash"
+
+        with patch.object(downloader, '_download_file', side_effect=fake_download):
+            result = downloader.download_pending(limit=10, bulk_status=True)
+
+        assert result["downloaded"] == 1
+        assert result["failed"] == 1
+        mock_repository.mark_many.assert_called_once_with(
+            "download", ["ep-0", "ep-1"], "downloading"
+        )
+        mock_repository.mark_download_started.assert_not_called()
+        mock_repository.mark_download_complete.assert_not_called()
+        mock_repository.mark_download_failed.assert_not_called()
+        assert batch.updates["ep-0"]["download_status"] == "completed"
+        assert batch.updates["ep-0"]["file_hash"] == "hash"
+        assert batch.updates["ep-1"] == {
+            "download_status": "failed",
+            "download_error": "Connection reset",
+        }
+
     def test_download_file_with_expected_size(self, downloader, download_dir):
         """Test _download_file uses expected_size when content-length missing."""
         mock_response = Mock()
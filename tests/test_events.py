@@ -0,0 +1,108 @@
+"""Tests for the pipeline event bus."""
+
+import threading
+import time
+from unittest.mock import Mock
+
+from src.db.factory import create_repository
+from src.workflow.events import (
+    AUDIO_DOWNLOADED,
+    EPISODES_ADDED,
+    TRANSCRIPT_READY,
+    EventBus,
+    PostgresEventBus,
+    create_event_bus,
+)
+
+
+class TestEventBus:
+    """Tests for the in-process EventBus."""
+
+    def test_wait_returns_published_topics(self):
+        """Test topics published before wait() are returned once."""
+        bus = EventBus()
+        bus.publish(EPISODES_ADDED)
+        bus.publish(AUDIO_DOWNLOADED)
+        bus.publish(EPISODES_ADDED)
+
+        assert bus.wait(timeout=0) == {EPISODES_ADDED, AUDIO_DOWNLOADED}
+        assert bus.wait(timeout=0) == set()
+
+    def test_wait_times_out(self):
+        """Test wait() returns empty after the timeout."""
+        started = time.monotonic()
+
+        assert EventBus().wait(timeout=0.05) == set()
+        assert time.monotonic() - started >= 0.04
+
+    def test_publish_wakes_waiter(self):
+        """Test a blocked waiter wakes as soon as a topic is published."""
+        bus = EventBus()
+        received = []
+        waiter = threading.Thread(target=lambda: received.append(bus.wait(timeout=10)))
+        waiter.start()
+        time.sleep(0.05)
+
+        started = time.monotonic()
+        bus.publish(TRANSCRIPT_READY)
+        waiter.join(timeout=5)
+
+        assert received == [{TRANSCRIPT_READY}]
+        assert time.monotonic() - started < 5
+
+    def test_interrupt_wakes_waiter_without_topics(self):
+        """Test interrupt() releases waiters, e.g. on shutdown."""
+        bus = EventBus()
+        received = []
+        waiter = threading.Thread(target=lambda: received.append(bus.wait(timeout=10)))
+        waiter.start()
+        time.sleep(0.05)
+
+        bus.interrupt()
+        waiter.join(timeout=5)
+
+        assert received == [set()]
+
+    def test_subscribers_called_and_isolated(self):
+        """Test subscribers run on publish and a failing one doesn't stop others."""
+        bus = EventBus()
+        failing = Mock(side_effect=RuntimeError("boom"))
+        callback = Mock()
+        bus.subscribe(AUDIO_DOWNLOADED, failing)
+        bus.subscribe(AUDIO_DOWNLOADED, callback)
+
+        bus.publish(AUDIO_DOWNLOADED)
+        bus.publish(EPISODES_ADDED)
+
+        callback.assert_called_once()
+        failing.assert_called_once()
+
+
+class TestCreateEventBus:
+    """Tests for backend selection."""
+
+    def test_sqlite_uses_in_process_bus(self, tmp_path):
+        """Test SQLite repositories get the in-process bus."""
+        repo = create_repository(f"sqlite:///{tmp_path / 'events.db'}")
+        try:
+            bus = create_event_bus(repo)
+            assert type(bus) is EventBus
+        finally:
+            repo.close()
+
+    def test_postgres_uses_listen_notify(self):
+        """Test PostgreSQL repositories get the LISTEN/NOTIFY bus."""
+        repo = Mock()
+        repo.engine.dialect.name = "postgresql"
+
+        assert isinstance(create_event_bus(repo), PostgresEventBus)
+
+    def test_postgres_publish_delivers_locally_when_notify_fails(self):
+        """Test a failed NOTIFY still wakes local waiters."""
+        engine = Mock()
+        engine.connect.side_effect = RuntimeError("connection refused")
+        bus = PostgresEventBus(engine)
+
+        bus.publish(EPISODES_ADDED)
+
+        assert bus.wait(timeout=0) == {EPISODES_ADDED}
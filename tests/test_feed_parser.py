@@ -326,6 +326,45 @@ class TestParseUrl:
         assert podcast.title == "Test"
 
 
+class TestFetch:
+    """Tests for conditional fetches."""
+
+    def test_fetch_sends_validators(self, parser):
+        from unittest.mock import patch, Mock
+
+        mock_response = Mock(status_code=200, content=b"<rss/>", headers={"ETag": '"v2"'})
+
+        with patch.object(parser._session, 'get', return_value=mock_response) as mock_get:
+            fetched = parser.fetch(
+                "https://example.com/feed.xml",
+                etag='"v1"',
+                last_modified="Mon, 01 Jan 2024 00:00:00 GMT",
+            )
+
+        headers = mock_get.call_args.kwargs["headers"]
+        assert headers == {
+            "If-None-Match": '"v1"',
+            "If-Modified-Since": "Mon, 01 Jan 2024 00:00:00 GMT",
+        }
+        assert not fetched.not_modified
+        assert fetched.etag == '"v2"'
+        assert fetched.last_modified is None
+        assert len(fetched.content_hash) == 64
+
+    def test_fetch_not_modified_keeps_validators(self, parser):
+        from unittest.mock import patch, Mock
+
+        mock_response = Mock(status_code=304, headers={})
+
+        with patch.object(parser._session, 'get', return_value=mock_response):
+            fetched = parser.fetch("https://example.com/feed.xml", etag='"v1"')
+
+        assert fetched.not_modified
+        assert fetched.content_hash is None
+        assert fetched.etag == '"v1"'
+        mock_response.raise_for_status.assert_not_called()
+
+
 class TestFeedParserInit:
     """Tests for FeedParser initialization."""
 
@@ -655,3 +694,92 @@ class TestEpisodeMetadataEdgeCases:
         podcast = parser.parse_string(feed, "")
         assert len(podcast.episodes) == 1
         assert podcast.episodes[0].enclosure_length is None
+
+
+def _catalogue_feed(count, newest_first=True, extra=""):
+    """RSS feed of `count` daily episodes, guid-0 being the newest."""
+    days = range(count) if newest_first else reversed(range(count))
+    items = "".join(
+        f"""<item>
+              <guid>guid-{i}</guid>
+              <title>Episode {i}</title>
+              <itunes:duration>10:00</itunes:duration>
+              <enclosure url="https://example.com/{i}.mp3" type="audio/mpeg" length="100"/>
+              <pubDate>{29 - i:02d} Jan 2024 06:00:00 GMT</pubDate>{extra}
+            </item>"""
+        for i in days
+    )
+    return f"""<?xml version="1.0" encoding="UTF-8"?>
+        <rss version="2.0" xmlns:itunes="http://www.itunes.com/dtds/podcast-1.0.dtd">
+          <channel>
+            <title>Catalogue</title>
+            <itunes:author>Host</itunes:author>
+            <itunes:image href="https://example.com/art.jpg"/>
+            {items}
+          </channel>
+        </rss>""".encode()
+
+
+class TestIncrementalParse:
+    """Tests for streaming, early-terminating parsing."""
+
+    def test_iter_episodes_matches_full_parse(self, parser):
+        content = _catalogue_feed(5)
+
+        assert list(parser.iter_episodes(content)) == parser.parse_content(content, "u").episodes
+
+    def test_iter_episodes_atom(self, parser):
+        content = b"""<?xml version="1.0"?>
+        <feed xmlns="http://www.w3.org/2005/Atom">
+          <title>Atom Podcast</title>
+          <entry>
+            <id>atom-1</id>
+            <title>Atom Episode</title>
+            <link rel="enclosure" href="https://example.com/a.mp3" type="audio/mpeg" length="3"/>
+            <updated>2024-01-01T00:00:00Z</updated>
+          </entry>
+        </feed>"""
+
+        episodes = list(parser.iter_episodes(content))
+
+        assert [e.guid for e in episodes] == ["atom-1"]
+        assert episodes == parser.parse_content(content, "u").episodes
+
+    def test_stops_after_known_guids(self, parser):
+        content = _catalogue_feed(50)
+        known = {f"guid-{i}" for i in range(2, 50)}
+
+        podcast = parser.parse_content_incremental(content, "u", known, stop_after_known=3)
+
+        assert [e.guid for e in podcast.episodes] == [f"guid-{i}" for i in range(5)]
+        assert podcast.title == "Catalogue"
+        assert podcast.author == "Host"
+        assert podcast.image_url == "https://example.com/art.jpg"
+
+    def test_reads_everything_without_known_run(self, parser):
+        content = _catalogue_feed(10)
+
+        podcast = parser.parse_content_incremental(content, "u", set(), stop_after_known=3)
+
+        assert len(podcast.episodes) == 10
+
+    def test_oldest_first_feed_is_parsed_in_full(self, parser):
+        content = _catalogue_feed(10, newest_first=False)
+        known = {f"guid-{i}" for i in range(1, 10)}
+
+        podcast = parser.parse_content_incremental(content, "u", known, stop_after_known=3)
+
+        # The new episode comes last; it must still be found
+        assert "guid-0" in [e.guid for e in podcast.episodes]
+        assert len(podcast.episodes) == 10
+
+    def test_malformed_xml_falls_back_to_full_parse(self, parser):
+        content = _catalogue_feed(5, extra="<description>a&nbsp;b</description>")
+
+        podcast = parser.parse_content_incremental(content, "u", set(), stop_after_known=3)
+
+        assert len(podcast.episodes) == 5
+
+    def test_not_a_feed(self, parser):
+        with pytest.raises(ValueError):
+            parser.parse_content_incremental(b"not xml at all", "u", set(), stop_after_known=3)
@@ -4,9 +4,22 @@ import pytest
 from datetime import datetime, UTC
 from unittest.mock import Mock, patch, MagicMock
 
+from src.podcast.feed_parser import FetchedFeed
 from src.podcast.feed_sync import FeedSyncService
 
 
+def _feed_result(podcast_id, new_episodes=0, error=None):
+    """Per-feed result as returned by FeedSyncService._sync_podcast_async."""
+    return {
+        "podcast_id": podcast_id,
+        "new_episodes": new_episodes,
+        "updated": error is None,
+        "error": error,
+        "fetch_seconds": 0.1,
+        "parse_seconds": 0.01,
+    }
+
+
 class TestFeedSyncService:
     """Tests for FeedSyncService class."""
 
@@ -57,7 +70,7 @@ class TestFeedSyncService:
         mock_podcast.feed_url = "https://example.com/feed.xml"
 
         mock_repository.get_podcast.return_value = mock_podcast
-        sync_service.feed_parser.parse_url = Mock(side_effect=Exception("Parse error"))
+        sync_service.feed_parser.fetch = Mock(side_effect=Exception("Parse error"))
 
         result = sync_service.sync_podcast("pod-1")
 
@@ -83,10 +96,10 @@ class TestFeedSyncService:
 
         mock_repository.list_podcasts.return_value = [mock_podcast1, mock_podcast2]
 
-        with patch.object(sync_service, "sync_podcast") as mock_sync:
+        with patch.object(sync_service, "_sync_podcast_async") as mock_sync:
             mock_sync.side_effect = [
-                {"error": None, "new_episodes": 3},
-                {"error": None, "new_episodes": 2},
+                _feed_result("pod-1", new_episodes=3),
+                _feed_result("pod-2", new_episodes=2),
             ]
 
             result = sync_service.sync_all_podcasts()
@@ -94,6 +107,52 @@ class TestFeedSyncService:
             assert result["synced"] == 2
             assert result["failed"] == 0
             assert result["new_episodes"] == 5
+            # Priorities are refreshed once for the whole pass
+            mock_repository.refresh_episode_priorities.assert_called_once_with(["pod-1", "pod-2"])
+
+    def test_sync_due_podcasts(self, sync_service, mock_repository):
+        """Test the pipeline sync only checks podcasts that are due."""
+        mock_podcast = Mock()
+        mock_podcast.id = "pod-1"
+        mock_repository.list_podcasts_due_for_sync.return_value = [mock_podcast]
+
+        with patch.object(sync_service, "_sync_podcast_async") as mock_sync:
+            mock_sync.side_effect = [_feed_result("pod-1", new_episodes=1)]
+
+            result = sync_service.sync_due_podcasts()
+
+        assert result["synced"] == 1
+        mock_repository.list_podcasts_due_for_sync.assert_called_once()
+        mock_repository.list_podcasts_with_subscribers.assert_not_called()
+
+    def test_add_new_episodes_bulk_inserts_unknown_guids(self, sync_service, mock_repository):
+        """Test new episodes are inserted in one bulk call, skipping stored GUIDs."""
+        from src.podcast.feed_parser import ParsedEpisode, ParsedPodcast
+
+        podcast = Mock(id="pod-1", title="Podcast")
+        parsed = ParsedPodcast(
+            feed_url="https://example.com/feed.xml",
+            title="Podcast",
+            episodes=[
+                ParsedEpisode(
+                    guid=guid,
+                    title=guid,
+                    enclosure_url=f"https://e/{guid}.mp3",
+                    enclosure_type="audio/mpeg",
+                )
+                for guid in ("ep-1", "ep-2", "ep-3")
+            ],
+        )
+        mock_repository.get_existing_episode_guids.return_value = {"ep-2"}
+        mock_repository.bulk_create_episodes.return_value = 2
+
+        assert sync_service._add_new_episodes(podcast, parsed) == 2
+
+        podcast_id, episodes = mock_repository.bulk_create_episodes.call_args.args
+        assert podcast_id == "pod-1"
+        assert [e["guid"] for e in episodes] == ["ep-1", "ep-3"]
+        assert episodes[0]["enclosure_url"] == "https://e/ep-1.mp3"
+        mock_repository.create_episode.assert_not_called()
 
     def test_sync_all_podcasts_partial_failure(self, sync_service, mock_repository):
         """Test sync_all with partial failures."""
@@ -105,10 +164,10 @@ class TestFeedSyncService:
 
         mock_repository.list_podcasts.return_value = [mock_podcast1, mock_podcast2]
 
-        with patch.object(sync_service, "sync_podcast") as mock_sync:
+        with patch.object(sync_service, "_sync_podcast_async") as mock_sync:
             mock_sync.side_effect = [
-                {"error": None, "new_episodes": 3},
-                {"error": "Failed to sync", "new_episodes": 0},
+                _feed_result("pod-1", new_episodes=3),
+                _feed_result("pod-2", error="Failed to sync"),
             ]
 
             result = sync_service.sync_all_podcasts()
@@ -116,6 +175,7 @@ class TestFeedSyncService:
             assert result["synced"] == 1
             assert result["failed"] == 1
             assert result["new_episodes"] == 3
+            mock_repository.refresh_episode_priorities.assert_called_once_with(["pod-1"])
 
 
 class TestFeedSyncAddPodcast:
@@ -149,7 +209,7 @@ class TestFeedSyncAddPodcast:
     def test_add_podcast_parse_error(self, sync_service, mock_repository):
         """Test adding a podcast when parsing fails."""
         mock_repository.get_podcast_by_feed_url.return_value = None
-        sync_service.feed_parser.parse_url = Mock(side_effect=Exception("Invalid feed"))
+        sync_service.feed_parser.fetch = Mock(side_effect=Exception("Invalid feed"))
 
         result = sync_service.add_podcast_from_url("https://example.com/bad-feed.xml")
 
@@ -190,9 +250,212 @@ class TestFeedSyncMetadataUpdate:
         mock_parsed.language = "en"
         mock_parsed.episodes = []
 
-        sync_service.feed_parser.parse_url = Mock(return_value=mock_parsed)
+        mock_podcast.feed_etag = None
+        mock_podcast.feed_last_modified = None
+        mock_podcast.feed_content_hash = None
+        mock_podcast.feed_reconciled_at = None
+        mock_podcast.check_frequency_hours = 24
+        mock_repository.get_episode_published_dates.return_value = []
+        sync_service.feed_parser.fetch = Mock(return_value=FetchedFeed(content=b"<rss/>"))
+        sync_service.feed_parser.parse_content = Mock(return_value=mock_parsed)
 
         result = sync_service.sync_podcast("pod-1")
 
         # update_podcast should have been called
         mock_repository.update_podcast.assert_called()
+        # Queued episodes are re-scored after every sync
+        mock_repository.refresh_episode_priorities.assert_called_once_with(["pod-1"])
+
+
+def _rss(title, guids):
+    """Minimal RSS document with one audio item per GUID."""
+    items = "".join(
+        f"<item><guid>{guid}</guid><title>{guid}</title>"
+        f'<enclosure url="https://cdn.example.com/{guid}.mp3" type="audio/mpeg"/>'
+        "<pubDate>Mon, 01 Jan 2024 00:00:00 GMT</pubDate></item>"
+        for guid in guids
+    )
+    return (
+        '<?xml version="1.0"?><rss version="2.0"><channel>'
+        f"<title>{title}</title>{items}</channel></rss>"
+    )
+
+
+def _run_coroutine(coro):
+    """Run a coroutine on a private event loop (see test_async_repository)."""
+    import asyncio
+
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+class TestConcurrentSync:
+    """Tests for the asyncio sync engine against a local HTTP server."""
+
+    @pytest.fixture
+    def repository(self, tmp_path):
+        from src.db.factory import create_repository
+
+        repo = create_repository(f"sqlite:///{tmp_path / 'sync.db'}", create_tables=True)
+        yield repo
+        repo.close()
+
+    def _serve_and_sync(self, service, podcasts_for, feeds, delay=0.0):
+        """Serve `feeds` (path -> body, status or (body, etag)) and sync the podcasts built by `podcasts_for(base_url)`."""
+        import asyncio
+
+        from aiohttp import web
+
+        stats = {"in_flight": 0, "max_in_flight": 0}
+
+        async def handler(request):
+            stats["in_flight"] += 1
+            stats["max_in_flight"] = max(stats["max_in_flight"], stats["in_flight"])
+            try:
+                await asyncio.sleep(delay)
+                body = feeds[request.path]
+                if isinstance(body, int):
+                    return web.Response(status=body)
+                headers = {}
+                if isinstance(body, tuple):
+                    body, etag = body
+                    if request.headers.get("If-None-Match") == etag:
+                        return web.Response(status=304, headers={"ETag": etag})
+                    headers["ETag"] = etag
+                return web.Response(
+                    text=body, content_type="application/rss+xml", headers=headers
+                )
+            finally:
+                stats["in_flight"] -= 1
+
+        async def run():
+            app = web.Application()
+            app.router.add_get("/{name}", handler)
+            runner = web.AppRunner(app)
+            await runner.setup()
+            site = web.TCPSite(runner, "127.0.0.1", 0)
+            await site.start()
+            port = site._server.sockets[0].getsockname()[1]
+            try:
+                return await service.sync_podcasts_async(podcasts_for(f"http://127.0.0.1:{port}"))
+            finally:
+                await runner.cleanup()
+
+        return _run_coroutine(run()), stats
+
+    def test_syncs_feeds_concurrently_with_timings(self, repository):
+        service = FeedSyncService(repository, max_concurrent=3, max_per_host=2)
+        service.feed_parser.retry_attempts = 0
+        feeds = {f"/feed{i}": _rss(f"Feed {i}", [f"ep-{i}-a", f"ep-{i}-b"]) for i in range(6)}
+
+        def podcasts_for(base_url):
+            return [
+                repository.create_podcast(feed_url=f"{base_url}/feed{i}", title=f"Feed {i}")
+                for i in range(6)
+            ]
+
+        result, stats = self._serve_and_sync(service, podcasts_for, feeds, delay=0.05)
+
+        assert result["synced"] == 6
+        assert result["failed"] == 0
+        assert result["new_episodes"] == 12
+        # Every feed comes from one host, so the per-host limit applies
+        assert 1 < stats["max_in_flight"] <= 2
+        for feed_result in result["results"]:
+            assert feed_result["fetch_seconds"] >= 0.05
+            assert feed_result["parse_seconds"] is not None
+        podcast = repository.get_podcast(result["results"][0]["podcast_id"])
+        assert podcast.last_checked is not None
+        assert podcast.next_check_at is not None
+
+    def test_failed_feed_does_not_stop_pass(self, repository):
+        service = FeedSyncService(repository)
+        service.feed_parser.retry_attempts = 0
+        feeds = {"/good": _rss("Good", ["ep-1"]), "/gone": 404}
+
+        def podcasts_for(base_url):
+            return [
+                repository.create_podcast(feed_url=f"{base_url}/good", title="Good"),
+                repository.create_podcast(feed_url=f"{base_url}/gone", title="Gone"),
+            ]
+
+        result, _ = self._serve_and_sync(service, podcasts_for, feeds)
+
+        assert result["synced"] == 1
+        assert result["failed"] == 1
+        failed = next(r for r in result["results"] if r["error"])
+        assert "404" in failed["error"]
+        assert failed["parse_seconds"] is None
+        # A failed feed is scheduled like any other rather than retried every pass
+        assert repository.get_podcast(failed["podcast_id"]).next_check_at is not None
+
+    def test_unchanged_feeds_skip_parse(self, repository):
+        service = FeedSyncService(repository)
+        service.feed_parser.retry_attempts = 0
+        feeds = {
+            "/etag": (_rss("ETag", ["ep-1"]), '"v1"'),
+            "/plain": _rss("Plain", ["ep-1"]),
+        }
+        podcasts = []
+
+        def podcasts_for(base_url):
+            if not podcasts:
+                podcasts.extend([
+                    repository.create_podcast(feed_url=f"{base_url}/etag", title="ETag"),
+                    repository.create_podcast(feed_url=f"{base_url}/plain", title="Plain"),
+                ])
+            # The server listens on a new port each pass
+            for podcast in podcasts:
+                name = podcast.feed_url.rsplit("/", 1)[1]
+                repository.update_podcast(podcast.id, feed_url=f"{base_url}/{name}")
+            return [repository.get_podcast(p.id) for p in podcasts]
+
+        first, _ = self._serve_and_sync(service, podcasts_for, feeds)
+        assert first["new_episodes"] == 2
+        assert first["not_modified"] == 0
+        stored = repository.get_podcast(podcasts[0].id)
+        assert stored.feed_etag == '"v1"'
+        assert stored.feed_content_hash is not None
+
+        # The ETag feed answers 304; the other is byte-identical
+        second, _ = self._serve_and_sync(service, podcasts_for, feeds)
+
+        assert second["synced"] == 2
+        assert second["not_modified"] == 2
+        assert second["new_episodes"] == 0
+        for feed_result in second["results"]:
+            assert feed_result["not_modified"] is True
+            assert feed_result["parse_seconds"] is None
+
+    def test_changed_feed_is_parsed_incrementally(self, repository):
+        service = FeedSyncService(repository, stop_after_known=2)
+        service.feed_parser.retry_attempts = 0
+        feeds = {"/feed": _rss("Feed", [f"ep-{i}" for i in range(10)])}
+        podcasts = []
+
+        def podcasts_for(base_url):
+            if not podcasts:
+                podcasts.append(
+                    repository.create_podcast(feed_url=f"{base_url}/feed", title="Feed")
+                )
+            repository.update_podcast(podcasts[0].id, feed_url=f"{base_url}/feed")
+            return [repository.get_podcast(podcasts[0].id)]
+
+        first, _ = self._serve_and_sync(service, podcasts_for, feeds)
+        assert first["new_episodes"] == 10
+        reconciled_at = repository.get_podcast(podcasts[0].id).feed_reconciled_at
+        assert reconciled_at is not None
+
+        feeds["/feed"] = _rss("Feed", ["ep-new"] + [f"ep-{i}" for i in range(10)])
+        with patch.object(
+            service.feed_parser, "parse_content", wraps=service.feed_parser.parse_content
+        ) as full_parse:
+            second, _ = self._serve_and_sync(service, podcasts_for, feeds)
+
+        assert second["new_episodes"] == 1
+        full_parse.assert_not_called()
+        assert repository.get_episode_by_guid(podcasts[0].id, "ep-new") is not None
+        assert repository.get_podcast(podcasts[0].id).feed_reconciled_at == reconciled_at
@@ -0,0 +1,159 @@
+"""Tests for the Prometheus metrics registry and HTTP listener."""
+
+import json
+import urllib.error
+import urllib.request
+
+import pytest
+from sqlalchemy import create_engine, text
+
+from src.utils.metrics import (
+    DB_QUERY_SECONDS,
+    STAGE_EPISODES,
+    STAGE_SECONDS,
+    MetricsRegistry,
+    MetricsServer,
+    instrument_engine,
+    record_stage,
+)
+
+
+@pytest.fixture
+def registry():
+    """Create an empty registry."""
+    return MetricsRegistry()
+
+
+class TestMetricsRegistry:
+    """Tests for metric families and text rendering."""
+
+    def test_counter_and_gauge_render(self, registry):
+        """Test counters and gauges render one sample per label set."""
+        counter = registry.counter("jobs_total", "Jobs run.", ("stage",))
+        gauge = registry.gauge("queue_depth", "Queued jobs.")
+        counter.inc(stage="download")
+        counter.inc(2, stage="download")
+        gauge.set(7)
+
+        output = registry.render()
+
+        assert "# TYPE jobs_total counter" in output
+        assert 'jobs_total{stage="download"} 3' in output
+        assert "# TYPE queue_depth gauge" in output
+        assert "queue_depth 7" in output
+
+    def test_histogram_buckets_are_cumulative(self, registry):
+        """Test histogram buckets, sum and count."""
+        histogram = registry.histogram("latency_seconds", "Latency.", buckets=(1, 5))
+        for value in (0.5, 2, 10):
+            histogram.observe(value)
+
+        output = registry.render()
+
+        assert 'latency_seconds_bucket{le="1"} 1' in output
+        assert 'latency_seconds_bucket{le="5"} 2' in output
+        assert 'latency_seconds_bucket{le="+Inf"} 3' in output
+        assert "latency_seconds_sum 12.5" in output
+        assert "latency_seconds_count 3" in output
+
+    def test_histogram_time_context_manager(self, registry):
+        """Test time() observes the block duration."""
+        histogram = registry.histogram("block_seconds", "Block.", ("name",))
+
+        with histogram.time(name="x"):
+            pass
+
+        assert histogram.count(name="x") == 1
+        assert histogram.sum(name="x") >= 0
+
+    def test_label_values_are_escaped(self, registry):
+        """Test quotes, backslashes and newlines in label values."""
+        counter = registry.counter("errors_total", "Errors.", ("message",))
+        counter.inc(message='bad "x"\\\n')
+
+        assert 'errors_total{message="bad \\"x\\"\\\\\\n"} 1' in registry.render()
+
+    def test_wrong_labels_rejected(self, registry):
+        """Test observations must supply exactly the declared labels."""
+        counter = registry.counter("jobs_total", "Jobs run.", ("stage",))
+
+        with pytest.raises(ValueError):
+            counter.inc(outcome="ok")
+        with pytest.raises(ValueError):
+            counter.inc(-1, stage="download")
+
+    def test_duplicate_registration_rejected(self, registry):
+        """Test metric names are unique within a registry."""
+        registry.gauge("queue_depth", "Queued jobs.")
+
+        with pytest.raises(ValueError, match="already registered"):
+            registry.gauge("queue_depth", "Queued jobs.")
+
+
+class TestPipelineMetrics:
+    """Tests for the shared pipeline metrics helpers."""
+
+    def test_record_stage(self):
+        """Test stage outcomes and durations are recorded."""
+        before_count = STAGE_SECONDS.count(stage="cleanup")
+        before_failures = STAGE_EPISODES.value(stage="cleanup", outcome="failure")
+
+        record_stage("cleanup", 1.5, True)
+        record_stage("cleanup", None, False)
+
+        assert STAGE_SECONDS.count(stage="cleanup") == before_count + 1
+        assert STAGE_EPISODES.value(stage="cleanup", outcome="failure") == before_failures + 1
+
+    def test_instrument_engine_times_statements(self):
+        """Test statements are timed and labelled by their leading keyword."""
+        engine = create_engine("sqlite://")
+        instrument_engine(engine)
+        instrument_engine(engine)  # Idempotent
+        before = DB_QUERY_SECONDS.count(operation="SELECT")
+
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+
+        assert DB_QUERY_SECONDS.count(operation="SELECT") == before + 1
+        engine.dispose()
+
+
+class TestMetricsServer:
+    """Tests for the background HTTP listener."""
+
+    @pytest.fixture
+    def server(self, registry):
+        """Start a server on a free port."""
+        registry.gauge("queue_depth", "Queued jobs.").set(3)
+        server = MetricsServer(
+            port=0,
+            host="127.0.0.1",
+            registry=registry,
+            status_provider=lambda: {"running": True},
+        )
+        server.start()
+        yield server
+        server.stop()
+
+    def _get(self, server, path):
+        return urllib.request.urlopen(f"http://127.0.0.1:{server.port}{path}", timeout=5)
+
+    def test_serves_metrics(self, server):
+        """Test /metrics returns the text exposition format."""
+        with self._get(server, "/metrics") as response:
+            body = response.read().decode()
+            assert response.headers["Content-Type"].startswith("text/plain; version=0.0.4")
+
+        assert "queue_depth 3" in body
+
+    def test_serves_status(self, server):
+        """Test /status returns the status provider's JSON."""
+        with self._get(server, "/status") as response:
+            assert json.loads(response.read()) == {"running": True}
+
+    def test_unknown_path_404(self, server):
+        """Test other paths are not found."""
+        with pytest.raises(urllib.error.HTTPError) as exc_info:
+            self._get(server, "/other")
+
+        assert exc_info.value.code == 404
@@ -9,6 +9,7 @@ from pathlib import Path
 import pytest
 
 from src.db.factory import create_repository
+from src.db.models import EpisodeTranscript
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from scripts.migrate_transcripts_to_db import (
@@ -191,7 +192,7 @@ class TestMigrationLogic:
 
         # Verify transcript was stored in database
         updated_episode = repository.get_episode(episode.id)
-        assert updated_episode.transcript_text == transcript_content
+        assert repository.get_transcript_text(updated_episode.id) == transcript_content
 
     def test_migrate_with_metadata(self, repository, sample_podcast, tmp_path):
         """Test migrating episode with metadata file."""
@@ -231,7 +232,7 @@ class TestMigrationLogic:
 
         # Verify both transcript and metadata were stored
         updated_episode = repository.get_episode(episode.id)
-        assert updated_episode.transcript_text == transcript_content
+        assert repository.get_transcript_text(updated_episode.id) == transcript_content
         assert updated_episode.mp3_artist == "Test Artist"
         assert updated_episode.mp3_album == "Test Album"
 
@@ -265,7 +266,7 @@ class TestMigrationLogic:
         # Verify all episodes were migrated
         for i, episode in enumerate(episodes):
             updated_episode = repository.get_episode(episode.id)
-            assert updated_episode.transcript_text == f"Transcript {i}"
+            assert repository.get_transcript_text(updated_episode.id) == f"Transcript {i}"
 
     def test_migrate_dry_run(self, repository, sample_podcast, tmp_path):
         """Test migration in dry-run mode."""
@@ -292,8 +293,8 @@ class TestMigrationLogic:
         assert errors == 0
 
         # Verify database was NOT updated
-        updated_episode = repository.get_episode(episode.id)
-        assert updated_episode.transcript_text is None
+        with repository._get_session() as session:
+            assert session.get(EpisodeTranscript, episode.id) is None
 
     def test_migrate_verify_only(self, repository, sample_podcast, tmp_path):
         """Test migration in verify-only mode."""
@@ -394,7 +395,7 @@ class TestMigrationLogic:
 
         # Verify Unicode content preserved
         updated_episode = repository.get_episode(episode.id)
-        assert updated_episode.transcript_text == transcript_content
+        assert repository.get_transcript_text(updated_episode.id) == transcript_content
 
     def test_migrate_large_transcript(self, repository, sample_podcast, tmp_path):
         """Test migrating a large transcript file."""
@@ -424,4 +425,4 @@ class TestMigrationLogic:
 
         # Verify large content stored correctly
         updated_episode = repository.get_episode(episode.id)
-        assert len(updated_episode.transcript_text) == len(transcript_content)
+        assert len(repository.get_transcript_text(updated_episode.id)) == len(transcript_content)
@@ -472,6 +472,12 @@ class TestPipelineOrchestratorIteration:
         config.download_buffer_size = 5
         config.download_buffer_threshold = 2
         config.max_retries = 3
+        config.worker_id = "node-a:1"
+        config.transcription_lease_seconds = 3600
+        config.lease_reap_interval_seconds = 300
+        config.priority_refresh_interval_seconds = 3600
+        config.stale_claim_seconds = 3600
+        config.transcription_workers = 1
         return config
 
     @pytest.fixture
@@ -479,7 +485,7 @@ class TestPipelineOrchestratorIteration:
         """Create mock repository."""
         repo = Mock()
         repo.get_download_buffer_count.return_value = 5
-        repo.get_next_for_transcription.return_value = None
+        repo.claim_next_for_transcription.return_value = None
         return repo
 
     @pytest.fixture
@@ -493,7 +499,7 @@ class TestPipelineOrchestratorIteration:
 
     def test_pipeline_iteration_returns_false_when_no_work(self, orchestrator, mock_repository):
         """Test _pipeline_iteration returns False when no work."""
-        mock_repository.get_next_for_transcription.return_value = None
+        mock_repository.claim_next_for_transcription.return_value = None
 
         result = orchestrator._pipeline_iteration()
 
@@ -505,7 +511,7 @@ class TestPipelineOrchestratorIteration:
         mock_episode.id = "ep-1"
         mock_episode.title = "Test Episode"
 
-        mock_repository.get_next_for_transcription.return_value = mock_episode
+        mock_repository.claim_next_for_transcription.return_value = mock_episode
 
         mock_worker = Mock()
         mock_worker.transcribe_single.return_value = "/path/to/transcript.txt"
@@ -526,7 +532,7 @@ class TestPipelineOrchestratorIteration:
         mock_episode.id = "ep-1"
         mock_episode.title = "Test Episode"
 
-        mock_repository.get_next_for_transcription.return_value = mock_episode
+        mock_repository.claim_next_for_transcription.return_value = mock_episode
         mock_repository.increment_retry_count.return_value = 1
 
         mock_worker = Mock()
@@ -547,7 +553,7 @@ class TestPipelineOrchestratorIteration:
         mock_episode.id = "ep-1"
         mock_episode.title = "Test Episode"
 
-        mock_repository.get_next_for_transcription.return_value = mock_episode
+        mock_repository.claim_next_for_transcription.return_value = mock_episode
         mock_repository.increment_retry_count.return_value = 4  # Exceeds max_retries=3
 
         mock_worker = Mock()
@@ -560,6 +566,190 @@ class TestPipelineOrchestratorIteration:
         assert orchestrator._stats.transcription_permanent_failures == 1
         mock_repository.mark_permanently_failed.assert_called_once()
 
+    def test_pipeline_iteration_claims_with_worker_id(self, orchestrator, mock_repository):
+        """Test _pipeline_iteration claims work under this node's worker id."""
+        orchestrator._pipeline_iteration()
+
+        mock_repository.claim_next_for_transcription.assert_called_once_with(
+            worker_id="node-a:1", lease_seconds=3600
+        )
+
+    def test_pipeline_iteration_batched_mode(
+        self, orchestrator, mock_repository, mock_pipeline_config
+    ):
+        """Test batched mode claims several buffered episodes and transcribes them together."""
+        from src.workflow.workers.transcription import TranscriptionOutcome
+
+        mock_pipeline_config.transcription_workers = 3
+        episodes = [Mock(id=f"ep-{i}", title=f"Episode {i}") for i in range(2)]
+        mock_repository.claim_next_for_transcription.side_effect = episodes + [None]
+        mock_repository.increment_retry_count.return_value = 1
+
+        mock_worker = Mock()
+        mock_worker.transcribe_many.return_value = [
+            TranscriptionOutcome(episodes[0], "Transcript", realtime_factor=0.1),
+            TranscriptionOutcome(episodes[1], None),
+        ]
+        orchestrator._transcription_worker = mock_worker
+        orchestrator._post_processor = Mock()
+        orchestrator._running = True
+
+        result = orchestrator._pipeline_iteration()
+
+        assert result is True
+        mock_worker.transcribe_many.assert_called_once_with(episodes)
+        mock_worker.transcribe_single.assert_not_called()
+        orchestrator._post_processor.submit.assert_called_once_with("ep-0")
+        assert orchestrator._stats.episodes_transcribed == 1
+        assert orchestrator._stats.transcription_failures == 1
+        mock_repository.reset_episode_for_retry.assert_called_once_with("ep-1", "transcript")
+
+    def test_pipeline_iteration_feeds_prefetcher(self, orchestrator, mock_repository):
+        """Test the prefetcher replaces the inline refill and receives throughput."""
+        mock_episode = Mock(id="ep-1", title="Episode", duration_seconds=1200)
+        mock_repository.claim_next_for_transcription.return_value = mock_episode
+        mock_worker = Mock()
+        mock_worker.transcribe_single.return_value = "Transcript"
+        orchestrator._transcription_worker = mock_worker
+        orchestrator._prefetcher = Mock()
+        orchestrator._running = True
+
+        with patch.object(orchestrator, "_maintain_download_buffer") as mock_maintain:
+            orchestrator._pipeline_iteration()
+
+        mock_maintain.assert_not_called()
+        audio_seconds, wall_seconds = orchestrator._prefetcher.record_transcription.call_args.args
+        assert audio_seconds == 1200
+        assert wall_seconds >= 0
+
+    def test_preprocessing_skipped_when_disabled(self, orchestrator):
+        """Test no preprocessing is scheduled without an executor."""
+        orchestrator._maybe_run_preprocessing()
+
+        assert orchestrator._preprocess_future is None
+
+    def test_preprocessing_runs_one_batch_at_a_time(self, orchestrator, mock_pipeline_config):
+        """Test a new preprocessing batch is only submitted after the last one finished."""
+        mock_pipeline_config.download_buffer_size = 5
+        orchestrator._preprocess_worker = Mock()
+        orchestrator._preprocess_executor = Mock()
+        running = Mock()
+        running.done.return_value = False
+        orchestrator._preprocess_executor.submit.return_value = running
+
+        orchestrator._maybe_run_preprocessing()
+        orchestrator._maybe_run_preprocessing()
+
+        orchestrator._preprocess_executor.submit.assert_called_once()
+
+    def test_reap_expired_leases_respects_interval(self, orchestrator, mock_repository):
+        """Test expired leases are reaped at most once per interval."""
+        orchestrator._maybe_reap_expired_leases()
+        orchestrator._maybe_reap_expired_leases()
+
+        mock_repository.release_expired_transcription_leases.assert_called_once()
+        requeued = [c.args[:2] for c in mock_repository.requeue_stale_episodes.call_args_list]
+        assert requeued == [("download", "downloading"), ("indexing", "uploading")]
+        stale_before = mock_repository.requeue_stale_episodes.call_args.args[2]
+        assert stale_before <= orchestrator._last_lease_reap - timedelta(seconds=3600)
+
+    def test_refresh_priorities_respects_interval(self, orchestrator, mock_repository):
+        """Test every queued episode is re-scored at most once per interval."""
+        orchestrator._maybe_refresh_priorities()
+        orchestrator._maybe_refresh_priorities()
+
+        mock_repository.refresh_episode_priorities.assert_called_once_with()
+
+        orchestrator._last_priority_refresh -= timedelta(hours=1)
+        orchestrator._maybe_refresh_priorities()
+        assert mock_repository.refresh_episode_priorities.call_count == 2
+
+    def _due_for_audio_retention(self, orchestrator, mock_config, directory):
+        mock_config.BRIEFING_AUDIO_RETENTION_DAYS = 30
+        mock_config.BRIEFING_AUDIO_STORAGE = "local"
+        mock_config.BRIEFING_AUDIO_DIRECTORY = str(directory)
+        orchestrator._last_audio_retention = datetime.now(UTC) - timedelta(days=2)
+
+    def test_audio_retention_deletes_expired_audio(
+        self, orchestrator, mock_config, mock_repository, tmp_path
+    ):
+        """Test expired audio rows are cleared and their files deleted."""
+        audio = tmp_path / "briefings" / "b1" / "a.mp3"
+        audio.parent.mkdir(parents=True)
+        audio.write_bytes(b"mp3")
+        mock_repository.get_audio_storage_keys_before.return_value = ["briefings/b1/a.mp3"]
+        mock_repository.clear_audio_data_before.return_value = 1
+        self._due_for_audio_retention(orchestrator, mock_config, tmp_path)
+
+        orchestrator._maybe_run_audio_retention()
+
+        mock_repository.clear_audio_data_before.assert_called_once()
+        assert not audio.exists()
+
+    def test_audio_retention_skipped_without_shared_directory(
+        self, orchestrator, mock_config, mock_repository, tmp_path
+    ):
+        """Test rows are kept when the local audio directory is not mounted here."""
+        self._due_for_audio_retention(orchestrator, mock_config, tmp_path / "missing")
+
+        orchestrator._maybe_run_audio_retention()
+
+        mock_repository.get_audio_storage_keys_before.assert_not_called()
+        mock_repository.clear_audio_data_before.assert_not_called()
+
+    def test_reap_expired_leases_handles_db_error(self, orchestrator, mock_repository):
+        """Test reaper failures do not break the pipeline iteration."""
+        from sqlalchemy.exc import SQLAlchemyError
+
+        mock_repository.release_expired_transcription_leases.side_effect = SQLAlchemyError(
+            "boom"
+        )
+
+        orchestrator._maybe_reap_expired_leases()
+
+        assert orchestrator._last_lease_reap is not None
+
+    def test_transcript_ready_published(self, orchestrator):
+        """Test a stored transcript wakes post-processing consumers."""
+        from src.workflow.events import TRANSCRIPT_READY
+
+        orchestrator._handle_transcription_result(Mock(id="ep-1"), "Transcript")
+
+        assert orchestrator._events.wait(timeout=0) == {TRANSCRIPT_READY}
+
+    def test_idle_wait_longer_with_listen_notify(self, orchestrator, mock_pipeline_config):
+        """Test the fallback poll is relaxed when other processes can wake the loop."""
+        from src.workflow.events import PostgresEventBus
+
+        mock_pipeline_config.idle_wait_seconds = 10
+        mock_pipeline_config.event_idle_wait_seconds = 60
+
+        assert orchestrator._idle_wait_seconds() == 10
+        orchestrator._events = PostgresEventBus(Mock())
+        assert orchestrator._idle_wait_seconds() == 60
+
+    def test_queue_metrics_only_when_served(self, orchestrator, mock_repository):
+        """Test queue-depth gauges are refreshed only while metrics are served."""
+        from src.utils.metrics import QUEUE_DEPTH
+
+        orchestrator._maybe_update_queue_metrics()
+        mock_repository.get_overall_stats.assert_not_called()
+
+        orchestrator._metrics_server = Mock()
+        mock_repository.get_overall_stats.return_value = {
+            "pending_download": 12,
+            "pending_indexing": 3,
+        }
+        mock_repository.get_download_buffer_count.return_value = 4
+
+        orchestrator._maybe_update_queue_metrics()
+        orchestrator._maybe_update_queue_metrics()  # Within the interval
+
+        mock_repository.get_overall_stats.assert_called_once()
+        assert QUEUE_DEPTH.value(stage="download") == 12
+        assert QUEUE_DEPTH.value(stage="transcribe") == 4
+        assert QUEUE_DEPTH.value(stage="index") == 3
+
 
 class TestPipelineOrchestratorPostProcess:
     """Tests for post-processing functionality."""
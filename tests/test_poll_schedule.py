@@ -0,0 +1,96 @@
+"""Tests for the adaptive feed polling schedule."""
+
+from datetime import UTC, datetime, timedelta
+
+from src.podcast.poll_schedule import publishing_cadence, schedule_next_check
+
+MIN = timedelta(minutes=30)
+MAX = timedelta(days=7)
+FALLBACK = timedelta(hours=24)
+
+
+def _daily(last, count=10):
+    """Published dates of a daily show whose latest episode came out at `last`."""
+    return [last - timedelta(days=i) for i in range(count)]
+
+
+def _schedule(dates, now):
+    return schedule_next_check(dates, now, FALLBACK, MIN, MAX)
+
+
+class TestPublishingCadence:
+    def test_median_gap(self):
+        start = datetime(2024, 1, 1, tzinfo=UTC)
+        dates = [start + timedelta(days=offset) for offset in (0, 1, 2, 9)]
+        assert publishing_cadence(dates) == timedelta(days=1)
+
+    def test_needs_two_dates(self):
+        assert publishing_cadence([]) is None
+        assert publishing_cadence([datetime(2024, 1, 1), None]) is None
+
+    def test_naive_dates_are_utc(self):
+        dates = [datetime(2024, 1, 1), datetime(2024, 1, 2, tzinfo=UTC)]
+        assert publishing_cadence(dates) == timedelta(days=1)
+
+
+class TestScheduleNextCheck:
+    def test_unknown_cadence_uses_fallback(self):
+        now = datetime(2024, 3, 1, tzinfo=UTC)
+        schedule = _schedule([], now)
+
+        assert schedule.next_check_at == now + FALLBACK
+        assert schedule.check_frequency_hours == 24
+
+    def test_daily_show_between_releases(self):
+        last = datetime(2024, 3, 1, 6, tzinfo=UTC)
+        now = last + timedelta(hours=1)
+
+        schedule = _schedule(_daily(last), now)
+
+        assert schedule.next_check_at == now + timedelta(hours=6)
+        assert schedule.check_frequency_hours == 6
+
+    def test_daily_show_waits_for_release_window(self):
+        last = datetime(2024, 3, 1, 6, tzinfo=UTC)
+        now = last + timedelta(hours=20)
+
+        schedule = _schedule(_daily(last), now)
+
+        # Window opens 3 hours (1/8 of a day) before the usual 06:00 release
+        assert schedule.next_check_at == datetime(2024, 3, 2, 3, tzinfo=UTC)
+
+    def test_daily_show_polled_often_in_release_window(self):
+        last = datetime(2024, 3, 1, 6, tzinfo=UTC)
+        now = datetime(2024, 3, 2, 5, tzinfo=UTC)
+
+        assert _schedule(_daily(last), now).next_check_at == now + MIN
+
+    def test_skipped_release_keeps_release_hour(self):
+        last = datetime(2024, 3, 1, 6, tzinfo=UTC)
+        now = datetime(2024, 3, 2, 12, tzinfo=UTC)  # past the window, no new episode
+
+        schedule = _schedule(_daily(last), now)
+
+        assert schedule.next_check_at == now + timedelta(hours=6)
+        now = datetime(2024, 3, 2, 23, tzinfo=UTC)
+        assert _schedule(_daily(last), now).next_check_at == datetime(2024, 3, 3, 3, tzinfo=UTC)
+
+    def test_dormant_feed_backs_off(self):
+        last = datetime(2024, 3, 1, 6, tzinfo=UTC)
+
+        # Silent for 10 cadences: checked every quarter of the silence
+        ten_days = _schedule(_daily(last), last + timedelta(days=10))
+        year_later = _schedule(_daily(last), last + timedelta(days=365))
+
+        assert ten_days.check_frequency_hours == 60
+        assert ten_days.next_check_at == last + timedelta(days=10, hours=60)
+        assert year_later.next_check_at == last + timedelta(days=365) + MAX
+
+    def test_interval_bounded_below(self):
+        last = datetime(2024, 3, 1, 6, tzinfo=UTC)
+        hourly = [last - timedelta(minutes=10 * i) for i in range(10)]
+
+        schedule = _schedule(hourly, last + timedelta(minutes=1))
+
+        assert schedule.next_check_at == last + timedelta(minutes=1) + MIN
+        assert schedule.check_frequency_hours == 1
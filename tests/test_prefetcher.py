@@ -0,0 +1,179 @@
+"""Tests for the background download prefetcher."""
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+from src.podcast.downloader import DownloadResult
+from src.workflow.config import PipelineConfig
+from src.workflow.prefetcher import DownloadPrefetcher, RollingRate
+
+
+class TestRollingRate:
+    """Tests for RollingRate."""
+
+    def test_rate_none_without_samples(self):
+        """Test rate is unknown before any sample."""
+        assert RollingRate().rate is None
+
+    def test_rate_over_window(self):
+        """Test only the most recent samples are used."""
+        rate = RollingRate(window=2)
+        rate.add(100, 1)
+        rate.add(30, 1)
+        rate.add(10, 1)
+
+        assert rate.rate == 20
+        assert rate.average_amount == 20
+
+    def test_ignores_non_positive_samples(self):
+        """Test zero-length samples don't skew the rate."""
+        rate = RollingRate()
+        rate.add(0, 10)
+        rate.add(10, 0)
+
+        assert rate.rate is None
+
+
+class TestDownloadPrefetcher:
+    """Tests for DownloadPrefetcher."""
+
+    @pytest.fixture
+    def pipeline_config(self):
+        """Create a PipelineConfig with the prefetcher enabled."""
+        return PipelineConfig(
+            download_buffer_size=10,
+            download_workers=2,
+            download_buffer_hours=2.0,
+            download_min_free_disk_mb=100,
+        )
+
+    @pytest.fixture
+    def mock_repository(self):
+        """Create mock repository with an empty buffer."""
+        repo = Mock()
+        repo.get_download_buffer_count.return_value = 0
+        repo.get_download_buffer_audio_seconds.return_value = 0
+        return repo
+
+    @pytest.fixture
+    def download_worker(self):
+        """Create mock download worker."""
+        return Mock()
+
+    @pytest.fixture
+    def prefetcher(self, pipeline_config, mock_repository, download_worker, tmp_path):
+        """Create prefetcher instance."""
+        return DownloadPrefetcher(
+            pipeline_config=pipeline_config,
+            repository=mock_repository,
+            download_worker=download_worker,
+            download_directory=str(tmp_path),
+        )
+
+    def test_target_defaults_to_configured_hours(self, prefetcher):
+        """Test target is download_buffer_hours before any measurement."""
+        assert prefetcher.target_audio_seconds() == 7200
+
+    def test_target_grows_with_throughput(self, prefetcher):
+        """Test fast transcription over slow downloads needs a deeper buffer."""
+        # Transcribes 10 s of audio per second; one 100 MB episode takes 1000 s
+        prefetcher.record_transcription(audio_seconds=36000, wall_seconds=3600)
+        prefetcher.download_bandwidth.add(100 * 1024 * 1024, 1000)
+
+        assert prefetcher.target_audio_seconds() == pytest.approx(10 * 1000 * 2)
+
+    def test_refill_downloads_until_target(
+        self, prefetcher, mock_repository, download_worker
+    ):
+        """Test refill keeps downloading while buffered audio is below target."""
+        mock_repository.get_download_buffer_audio_seconds.side_effect = [0, 3600, 7200]
+        mock_repository.get_download_buffer_count.side_effect = [0, 2, 4]
+        download_worker.downloader.download_pending.return_value = {
+            "downloaded": 2,
+            "results": [
+                DownloadResult("ep-1", True, file_size=50_000_000, duration_seconds=5.0),
+                DownloadResult("ep-2", False, error="404"),
+            ],
+        }
+
+        downloaded = prefetcher.refill()
+
+        assert downloaded == 4
+        assert download_worker.downloader.download_pending.call_count == 2
+        download_worker.downloader.download_pending.assert_called_with(limit=2, bulk_status=True)
+        assert prefetcher.download_bandwidth.rate == 10_000_000
+
+    def test_refill_publishes_audio_downloaded(
+        self, prefetcher, mock_repository, download_worker
+    ):
+        """Test each successful batch wakes transcription via the event bus."""
+        from src.workflow.events import AUDIO_DOWNLOADED, EventBus
+
+        prefetcher.event_bus = EventBus()
+        mock_repository.get_download_buffer_audio_seconds.side_effect = [0, 7200]
+        download_worker.downloader.download_pending.return_value = {
+            "downloaded": 1,
+            "results": [],
+        }
+
+        prefetcher.refill()
+
+        assert prefetcher.event_bus.wait(timeout=0) == {AUDIO_DOWNLOADED}
+
+    def test_refill_respects_episode_cap(self, prefetcher, mock_repository, download_worker):
+        """Test refill stops at download_buffer_size episodes."""
+        mock_repository.get_download_buffer_count.return_value = 10
+
+        assert prefetcher.refill() == 0
+        download_worker.downloader.download_pending.assert_not_called()
+
+    def test_refill_stops_on_low_disk(self, prefetcher, download_worker):
+        """Test refill pauses when another episode would cross the free-disk floor."""
+        with patch("src.workflow.prefetcher.shutil.disk_usage") as mock_usage:
+            mock_usage.return_value = Mock(free=120 * 1024 * 1024)
+            assert prefetcher.refill() == 0
+
+        download_worker.downloader.download_pending.assert_not_called()
+
+    def test_refill_shrinks_batch_to_fit_disk(
+        self, prefetcher, mock_repository, download_worker
+    ):
+        """Test a batch is cut to the episodes that all fit above the floor together."""
+        mock_repository.get_download_buffer_audio_seconds.side_effect = [0, 7200]
+        prefetcher.download_bandwidth.add(10 * 1024 * 1024, 1.0)
+        download_worker.downloader.download_pending.return_value = {
+            "downloaded": 1,
+            "results": [],
+        }
+        with patch("src.workflow.prefetcher.shutil.disk_usage") as mock_usage:
+            # Room for one 10 MB episode above the 100 MB floor, not two
+            mock_usage.return_value = Mock(free=115 * 1024 * 1024)
+            assert prefetcher.refill() == 1
+
+        download_worker.downloader.download_pending.assert_called_once_with(
+            limit=1, bulk_status=True
+        )
+
+    def test_refill_stops_when_nothing_downloaded(
+        self, prefetcher, download_worker
+    ):
+        """Test refill gives up for this round when no episode could be fetched."""
+        download_worker.downloader.download_pending.return_value = {
+            "downloaded": 0,
+            "results": [],
+        }
+
+        assert prefetcher.refill() == 0
+        download_worker.downloader.download_pending.assert_called_once()
+
+    def test_start_and_stop(self, prefetcher, mock_repository):
+        """Test the background thread refills and stops cleanly."""
+        mock_repository.get_download_buffer_count.return_value = 10
+
+        prefetcher.start()
+        prefetcher.notify()
+        prefetcher.stop(timeout=5)
+
+        assert prefetcher._thread is None
+        mock_repository.get_download_buffer_count.assert_called()
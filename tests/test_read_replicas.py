@@ -0,0 +1,168 @@
+"""Tests for routing web-tier reads to read replicas."""
+
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from src.db.factory import create_repository
+from src.web.db import (
+    READ_PRIMARY_COOKIE,
+    ReadReplicas,
+    Replica,
+    mark_write,
+    read_repository,
+    read_your_writes_middleware,
+    run_read,
+)
+
+PODCAST_ID = "podcast-1"
+
+
+def _run_coroutine(coro):
+    """Run a coroutine on a private event loop (see test_async_repository)."""
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+def _database(tmp_path, name, title):
+    """Repository over a fresh database holding one podcast with the given title."""
+    repo = create_repository(f"sqlite:///{tmp_path / name}", create_tables=True)
+    repo.create_podcast(feed_url="https://example.com/feed.xml", title=title, id=PODCAST_ID)
+    return repo
+
+
+@pytest.fixture
+def state(tmp_path):
+    """App state with a primary and one replica whose data differ."""
+    primary = _database(tmp_path, "primary.db", "Primary")
+    replica = _database(tmp_path, "replica.db", "Replica")
+    yield SimpleNamespace(
+        repository=primary,
+        async_repository=None,
+        read_replicas=ReadReplicas([Replica(repository=replica)]),
+    )
+    primary.close()
+    replica.close()
+
+
+class TestReadReplicas:
+    """Tests for the replica pool."""
+
+    def test_requires_a_replica(self):
+        with pytest.raises(ValueError):
+            ReadReplicas([])
+
+    def test_rotates(self):
+        first, second = Replica(repository="a"), Replica(repository="b")
+        replicas = ReadReplicas([first, second])
+
+        assert [replicas.next() for _ in range(3)] == [first, second, first]
+
+
+class TestRunRead:
+    """Tests for run_read() with replicas configured."""
+
+    def test_reads_from_replica(self, state):
+        podcast = _run_coroutine(run_read(state, state.repository.get_podcast, PODCAST_ID))
+        assert podcast.title == "Replica"
+
+    def test_reads_from_primary_after_mark_write(self, state):
+        request = SimpleNamespace(state=SimpleNamespace())
+
+        async def call():
+            mark_write(request)
+            return await run_read(state, state.repository.get_podcast, PODCAST_ID)
+
+        assert _run_coroutine(call()).title == "Primary"
+        assert request.state.db_write is True
+
+    def test_reads_from_primary_without_replicas(self, state):
+        state.read_replicas = None
+        podcast = _run_coroutine(run_read(state, state.repository.get_podcast, PODCAST_ID))
+        assert podcast.title == "Primary"
+
+    def test_cached_primary_serves_replica_reads(self, state, tmp_path):
+        """Test the primary's repository cache answers reads routed to a replica."""
+        cached = create_repository(f"sqlite:///{tmp_path / 'primary.db'}", cache=True)
+        state.repository = cached
+        replica = state.read_replicas.replicas[0].repository
+
+        first = _run_coroutine(run_read(state, cached.get_podcast, PODCAST_ID))
+        replica.update_podcast(PODCAST_ID, title="Replica, changed")
+        second = _run_coroutine(run_read(state, cached.get_podcast, PODCAST_ID))
+
+        assert first.title == second.title == "Replica"
+        assert cached.cache_stats()["podcasts"]["hits"] == 1
+        assert cached.get_podcast(PODCAST_ID) is first
+        cached.close()
+
+    def test_read_repository(self, state):
+        assert read_repository(state).get_podcast(PODCAST_ID).title == "Replica"
+        state.read_replicas = None
+        assert read_repository(state) is state.repository
+
+
+class TestReadYourWritesMiddleware:
+    """Tests for pinning a client's reads to the primary after a write."""
+
+    @pytest.fixture
+    def client(self, state):
+        app = FastAPI()
+        app.state.repository = state.repository
+        app.state.async_repository = None
+        app.state.read_replicas = state.read_replicas
+        app.middleware("http")(read_your_writes_middleware(10, secure=False))
+
+        @app.get("/podcast")
+        async def get_podcast(request: Request):
+            podcast = await run_read(
+                request.app.state, request.app.state.repository.get_podcast, PODCAST_ID
+            )
+            return {"title": podcast.title}
+
+        @app.post("/write")
+        async def write():
+            return {"ok": True}
+
+        @app.get("/login")
+        async def login(request: Request):
+            mark_write(request)
+            podcast = await run_read(
+                request.app.state, request.app.state.repository.get_podcast, PODCAST_ID
+            )
+            return {"title": podcast.title}
+
+        return TestClient(app)
+
+    def test_reads_go_to_replica(self, client):
+        response = client.get("/podcast")
+
+        assert response.json() == {"title": "Replica"}
+        assert READ_PRIMARY_COOKIE not in response.cookies
+
+    def test_write_pins_following_reads_to_primary(self, client):
+        response = client.post("/write")
+        assert READ_PRIMARY_COOKIE in response.cookies
+
+        assert client.get("/podcast").json() == {"title": "Primary"}
+
+    def test_expired_window_reads_replica(self, client):
+        client.cookies.set(READ_PRIMARY_COOKIE, str(time.time() - 1))
+        assert client.get("/podcast").json() == {"title": "Replica"}
+
+    def test_malformed_cookie_is_ignored(self, client):
+        client.cookies.set(READ_PRIMARY_COOKIE, "not-a-time")
+        assert client.get("/podcast").json() == {"title": "Replica"}
+
+    def test_get_handler_can_mark_write(self, client):
+        response = client.get("/login")
+
+        assert response.json() == {"title": "Primary"}
+        assert READ_PRIMARY_COOKIE in response.cookies
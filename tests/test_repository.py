@@ -1,9 +1,11 @@
 """Tests for the podcast repository."""
 
+from datetime import UTC, datetime, timedelta
+
 import pytest
 
 from src.db.factory import create_repository
-from src.db.repository import _escape_like_pattern
+from src.db.models import Episode, EpisodeTranscript
 
 
 @pytest.fixture
@@ -117,6 +119,32 @@ class TestPodcastOperations:
         assert with_subscribers[0].id == podcast1.id
         assert len(all_podcasts) == 2
 
+    def test_list_podcasts_due_for_sync(self, repository, sample_user):
+        """Test listing subscribed podcasts whose next check is due."""
+        now = datetime.now(UTC)
+        never = repository.create_podcast(feed_url="https://example.com/1.xml", title="Never")
+        overdue = repository.create_podcast(
+            feed_url="https://example.com/2.xml",
+            title="Overdue",
+            next_check_at=now - timedelta(hours=1),
+        )
+        later = repository.create_podcast(
+            feed_url="https://example.com/3.xml",
+            title="Later",
+            next_check_at=now + timedelta(hours=1),
+        )
+        unsubscribed = repository.create_podcast(
+            feed_url="https://example.com/4.xml", title="Unsubscribed"
+        )
+        for podcast in (never, overdue, later):
+            repository.subscribe_user_to_podcast(sample_user.id, podcast.id)
+
+        due = repository.list_podcasts_due_for_sync(now)
+
+        assert [p.id for p in due] == [never.id, overdue.id]
+        assert unsubscribed.id not in [p.id for p in due]
+        assert len(repository.list_podcasts_due_for_sync(now, limit=1)) == 1
+
     def test_update_podcast(self, repository, sample_podcast):
         """Test updating a podcast."""
         updated = repository.update_podcast(
@@ -170,6 +198,25 @@ class TestEpisodeOperations:
         assert retrieved is not None
         assert retrieved.id == episode.id
 
+    def test_get_episode_published_dates(self, repository, sample_podcast):
+        """Test getting recent published dates, newest first."""
+        for i, published in enumerate([datetime(2024, 1, 1), None, datetime(2024, 1, 3)]):
+            repository.create_episode(
+                podcast_id=sample_podcast.id,
+                guid=f"episode-{i}",
+                title=f"Episode {i}",
+                enclosure_url=f"https://example.com/episode{i}.mp3",
+                enclosure_type="audio/mpeg",
+                published_date=published,
+            )
+
+        dates = repository.get_episode_published_dates(sample_podcast.id)
+
+        assert dates == [datetime(2024, 1, 3), datetime(2024, 1, 1)]
+        assert repository.get_episode_published_dates(sample_podcast.id, limit=1) == [
+            datetime(2024, 1, 3)
+        ]
+
     def test_get_episode_by_guid(self, repository, sample_podcast):
         """Test getting an episode by GUID."""
         repository.create_episode(
@@ -212,6 +259,42 @@ class TestEpisodeOperations:
         retrieved = repository.get_episode_by_file_search_display_name("nonexistent.txt")
         assert retrieved is None
 
+    def test_get_episodes_by_file_search_display_names(self, repository, sample_podcast):
+        """Test resolving several File Search display names at once."""
+        for i in range(3):
+            episode = repository.create_episode(
+                podcast_id=sample_podcast.id,
+                guid=f"episode-{i}",
+                title=f"Episode {i}",
+                enclosure_url=f"https://example.com/episode{i}.mp3",
+                enclosure_type="audio/mpeg",
+            )
+            repository.update_episode(
+                episode.id, file_search_display_name=f"episode_{i}_transcription.txt"
+            )
+
+        found = repository.get_episodes_by_file_search_display_names(
+            ["episode_0_transcription.txt", "episode_2_transcription.txt", "missing.txt"]
+        )
+
+        assert set(found) == {"episode_0_transcription.txt", "episode_2_transcription.txt"}
+        assert found["episode_2_transcription.txt"].guid == "episode-2"
+        assert found["episode_0_transcription.txt"].podcast.title == "Test Podcast"
+        assert repository.get_episodes_by_file_search_display_names([]) == {}
+
+    def test_get_podcasts_by_description_display_names(self, repository, sample_podcast):
+        """Test resolving several podcast description display names at once."""
+        repository.update_podcast(
+            sample_podcast.id, description_file_search_display_name="test_description.txt"
+        )
+
+        found = repository.get_podcasts_by_description_display_names(
+            ["test_description.txt", "missing.txt"]
+        )
+
+        assert list(found) == ["test_description.txt"]
+        assert found["test_description.txt"].id == sample_podcast.id
+
     def test_list_episodes(self, repository, sample_podcast):
         """Test listing episodes."""
         for i in range(3):
@@ -275,6 +358,67 @@ class TestEpisodeOperations:
         assert created2 is False
         assert episode2.id == episode1.id
 
+    @staticmethod
+    def _episode_fields(guid, **kwargs):
+        return {
+            "guid": guid,
+            "title": f"Episode {guid}",
+            "enclosure_url": f"https://example.com/{guid}.mp3",
+            "enclosure_type": "audio/mpeg",
+            **kwargs,
+        }
+
+    def test_bulk_create_episodes(self, repository, sample_podcast):
+        """Test bulk creation across several insert chunks."""
+        episodes = [self._episode_fields(f"ep-{i}") for i in range(1203)]
+
+        created = repository.bulk_create_episodes(sample_podcast.id, episodes)
+
+        assert created == 1203
+        assert len(repository.get_existing_episode_guids(sample_podcast.id)) == 1203
+        episode = repository.get_episode_by_guid(sample_podcast.id, "ep-7")
+        assert episode.title == "Episode ep-7"
+        assert episode.download_status == "pending"
+        assert repository.get_pipeline_counters(sample_podcast.id)["total_episodes"] == 1203
+
+    def test_bulk_create_episodes_skips_existing(self, repository, sample_podcast):
+        """Test existing and repeated GUIDs are skipped, not errors."""
+        repository.create_episode(podcast_id=sample_podcast.id, **self._episode_fields("old"))
+
+        created = repository.bulk_create_episodes(
+            sample_podcast.id,
+            [
+                self._episode_fields("old", title="Changed"),
+                self._episode_fields("new", description="Has a description"),
+                self._episode_fields("new", title="Repeated"),
+                self._episode_fields("other"),
+            ],
+        )
+
+        assert created == 2
+        assert repository.get_episode_by_guid(sample_podcast.id, "old").title == "Episode old"
+        assert repository.get_episode_by_guid(sample_podcast.id, "new").title == "Episode new"
+        assert repository.bulk_create_episodes(sample_podcast.id, []) == 0
+
+    def test_bulk_create_episodes_skips_failing_rows(self, repository, sample_podcast):
+        """Test a row the database rejects is skipped without losing its chunk."""
+        episodes = [self._episode_fields(f"ep-{i}") for i in range(5)]
+        episodes[2]["title"] = None
+
+        created = repository.bulk_create_episodes(sample_podcast.id, episodes)
+
+        assert created == 4
+        assert repository.get_existing_episode_guids(sample_podcast.id) == {
+            "ep-0", "ep-1", "ep-3", "ep-4"
+        }
+
+    def test_bulk_create_episodes_rejects_unknown_fields(self, repository, sample_podcast):
+        """Test unknown fields raise ValueError."""
+        with pytest.raises(ValueError):
+            repository.bulk_create_episodes(
+                sample_podcast.id, [self._episode_fields("ep-1", not_a_column=1)]
+            )
+
     def test_update_episode(self, repository, sample_podcast):
         """Test updating an episode."""
         episode = repository.create_episode(
@@ -311,6 +455,125 @@ class TestEpisodeOperations:
         assert retrieved is None
 
 
+class TestKeysetPagination:
+    """Tests for cursor-paginated listing."""
+
+    @staticmethod
+    def _collect(fetch, **kwargs):
+        """Follow cursors until the last page; return items in order and the page count."""
+        items, cursor, pages = [], None, 0
+        while True:
+            page, cursor = fetch(cursor=cursor, **kwargs)
+            items.extend(page)
+            pages += 1
+            if cursor is None:
+                return items, pages
+
+    def test_episode_pages_cover_all_in_order(self, repository, sample_podcast):
+        """Pages follow published date desc with ties and undated episodes handled."""
+        dates = [
+            datetime(2024, 1, 3),
+            datetime(2024, 1, 2),
+            datetime(2024, 1, 2),
+            datetime(2024, 1, 2),
+            datetime(2024, 1, 1),
+            None,
+            None,
+        ]
+        for i, published in enumerate(dates):
+            repository.create_episode(
+                podcast_id=sample_podcast.id,
+                guid=f"episode-{i}",
+                title=f"Episode {i}",
+                enclosure_url=f"https://example.com/{i}.mp3",
+                enclosure_type="audio/mpeg",
+                published_date=published,
+            )
+
+        episodes, pages = self._collect(
+            repository.list_episodes_page, podcast_id=sample_podcast.id, limit=2
+        )
+
+        assert pages == 4
+        assert len({e.id for e in episodes}) == len(dates)
+        dated = [e for e in episodes if e.published_date is not None]
+        assert [(e.published_date, e.id) for e in dated] == sorted(
+            ((e.published_date, e.id) for e in dated), reverse=True
+        )
+        assert [e.published_date for e in episodes[-2:]] == [None, None]
+        assert episodes[0].podcast.title == "Test Podcast"
+
+    def test_episode_page_filters(self, repository, sample_podcast):
+        """Status filters apply to keyset pages."""
+        for i in range(3):
+            repository.create_episode(
+                podcast_id=sample_podcast.id,
+                guid=f"episode-{i}",
+                title=f"Episode {i}",
+                enclosure_url=f"https://example.com/{i}.mp3",
+                enclosure_type="audio/mpeg",
+                published_date=datetime(2024, 1, i + 1),
+            )
+        first = repository.list_episodes(podcast_id=sample_podcast.id)[0]
+        repository.update_episode(first.id, download_status="failed")
+
+        episodes, next_cursor = repository.list_episodes_page(download_status="failed")
+
+        assert [e.id for e in episodes] == [first.id]
+        assert next_cursor is None
+
+    def test_exact_final_page_has_no_cursor(self, repository, sample_podcast):
+        """A page that ends exactly on the last row does not return a cursor."""
+        for i in range(2):
+            repository.create_episode(
+                podcast_id=sample_podcast.id,
+                guid=f"episode-{i}",
+                title=f"Episode {i}",
+                enclosure_url=f"https://example.com/{i}.mp3",
+                enclosure_type="audio/mpeg",
+                published_date=datetime(2024, 1, i + 1),
+            )
+
+        episodes, next_cursor = repository.list_episodes_page(limit=2)
+
+        assert len(episodes) == 2
+        assert next_cursor is None
+
+    def test_invalid_cursor(self, repository):
+        """Malformed cursors raise ValueError."""
+        with pytest.raises(ValueError):
+            repository.list_episodes_page(cursor="not-a-cursor")
+
+    def test_conversation_and_message_pages(self, repository, sample_user):
+        """Conversations page newest first, messages oldest first."""
+        conversations = [
+            repository.create_conversation(user_id=sample_user.id, scope="all")
+            for _ in range(3)
+        ]
+        for i in range(5):
+            repository.add_message(
+                conversation_id=conversations[0].id, role="user", content=f"Message {i}"
+            )
+
+        listed, pages = self._collect(
+            repository.list_conversations_page, user_id=sample_user.id, limit=2
+        )
+        assert pages == 2
+        assert {c.id for c in listed} == {c.id for c in conversations}
+        assert [c.updated_at for c in listed] == sorted(
+            (c.updated_at for c in listed), reverse=True
+        )
+
+        messages, pages = self._collect(
+            repository.get_messages_page, conversation_id=conversations[0].id, limit=2
+        )
+        assert pages == 3
+        assert len(messages) == 5
+        assert [(m.created_at, m.id) for m in messages] == sorted(
+            (m.created_at, m.id) for m in messages
+        )
+
+
 class TestStatusUpdates:
     """Tests for status update methods."""
 
@@ -378,7 +641,7 @@ class TestStatusUpdates:
         repository.mark_transcript_complete(episode.id, transcript_text=transcript_text)
         episode = repository.get_episode(episode.id)
         assert episode.transcript_status == "completed"
-        assert episode.transcript_text == transcript_text
+        assert repository.get_transcript_text(episode.id) == transcript_text
 
     def test_indexing_status_flow(self, repository, sample_podcast):
         """Test File Search indexing status transitions."""
@@ -465,7 +728,7 @@ class TestTranscriptTextStorage:
 
         episode = repository.get_episode(episode.id)
         assert episode.transcript_status == "completed"
-        assert episode.transcript_text == transcript_text
+        assert repository.get_transcript_text(episode.id) == transcript_text
         assert episode.transcribed_at is not None
 
     def test_mark_transcript_complete_with_text_and_path(self, repository, sample_podcast):
@@ -487,7 +750,7 @@ class TestTranscriptTextStorage:
         )
 
         episode = repository.get_episode(episode.id)
-        assert episode.transcript_text == transcript_text
+        assert repository.get_transcript_text(episode.id) == transcript_text
         assert episode.transcript_path == transcript_path
 
     def test_get_transcript_text_from_database(self, repository, sample_podcast):
@@ -509,6 +772,29 @@ class TestTranscriptTextStorage:
         retrieved_text = repository.get_transcript_text(episode.id)
         assert retrieved_text == transcript_text
 
+    def test_transcript_stored_compressed_outside_episode(self, repository, sample_podcast):
+        """Test transcripts live compressed in episode_transcripts, not on the episode row."""
+        episode = repository.create_episode(
+            podcast_id=sample_podcast.id,
+            guid="episode-1",
+            title="Episode 1",
+            enclosure_url="https://example.com/episode1.mp3",
+            enclosure_type="audio/mpeg",
+        )
+
+        transcript_text = "spoken words " * 1000
+        repository.mark_transcript_complete(episode.id, transcript_text=transcript_text)
+
+        with repository._get_session() as session:
+            record = session.get(EpisodeTranscript, episode.id)
+            assert record.text_length == len(transcript_text)
+            assert len(record.content) < len(transcript_text)
+        assert "transcript_text" not in Episode.__table__.columns
+
+        # Overwriting replaces the stored transcript
+        repository.update_episode(episode.id, transcript_text="replacement")
+        assert repository.get_transcript_text(episode.id) == "replacement"
+
     def test_get_transcript_text_from_file(self, repository, sample_podcast, tmp_path):
         """Test retrieving transcript text from legacy file."""
         episode = repository.create_episode(
@@ -637,6 +923,249 @@ class TestTranscriptTextStorage:
         assert retrieved_text == ""
 
 
+class TestFulltextSearch:
+    """Tests for the full-text transcript and metadata index."""
+
+    def _episode(self, repository, podcast, guid, title, transcript=None, **metadata):
+        episode = repository.create_episode(
+            podcast_id=podcast.id,
+            guid=guid,
+            title=title,
+            enclosure_url=f"https://example.com/{guid}.mp3",
+            enclosure_type="audio/mpeg",
+        )
+        if transcript is not None:
+            repository.mark_transcript_complete(episode.id, transcript_text=transcript)
+        if metadata:
+            repository.mark_metadata_complete(episode.id, **metadata)
+        return episode
+
+    def test_matches_transcript_words_and_phrases(self, repository, sample_podcast):
+        """Test transcript text is searchable, including quoted phrases."""
+        ep = self._episode(
+            repository, sample_podcast, "ep-1", "Episode 1",
+            transcript="Today we discuss quantum computing and error correction.",
+        )
+        self._episode(
+            repository, sample_podcast, "ep-2", "Episode 2",
+            transcript="Computing history, then quantum mechanics.",
+        )
+
+        episodes, _ = repository.search_episodes_fulltext("quantum computing")
+        assert len(episodes) == 2
+
+        episodes, _ = repository.search_episodes_fulltext('"quantum computing"')
+        assert [e.id for e in episodes] == [ep.id]
+        assert episodes[0].podcast.title == "Test Podcast"
+
+    def test_metadata_is_indexed_and_outranks_transcript(self, repository, sample_podcast):
+        """Test title/keyword matches rank above transcript-only matches."""
+        in_transcript = self._episode(
+            repository, sample_podcast, "ep-1", "Episode 1",
+            transcript="A brief aside about gardening.",
+        )
+        in_metadata = self._episode(
+            repository, sample_podcast, "ep-2", "Gardening for beginners",
+            transcript="Soil, seeds and water.",
+            keywords=["gardening"], hosts=["Ada Lovelace"],
+        )
+
+        episodes, _ = repository.search_episodes_fulltext("gardening")
+        assert [e.id for e in episodes] == [in_metadata.id, in_transcript.id]
+
+        episodes, _ = repository.search_episodes_fulltext("lovelace")
+        assert [e.id for e in episodes] == [in_metadata.id]
+
+    def test_filters_by_podcast(self, repository, sample_podcast):
+        """Test results can be restricted to a set of podcasts."""
+        other = repository.create_podcast(feed_url="https://other.com/feed.xml", title="Other")
+        self._episode(repository, sample_podcast, "ep-1", "Episode 1", transcript="shared topic")
+        ep = self._episode(repository, other, "ep-2", "Episode 2", transcript="shared topic")
+
+        episodes, _ = repository.search_episodes_fulltext("topic", podcast_ids=[other.id])
+        assert [e.id for e in episodes] == [ep.id]
+        assert repository.search_episodes_fulltext("topic", podcast_ids=[]) == ([], None)
+
+    def test_cursor_pagination(self, repository, sample_podcast):
+        """Test the cursor walks through every ranked result exactly once."""
+        for i in range(5):
+            self._episode(repository, sample_podcast, f"ep-{i}", f"Episode {i}", transcript="common")
+
+        seen = []
+        cursor = None
+        while True:
+            episodes, cursor = repository.search_episodes_fulltext("common", limit=2, cursor=cursor)
+            seen.extend(e.id for e in episodes)
+            if cursor is None:
+                break
+        assert len(seen) == 5
+        assert len(set(seen)) == 5
+
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            repository.search_episodes_fulltext("common", cursor="abc")
+
+    def test_reindexes_and_deletes(self, repository, sample_podcast):
+        """Test a new transcript replaces the old document and deletion removes it."""
+        ep = self._episode(repository, sample_podcast, "ep-1", "Episode 1", transcript="old words")
+        repository.mark_transcript_complete(ep.id, transcript_text="new words")
+
+        assert repository.search_episodes_fulltext("old") == ([], None)
+        assert len(repository.search_episodes_fulltext("new")[0]) == 1
+
+        repository.delete_episode(ep.id)
+        assert repository.search_episodes_fulltext("new") == ([], None)
+
+    def test_transcript_and_document_commit_together(
+        self, repository, sample_podcast, monkeypatch
+    ):
+        """Test a failed index write leaves the transcript status unchanged."""
+        ep = self._episode(repository, sample_podcast, "ep-1", "Episode 1")
+
+        def fail(*args, **kwargs):
+            raise RuntimeError("index unavailable")
+
+        monkeypatch.setattr("src.db.fulltext.upsert_document", fail)
+        with pytest.raises(RuntimeError):
+            repository.mark_transcript_complete(ep.id, transcript_text="some words")
+
+        episode = repository.get_episode(ep.id)
+        assert episode.transcript_status == "pending"
+        assert repository.get_transcript_text(ep.id) is None
+
+    def test_query_operators_are_literal(self, repository, sample_podcast):
+        """Test FTS syntax in user input does not raise."""
+        self._episode(repository, sample_podcast, "ep-1", "Episode 1", transcript="plain text")
+
+        assert repository.search_episodes_fulltext('AND OR "unclosed') == ([], None)
+        assert repository.search_episodes_fulltext("   ") == ([], None)
+
+
+class TestPeopleAndKeywords:
+    """Tests for the normalised people and keyword tables."""
+
+    def _episode(self, repository, podcast, guid, published=None, **metadata):
+        episode = repository.create_episode(
+            podcast_id=podcast.id,
+            guid=guid,
+            title=f"Episode {guid}",
+            enclosure_url=f"https://example.com/{guid}.mp3",
+            enclosure_type="audio/mpeg",
+            published_date=published,
+        )
+        repository.mark_metadata_complete(episode.id, **metadata)
+        return episode
+
+    def test_person_and_keyword_search_are_normalised(self, repository, sample_podcast):
+        """Test names are matched case- and whitespace-insensitively."""
+        ep = self._episode(
+            repository, sample_podcast, "ep-1",
+            hosts=["Ada Lovelace"], guests=["Charles  Babbage"], keywords=["Analytical Engine"],
+        )
+        self._episode(repository, sample_podcast, "ep-2", hosts=["Someone Else"])
+
+        assert [e.id for e in repository.search_episodes_by_person("ada lovelace")] == [ep.id]
+        assert [e.id for e in repository.search_episodes_by_person("CHARLES BABBAGE")] == [ep.id]
+        assert [e.id for e in repository.search_episodes_by_keyword("analytical   engine")] == [ep.id]
+        assert repository.search_episodes_by_person("Lovelace") == []
+
+    def test_metadata_rewrite_replaces_links(self, repository, sample_podcast):
+        """Test re-running metadata extraction replaces old people and keywords."""
+        ep = self._episode(repository, sample_podcast, "ep-1", guests=["Old Guest"], keywords=["old"])
+        repository.mark_metadata_complete(ep.id, guests=["New Guest"], keywords=["new"])
+
+        assert repository.search_episodes_by_person("Old Guest") == []
+        assert [e.id for e in repository.search_episodes_by_person("New Guest")] == [ep.id]
+        assert repository.search_episodes_by_keyword("old") == []
+
+    def test_top_people(self, repository, sample_podcast):
+        """Test ranking people by appearances, filtered by role and date."""
+        recent = datetime(2026, 10, 1)
+        old = datetime(2025, 1, 1)
+        self._episode(repository, sample_podcast, "ep-1", recent, hosts=["Host"], guests=["Alice"])
+        self._episode(repository, sample_podcast, "ep-2", recent, hosts=["host"], guests=["Alice", "Bob"])
+        self._episode(repository, sample_podcast, "ep-3", old, hosts=["Host"], guests=["Bob", "Bob"])
+
+        assert repository.get_top_people(role="guest") == [("Alice", 2), ("Bob", 2)]
+        assert repository.get_top_people(role="guest", since=datetime(2026, 9, 1)) == [
+            ("Alice", 2),
+            ("Bob", 1),
+        ]
+        assert repository.get_top_people(limit=1) == [("Host", 3)]
+
+    def test_episodes_sharing_people(self, repository, sample_podcast):
+        """Test related episodes are ordered by the number of shared people."""
+        ep = self._episode(repository, sample_podcast, "ep-1", hosts=["Host"], guests=["Alice", "Bob"])
+        both = self._episode(repository, sample_podcast, "ep-2", guests=["Alice", "Bob"])
+        one = self._episode(repository, sample_podcast, "ep-3", hosts=["Host"])
+        self._episode(repository, sample_podcast, "ep-4", guests=["Carol"])
+
+        related = repository.get_episodes_sharing_people(ep.id)
+        assert [e.id for e in related] == [both.id, one.id]
+        related = repository.get_episodes_sharing_people(ep.id, role="guest")
+        assert [e.id for e in related] == [both.id]
+
+    def test_backfill_episode_tags(self, repository, sample_podcast):
+        """Test backfill links episodes whose metadata predates the tables."""
+        ep = repository.create_episode(
+            podcast_id=sample_podcast.id,
+            guid="ep-1",
+            title="Episode 1",
+            enclosure_url="https://example.com/ep-1.mp3",
+            enclosure_type="audio/mpeg",
+        )
+        repository.update_episode(
+            ep.id, metadata_status="completed", ai_guests=["Grace Hopper"], ai_keywords=["COBOL"]
+        )
+        assert repository.search_episodes_by_person("grace hopper") == []
+
+        assert repository.backfill_episode_tags(batch_size=1) == 1
+        assert [e.id for e in repository.search_episodes_by_person("grace hopper")] == [ep.id]
+        assert [e.id for e in repository.search_episodes_by_keyword("cobol")] == [ep.id]
+
+        # Re-running is harmless
+        assert repository.backfill_episode_tags() == 1
+        assert repository.get_top_people() == [("Grace Hopper", 1)]
+
+
+class TestTranscriptSegments:
+    """Tests for incremental transcript segment storage."""
+
+    def test_append_and_get_segments_ordered(self, repository, sample_podcast):
+        """Test segments come back ordered by start time across appends."""
+        episode = repository.create_episode(
+            podcast_id=sample_podcast.id,
+            guid="segments-1",
+            title="Episode",
+            enclosure_url="https://example.com/segments.mp3",
+            enclosure_type="audio/mpeg",
+        )
+
+        repository.append_transcript_segments(episode.id, [(0.0, 1.5, "Hello")])
+        repository.append_transcript_segments(
+            episode.id, [(1.5, 3.0, "world"), (3.0, 4.2, "again")]
+        )
+        repository.append_transcript_segments(episode.id, [])
+
+        segments = repository.get_transcript_segments(episode.id)
+        assert [s.text for s in segments] == ["Hello", "world", "again"]
+        assert segments[-1].end_seconds == 4.2
+
+    def test_segments_removed_with_episode(self, repository, sample_podcast):
+        """Test segments are deleted together with their episode."""
+        episode = repository.create_episode(
+            podcast_id=sample_podcast.id,
+            guid="segments-3",
+            title="Episode",
+            enclosure_url="https://example.com/segments3.mp3",
+            enclosure_type="audio/mpeg",
+        )
+        repository.append_transcript_segments(episode.id, [(0.0, 1.0, "a")])
+
+        repository.delete_episode(episode.id)
+
+        assert repository.get_transcript_segments(episode.id) == []
+
+
 class TestMP3Metadata:
     """Tests for MP3 metadata storage functionality."""
 
@@ -995,42 +1524,90 @@ class TestStatistics:
         assert stats["total_episodes"] == 2
 
 
-class TestEscapeLikePattern:
-    """Tests for LIKE pattern escaping to prevent injection."""
+class TestPipelineCounters:
+    """Tests for the trigger-maintained pipeline counters."""
+
+    @staticmethod
+    def _create_episodes(repository, podcast_id, count):
+        return [
+            repository.create_episode(
+                podcast_id=podcast_id,
+                guid=f"episode-{i}",
+                title=f"Episode {i}",
+                enclosure_url=f"https://example.com/episode{i}.mp3",
+                enclosure_type="audio/mpeg",
+            )
+            for i in range(count)
+        ]
+
+    @staticmethod
+    def _assert_matches_recount(repository):
+        """Incrementally maintained counts equal a rebuild from scratch."""
+        incremental = repository.get_pipeline_counters()
+        repository.rebuild_pipeline_counters()
+        assert repository.get_pipeline_counters() == incremental
+
+    def test_counts_follow_status_transitions(self, repository, sample_podcast):
+        episodes = self._create_episodes(repository, sample_podcast.id, 3)
+        first, second, _ = episodes
 
-    def test_escape_normal_string(self):
-        """Test that normal strings pass through unchanged."""
-        assert _escape_like_pattern("John Smith") == "John Smith"
-        assert _escape_like_pattern("AI Technology") == "AI Technology"
+        repository.mark_download_complete(first.id, "/tmp/1.mp3", 100, "hash")
+        repository.mark_download_started(second.id)
 
-    def test_escape_percent(self):
-        """Test that percent signs are escaped."""
-        assert _escape_like_pattern("100%") == "100\\%"
-        assert _escape_like_pattern("%wildcard%") == "\\%wildcard\\%"
+        counters = repository.get_pipeline_counters()
+        assert counters["total_episodes"] == 3
+        assert counters["pending_download"] == 1
+        assert repository.count_episodes_pending_download() == 1
+        assert counters["downloading"] == 1
+        assert counters["downloaded"] == 1
+        assert counters["transcription_queue"] == 1
+        assert repository.get_download_buffer_count() == 1
+        assert repository.count_episodes_pending_preprocessing() == 1
 
-    def test_escape_underscore(self):
-        """Test that underscores are escaped."""
-        assert _escape_like_pattern("some_name") == "some\\_name"
-        assert _escape_like_pattern("_prefix") == "\\_prefix"
+        repository.mark_transcript_complete(first.id, "Transcript text")
+        assert repository.get_download_buffer_count() == 0
+        assert repository.count_episodes_pending_metadata() == 1
 
-    def test_escape_backslash(self):
-        """Test that backslashes are escaped."""
-        assert _escape_like_pattern("path\\to") == "path\\\\to"
-        assert _escape_like_pattern("\\start") == "\\\\start"
+        repository.mark_metadata_complete(first.id, summary="Summary")
+        assert repository.count_episodes_pending_metadata() == 0
+        assert repository.count_episodes_pending_indexing() == 1
 
-    def test_escape_double_quote(self):
-        """Test that double quotes are escaped."""
-        assert _escape_like_pattern('say "hello"') == 'say \\"hello\\"'
+        repository.mark_indexing_complete(first.id, "files/1", "episode-1.txt")
+        assert repository.count_episodes_pending_indexing() == 0
+        assert repository.count_episodes_ready_for_cleanup() == 1
+        assert repository.get_pipeline_counters()["fully_processed"] == 1
 
-    def test_escape_combined(self):
-        """Test escaping multiple special characters together."""
-        # Backslash must be escaped first to avoid double-escaping
-        result = _escape_like_pattern('100% of "users_data"\\path')
-        assert result == '100\\% of \\"users\\_data\\"\\\\path'
+        repository.mark_audio_cleaned_up(first.id)
+        assert repository.count_episodes_ready_for_cleanup() == 0
 
-    def test_escape_empty_string(self):
-        """Test that empty string returns empty."""
-        assert _escape_like_pattern("") == ""
+        self._assert_matches_recount(repository)
+
+    def test_bulk_updates_and_deletes_are_counted(self, repository, sample_podcast):
+        episodes = self._create_episodes(repository, sample_podcast.id, 4)
+
+        repository.mark_many("download", [e.id for e in episodes[:3]], "failed")
+        repository.delete_episode(episodes[0].id)
+
+        counters = repository.get_pipeline_counters()
+        assert counters["total_episodes"] == 3
+        assert counters["download_failed"] == 2
+        assert counters["pending_download"] == 1
+        self._assert_matches_recount(repository)
+
+        repository.delete_podcast(sample_podcast.id)
+        assert repository.get_pipeline_counters()["total_episodes"] == 0
+
+    def test_counts_are_kept_per_podcast(self, repository, sample_podcast):
+        other = repository.create_podcast(
+            feed_url="https://example.com/other.xml", title="Other"
+        )
+        self._create_episodes(repository, sample_podcast.id, 2)
+        self._create_episodes(repository, other.id, 1)
+
+        assert repository.get_pipeline_counters(sample_podcast.id)["total_episodes"] == 2
+        assert repository.get_pipeline_counters(other.id)["total_episodes"] == 1
+        assert repository.get_pipeline_counters()["total_episodes"] == 3
+        assert repository.get_podcast_stats(other.id)["pending_download"] == 1
 
 
 # Additional test classes added for database storage migration:
@@ -1058,6 +1635,17 @@ class TestPipelineModeMethods:
         count = repository.get_download_buffer_count()
         assert count == 3
 
+    def test_get_download_buffer_audio_seconds(self, repository, sample_podcast):
+        """Test buffered audio sums known durations and a default for unknown ones."""
+        episodes = self._create_downloaded_episodes(repository, sample_podcast, 3)
+        repository.update_episode(episodes[0].id, duration_seconds=1800)
+        repository.update_episode(episodes[1].id, duration_seconds=600)
+        repository.claim_next_for_transcription("node-a:1")  # Takes episodes[2]
+
+        assert repository.get_download_buffer_audio_seconds() == 2400
+        repository.reset_episode_for_retry(episodes[2].id, "transcript")
+        assert repository.get_download_buffer_audio_seconds(default_duration_seconds=100) == 2500
+
     def test_get_next_for_transcription(self, repository, sample_podcast):
         """Test getting next episode for transcription."""
         from datetime import datetime, UTC
@@ -1093,6 +1681,120 @@ class TestPipelineModeMethods:
         next_ep = repository.get_next_for_transcription()
         assert next_ep is None
 
+    def _create_downloaded_episodes(self, repository, podcast, count):
+        """Create downloaded episodes, newest last."""
+        from datetime import datetime, UTC
+
+        episodes = []
+        for i in range(count):
+            episode = repository.create_episode(
+                podcast_id=podcast.id,
+                guid=f"claim-{i}",
+                title=f"Episode {i}",
+                enclosure_url=f"https://example.com/claim{i}.mp3",
+                enclosure_type="audio/mpeg",
+                published_date=datetime(2024, 1, i + 1, tzinfo=UTC),
+            )
+            repository.mark_download_complete(episode.id, f"/path/claim{i}.mp3", 1000, f"h{i}")
+            episodes.append(episode)
+        return episodes
+
+    def test_claim_next_for_transcription(self, repository, sample_podcast):
+        """Test claiming marks the newest episode as processing by this worker."""
+        episodes = self._create_downloaded_episodes(repository, sample_podcast, 2)
+
+        claimed = repository.claim_next_for_transcription("node-a:1", lease_seconds=600)
+
+        assert claimed.id == episodes[1].id
+        assert claimed.transcript_status == "processing"
+        assert claimed.transcript_worker_id == "node-a:1"
+        assert claimed.transcript_lease_expires_at is not None
+
+    def test_claim_next_for_transcription_skips_claimed(self, repository, sample_podcast):
+        """Test two workers never claim the same episode."""
+        episodes = self._create_downloaded_episodes(repository, sample_podcast, 2)
+
+        first = repository.claim_next_for_transcription("node-a:1")
+        second = repository.claim_next_for_transcription("node-b:1")
+        third = repository.claim_next_for_transcription("node-c:1")
+
+        assert {first.id, second.id} == {ep.id for ep in episodes}
+        assert third is None
+
+    def test_renew_transcription_lease_requires_owner(self, repository, sample_podcast):
+        """Test only the claiming worker can renew its lease."""
+        self._create_downloaded_episodes(repository, sample_podcast, 1)
+        claimed = repository.claim_next_for_transcription("node-a:1")
+
+        assert repository.renew_transcription_lease(claimed.id, "node-a:1") is True
+        assert repository.renew_transcription_lease(claimed.id, "node-b:1") is False
+
+    def test_release_expired_transcription_leases(self, repository, sample_podcast):
+        """Test expired claims go back to pending and can be claimed again."""
+        from datetime import datetime, timedelta, UTC
+
+        self._create_downloaded_episodes(repository, sample_podcast, 1)
+        claimed = repository.claim_next_for_transcription("node-a:1")
+        repository.update_episode(
+            claimed.id,
+            transcript_lease_expires_at=datetime.now(UTC) - timedelta(seconds=1),
+        )
+
+        assert repository.release_expired_transcription_leases() == 1
+
+        episode = repository.get_episode(claimed.id)
+        assert episode.transcript_status == "pending"
+        assert episode.transcript_worker_id is None
+        assert episode.transcript_lease_expires_at is None
+        assert repository.claim_next_for_transcription("node-b:1").id == claimed.id
+
+    def test_release_expired_transcription_leases_keeps_live_claims(
+        self, repository, sample_podcast
+    ):
+        """Test claims with an unexpired lease are left alone."""
+        self._create_downloaded_episodes(repository, sample_podcast, 1)
+        claimed = repository.claim_next_for_transcription("node-a:1")
+
+        assert repository.release_expired_transcription_leases() == 0
+        assert repository.get_episode(claimed.id).transcript_status == "processing"
+
+    def test_mark_transcript_complete_clears_lease(self, repository, sample_podcast):
+        """Test completing a transcript clears the claim fields."""
+        self._create_downloaded_episodes(repository, sample_podcast, 1)
+        claimed = repository.claim_next_for_transcription("node-a:1")
+
+        repository.mark_transcript_complete(claimed.id, transcript_text="Transcript")
+
+        episode = repository.get_episode(claimed.id)
+        assert episode.transcript_worker_id is None
+        assert episode.transcript_lease_expires_at is None
+
+    def test_preprocessing_lifecycle(self, repository, sample_podcast, tmp_path):
+        """Test pending query, completion and cleanup of preprocessed audio."""
+        episode = self._create_downloaded_episodes(repository, sample_podcast, 1)[0]
+        assert [e.id for e in repository.get_episodes_pending_preprocessing()] == [episode.id]
+
+        pcm_path = tmp_path / "claim0.pcm16k.npy"
+        pcm_path.write_bytes(b"pcm")
+        assert repository.mark_preprocessing_complete(episode.id, str(pcm_path), [[0.0, 2.5]])
+
+        stored = repository.get_episode(episode.id)
+        assert stored.preprocess_status == "completed"
+        assert stored.speech_regions == [[0.0, 2.5]]
+        assert repository.get_episodes_pending_preprocessing() == []
+
+        repository.clear_preprocessed_audio(episode.id)
+        assert not pcm_path.exists()
+        assert repository.get_episode(episode.id).preprocessed_audio_path is None
+
+    def test_mark_preprocessing_complete_after_claim(self, repository, sample_podcast):
+        """Test preprocessing results are rejected once transcription has started."""
+        episode = self._create_downloaded_episodes(repository, sample_podcast, 1)[0]
+        repository.claim_next_for_transcription("node-a:1")
+
+        assert repository.mark_preprocessing_complete(episode.id, "/tmp/x.npy", []) is False
+        assert repository.get_episode(episode.id).preprocessed_audio_path is None
+
     def test_get_next_pending_post_processing_metadata(self, repository, sample_podcast):
         """Test getting next episode for metadata extraction."""
         episode = repository.create_episode(
@@ -1277,6 +1979,226 @@ class TestPipelineModeMethods:
             repository.reset_episode_for_retry(episode.id, "invalid")
 
 
+class TestBulkStatusUpdates:
+    """Tests for mark_many and unit_of_work."""
+
+    def _create_episodes(self, repository, podcast, count):
+        return [
+            repository.create_episode(
+                podcast_id=podcast.id,
+                guid=f"episode-{i}",
+                title=f"Episode {i}",
+                enclosure_url=f"https://example.com/episode{i}.mp3",
+                enclosure_type="audio/mpeg",
+            )
+            for i in range(count)
+        ]
+
+    def test_mark_many(self, repository, sample_podcast):
+        """Test setting a stage status on several episodes at once."""
+        episodes = self._create_episodes(repository, sample_podcast, 3)
+
+        updated = repository.mark_many(
+            "indexing", [episodes[0].id, episodes[1].id], "uploading", file_search_error=None
+        )
+
+        assert updated == 2
+        statuses = [repository.get_episode(e.id).file_search_status for e in episodes]
+        assert statuses == ["uploading", "uploading", "pending"]
+
+    def test_mark_many_empty(self, repository):
+        """Test mark_many with no episodes is a no-op."""
+        assert repository.mark_many("download", [], "downloading") == 0
+
+    def test_mark_many_invalid_stage(self, repository):
+        """Test mark_many rejects unknown stages and fields."""
+        with pytest.raises(ValueError, match="Invalid stage"):
+            repository.mark_many("invalid", ["ep-1"], "pending")
+        with pytest.raises(ValueError, match="Unknown episode fields"):
+            repository.mark_many("download", ["ep-1"], "pending", not_a_column=1)
+
+    def test_unit_of_work(self, repository, sample_podcast):
+        """Test that queued updates are merged per episode and written on exit."""
+        episodes = self._create_episodes(repository, sample_podcast, 2)
+
+        with repository.unit_of_work() as batch:
+            batch.mark("download", episodes[0].id, "completed", local_file_path="/tmp/a.mp3")
+            batch.update(episodes[0].id, file_size_bytes=123)
+            batch.mark("download", episodes[1].id, "failed", download_error="Timeout")
+            # Nothing is written until the block exits
+            assert repository.get_episode(episodes[0].id).download_status == "pending"
+
+        first = repository.get_episode(episodes[0].id)
+        assert first.download_status == "completed"
+        assert first.local_file_path == "/tmp/a.mp3"
+        assert first.file_size_bytes == 123
+        second = repository.get_episode(episodes[1].id)
+        assert second.download_status == "failed"
+        assert second.download_error == "Timeout"
+
+    def test_unit_of_work_discarded_on_error(self, repository, sample_podcast):
+        """Test that updates are not written if the block raises."""
+        (episode,) = self._create_episodes(repository, sample_podcast, 1)
+
+        with pytest.raises(RuntimeError):
+            with repository.unit_of_work() as batch:
+                batch.mark("download", episode.id, "completed")
+                raise RuntimeError("boom")
+
+        assert repository.get_episode(episode.id).download_status == "pending"
+
+    def test_unit_of_work_flush_every(self, repository, sample_podcast):
+        """Test that flush_every writes results before the block ends."""
+        episodes = self._create_episodes(repository, sample_podcast, 3)
+
+        with pytest.raises(RuntimeError):
+            with repository.unit_of_work(flush_every=2) as batch:
+                batch.mark("indexing", episodes[0].id, "indexed")
+                assert repository.get_episode(episodes[0].id).file_search_status == "pending"
+                batch.mark("indexing", episodes[1].id, "indexed")
+                assert repository.get_episode(episodes[0].id).file_search_status == "indexed"
+                batch.mark("indexing", episodes[2].id, "indexed")
+                raise RuntimeError("crash")
+
+        statuses = [repository.get_episode(e.id).file_search_status for e in episodes]
+        assert statuses == ["indexed", "indexed", "pending"]
+
+    def test_requeue_stale_episodes(self, repository, sample_podcast):
+        """Test only stale rows of the given stage status go back to pending."""
+        episodes = self._create_episodes(repository, sample_podcast, 3)
+        repository.mark_many("download", [episodes[0].id, episodes[1].id], "downloading")
+        repository.mark_many("indexing", [episodes[2].id], "uploading")
+
+        now = datetime.now(UTC)
+        assert repository.requeue_stale_episodes(
+            "download", "downloading", now - timedelta(hours=1)
+        ) == 0
+        assert repository.requeue_stale_episodes(
+            "download", "downloading", now + timedelta(seconds=1)
+        ) == 2
+
+        statuses = [repository.get_episode(e.id).download_status for e in episodes]
+        assert statuses == ["pending", "pending", "pending"]
+        assert repository.get_episode(episodes[2].id).file_search_status == "uploading"
+        with pytest.raises(ValueError, match="Invalid stage"):
+            repository.requeue_stale_episodes("invalid", "downloading", now)
+
+
+class TestEpisodePriority:
+    """Tests for queue priority scoring."""
+
+    @staticmethod
+    def _create_episode(repository, podcast_id, guid, **kwargs):
+        """Create a pending episode."""
+        return repository.create_episode(
+            podcast_id=podcast_id,
+            guid=guid,
+            title=guid,
+            enclosure_url=f"https://example.com/{guid}.mp3",
+            enclosure_type="audio/mpeg",
+            **kwargs,
+        )
+
+    def test_default_priority_weights(self):
+        """Test subscribers, recency, length and digest proximity raise the score."""
+        from datetime import UTC, datetime, timedelta
+
+        from src.db.priority import PriorityInputs, default_priority
+
+        now = datetime(2026, 10, 16, 12, 0, tzinfo=UTC)
+        base = PriorityInputs(
+            subscriber_count=1,
+            published_date=now - timedelta(days=30),
+            duration_seconds=3600,
+            hours_until_digest=None,
+        )
+
+        def score(**changes):
+            return default_priority(PriorityInputs(**{**base.__dict__, **changes}), now)
+
+        assert score(subscriber_count=200) > score()
+        assert score(published_date=now) > score()
+        assert score(duration_seconds=600) > score()
+        assert score(hours_until_digest=1.0) > score(hours_until_digest=12.0) == score()
+
+    def test_hours_until_digest_uses_user_timezone(self):
+        """Test digest hour is interpreted in the user's timezone."""
+        from datetime import UTC, datetime
+
+        from src.db.priority import hours_until_digest
+
+        now = datetime(2026, 1, 15, 12, 0, tzinfo=UTC)  # 07:00 in New York
+
+        assert hours_until_digest(8, "America/New_York", now) == 1.0
+        assert hours_until_digest(8, None, now) == 20.0
+        assert hours_until_digest(8, "Not/AZone", now) == 20.0
+
+    def test_subscribed_podcast_jumps_the_queue(self, repository, sample_user):
+        """Test a newer backfill on an unsubscribed show waits behind subscribed episodes."""
+        from datetime import UTC, datetime, timedelta
+
+        now = datetime.now(UTC)
+        popular = repository.create_podcast(feed_url="https://example.com/popular.xml", title="Popular")
+        niche = repository.create_podcast(feed_url="https://example.com/niche.xml", title="Niche")
+        old_popular = self._create_episode(
+            repository, popular.id, "popular-1", published_date=now - timedelta(days=2)
+        )
+        self._create_episode(repository, niche.id, "niche-1", published_date=now)
+
+        assert repository.get_episodes_pending_download(limit=1)[0].guid == "niche-1"
+
+        repository.subscribe_user_to_podcast(sample_user.id, popular.id)
+
+        pending = repository.get_episodes_pending_download(limit=2)
+        assert [e.guid for e in pending] == ["popular-1", "niche-1"]
+
+        repository.mark_download_complete(old_popular.id, "/path/p1.mp3", 1000, "hash")
+        assert repository.get_next_for_transcription().id == old_popular.id
+        assert repository.claim_next_for_transcription("node-a:1").id == old_popular.id
+
+    def test_unsubscribe_lowers_priority(self, repository, sample_podcast, sample_user):
+        """Test unsubscribing re-scores the podcast's queued episodes."""
+        repository.subscribe_user_to_podcast(sample_user.id, sample_podcast.id)
+        episode = self._create_episode(repository, sample_podcast.id, "ep-1")
+        repository.refresh_episode_priorities([sample_podcast.id])
+        subscribed_priority = repository.get_episode(episode.id).priority
+
+        repository.unsubscribe_user_from_podcast(sample_user.id, sample_podcast.id)
+
+        assert repository.get_episode(episode.id).priority < subscribed_priority
+
+    def test_refresh_skips_finished_episodes_and_unchanged_scores(self, repository, sample_podcast):
+        """Test only queued episodes are scored and unchanged scores aren't rewritten."""
+        queued = self._create_episode(repository, sample_podcast.id, "queued")
+        done = self._create_episode(repository, sample_podcast.id, "done")
+        repository.mark_download_complete(done.id, "/path/done.mp3", 1000, "hash")
+        repository.mark_transcript_complete(done.id, transcript_text="Text")
+
+        assert repository.refresh_episode_priorities() == 1
+        assert repository.refresh_episode_priorities() == 0
+        assert repository.get_episode(queued.id).priority > 0
+        assert repository.get_episode(done.id).priority == 0
+
+    def test_custom_priority_function(self, tmp_path):
+        """Test the priority function is pluggable."""
+        from src.db.factory import create_repository
+
+        repo = create_repository(
+            f"sqlite:///{tmp_path / 'custom.db'}",
+            create_tables=True,
+            priority_function=lambda inputs, now: float(inputs.duration_seconds or 0),
+        )
+        try:
+            podcast = repo.create_podcast(feed_url="https://example.com/c.xml", title="C")
+            self._create_episode(repo, podcast.id, "short", duration_seconds=60)
+            self._create_episode(repo, podcast.id, "long", duration_seconds=7200)
+            repo.refresh_episode_priorities([podcast.id])
+
+            assert [e.guid for e in repo.get_episodes_pending_download()] == ["long", "short"]
+        finally:
+            repo.close()
+
+
 class TestUserOperations:
     """Tests for user CRUD operations."""
 
@@ -0,0 +1,102 @@
+"""Tests for the process-pool transcription backend.
+
+These start real (spawned) processes with a fake model, so they exercise
+queueing, crash recovery and timeouts without loading faster-whisper.
+"""
+
+import os
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from src.workflow.transcription_pool import PooledSegment, TranscriptionProcessPool
+
+
+class FakeModel:
+    """Model whose behaviour is selected by the audio path."""
+
+    def transcribe(self, audio_path, **kwargs):
+        if audio_path == "crash":
+            os._exit(1)
+        if audio_path == "error":
+            raise ValueError("bad audio")
+
+        def segments():
+            if audio_path == "hang":
+                time.sleep(60)
+            for i in range(3):
+                yield SimpleNamespace(start=float(i), end=float(i + 1), text=f"part {i}")
+
+        return segments(), SimpleNamespace(duration=3.0)
+
+
+def fake_loader(model_size, device, compute_type, cpu_threads):
+    return FakeModel()
+
+
+@pytest.fixture
+def pool():
+    """Start a two-process pool backed by FakeModel."""
+    pool = TranscriptionProcessPool(
+        "tiny",
+        "cpu",
+        "int8",
+        num_processes=2,
+        episode_timeout_seconds=5,
+        model_loader=fake_loader,
+    )
+    pool.start()
+    yield pool
+    pool.stop()
+
+
+class TestTranscriptionProcessPool:
+    """Tests for TranscriptionProcessPool."""
+
+    def test_transcribe_streams_segments(self, pool):
+        """Test segments and duration come back from the child process."""
+        segments, info = pool.transcribe("episode.mp3", language="en")
+
+        assert info.duration == 3.0
+        assert list(segments) == [
+            PooledSegment(0.0, 1.0, "part 0"),
+            PooledSegment(1.0, 2.0, "part 1"),
+            PooledSegment(2.0, 3.0, "part 2"),
+        ]
+
+    def test_model_error_is_raised(self, pool):
+        """Test exceptions inside the child surface as RuntimeError."""
+        with pytest.raises(RuntimeError, match="bad audio"):
+            pool.transcribe("error")
+
+        # The process survives and keeps serving work
+        segments, _info = pool.transcribe("episode.mp3")
+        assert len(list(segments)) == 3
+        assert pool.restarts == 0
+
+    def test_crashed_process_is_restarted(self, pool):
+        """Test a crashing process fails only its episode and is replaced."""
+        with pytest.raises(RuntimeError, match="crashed"):
+            pool.transcribe("crash")
+
+        assert pool.restarts == 1
+        segments, _info = pool.transcribe("episode.mp3")
+        assert len(list(segments)) == 3
+
+    def test_episode_timeout_kills_process(self, pool):
+        """Test a hung decode is killed after the episode timeout."""
+        pool.episode_timeout_seconds = 1
+
+        with pytest.raises(TimeoutError):
+            segments, _info = pool.transcribe("hang")
+            list(segments)
+
+        assert pool.restarts == 1
+
+    def test_transcribe_requires_start(self):
+        """Test transcribe() before start() raises."""
+        pool = TranscriptionProcessPool("tiny", "cpu", "int8", model_loader=fake_loader)
+
+        with pytest.raises(RuntimeError, match="not started"):
+            pool.transcribe("episode.mp3")
@@ -9,14 +9,21 @@ import os
 import pytest
 import threading
 import time
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from unittest.mock import Mock, MagicMock, patch, PropertyMock
 
+from src.db.repository import EpisodeUpdateBatch
 from src.workflow.workers.base import WorkerResult, WorkerInterface
-from src.workflow.workers.cleanup import CleanupWorker
+from src.workflow.workers.cleanup import CLEANUP_FLUSH_EVERY, CleanupWorker
 from src.workflow.workers.sync import SyncWorker
 from src.workflow.workers.download import DownloadWorker
 from src.workflow.workers.metadata import MetadataWorker, RateLimiter, MergedMetadata
+from src.workflow.workers.preprocess import (
+    PreprocessWorker,
+    load_preprocessed_audio,
+    preprocess_audio,
+)
 from src.workflow.workers.transcription import TranscriptionWorker
 
 
@@ -170,8 +177,16 @@ class TestCleanupWorker:
 
     @pytest.fixture
     def mock_repository(self):
-        """Create mock repository."""
-        return Mock()
+        """Create mock repository with a recording unit of work."""
+        repo = Mock()
+        repo.batch = EpisodeUpdateBatch()
+
+        @contextmanager
+        def unit_of_work(flush_every=None):
+            yield repo.batch
+
+        repo.unit_of_work.side_effect = unit_of_work
+        return repo
 
     @pytest.fixture
     def cleanup_worker(self, mock_config, mock_repository):
@@ -184,17 +199,16 @@ class TestCleanupWorker:
 
     def test_get_pending_count(self, cleanup_worker, mock_repository):
         """Test getting pending count."""
-        mock_episodes = [Mock(), Mock(), Mock()]
-        mock_repository.get_episodes_ready_for_cleanup.return_value = mock_episodes
+        mock_repository.count_episodes_ready_for_cleanup.return_value = 3
 
         count = cleanup_worker.get_pending_count()
 
         assert count == 3
-        mock_repository.get_episodes_ready_for_cleanup.assert_called_with(limit=1000)
+        mock_repository.get_episodes_ready_for_cleanup.assert_not_called()
 
     def test_get_pending_count_empty(self, cleanup_worker, mock_repository):
         """Test pending count when no episodes."""
-        mock_repository.get_episodes_ready_for_cleanup.return_value = []
+        mock_repository.count_episodes_ready_for_cleanup.return_value = 0
 
         count = cleanup_worker.get_pending_count()
 
@@ -220,10 +234,16 @@ class TestCleanupWorker:
 
         mock_repository.mark_audio_cleaned_up.assert_not_called()
 
-    def test_process_batch_success(self, cleanup_worker, mock_repository):
-        """Test successful batch processing."""
-        episodes = [Mock(id="ep-1", local_file_path="/path/1.mp3"),
-                   Mock(id="ep-2", local_file_path="/path/2.mp3")]
+    def test_process_batch_success(self, cleanup_worker, mock_repository, tmp_path):
+        """Test successful batch processing deletes files and clears paths together."""
+        audio = tmp_path / "1.mp3"
+        audio.write_bytes(b"audio")
+        preprocessed = tmp_path / "1.flac"
+        preprocessed.write_bytes(b"audio")
+        episodes = [Mock(id="ep-1", local_file_path=str(audio),
+                         preprocessed_audio_path=str(preprocessed)),
+                   Mock(id="ep-2", local_file_path="/path/2.mp3",
+                        preprocessed_audio_path=None)]
         mock_repository.get_episodes_ready_for_cleanup.return_value = episodes
 
         result = cleanup_worker.process_batch(limit=10)
@@ -231,6 +251,16 @@ class TestCleanupWorker:
         assert result.processed == 2
         assert result.failed == 0
         assert len(result.errors) == 0
+        assert not audio.exists()
+        assert not preprocessed.exists()
+        mock_repository.unit_of_work.assert_called_once_with(flush_every=CLEANUP_FLUSH_EVERY)
+        mock_repository.mark_audio_cleaned_up.assert_not_called()
+        assert mock_repository.batch.updates["ep-1"] == {
+            "local_file_path": None,
+            "preprocessed_audio_path": None,
+            "speech_regions": None,
+        }
+        assert "ep-2" in mock_repository.batch.updates
 
     def test_process_batch_empty(self, cleanup_worker, mock_repository):
         """Test batch processing with no episodes."""
@@ -243,15 +273,17 @@ class TestCleanupWorker:
 
     def test_process_batch_with_failure(self, cleanup_worker, mock_repository):
         """Test batch processing with failure."""
-        episode = Mock(id="ep-1", local_file_path="/path/1.mp3")
+        episode = Mock(id="ep-1", local_file_path="/path/1.mp3", preprocessed_audio_path=None)
         mock_repository.get_episodes_ready_for_cleanup.return_value = [episode]
-        mock_repository.mark_audio_cleaned_up.side_effect = Exception("Cleanup failed")
 
-        result = cleanup_worker.process_batch(limit=10)
+        with patch("src.workflow.workers.cleanup.os.path.exists", return_value=True), \
+             patch("src.workflow.workers.cleanup.os.remove", side_effect=OSError("Cleanup failed")):
+            result = cleanup_worker.process_batch(limit=10)
 
         assert result.processed == 0
         assert result.failed == 1
         assert "ep-1" in result.errors[0]
+        assert "ep-1" not in mock_repository.batch.updates
 
     def test_process_batch_exception(self, cleanup_worker, mock_repository):
         """Test batch processing with exception getting episodes."""
@@ -304,6 +336,13 @@ class TestSyncWorker:
             mock_service_class.assert_called_once_with(
                 repository=mock_repository,
                 download_directory=mock_config.PODCAST_DOWNLOAD_DIRECTORY,
+                max_concurrent=mock_config.FEED_SYNC_MAX_CONCURRENT,
+                max_per_host=mock_config.FEED_SYNC_MAX_PER_HOST,
+                parse_workers=mock_config.FEED_SYNC_PARSE_WORKERS,
+                min_check_interval_minutes=mock_config.FEED_SYNC_MIN_INTERVAL_MINUTES,
+                max_check_interval_hours=mock_config.FEED_SYNC_MAX_INTERVAL_HOURS,
+                stop_after_known=mock_config.FEED_SYNC_STOP_AFTER_KNOWN,
+                reconcile_interval_hours=mock_config.FEED_SYNC_RECONCILE_HOURS,
             )
             assert service == mock_service
 
@@ -317,19 +356,19 @@ class TestSyncWorker:
         assert service == mock_service
 
     def test_get_pending_count(self, sync_worker, mock_repository):
-        """Test getting pending count (number of podcasts with subscribers)."""
+        """Test getting pending count (number of subscribed podcasts due for a check)."""
         mock_podcasts = [Mock(), Mock()]
-        mock_repository.list_podcasts_with_subscribers.return_value = mock_podcasts
+        mock_repository.list_podcasts_due_for_sync.return_value = mock_podcasts
 
         count = sync_worker.get_pending_count()
 
         assert count == 2
-        mock_repository.list_podcasts_with_subscribers.assert_called_once()
+        mock_repository.list_podcasts_due_for_sync.assert_called_once()
 
     def test_process_batch_success(self, sync_worker):
         """Test successful feed sync."""
         mock_service = Mock()
-        mock_service.sync_podcasts_with_subscribers.return_value = {
+        mock_service.sync_due_podcasts.return_value = {
             "synced": 5,
             "failed": 0,
             "new_episodes": 10,
@@ -341,12 +380,30 @@ class TestSyncWorker:
 
         assert result.processed == 5
         assert result.failed == 0
-        mock_service.sync_podcasts_with_subscribers.assert_called_once()
+        mock_service.sync_due_podcasts.assert_called_once()
+
+    def test_process_batch_publishes_new_episodes(self, sync_worker):
+        """Test discovering episodes wakes the download stage."""
+        from src.workflow.events import EPISODES_ADDED, EventBus
+
+        sync_worker.event_bus = EventBus()
+        mock_service = Mock()
+        mock_service.sync_due_podcasts.side_effect = [
+            {"synced": 1, "failed": 0, "new_episodes": 0, "results": []},
+            {"synced": 1, "failed": 0, "new_episodes": 2, "results": []},
+        ]
+        sync_worker._feed_sync_service = mock_service
+
+        sync_worker.process_batch(limit=0)
+        assert sync_worker.event_bus.wait(timeout=0) == set()
+
+        sync_worker.process_batch(limit=0)
+        assert sync_worker.event_bus.wait(timeout=0) == {EPISODES_ADDED}
 
     def test_process_batch_with_failures(self, sync_worker):
         """Test feed sync with some failures."""
         mock_service = Mock()
-        mock_service.sync_podcasts_with_subscribers.return_value = {
+        mock_service.sync_due_podcasts.return_value = {
             "synced": 3,
             "failed": 2,
             "new_episodes": 5,
@@ -368,7 +425,7 @@ class TestSyncWorker:
     def test_process_batch_exception(self, sync_worker):
         """Test feed sync with exception."""
         mock_service = Mock()
-        mock_service.sync_podcasts_with_subscribers.side_effect = Exception("Sync failed")
+        mock_service.sync_due_podcasts.side_effect = Exception("Sync failed")
         sync_worker._feed_sync_service = mock_service
 
         result = sync_worker.process_batch(limit=0)
@@ -455,13 +512,13 @@ class TestDownloadWorker:
 
     def test_get_pending_count(self, download_worker, mock_repository):
         """Test getting pending count."""
-        mock_episodes = [Mock(), Mock(), Mock()]
-        mock_repository.get_episodes_pending_download.return_value = mock_episodes
+        mock_repository.count_episodes_pending_download.return_value = 3
 
         count = download_worker.get_pending_count()
 
         assert count == 3
-        mock_repository.get_episodes_pending_download.assert_called_with(limit=1000)
+        mock_repository.count_episodes_pending_download.assert_called_once_with()
+        mock_repository.get_episodes_pending_download.assert_not_called()
 
     def test_process_batch_success(self, download_worker):
         """Test successful download batch."""
@@ -519,6 +576,100 @@ class TestDownloadWorker:
 # Tests for RateLimiter
 # ============================================================================
 
+class TestPreprocessWorker:
+    """Tests for PreprocessWorker."""
+
+    @pytest.fixture
+    def mock_repository(self):
+        """Create mock repository."""
+        return Mock()
+
+    @pytest.fixture
+    def preprocess_worker(self, mock_repository):
+        """Create PreprocessWorker instance."""
+        return PreprocessWorker(config=Mock(), repository=mock_repository, preprocess_workers=2)
+
+    def test_name_property(self, preprocess_worker):
+        """Test worker name."""
+        assert preprocess_worker.name == "Preprocess"
+
+    def test_preprocess_audio_writes_pcm(self, tmp_path):
+        """Test decoding a real file to 16 kHz int16 PCM."""
+        import math
+        import struct
+        import wave
+
+        audio_file = tmp_path / "tone.wav"
+        with wave.open(str(audio_file), "wb") as wav:
+            wav.setnchannels(1)
+            wav.setsampwidth(2)
+            wav.setframerate(8000)
+            wav.writeframes(
+                b"".join(
+                    struct.pack("<h", int(8000 * math.sin(2 * math.pi * 440 * i / 8000)))
+                    for i in range(16000)
+                )
+            )
+        output = tmp_path / "tone.pcm16k.npy"
+
+        regions = preprocess_audio(str(audio_file), str(output))
+
+        assert isinstance(regions, list)
+        audio = load_preprocessed_audio(str(output))
+        assert audio.dtype.name == "float32"
+        assert abs(len(audio) - 32000) < 1600  # 2 s at 16 kHz
+        assert not (tmp_path / "tone.pcm16k.npy.tmp").exists()
+
+    def test_process_batch_records_results(self, preprocess_worker, mock_repository):
+        """Test successful preprocessing is recorded with path and regions."""
+        episode = Mock(id="ep-1", local_file_path="/audio/ep1.mp3")
+        mock_repository.get_episodes_pending_preprocessing.return_value = [episode]
+        mock_repository.mark_preprocessing_complete.return_value = True
+
+        with patch(
+            "src.workflow.workers.preprocess.preprocess_audio", return_value=[[0.5, 3.0]]
+        ) as mock_preprocess:
+            result = preprocess_worker.process_batch(limit=5)
+
+        assert result.processed == 1
+        mock_preprocess.assert_called_once_with("/audio/ep1.mp3", "/audio/ep1.pcm16k.npy")
+        mock_repository.mark_preprocessing_complete.assert_called_once_with(
+            "ep-1", "/audio/ep1.pcm16k.npy", [[0.5, 3.0]]
+        )
+
+    def test_process_batch_discards_when_transcription_started(
+        self, preprocess_worker, mock_repository, tmp_path
+    ):
+        """Test output is deleted when the episode was claimed meanwhile."""
+        episode = Mock(id="ep-1", local_file_path=str(tmp_path / "ep1.mp3"))
+        mock_repository.get_episodes_pending_preprocessing.return_value = [episode]
+        mock_repository.mark_preprocessing_complete.return_value = False
+
+        def fake_preprocess(audio_path, output_path):
+            open(output_path, "wb").close()
+            return []
+
+        with patch("src.workflow.workers.preprocess.preprocess_audio", fake_preprocess):
+            result = preprocess_worker.process_batch(limit=5)
+
+        assert result.processed == 1
+        assert not (tmp_path / "ep1.pcm16k.npy").exists()
+
+    def test_process_batch_marks_failures(self, preprocess_worker, mock_repository):
+        """Test failed decodes are marked so transcription uses the original file."""
+        episode = Mock(id="ep-1", local_file_path="/audio/ep1.mp3")
+        mock_repository.get_episodes_pending_preprocessing.return_value = [episode]
+
+        with patch(
+            "src.workflow.workers.preprocess.preprocess_audio",
+            side_effect=RuntimeError("corrupt"),
+        ):
+            result = preprocess_worker.process_batch(limit=5)
+
+        assert result.failed == 1
+        mock_repository.mark_preprocessing_failed.assert_called_once_with("ep-1")
+
+
 class TestRateLimiter:
     """Tests for RateLimiter class."""
 
@@ -672,13 +823,12 @@ class TestMetadataWorker:
 
     def test_get_pending_count(self, metadata_worker, mock_repository):
         """Test getting pending count."""
-        mock_episodes = [Mock(), Mock()]
-        mock_repository.get_episodes_pending_metadata.return_value = mock_episodes
+        mock_repository.count_episodes_pending_metadata.return_value = 2
 
         count = metadata_worker.get_pending_count()
 
         assert count == 2
-        mock_repository.get_episodes_pending_metadata.assert_called_with(limit=1000)
+        mock_repository.get_episodes_pending_metadata.assert_not_called()
 
     def test_read_mp3_tags_returns_dict(self, metadata_worker, tmp_path):
         """Test that _read_mp3_tags returns a dictionary for valid MP3 files."""
@@ -796,7 +946,10 @@ class TestTranscriptionWorker:
     @pytest.fixture
     def mock_repository(self):
         """Create mock repository."""
-        return Mock()
+        repo = Mock()
+        repo.get_transcript_segments.return_value = []
+        repo.get_transcript_text.return_value = None
+        return repo
 
     @pytest.fixture
     def transcription_worker(self, mock_config, mock_repository):
@@ -852,13 +1005,12 @@ class TestTranscriptionWorker:
 
     def test_get_pending_count(self, transcription_worker, mock_repository):
         """Test getting pending count."""
-        mock_episodes = [Mock(), Mock()]
-        mock_repository.get_episodes_pending_transcription.return_value = mock_episodes
+        mock_repository.get_download_buffer_count.return_value = 2
 
         count = transcription_worker.get_pending_count()
 
         assert count == 2
-        mock_repository.get_episodes_pending_transcription.assert_called_with(limit=1000)
+        mock_repository.get_episodes_pending_transcription.assert_not_called()
 
     def test_transcribe_episode_no_file_path(self, transcription_worker):
         """Test transcribing episode without file path."""
@@ -874,12 +1026,13 @@ class TestTranscriptionWorker:
         episode = Mock()
         episode.id = "ep-1"
         episode.local_file_path = "/nonexistent/file.mp3"
-        episode.transcript_text = None
 
         with pytest.raises(FileNotFoundError, match="Audio file not found"):
             transcription_worker._transcribe_episode(episode)
 
-    def test_transcribe_episode_returns_existing_text(self, transcription_worker, tmp_path):
+    def test_transcribe_episode_returns_existing_text(
+        self, transcription_worker, mock_repository, tmp_path
+    ):
         """Test that existing transcript text is returned."""
         # Create a temp file so the file exists check passes
         audio_file = tmp_path / "file.mp3"
@@ -888,11 +1041,12 @@ class TestTranscriptionWorker:
         episode = Mock()
         episode.id = "ep-1"
         episode.local_file_path = str(audio_file)
-        episode.transcript_text = "Existing transcript"
+        mock_repository.get_transcript_text.return_value = "Existing transcript"
 
         result = transcription_worker._transcribe_episode(episode)
 
         assert result == "Existing transcript"
+        mock_repository.get_transcript_text.assert_called_once_with("ep-1")
 
     def test_transcribe_single_success(self, transcription_worker, mock_repository, tmp_path):
         """Test successful single transcription."""
@@ -903,7 +1057,7 @@ class TestTranscriptionWorker:
         episode = Mock()
         episode.id = "ep-1"
         episode.local_file_path = str(audio_file)
-        episode.transcript_text = None
+        episode.preprocessed_audio_path = None
         episode.title = "Test Episode"
 
         # Mock the model
@@ -919,12 +1073,190 @@ class TestTranscriptionWorker:
         mock_repository.mark_transcript_started.assert_called_with("ep-1")
         mock_repository.mark_transcript_complete.assert_called()
 
+    def test_audio_input_falls_back_on_corrupt_preprocessed_file(
+        self, transcription_worker, tmp_path
+    ):
+        """Test a truncated .npy is skipped in favour of the downloaded file."""
+        import numpy as np
+
+        good = tmp_path / "good.pcm16k.npy"
+        np.save(good, np.array([0, 16384, -32768], dtype=np.int16))
+        corrupt = tmp_path / "corrupt.pcm16k.npy"
+        corrupt.write_bytes(good.read_bytes()[:-2])
+        episode = Mock(id="ep-1", local_file_path="/audio/ep1.mp3", speech_regions=[[0, 1]])
+
+        episode.preprocessed_audio_path = str(good)
+        audio, regions = transcription_worker._audio_input(episode)
+        assert audio.dtype.name == "float32"
+        assert audio.tolist() == [0.0, 0.5, -1.0]
+        assert regions == [[0, 1]]
+
+        episode.preprocessed_audio_path = str(corrupt)
+        assert transcription_worker._audio_input(episode) == ("/audio/ep1.mp3", None)
+
+    def test_maybe_renew_lease_after_a_third_of_lease(self, mock_repository):
+        """Test the claim is renewed once a third of the lease has elapsed."""
+        worker = TranscriptionWorker(
+            config=Mock(), repository=mock_repository, worker_id="node-a:1", lease_seconds=300
+        )
+        mock_repository.renew_transcription_lease.return_value = True
+
+        with patch("src.workflow.workers.transcription.time.monotonic", return_value=150.0):
+            assert worker._maybe_renew_lease("ep-1", 100.0) == 100.0
+            mock_repository.renew_transcription_lease.assert_not_called()
+
+            assert worker._maybe_renew_lease("ep-1", 0.0) == 150.0
+            mock_repository.renew_transcription_lease.assert_called_once_with(
+                "ep-1", "node-a:1", 300
+            )
+
+    def test_maybe_renew_lease_without_worker_id(self, transcription_worker, mock_repository):
+        """Test no renewal happens when the worker was not given a claim identity."""
+        transcription_worker._maybe_renew_lease("ep-1", 0.0)
+
+        mock_repository.renew_transcription_lease.assert_not_called()
+
+    def test_transcribe_many_reports_realtime_factor(self, mock_config, mock_repository, tmp_path):
+        """Test batched mode transcribes every episode and reports realtime factor."""
+        worker = TranscriptionWorker(config=mock_config, repository=mock_repository, num_workers=2)
+
+        episodes = []
+        for i in range(2):
+            audio_file = tmp_path / f"episode{i}.mp3"
+            audio_file.write_bytes(b"fake audio")
+            episodes.append(
+                Mock(
+                    id=f"ep-{i}",
+                    local_file_path=str(audio_file),
+                    transcript_text=None,
+                    preprocessed_audio_path=None,
+                )
+            )
+        missing = Mock(id="ep-missing", local_file_path="/nonexistent.mp3", transcript_text=None)
+
+        mock_segment = Mock()
+        mock_segment.text = "Transcribed text"
+        mock_model = Mock()
+        mock_model.transcribe.side_effect = lambda *a, **kw: ([mock_segment], Mock(duration=600.0))
+        worker._model = mock_model
+
+        outcomes = worker.transcribe_many(episodes + [missing])
+
+        assert [o.episode.id for o in outcomes] == ["ep-0", "ep-1", "ep-missing"]
+        assert [o.transcript_text for o in outcomes] == [
+            "Transcribed text",
+            "Transcribed text",
+            None,
+        ]
+        assert outcomes[0].realtime_factor is not None
+        assert outcomes[2].realtime_factor is None
+        assert mock_repository.mark_transcript_complete.call_count == 2
+        mock_repository.mark_transcript_failed.assert_called_once()
+
+    def test_batched_inference_pipeline_used_when_batch_size_set(
+        self, mock_config, mock_repository, tmp_path
+    ):
+        """Test batch_size routes decoding through BatchedInferencePipeline."""
+        worker = TranscriptionWorker(config=mock_config, repository=mock_repository, batch_size=16)
+        worker._model = Mock()
+
+        audio_file = tmp_path / "episode.mp3"
+        audio_file.write_bytes(b"fake audio")
+        episode = Mock(
+            id="ep-1",
+            local_file_path=str(audio_file),
+            transcript_text=None,
+            preprocessed_audio_path=None,
+        )
+
+        with patch("faster_whisper.BatchedInferencePipeline") as mock_pipeline_cls:
+            mock_pipeline_cls.return_value.transcribe.return_value = ([], None)
+            worker._transcribe_episode(episode)
+
+        mock_pipeline_cls.assert_called_once_with(model=worker._model)
+        assert mock_pipeline_cls.return_value.transcribe.call_args.kwargs["batch_size"] == 16
+        worker._model.transcribe.assert_not_called()
+
+    def test_process_pool_backend(self, mock_config, mock_repository, tmp_path):
+        """Test num_processes routes decoding through the process pool."""
+        worker = TranscriptionWorker(
+            config=mock_config,
+            repository=mock_repository,
+            num_processes=2,
+            episode_timeout_seconds=600,
+        )
+        audio_file = tmp_path / "episode.mp3"
+        audio_file.write_bytes(b"fake audio")
+        episode = Mock(
+            id="ep-1",
+            local_file_path=str(audio_file),
+            transcript_text=None,
+            preprocessed_audio_path=None,
+        )
+
+        with patch("src.workflow.transcription_pool.TranscriptionProcessPool") as mock_pool_cls:
+            mock_pool = mock_pool_cls.return_value
+            mock_pool.transcribe.return_value = ([Mock(text=" Pooled ")], Mock(duration=60.0))
+
+            worker.load_model()
+            assert worker.transcribe_single(episode) == "Pooled"
+            assert worker.is_model_loaded() is True
+            worker.unload_model()
+
+        mock_pool_cls.assert_called_once_with(
+            "medium", "cpu", "int8", num_processes=2, episode_timeout_seconds=600
+        )
+        mock_pool.start.assert_called_once()
+        mock_pool.stop.assert_called_once()
+        assert worker._model is None
+
+    def test_process_batch_passes_preprocessed_path_to_pool(
+        self, mock_config, mock_repository, tmp_path
+    ):
+        """Test the pool gets the .npy path, not samples, even before it has started."""
+        import numpy as np
+
+        worker = TranscriptionWorker(
+            config=mock_config, repository=mock_repository, num_processes=2
+        )
+        preprocessed = tmp_path / "ep-1.pcm16k.npy"
+        np.save(preprocessed, np.zeros(16000, dtype=np.int16))
+        audio_file = tmp_path / "episode.mp3"
+        audio_file.write_bytes(b"fake audio")
+        episodes = [
+            Mock(
+                id="ep-1",
+                local_file_path=str(audio_file),
+                transcript_text=None,
+                preprocessed_audio_path=str(preprocessed),
+                speech_regions=[[0.0, 1.0]],
+            ),
+            Mock(
+                id="ep-2",
+                local_file_path=str(audio_file),
+                transcript_text=None,
+                preprocessed_audio_path=None,
+            ),
+        ]
+        mock_repository.get_episodes_pending_transcription.return_value = episodes
+        mock_repository.get_transcript_segments.return_value = []
+
+        with patch("src.workflow.transcription_pool.TranscriptionProcessPool") as mock_pool_cls:
+            mock_pool = mock_pool_cls.return_value
+            mock_pool.transcribe.return_value = ([Mock(text="Pooled")], Mock(duration=1.0))
+
+            result = worker.process_batch(limit=10)
+
+        assert result.processed == 2
+        audio_args = [c.args[0] for c in mock_pool.transcribe.call_args_list]
+        assert audio_args == [str(preprocessed), str(audio_file)]
+        mock_pool.stop.assert_called_once()
+
     def test_transcribe_single_failure(self, transcription_worker, mock_repository):
         """Test failed single transcription."""
         episode = Mock()
         episode.id = "ep-1"
         episode.local_file_path = "/nonexistent/file.mp3"
-        episode.transcript_text = None
 
         result = transcription_worker.transcribe_single(episode)
 
@@ -954,7 +1286,6 @@ class TestTranscriptionWorker:
         episode = Mock()
         episode.id = "ep-1"
         episode.local_file_path = "/nonexistent/file.mp3"
-        episode.transcript_text = None
         mock_repository.get_episodes_pending_transcription.return_value = [episode]
 
         with patch.object(transcription_worker, "_release_model"):
@@ -985,5 +1316,6 @@ class TestTranscriptionWorker:
                 "medium",
                 device="cpu",
                 compute_type="int8",
+                num_workers=1,
             )
             assert result == mock_model
@@ -84,6 +84,8 @@ class TestTranscriptionWorkerDatabaseStorage:
         mock_model = MagicMock()
         mock_segment = MagicMock()
         mock_segment.text = "Test transcript segment."
+        mock_segment.start = 0.0
+        mock_segment.end = 2.5
         mock_model.transcribe.return_value = ([mock_segment], None)
         worker._model = mock_model
 
@@ -106,6 +108,8 @@ class TestTranscriptionWorkerDatabaseStorage:
         mock_model = MagicMock()
         mock_segment = MagicMock()
         mock_segment.text = "Full transcript text."
+        mock_segment.start = 0.0
+        mock_segment.end = 2.5
         mock_model.transcribe.return_value = ([mock_segment], None)
         worker._model = mock_model
 
@@ -118,9 +122,96 @@ class TestTranscriptionWorkerDatabaseStorage:
         # Verify database was updated
         episode = repository.get_episode(sample_episode_with_audio.id)
         assert episode.transcript_status == "completed"
-        assert episode.transcript_text == "Full transcript text."
+        assert repository.get_transcript_text(episode.id) == "Full transcript text."
         assert episode.transcribed_at is not None
 
+    def test_transcribe_persists_segments(
+        self, mock_config, repository, sample_episode_with_audio
+    ):
+        """Test that decoded segments are stored with their timestamps."""
+        from src.workflow.workers.transcription import TranscriptionWorker
+
+        worker = TranscriptionWorker(config=mock_config, repository=repository)
+        worker.SEGMENT_FLUSH_SIZE = 2
+
+        mock_model = MagicMock()
+        mock_model.transcribe.return_value = (
+            [
+                MagicMock(start=0.0, end=2.0, text=" One."),
+                MagicMock(start=2.0, end=4.0, text=" Two."),
+                MagicMock(start=4.0, end=6.5, text=" Three."),
+            ],
+            None,
+        )
+        worker._model = mock_model
+
+        worker._transcribe_episode(sample_episode_with_audio)
+
+        segments = repository.get_transcript_segments(sample_episode_with_audio.id)
+        assert [(s.start_seconds, s.end_seconds, s.text) for s in segments] == [
+            (0.0, 2.0, "One."),
+            (2.0, 4.0, "Two."),
+            (4.0, 6.5, "Three."),
+        ]
+
+    def test_transcribe_resumes_after_stored_segments(
+        self, mock_config, repository, sample_episode_with_audio
+    ):
+        """Test that an interrupted transcription resumes after the last stored segment."""
+        from src.workflow.workers.transcription import TranscriptionWorker
+
+        repository.append_transcript_segments(
+            sample_episode_with_audio.id,
+            [(0.0, 2.0, "One."), (2.0, 4.0, "Two.")],
+        )
+        worker = TranscriptionWorker(config=mock_config, repository=repository)
+
+        mock_model = MagicMock()
+        mock_model.transcribe.return_value = (
+            [MagicMock(start=4.0, end=6.5, text=" Three.")],
+            None,
+        )
+        worker._model = mock_model
+
+        result = worker._transcribe_episode(sample_episode_with_audio)
+
+        assert result == "One. Two. Three."
+        assert mock_model.transcribe.call_args.kwargs["clip_timestamps"] == [4.0]
+        assert mock_model.transcribe.call_args.kwargs["vad_filter"] is False
+        assert len(repository.get_transcript_segments(sample_episode_with_audio.id)) == 3
+
+    def test_transcribe_uses_preprocessed_audio(
+        self, mock_config, repository, sample_episode_with_audio, tmp_path
+    ):
+        """Test preprocessed PCM and speech regions replace file decoding and VAD."""
+        import numpy as np
+
+        from src.workflow.workers.transcription import TranscriptionWorker
+
+        pcm_path = tmp_path / "episode.pcm16k.npy"
+        np.save(pcm_path, np.zeros(16000 * 10, dtype=np.int16))
+        repository.mark_preprocessing_complete(
+            sample_episode_with_audio.id, str(pcm_path), [[1.0, 4.0], [6.0, 9.5]]
+        )
+        episode = repository.get_episode(sample_episode_with_audio.id)
+
+        worker = TranscriptionWorker(config=mock_config, repository=repository)
+        mock_model = MagicMock()
+        mock_model.transcribe.return_value = ([MagicMock(start=1.0, end=4.0, text="Hi")], None)
+        worker._model = mock_model
+
+        result = worker.transcribe_single(episode)
+
+        assert result == "Hi"
+        audio = mock_model.transcribe.call_args.args[0]
+        assert audio.dtype == np.float32 and len(audio) == 160000
+        kwargs = mock_model.transcribe.call_args.kwargs
+        assert kwargs["vad_filter"] is False
+        assert kwargs["clip_timestamps"] == [1.0, 4.0, 6.0, 9.5]
+        # Preprocessed audio is removed once transcribed
+        assert not pcm_path.exists()
+        assert repository.get_episode(episode.id).preprocessed_audio_path is None
+
     def test_transcribe_handles_existing_transcript_text(
         self, mock_config, repository, sample_episode_with_audio
     ):
@@ -227,7 +318,7 @@ class TestTranscriptionWorkerDatabaseStorage:
         # Verify all transcripts stored in database
         for i, episode in enumerate(episodes):
             updated = repository.get_episode(episode.id)
-            assert updated.transcript_text == f"Transcript {i}"
+            assert repository.get_transcript_text(updated.id) == f"Transcript {i}"
             assert updated.transcript_status == "completed"
 
     def test_transcribe_handles_unicode(
@@ -252,7 +343,7 @@ class TestTranscriptionWorkerDatabaseStorage:
         assert "émojis 🎙️" in result
 
         episode = repository.get_episode(sample_episode_with_audio.id)
-        assert "émojis 🎙️" in episode.transcript_text
+        assert "émojis 🎙️" in repository.get_transcript_text(episode.id)
 
 
 class TestMetadataWorkerDatabaseStorage:
@@ -645,6 +736,45 @@ class TestIndexingWorkerDatabaseStorage:
         assert result.failed == 0
         assert mock_manager.upload_transcript_text.call_count == 3
 
+    def test_process_batch_records_outcomes(
+        self, mock_config, repository, sample_podcast
+    ):
+        """Test that batch indexing writes successes and failures to the database."""
+        from src.workflow.workers.indexing import IndexingWorker
+
+        episode_ids = []
+        for i in range(2):
+            episode = repository.create_episode(
+                podcast_id=sample_podcast.id,
+                guid=f"episode-{i}",
+                title=f"Episode {i}",
+                enclosure_url=f"https://example.com/episode{i}.mp3",
+                enclosure_type="audio/mpeg",
+            )
+            repository.mark_transcript_complete(episode.id, transcript_text=f"Transcript {i}")
+            repository.mark_metadata_complete(episode_id=episode.id, summary=f"Summary {i}")
+            episode_ids.append(episode.id)
+
+        worker = IndexingWorker(config=mock_config, repository=repository)
+        mock_manager = MagicMock()
+        mock_manager.upload_transcript_text.side_effect = [
+            "corpus/doc/1",
+            Exception("Upload failed"),
+        ]
+        worker._file_search_manager = mock_manager
+
+        result = worker.process_batch(limit=10)
+
+        assert result.processed == 1
+        assert result.failed == 1
+        statuses = {
+            repository.get_episode(eid).file_search_status: repository.get_episode(eid)
+            for eid in episode_ids
+        }
+        assert statuses["indexed"].file_search_resource_name == "corpus/doc/1"
+        assert statuses["indexed"].file_search_uploaded_at is not None
+        assert statuses["failed"].file_search_error == "Upload failed"
+
     def test_index_episode_handles_unicode(
         self, mock_config, repository, sample_podcast
     ):
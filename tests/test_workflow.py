@@ -278,6 +278,7 @@ class TestPipelineConfig:
         config = PipelineConfig()
 
         assert config.sync_interval_seconds == 900  # 15 minutes
+        assert config.priority_refresh_interval_seconds == 3600
         assert config.download_buffer_size == 10
         assert config.download_buffer_threshold == 5
         assert config.download_batch_size == 10
@@ -285,6 +286,86 @@ class TestPipelineConfig:
         assert config.post_processing_workers == 4
         assert config.idle_wait_seconds == 10
         assert config.max_retries == 3
+        assert config.download_buffer_hours == 0.0
+        assert config.download_min_free_disk_mb == 2048
+        assert config.preprocess_workers == 0
+        assert config.transcription_workers == 1
+        assert config.transcription_batch_size == 0
+        assert config.transcription_processes == 0
+        assert config.transcription_timeout_seconds == 14400
+        assert config.worker_id  # "<hostname>:<pid>"
+        assert config.transcription_lease_seconds == 3600
+        assert config.lease_reap_interval_seconds == 300
+        assert config.metrics_port == 0
+        assert config.event_idle_wait_seconds == 60
+        assert config.metrics_host == "0.0.0.0"
+
+    def test_from_env_worker_settings(self):
+        """Test loading work-claiming settings from environment variables."""
+        with patch.dict(
+            "os.environ",
+            {
+                "PIPELINE_WORKER_ID": "gpu-node-2",
+                "PIPELINE_TRANSCRIPTION_LEASE_SECONDS": "900",
+                "PIPELINE_LEASE_REAP_INTERVAL_SECONDS": "60",
+            },
+        ):
+            config = PipelineConfig.from_env()
+
+            assert config.worker_id == "gpu-node-2"
+            assert config.transcription_lease_seconds == 900
+            assert config.lease_reap_interval_seconds == 60
+
+    def test_from_env_transcription_settings(self):
+        """Test loading batched transcription settings from environment variables."""
+        with patch.dict(
+            "os.environ",
+            {
+                "PIPELINE_DOWNLOAD_BUFFER_HOURS": "1.5",
+                "PIPELINE_DOWNLOAD_MIN_FREE_DISK_MB": "500",
+                "PIPELINE_PREPROCESS_WORKERS": "2",
+                "PIPELINE_TRANSCRIPTION_WORKERS": "4",
+                "PIPELINE_TRANSCRIPTION_BATCH_SIZE": "16",
+                "PIPELINE_TRANSCRIPTION_PROCESSES": "2",
+                "PIPELINE_TRANSCRIPTION_TIMEOUT_SECONDS": "3600",
+            },
+        ):
+            config = PipelineConfig.from_env()
+
+            assert config.download_buffer_hours == 1.5
+            assert config.download_min_free_disk_mb == 500
+            assert config.preprocess_workers == 2
+            assert config.transcription_workers == 4
+            assert config.transcription_batch_size == 16
+            assert config.transcription_processes == 2
+            assert config.transcription_timeout_seconds == 3600
+
+    def test_from_env_metrics_settings(self):
+        """Test loading metrics listener settings from environment variables."""
+        with patch.dict(
+            "os.environ",
+            {"PIPELINE_METRICS_PORT": "9464", "PIPELINE_METRICS_HOST": "127.0.0.1"},
+        ):
+            config = PipelineConfig.from_env()
+
+            assert config.metrics_port == 9464
+            assert config.metrics_host == "127.0.0.1"
+
+        with patch.dict("os.environ", {"PIPELINE_METRICS_PORT": "70000"}):
+            with pytest.raises(ValueError):
+                PipelineConfig.from_env()
+
+    def test_from_env_transcription_workers_within_buffer(self):
+        """Test transcription_workers cannot exceed the download buffer size."""
+        with patch.dict(
+            "os.environ",
+            {
+                "PIPELINE_TRANSCRIPTION_WORKERS": "12",
+                "PIPELINE_DOWNLOAD_BUFFER_SIZE": "10",
+            },
+        ):
+            with pytest.raises(ValueError, match="PIPELINE_TRANSCRIPTION_WORKERS"):
+                PipelineConfig.from_env()
 
     def test_from_env(self):
         """Test loading configuration from environment variables."""